@@ -0,0 +1,7 @@
+import Range
+from Range.types import KX_GameObject
+
+cont = Range.logic.getCurrentController()
+own: KX_GameObject = cont.owner
+own.worldPosition.z += 0.1
+own.name
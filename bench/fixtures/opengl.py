@@ -0,0 +1,5 @@
+import Range
+import bgl
+
+buffer = bgl.Buffer(bgl.GL_FLOAT, 4)
+bgl.glFlush()
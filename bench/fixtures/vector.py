@@ -0,0 +1,5 @@
+from mathutils import Vector, Matrix
+
+velocity = Vector((1.0, 0.0, 0.0))
+transform = Matrix.Identity(4)
+velocity.length
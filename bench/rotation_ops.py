@@ -0,0 +1,133 @@
+"""Compare per-object and batched ``mathutils`` rotation throughput.
+
+Animation blending interpolates one quaternion per bone or object every
+frame. For each operation the cost of a Python loop over ``Quaternion`` (or
+``Euler``) objects is compared with the same work on a
+``mathutils.QuaternionArray``, in nanoseconds per rotation. Conversions of a
+frozen rotation, which are computed once and remembered, are listed with the
+single object numbers.
+
+Usage:
+    python bench/rotation_ops.py [--number 20000] [--batch 10000] [--json]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "stubs"))
+
+from mathutils import Euler, Quaternion, QuaternionArray, Vector, VectorArray, arrays  # noqa: E402
+
+REPEAT = 5
+
+
+def operations():
+    a = Quaternion((0.0, 0.0, 1.0), 0.5)
+    b = Quaternion((1.0, 0.0, 0.0), 1.2)
+    euler = Euler((0.1, 0.2, 0.3), "ZXY")
+    frozen = a.copy().freeze()
+    frozen_euler = euler.copy().freeze()
+    v = Vector((1.0, 2.0, 3.0))
+    return [
+        ("a.slerp(b, 0.5)", lambda: a.slerp(b, 0.5)),
+        ("a @ b", lambda: a @ b),
+        ("a @ v", lambda: a @ v),
+        ("a.to_matrix()", lambda: a.to_matrix()),
+        ("frozen.to_matrix()", lambda: frozen.to_matrix()),
+        ("a.to_euler()", lambda: a.to_euler()),
+        ("frozen.to_euler()", lambda: frozen.to_euler()),
+        ("euler.to_quaternion()", lambda: euler.to_quaternion()),
+        ("frozen_euler.to_quaternion()", lambda: frozen_euler.to_quaternion()),
+        ("euler.to_matrix()", lambda: euler.to_matrix()),
+    ]
+
+
+def measure(number):
+    results = []
+    for name, function in operations():
+        best = min(timeit.repeat(function, number=number, repeat=REPEAT))
+        results.append({"operation": name, "ns_per_op": round(best / number * 1e9, 1)})
+    return results
+
+
+def _random_quaternion(generator):
+    axis = [generator.uniform(-1.0, 1.0) for _ in range(3)]
+    return Quaternion(axis, generator.uniform(-math.pi, math.pi))
+
+
+def batch_operations(count):
+    generator = random.Random(0)
+    starts = [_random_quaternion(generator) for _ in range(count)]
+    ends = [_random_quaternion(generator) for _ in range(count)]
+    factors = [generator.random() for _ in range(count)]
+    points = [Vector((generator.uniform(-1.0, 1.0), 1.0, 0.5)) for _ in range(count)]
+    packed, packed_ends, packed_points = QuaternionArray(starts), QuaternionArray(ends), VectorArray(points)
+
+    def nlerp(a, b, t):
+        if a.dot(b) < 0.0:
+            b = -b
+        return (a * (1.0 - t) + b * t).normalized()
+
+    return [
+        (
+            "slerp, per item factor",
+            lambda: [a.slerp(b, t) for a, b, t in zip(starts, ends, factors)],
+            lambda: packed.slerp(packed_ends, factors),
+        ),
+        (
+            "nlerp, per item factor",
+            lambda: [nlerp(a, b, t) for a, b, t in zip(starts, ends, factors)],
+            lambda: packed.nlerp(packed_ends, factors),
+        ),
+        ("a @ b", lambda: [a @ b for a, b in zip(starts, ends)], lambda: packed @ packed_ends),
+        ("a @ v", lambda: [a @ v for a, v in zip(starts, points)], lambda: packed @ packed_points),
+        ("to_matrix", lambda: [a.to_matrix() for a in starts], lambda: packed.to_matrix()),
+    ]
+
+
+def measure_batch(count):
+    results = []
+    for name, loop, batch in batch_operations(count):
+        loop_time = min(timeit.repeat(loop, number=1, repeat=REPEAT))
+        batch_time = min(timeit.repeat(batch, number=1, repeat=REPEAT))
+        results.append({
+            "operation": name,
+            "loop_ns_per_rotation": round(loop_time / count * 1e9, 1),
+            "batch_ns_per_rotation": round(batch_time / count * 1e9, 1),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="operations per timed run")
+    parser.add_argument("--batch", type=int, default=10000, help="rotations per batch operation")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = measure(args.number)
+    batch = measure_batch(args.batch)
+    if args.json:
+        print(json.dumps({"rotation": results, "batch": batch}, indent=2))
+        return
+    print(f"{'operation':<30} {'ns/op':>9}")
+    for result in results:
+        print(f"{result['operation']:<30} {result['ns_per_op']:>9.1f}")
+
+    backend = "numpy" if arrays.numpy is not None else "array('f')"
+    print(f"\n{'batch of ' + str(args.batch) + ' (' + backend + ')':<32} {'loop ns':>9} {'batch ns':>9}")
+    for result in batch:
+        print(
+            f"{result['operation']:<32} {result['loop_ns_per_rotation']:>9.1f} "
+            f"{result['batch_ns_per_rotation']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Measure the cost of spawning game objects.
+
+Tests and tools create thousands of ``Range.types.KX_GameObject``
+placeholders and headless scene objects. For each kind of object this
+reports how many can be spawned per second and the memory each one holds
+while alive, then the cost of the first access to the attributes built on
+demand (transform, scene, meshes and logic bricks).
+
+Usage:
+    python bench/spawn_objects.py [--count 10000] [--json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "stubs"))
+
+from Range import headless, types  # noqa: E402
+
+REPEAT = 5
+
+
+def spawners():
+    game = headless.Game()
+    scene = game.addScene("Spawn")
+
+    def spawn_headless(count):
+        objects = [scene.createObject("Object", position=(1.0, 2.0, 3.0)) for _ in range(count)]
+        scene._removeObjects(objects)
+        return objects
+
+    return [
+        ("KX_GameObject()", lambda count: [types.KX_GameObject() for _ in range(count)]),
+        ("scene.createObject()", spawn_headless),
+    ]
+
+
+def first_access():
+    return [
+        ("worldPosition", lambda obj: obj.worldPosition),
+        ("worldTransform", lambda obj: obj.worldTransform),
+        ("scene", lambda obj: obj.scene),
+        ("meshes", lambda obj: obj.meshes),
+        ("sensors + actuators", lambda obj: (obj.sensors, obj.actuators)),
+    ]
+
+
+def allocated(function, count):
+    """Bytes held per object while the spawned objects are alive."""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = function(count)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The list holding the objects is not part of the cost
+    size -= sys.getsizeof(objects)
+    return max(size - before, 0) / count
+
+
+def measure(count):
+    results = []
+    for name, function in spawners():
+        best = min(timeit.repeat(lambda: function(count), number=1, repeat=REPEAT))
+        results.append({
+            "operation": name,
+            "objects_per_second": round(count / best),
+            "bytes_per_object": round(allocated(function, count)),
+        })
+    return results
+
+
+def measure_access(count):
+    results = []
+    for name, function in first_access():
+        objects = [types.KX_GameObject() for _ in range(count)]
+        # Each object is touched once, later accesses are cached
+        best = timeit.timeit(lambda: [function(obj) for obj in objects], number=1)
+        results.append({"attribute": name, "us_per_object": round(best / count * 1e6, 2)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000, help="objects spawned per timed run")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = measure(args.count)
+    access = measure_access(args.count)
+    if args.json:
+        print(json.dumps({"spawn": results, "first_access": access}, indent=2))
+        return
+    print(f"{'spawn':<24} {'objects/s':>11} {'bytes/object':>13}")
+    for result in results:
+        print(f"{result['operation']:<24} {result['objects_per_second']:>11} {result['bytes_per_object']:>13}")
+
+    print(f"\n{'first access':<24} {'us/object':>11}")
+    for result in access:
+        print(f"{result['attribute']:<24} {result['us_per_object']:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""Measure how expensive the stubs are for a language server.
+
+Every script in ``bench/fixtures`` is opened in a fresh, headless pyright
+language server with the stubs on its ``extraPaths``, and three numbers are
+recorded:
+
+- ``cold_index_ms``: from ``initialize`` until the diagnostics of the script
+  are published, i.e. the stubs it imports have been parsed and bound;
+- ``first_completion_ms``: from opening the script until the first non-empty
+  completion list for the member access on its last line;
+- ``peak_rss_mb``: peak resident memory of the server process.
+
+The results are compared with ``bench/budgets.json`` and the script exits
+with status 1 when any budget is exceeded, so stub changes that make the
+language server slower or hungrier fail the check.
+
+Usage:
+    python bench/stub_index.py [--server pyright-langserver] [--stubs dist/stubs] [--version 1.5]
+    python bench/stub_index.py --update-budgets --runs 5   # re-baseline with headroom
+
+The server defaults to ``pyright-langserver`` (``npm install -g pyright``),
+any language server that speaks LSP over stdio can be passed with --server,
+e.g. ``basedpyright-langserver``.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import queue
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH = os.path.join(ROOT, "bench")
+FIXTURES = os.path.join(BENCH, "fixtures")
+BUDGETS = os.path.join(BENCH, "budgets.json")
+
+# --update-budgets leaves this much room above the measured values, about
+# twice the run to run spread of the timings
+HEADROOM = 1.25
+TIMEOUT = 120.0
+
+
+class LanguageServer:
+    """Minimal LSP client over the stdio of a child process."""
+
+    def __init__(self, command, cwd):
+        self.process = subprocess.Popen(
+            command, cwd=cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.messages = queue.Queue()
+        self.next_id = 0
+        # uri -> time the first diagnostics for it were published
+        self.published = {}
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        stream = self.process.stdout
+        while True:
+            length = None
+            while True:
+                line = stream.readline()
+                if not line:
+                    return
+                line = line.strip()
+                if not line:
+                    break
+                name, _, value = line.decode("ascii").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            self.messages.put(json.loads(stream.read(length)))
+
+    def _send(self, message):
+        body = json.dumps(message).encode("utf-8")
+        self.process.stdin.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        self.process.stdin.flush()
+
+    def notify(self, method, params):
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def request(self, method, params):
+        self.next_id += 1
+        self._send({"jsonrpc": "2.0", "id": self.next_id, "method": method, "params": params})
+        return self.next_id
+
+    def wait(self, predicate, deadline):
+        """Return the first message matching predicate, answering server requests."""
+
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutError("language server did not answer in time")
+            try:
+                message = self.messages.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError("language server did not answer in time") from None
+            if "method" in message and "id" in message:
+                # workspace/configuration, client/registerCapability, ...
+                items = message.get("params", {}).get("items")
+                result = [None] * len(items) if items is not None else None
+                self._send({"jsonrpc": "2.0", "id": message["id"], "result": result})
+                continue
+            if message.get("method") == "textDocument/publishDiagnostics":
+                self.published.setdefault(message["params"]["uri"], time.perf_counter())
+            if predicate(message):
+                return message
+
+    def peak_rss_mb(self):
+        # VmHWM is the high water mark of the resident set. Launchers such
+        # as the pip pyright package run the server as a child process, so
+        # the marks of the whole process tree are added up.
+        total, found = 0, False
+        pending = [self.process.pid]
+        while pending:
+            pid = pending.pop()
+            try:
+                with open(f"/proc/{pid}/status") as status:
+                    for line in status:
+                        if line.startswith("VmHWM:"):
+                            total += int(line.split()[1])
+                            found = True
+                for task in os.listdir(f"/proc/{pid}/task"):
+                    with open(f"/proc/{pid}/task/{task}/children") as children:
+                        pending.extend(int(child) for child in children.read().split())
+            except OSError:
+                continue
+        return total / 1024 if found else None
+
+    def close(self):
+        try:
+            self.request("shutdown", None)
+            self.notify("exit", None)
+            self.process.wait(timeout=10)
+        except Exception:
+            self.process.kill()
+            self.process.wait()
+
+
+def stub_roots(stubs, version=None):
+    """extraPaths for the stubs: every package root of a built version, or the tree itself."""
+
+    manifest = os.path.join(stubs, "manifest.json")
+    if not os.path.isfile(manifest):
+        return [stubs]
+    with open(manifest, encoding="utf-8") as file:
+        manifest = json.load(file)
+    version = version or manifest["default"]
+    if version not in manifest["versions"]:
+        raise SystemExit(f"no stubs for Range Engine {version}, built: {', '.join(manifest['versions'])}")
+    packages = manifest["versions"][version]["packages"]
+    return [os.path.join(stubs, version, package) for package in sorted(packages)]
+
+
+def completion_position(text):
+    """Position right after the last '.' of the last non-empty line."""
+
+    lines = text.rstrip("\n").split("\n")
+    return {"line": len(lines) - 1, "character": lines[-1].rindex(".") + 1}
+
+
+def measure(server, fixture, roots):
+    workspace = tempfile.mkdtemp(prefix="range-stub-bench-")
+    try:
+        script = os.path.join(workspace, os.path.basename(fixture))
+        shutil.copyfile(fixture, script)
+        with open(os.path.join(workspace, "pyrightconfig.json"), "w") as config:
+            json.dump({"extraPaths": roots, "typeCheckingMode": "basic"}, config)
+        with open(script, encoding="utf-8") as file:
+            text = file.read()
+        uri = pathlib.Path(script).as_uri()
+
+        start = time.perf_counter()
+        deadline = start + TIMEOUT
+        client = LanguageServer(server, workspace)
+        try:
+            request = client.request("initialize", {
+                "processId": os.getpid(),
+                "rootUri": pathlib.Path(workspace).as_uri(),
+                "workspaceFolders": [{"uri": pathlib.Path(workspace).as_uri(), "name": "bench"}],
+                "capabilities": {
+                    "textDocument": {"completion": {"completionItem": {"snippetSupport": False}}},
+                    "workspace": {"configuration": True},
+                },
+            })
+            client.wait(lambda m: m.get("id") == request, deadline)
+            client.notify("initialized", {})
+
+            opened = time.perf_counter()
+            client.notify("textDocument/didOpen", {"textDocument": {
+                "uri": uri, "languageId": "python", "version": 1, "text": text,
+            }})
+
+            # Ask for completions until the server returns a non-empty list
+            position = completion_position(text)
+            first_completion = None
+            while first_completion is None:
+                request = client.request("textDocument/completion", {
+                    "textDocument": {"uri": uri}, "position": position,
+                })
+                reply = client.wait(lambda m: m.get("id") == request, deadline)
+                result = reply.get("result") or []
+                items = result.get("items", []) if isinstance(result, dict) else result
+                if items:
+                    first_completion = time.perf_counter() - opened
+
+            if uri not in client.published:
+                client.wait(lambda m: uri in client.published, deadline)
+            cold_index = client.published[uri] - start
+            rss = client.peak_rss_mb()
+        finally:
+            client.close()
+        if rss is None:
+            # Fallback for systems without /proc, covers every finished child
+            import resource
+            rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+            if sys.platform == "darwin":
+                rss /= 1024
+
+        return {
+            "cold_index_ms": round(cold_index * 1000, 1),
+            "first_completion_ms": round(first_completion * 1000, 1),
+            "peak_rss_mb": round(rss, 1),
+        }
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stub indexing benchmark")
+    parser.add_argument("--server", default="pyright-langserver",
+                        help="language server executable, run with --stdio")
+    parser.add_argument("--stubs", default=None,
+                        help="stub tree, defaults to dist/stubs when built, else src/stubs")
+    parser.add_argument("--version", default=None,
+                        help="engine version of a built stub tree, defaults to the newest")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="measure every fixture this many times and keep the median of each metric")
+    parser.add_argument("--update-budgets", action="store_true",
+                        help="write the measured values (with headroom) as the new budgets")
+    args = parser.parse_args(argv)
+
+    executable = shutil.which(args.server)
+    if executable is None:
+        print(f"{args.server} not found, install pyright or pass --server", file=sys.stderr)
+        return 2
+
+    stubs = args.stubs
+    if stubs is None:
+        built = os.path.join(ROOT, "dist", "stubs")
+        stubs = built if os.path.isdir(built) else os.path.join(ROOT, "src", "stubs")
+    roots = stub_roots(os.path.abspath(stubs), args.version)
+
+    with open(BUDGETS, encoding="utf-8") as file:
+        budgets = json.load(file)
+
+    results = {}
+    failures = []
+    for name in sorted(os.listdir(FIXTURES)):
+        if not name.endswith(".py"):
+            continue
+        scenario = name[:-3]
+        runs = [measure([executable, "--stdio"], os.path.join(FIXTURES, name), roots) for _ in range(max(1, args.runs))]
+        results[scenario] = {metric: statistics.median(run[metric] for run in runs) for metric in runs[0]}
+        print(f"{scenario}:")
+        for metric, value in results[scenario].items():
+            budget = budgets.get(scenario, {}).get(metric)
+            status = ""
+            if budget is not None and value > budget:
+                status = "  OVER BUDGET"
+                failures.append(f"{scenario}.{metric}: {value} > {budget}")
+            print(f"  {metric:<20} {value:>10}  (budget {budget}){status}")
+
+    if args.update_budgets:
+        updated = {
+            scenario: {metric: round(value * HEADROOM) for metric, value in values.items()}
+            for scenario, values in results.items()
+        }
+        with open(BUDGETS, "w", encoding="utf-8") as file:
+            json.dump(updated, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"Budgets written to {os.path.relpath(BUDGETS, ROOT)}")
+        return 0
+
+    if failures:
+        print("\nBudgets exceeded:\n  " + "\n  ".join(failures), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
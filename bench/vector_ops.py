@@ -0,0 +1,161 @@
+"""Measure the cost of common ``mathutils.Vector`` and ``Matrix`` operations.
+
+Game logic runs vector math on every object every frame, so the executable
+``mathutils`` stubs (used by the headless runtime) have to be cheap. For each
+operation two numbers are recorded:
+
+- ``ns_per_op``: best of several timed runs, in nanoseconds per operation;
+- ``blocks_per_op`` / ``bytes_per_op``: memory blocks and bytes still
+  allocated per result, i.e. what keeping the returned vector costs.
+
+The batch section compares a Python loop over ``Vector`` objects with the
+same operation on a ``mathutils.VectorArray``, in nanoseconds per vector.
+
+Usage:
+    python bench/vector_ops.py [--number 100000] [--batch 10000] [--json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "stubs"))
+
+from mathutils import Matrix, Vector, VectorArray, arrays  # noqa: E402
+
+REPEAT = 5
+# Results kept alive while measuring allocations
+ALLOCATION_SAMPLES = 10000
+
+
+def operations():
+    a = Vector((1.0, 2.0, 3.0))
+    b = Vector((4.0, 5.0, 6.0))
+    wrapped = Vector._wrap((1.0, 2.0, 3.0), None, lambda values: None)
+    m = Matrix.Translation((1.0, 2.0, 3.0)) @ Matrix.Rotation(0.5, 4, "Z") @ Matrix.Scale(2.0, 4)
+    frozen = m.copy().freeze()
+    return a, b, [
+        ("Vector((x, y, z))", lambda: Vector((1.0, 2.0, 3.0))),
+        ("a + b", lambda: a + b),
+        ("a - b", lambda: a - b),
+        ("a * 2.0", lambda: a * 2.0),
+        ("a + (x, y, z)", lambda: a + (1.0, 1.0, 1.0)),
+        ("a.dot(b)", lambda: a.dot(b)),
+        ("a.cross(b)", lambda: a.cross(b)),
+        ("a.length", lambda: a.length),
+        ("a.normalized()", lambda: a.normalized()),
+        ("a.lerp(b, 0.5)", lambda: a.lerp(b, 0.5)),
+        ("a.x", lambda: a.x),
+        ("a.xy", lambda: a.xy),
+        ("a.copy()", lambda: a.copy()),
+        ("wrapped.z += 1.0", lambda: setattr(wrapped, "z", wrapped.z + 1.0)),
+        ("m @ m", lambda: m @ m),
+        ("m @ a", lambda: m @ a),
+        ("m.inverted()", lambda: m.inverted()),
+        ("frozen.inverted()", lambda: frozen.inverted()),
+        ("m.determinant()", lambda: m.determinant()),
+        ("m.decompose()", lambda: m.decompose()),
+    ]
+
+
+def allocations(function):
+    """Blocks and bytes allocated per call for the results of function."""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before_size, _ = tracemalloc.get_traced_memory()
+        before_blocks = sys.getallocatedblocks()
+        results = [function() for _ in range(ALLOCATION_SAMPLES)]
+        blocks = sys.getallocatedblocks() - before_blocks
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The list holding the results is not part of the cost
+    blocks -= 1
+    size -= sys.getsizeof(results)
+    return max(blocks, 0) / ALLOCATION_SAMPLES, max(size - before_size, 0) / ALLOCATION_SAMPLES
+
+
+def measure(number):
+    _, _, ops = operations()
+    results = []
+    for name, function in ops:
+        best = min(timeit.repeat(function, number=number, repeat=REPEAT))
+        blocks, size = allocations(function)
+        results.append({
+            "operation": name,
+            "ns_per_op": round(best / number * 1e9, 1),
+            "blocks_per_op": round(blocks, 2),
+            "bytes_per_op": round(size, 1),
+        })
+    return results
+
+
+def batch_operations(count):
+    points = [Vector((index * 0.5, index * 0.25 + 1.0, 2.0)) for index in range(count)]
+    others = [Vector((1.0, index * 0.75, -1.0)) for index in range(count)]
+    packed, packed_others = VectorArray(points), VectorArray(others)
+    matrix = [[0.0, -1.0, 0.0, 1.0], [1.0, 0.0, 0.0, 2.0], [0.0, 0.0, 1.0, 3.0], [0.0, 0.0, 0.0, 1.0]]
+    return [
+        ("normalized", lambda: [p.normalized() for p in points], lambda: packed.normalized()),
+        ("dot", lambda: [p.dot(o) for p, o in zip(points, others)], lambda: packed.dot(packed_others)),
+        ("cross", lambda: [p.cross(o) for p, o in zip(points, others)], lambda: packed.cross(packed_others)),
+        ("lerp", lambda: [p.lerp(o, 0.5) for p, o in zip(points, others)], lambda: packed.lerp(packed_others, 0.5)),
+        ("length", lambda: [p.length for p in points], lambda: packed.length),
+        ("matrix @ point", lambda: [_transform(matrix, p) for p in points], lambda: packed.__rmatmul__(matrix)),
+    ]
+
+
+def _transform(matrix, point):
+    return Vector([row[0] * point.x + row[1] * point.y + row[2] * point.z + row[3] for row in matrix[:3]])
+
+
+def measure_batch(count):
+    results = []
+    for name, loop, batch in batch_operations(count):
+        loop_time = min(timeit.repeat(loop, number=1, repeat=REPEAT))
+        batch_time = min(timeit.repeat(batch, number=1, repeat=REPEAT))
+        results.append({
+            "operation": name,
+            "loop_ns_per_vector": round(loop_time / count * 1e9, 1),
+            "batch_ns_per_vector": round(batch_time / count * 1e9, 1),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000, help="operations per timed run")
+    parser.add_argument("--batch", type=int, default=10000, help="vectors per batch operation")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = measure(args.number)
+    batch = measure_batch(args.batch)
+    if args.json:
+        print(json.dumps({"vector": results, "batch": batch}, indent=2))
+        return
+    print(f"{'operation':<22} {'ns/op':>9} {'blocks/op':>10} {'bytes/op':>9}")
+    for result in results:
+        print(
+            f"{result['operation']:<22} {result['ns_per_op']:>9.1f} "
+            f"{result['blocks_per_op']:>10.2f} {result['bytes_per_op']:>9.1f}"
+        )
+
+    backend = "numpy" if arrays.numpy is not None else "array('f')"
+    print(f"\n{'batch of ' + str(args.batch) + ' (' + backend + ')':<32} {'loop ns':>9} {'batch ns':>9}")
+    for result in batch:
+        print(
+            f"{result['operation']:<32} {result['loop_ns_per_vector']:>9.1f} "
+            f"{result['batch_ns_per_vector']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Build the compact API index used by the extension's completion provider.
+
+The index is a flat JSON map from qualified name (``Range.types.KX_GameObject``,
+``mathutils.Vector.normalized``, ...) to a small record, so every lookup the
+extension makes is a single hash lookup:
+
+- ``k``: kind, one of module, class, function, method, property, variable;
+- ``d``: docstring;
+- ``s``: signature, for functions and methods;
+- ``t``: qualified name of the type of the value (the return type for
+  functions), when it refers to an indexed class;
+- ``m``: member names, for modules and classes;
+- ``b``: qualified base classes, for classes.
+
+Entries are made from the declaration-only stubs written by ``stubgen``, so
+return types and attribute types are already annotations.
+"""
+
+import ast
+
+INDEX_VERSION = 1
+# Decorators making a method read like an attribute
+PROPERTY_DECORATORS = {"property", "cached_property", "functools.cached_property"}
+
+
+class ModuleIndexer:
+    def __init__(self, index, module, is_package):
+        self.index = index
+        self.module = module
+        self.package = module if is_package else module.rpartition(".")[0]
+        self.aliases = {}
+        self.classes = set()
+
+    def absolute(self, level, name):
+        """Resolve a (possibly relative) import to an absolute module name."""
+
+        if level == 0:
+            return name
+        parts = self.package.split(".")
+        base = ".".join(parts[: len(parts) - (level - 1)])
+        return f"{base}.{name}" if name else base
+
+    def qualify(self, annotation):
+        """Qualified class name of a simple annotation, or None."""
+
+        if annotation is None:
+            return None
+        text = ast.unparse(annotation).strip("'\"")
+        root, _, rest = text.partition(".")
+        if not root.isidentifier():
+            return None
+        if not rest and root in self.classes:
+            return f"{self.module}.{root}"
+        if root in self.aliases:
+            return f"{self.aliases[root]}.{rest}" if rest else self.aliases[root]
+        return None
+
+    def entry(self, qualname, kind, doc=None, **fields):
+        record = self.index.setdefault(qualname, {"k": kind})
+        record["k"] = kind
+        if doc:
+            record["d"] = doc
+        record.update({key: value for key, value in fields.items() if value})
+        return record
+
+    def add_member(self, owner, name):
+        members = self.index[owner].setdefault("m", [])
+        if name not in members:
+            members.append(name)
+
+    def function(self, owner, node, kind):
+        decorators = {ast.unparse(d) for d in node.decorator_list}
+        if decorators & PROPERTY_DECORATORS:
+            kind = "property"
+        elif any(d.endswith(".setter") for d in decorators):
+            return
+        args = node.args
+        if kind != "function" and args.args and args.args[0].arg in ("self", "cls"):
+            args.args = args.args[1:]
+        returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+        self.entry(
+            f"{owner}.{node.name}", kind, ast.get_docstring(node),
+            s=None if kind == "property" else f"({ast.unparse(args)}){returns}",
+            t=self.qualify(node.returns),
+        )
+        self.add_member(owner, node.name)
+
+    def variables(self, owner, node):
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            targets, annotation = [node.target.id], node.annotation
+        elif isinstance(node, ast.Assign):
+            targets = [t.id for t in node.targets if isinstance(t, ast.Name)]
+            annotation = None
+        else:
+            return
+        for name in targets:
+            self.entry(f"{owner}.{name}", "variable", t=self.qualify(annotation))
+            self.add_member(owner, name)
+
+    def body(self, owner, statements, in_class):
+        for node in statements:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.function(owner, node, "method" if in_class else "function")
+            elif isinstance(node, ast.ClassDef) and not in_class:
+                qualname = f"{owner}.{node.name}"
+                bases = [self.qualify(base) for base in node.bases]
+                self.entry(qualname, "class", ast.get_docstring(node), b=[b for b in bases if b])
+                self.add_member(owner, node.name)
+                self.body(qualname, node.body, True)
+            else:
+                self.variables(owner, node)
+
+    def run(self, tree):
+        self.entry(self.module, "module", ast.get_docstring(tree))
+        self.index[self.module].setdefault("m", [])
+
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                self.classes.add(node.name)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        self.aliases[alias.asname] = alias.name
+                    else:
+                        root = alias.name.split(".")[0]
+                        self.aliases[root] = root
+            elif isinstance(node, ast.ImportFrom):
+                source = self.absolute(node.level, node.module)
+                for alias in node.names:
+                    self.aliases[alias.asname or alias.name] = f"{source}.{alias.name}"
+
+        # Submodules imported by a package are reachable as its members
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom) and node.level and node.module is None \
+                    and self.absolute(node.level, None) == self.module:
+                for alias in node.names:
+                    self.add_member(self.module, alias.asname or alias.name)
+
+        self.body(self.module, tree.body, False)
+
+
+def add_module(index, module, is_package, source):
+    """Add the declarations of one stub module to index."""
+
+    ModuleIndexer(index, module, is_package).run(ast.parse(source))
+
+
+def finish(index):
+    """Make the member lists deterministic and wrap the index for writing."""
+
+    for record in index.values():
+        if "m" in record:
+            record["m"].sort()
+    return {"version": INDEX_VERSION, "symbols": index}
@@ -0,0 +1,247 @@
+"""Build the declaration-only stubs, with one analysis root per package.
+
+Pylance indexes everything below each ``python.analysis.extraPaths`` entry,
+so shipping all packages under ``src/stubs`` makes every workspace pay for
+``bpy``, ``bgl`` and ``freestyle`` even when only ``Range`` is imported.
+This script writes every package to its own root and records the
+packages each one depends on in ``dist/stubs/manifest.json``, so the
+extension can expose just the packages a workspace imports (plus their
+dependencies).
+
+``.py`` stubs are converted to ``.pyi`` declarations by ``stubgen`` so the
+language server does not have to infer types from placeholder code, the
+``.pyi`` stubs are copied as they are. The headless runtime (``Range.headless``)
+is not part of the engine API and is left out, and so are private modules
+no shipped stub imports from. The declarations are also indexed
+into an ``api-index.json`` for the extension's own completion and hover
+providers (see ``api_index``).
+
+Every source tree describes one Range Engine release, identified by
+``range_version_string`` in its ``Range/app``. Each release is written to
+its own bundle, ``dist/stubs/<version>/<package>/<package>``, so a
+workspace only ever sees the API of the engine version it targets:
+
+    dist/stubs/manifest.json            versions, packages and dependencies
+    dist/stubs/1.5/api-index.json
+    dist/stubs/1.5/Range/Range/...
+
+Usage: python scripts/build_stubs.py [--source src/stubs ...] [--output dist/stubs]
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import shutil
+import sys
+
+import api_index
+from stubgen import generate_stub, private_module, used_names
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STUB_SUFFIXES = (".py", ".pyi")
+# Modules of the stub trees that are not shipped, with their submodules
+EXCLUDED_MODULES = ("Range.headless",)
+
+
+def iter_sources(package_dir):
+    """Yield the paths of every stub file below package_dir."""
+
+    for directory, subdirs, files in os.walk(package_dir):
+        subdirs[:] = sorted(d for d in subdirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(STUB_SUFFIXES):
+                yield os.path.join(directory, name)
+
+
+def package_dependencies(package, package_dir, packages):
+    """Return the other stub packages that package needs to resolve its types.
+
+    An import only counts when the name it binds is actually used, in code
+    or in a string annotation such as ``'mathutils.Vector'``: an import
+    left over from the generator does not drag another tree along.
+    """
+
+    dependencies = set()
+    for path, *_ in shipped_sources(package, package_dir):
+        with open(path, encoding="utf-8") as source:
+            tree = ast.parse(source.read(), path)
+        names = used_names(tree)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    top = alias.name.split(".")[0]
+                    bound = alias.asname or top
+                    if top in packages and top != package and bound in names:
+                        dependencies.add(top)
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                top = node.module.split(".")[0]
+                if top in packages and top != package and any(
+                    (alias.asname or alias.name) in names for alias in node.names
+                ):
+                    dependencies.add(top)
+    return sorted(dependencies)
+
+
+def module_name(package, relative):
+    """Dotted module name of a stub file, and whether it is a package."""
+
+    parts = [package] + relative.replace(os.sep, "/").split("/")
+    name = parts.pop().rsplit(".", 1)[0]
+    if name == "__init__":
+        return ".".join(parts), True
+    return ".".join(parts + [name]), False
+
+
+def shipped_sources(package, package_dir):
+    """Yield path, relative path, module name and whether it is a package,
+    for the stub files of package_dir outside EXCLUDED_MODULES."""
+
+    for path in iter_sources(package_dir):
+        relative = os.path.relpath(path, package_dir)
+        module, is_package = module_name(package, relative)
+        if not any(module == excluded or module.startswith(excluded + ".") for excluded in EXCLUDED_MODULES):
+            yield path, relative, module, is_package
+
+
+def imported_modules(module, is_package, text):
+    """The absolute names of the modules a stub imports from, and of the
+    submodules it imports from packages."""
+
+    package = module if is_package else module.rpartition(".")[0]
+    modules = set()
+    for node in ast.walk(ast.parse(text)):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            parts = package.split(".")
+            base = ".".join(parts[:len(parts) - node.level + 1]) if node.level else ""
+            source = ".".join(part for part in (base, node.module) if part)
+            modules.add(source)
+            modules.update(f"{source}.{alias.name}" for alias in node.names)
+    return modules
+
+
+def write_package(package, package_dir, target_dir, index):
+    """Write the .pyi stubs of package_dir below target_dir and index them."""
+
+    stubs = {}
+    for path, relative, module, is_package in shipped_sources(package, package_dir):
+        with open(path, encoding="utf-8") as source:
+            text = source.read()
+        if path.endswith(".py"):
+            text = generate_stub(text, path, package)
+            relative += "i"
+        stubs[module] = (relative, is_package, text)
+
+    # Private modules are only shipped while a shipped stub imports from them
+    shipped = {module for module in stubs if not private_module(module)}
+    pending = list(shipped)
+    while pending:
+        module = pending.pop()
+        for imported in imported_modules(module, *stubs[module][1:]):
+            if imported in stubs and imported not in shipped:
+                shipped.add(imported)
+                pending.append(imported)
+
+    for module in sorted(shipped):
+        relative, is_package, text = stubs[module]
+        target = os.path.join(target_dir, relative)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "w", encoding="utf-8") as file:
+            file.write(text)
+        api_index.add_module(index, module, is_package, text)
+
+
+def engine_version(source):
+    """The Range Engine version a stub tree describes, from Range.app."""
+
+    path = os.path.join(source, "Range", "app", "__init__.py")
+    with open(path, encoding="utf-8") as file:
+        tree = ast.parse(file.read(), path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and any(
+            isinstance(target, ast.Name) and target.id == "range_version_string"
+            for target in node.targets
+        ):
+            return str(node.value.value)
+    raise ValueError(f"{path} does not define range_version_string")
+
+
+def stub_packages(source):
+    """The packages of a stub tree, without the tests of its runtime."""
+
+    return sorted(
+        name for name in os.listdir(source)
+        if name != "tests" and os.path.isfile(os.path.join(source, name, "__init__.py"))
+    )
+
+
+def version_key(version):
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+
+def build_version(source, output):
+    """Write the bundle of one stub tree to output, return its manifest entry."""
+
+    packages = stub_packages(source)
+    os.makedirs(output)
+
+    manifest = {"packages": {}}
+    index = {}
+    for package in packages:
+        package_dir = os.path.join(source, package)
+        write_package(package, package_dir, os.path.join(output, package, package), index)
+        manifest["packages"][package] = {
+            "dependencies": package_dependencies(package, package_dir, packages),
+        }
+
+    with open(os.path.join(output, "api-index.json"), "w", encoding="utf-8") as file:
+        json.dump(api_index.finish(index), file, separators=(",", ":"), sort_keys=True)
+    return manifest
+
+
+def build(sources, output):
+    versions = {}
+    for source in sources:
+        version = engine_version(source)
+        if version in versions:
+            raise ValueError(f"{source}: Range Engine {version} is built from {versions[version]} already")
+        versions[version] = source
+
+    if os.path.isdir(output):
+        shutil.rmtree(output)
+    os.makedirs(output)
+
+    manifest = {
+        # The newest release is used when a workspace does not pick one
+        "default": max(versions, key=version_key),
+        "versions": {
+            version: build_version(source, os.path.join(output, version))
+            for version, source in versions.items()
+        },
+    }
+    with open(os.path.join(output, "manifest.json"), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", action="append",
+                        help="stub tree of one engine release, can be repeated (default: src/stubs)")
+    parser.add_argument("--output", default=os.path.join(ROOT, "dist", "stubs"))
+    args = parser.parse_args(argv)
+
+    manifest = build(args.source or [os.path.join(ROOT, "src", "stubs")], args.output)
+    for version, entry in sorted(manifest["versions"].items(), key=lambda item: version_key(item[0])):
+        default = " (default)" if version == manifest["default"] else ""
+        print(f"Range Engine {version}{default}")
+        for package, dependencies in entry["packages"].items():
+            print(f"  {package}: {', '.join(dependencies['dependencies']) or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
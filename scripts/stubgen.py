@@ -0,0 +1,610 @@
+"""Turn the executable ``.py`` stubs into declaration-only ``.pyi`` stubs.
+
+The stubs under ``src/stubs`` are written as runnable modules: methods have
+placeholder bodies and ``__init__`` assigns every attribute, so a language
+server has to analyse all of that code to infer types. This module keeps only
+the declarations:
+
+- function bodies become ``...``, with a return annotation taken from the
+  existing annotation, the ``Return type:``/``:rtype:`` docstring entry or,
+  failing that, the placeholder value the body returns;
+- attributes assigned in ``__init__`` and class level assignments become
+  annotated declarations;
+- vector swizzles (``xy``, ``zyx``, ``wwzw``, ...) become typed properties,
+  read-only when an axis repeats, whether ``__init__`` assigns them or the
+  class names its axes in ``_swizzle_axes`` and gets them as descriptors;
+- imports made inside function bodies are hoisted so the annotations that
+  use them still resolve;
+- private helpers are left out: underscore members of classes, and module
+  level underscore names that no public declaration refers to, with the
+  imports from private modules only they used.
+"""
+
+import ast
+import copy
+import itertools
+import re
+
+ANY = "typing.Any"
+SWIZZLE = re.compile(r"^[xyzw]{2,4}$")
+RETURN_TYPE = re.compile(r"^\s*(?:Return type|:rtype)\s*:\s*(.*)$")
+
+# Words the docstrings use for builtin types
+TYPE_WORDS = {
+    "int": "int",
+    "integer": "int",
+    "float": "float",
+    "double": "float",
+    "bool": "bool",
+    "boolean": "bool",
+    "str": "str",
+    "string": "str",
+    "list": "list",
+    "tuple": "tuple",
+    "dict": "dict",
+    "set": "set",
+    "bytes": "bytes",
+    "None": "None",
+}
+BUILTIN_CALLS = {"str", "int", "float", "bool", "list", "dict", "tuple", "set", "bytes"}
+# Return types the protocol methods must have, whatever their body returns
+DUNDER_RETURNS = {
+    "__len__": "int",
+    "__bool__": "bool",
+    "__hash__": "int",
+    "__repr__": "str",
+    "__str__": "str",
+    "__contains__": "bool",
+    "__eq__": "bool",
+    "__ne__": "bool",
+    "__lt__": "bool",
+    "__le__": "bool",
+    "__gt__": "bool",
+    "__ge__": "bool",
+}
+
+
+class Namespace:
+    """The names an annotation in the generated stub can refer to."""
+
+    def __init__(self, tree, package=None):
+        # The top level package of the module, which docstrings name types of by their full name
+        self.package = package
+        self.classes = set()
+        # Module level functions, calls to them take their documented return type
+        self.functions = {}
+        self.modules = set()
+        self.imported = set()
+        self.imports = []
+        self.uses_typing = False
+
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                self.classes.add(node.name)
+            elif isinstance(node, ast.FunctionDef):
+                self.functions[node.name] = node
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                self.add_import(node)
+
+    def add_import(self, node):
+        # Stubs are never executed, __future__ imports mean nothing there
+        if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+            return
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    self.modules.add(alias.asname)
+                else:
+                    self.modules.add(alias.name.split(".")[0])
+        else:
+            for alias in node.names:
+                self.imported.add(alias.asname or alias.name)
+
+        # Merge repeated imports, function bodies import the same names a lot
+        for existing in self.imports:
+            if type(existing) is type(node) and getattr(existing, "module", None) == getattr(node, "module", None) \
+                    and getattr(existing, "level", None) == getattr(node, "level", None):
+                known = {(alias.name, alias.asname) for alias in existing.names}
+                existing.names.extend(
+                    ast.alias(alias.name, alias.asname)
+                    for alias in node.names
+                    if (alias.name, alias.asname) not in known
+                )
+                return
+        self.imports.append(type(node)(**{
+            field: [ast.alias(alias.name, alias.asname) for alias in node.names] if field == "names"
+            else getattr(node, field)
+            for field in node._fields
+        }))
+
+    def resolve(self, name):
+        """Return name as a usable annotation, or None when it is unknown."""
+
+        if name in TYPE_WORDS:
+            return TYPE_WORDS[name]
+        parts = name.split(".")
+        # "range.types.KX_Scene" may resolve as "types.KX_Scene" or "KX_Scene"
+        for start in range(len(parts)):
+            root, rest = parts[start], parts[start + 1:]
+            if not rest and (root in self.classes or root in self.imported):
+                return root
+            if rest and (root in self.modules or root in self.imported):
+                return ".".join(parts[start:])
+        # "mathutils.Vector" in a submodule of mathutils that does not import the name
+        if len(parts) > 1 and parts[0] == self.package:
+            self.add_import(ast.Import(names=[ast.alias(self.package)]))
+            return name
+        return None
+
+    def any(self):
+        self.uses_typing = True
+        return ANY
+
+
+def docstring_type(docstring, names):
+    """Parse the ``Return type:`` entry of a docstring into an annotation."""
+
+    if not docstring:
+        return None
+    lines = docstring.splitlines()
+    for number, line in enumerate(lines):
+        match = RETURN_TYPE.match(line)
+        if not match:
+            continue
+        phrase = match.group(1).strip()
+        if not phrase and number + 1 < len(lines):
+            phrase = lines[number + 1].strip()
+        return phrase_type(phrase, names)
+    return None
+
+
+def phrase_type(phrase, names):
+    phrase = phrase.strip().strip("'\"").strip()
+    if not phrase:
+        return None
+
+    # (Vector, Quaternion, Vector)
+    if phrase.startswith("(") and phrase.endswith(")"):
+        items = [names.resolve(item.strip()) for item in phrase[1:-1].split(",")]
+        if items and all(items):
+            return f"tuple[{', '.join(items)}]"
+        return None
+
+    if re.match(r"^\d+-tuple\b", phrase):
+        return "tuple"
+
+    # list of X, list [X], list[X]
+    match = re.match(r"^list\s*(?:of\s+([\w.]+)|\[\s*([\w.]+)\s*\])", phrase)
+    if match:
+        item = names.resolve(match.group(1) or match.group(2))
+        return f"list[{item}]" if item else "list"
+
+    match = re.match(r"^([\w.]+)\s*(.*)$", phrase)
+    if not match:
+        return None
+    head = names.resolve(match.group(1))
+    rest = match.group(2)
+    if head is None:
+        return None
+    # A or B
+    union = re.match(r"^or\s+([\w.]+)\s*$", rest)
+    if union:
+        other = names.resolve(union.group(1))
+        return f"{head} | {other}" if other else None
+    # Anything but a trailing description in brackets ("Vector((x, y, z))",
+    # "integer (one of 1, 2, 4)") makes the phrase too vague to trust
+    if rest and not rest.startswith(("(", "[", ",")):
+        return None
+    return head
+
+
+def value_type(node, names, class_name=None):
+    """Infer the annotation of a placeholder value."""
+
+    if isinstance(node, ast.Constant):
+        if node.value is None:
+            return "None"
+        if isinstance(node.value, (bool, int, float, str, bytes)):
+            return type(node.value).__name__
+        return names.any()
+    if isinstance(node, ast.Name):
+        if node.id == "self" and class_name:
+            return class_name
+        # Placeholders sometimes return the class itself instead of an instance
+        return names.resolve(node.id) or names.any()
+    if isinstance(node, ast.Attribute):
+        return names.resolve(ast.unparse(node)) or names.any()
+    if isinstance(node, ast.Call):
+        func = ast.unparse(node.func)
+        if func in BUILTIN_CALLS:
+            return func
+        if func in names.functions:
+            text = docstring_type(ast.get_docstring(names.functions[func], clean=False), names)
+            if text is not None:
+                return text
+        return names.resolve(func) or names.any()
+    if isinstance(node, ast.Subscript):
+        # __shared__["KX_GameObject"] holds a shared KX_GameObject instance
+        key = node.slice
+        if isinstance(key, ast.Constant) and isinstance(key.value, str):
+            resolved = names.resolve(key.value)
+            if resolved and resolved not in TYPE_WORDS.values():
+                return resolved
+        return names.any()
+    if isinstance(node, ast.Tuple):
+        items = [value_type(item, names, class_name) for item in node.elts]
+        return f"tuple[{', '.join(items)}]" if items else "tuple"
+    if isinstance(node, (ast.List, ast.Set)):
+        container = "list" if isinstance(node, ast.List) else "set"
+        items = {value_type(item, names, class_name) for item in node.elts}
+        return f"{container}[{items.pop()}]" if len(items) == 1 else container
+    if isinstance(node, ast.Dict):
+        keys = {value_type(key, names, class_name) for key in node.keys if key is not None}
+        values = {value_type(value, names, class_name) for value in node.values}
+        if len(keys) == 1 and len(values) == 1:
+            return f"dict[{keys.pop()}, {values.pop()}]"
+        return "dict"
+    if isinstance(node, ast.UnaryOp) and isinstance(node.operand, ast.Constant):
+        return value_type(node.operand, names, class_name)
+    return names.any()
+
+
+def attribute_type(node, names, class_name=None):
+    """Like value_type, but a None placeholder means the type is unknown."""
+
+    if isinstance(node, ast.Constant) and node.value is None:
+        return names.any()
+    return value_type(node, names, class_name)
+
+
+def annotation(text):
+    return ast.parse(text, mode="eval").body
+
+
+def ellipsis_body(docstring):
+    body = []
+    if docstring is not None:
+        body.append(ast.Expr(ast.Constant(docstring)))
+    body.append(ast.Expr(ast.Constant(...)))
+    return body
+
+
+def returned_values(function):
+    """The return statements of function, ignoring nested functions/classes."""
+
+    values = []
+    pending = list(function.body)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            continue
+        if isinstance(node, ast.Return):
+            values.append(node.value)
+        pending.extend(ast.iter_child_nodes(node))
+    return values
+
+
+def convert_function(node, names, class_name=None):
+    docstring = ast.get_docstring(node, clean=False)
+
+    # Hoist imports made in the body, the annotations may rely on them
+    for child in ast.walk(node):
+        if isinstance(child, (ast.Import, ast.ImportFrom)):
+            names.add_import(child)
+
+    returns = node.returns
+    if returns is None:
+        text = docstring_type(docstring, names) or DUNDER_RETURNS.get(node.name)
+        if text is None:
+            # Operators return NotImplemented to let the other operand try
+            values = [
+                v for v in returned_values(node)
+                if not (isinstance(v, ast.Name) and v.id == "NotImplemented")
+            ]
+            if node.name == "__init__" or not values or all(v is None for v in values):
+                text = "None"
+            else:
+                types = {value_type(v, names, class_name) for v in values if v is not None}
+                text = types.pop() if len(types) == 1 else names.any()
+        returns = annotation(text)
+
+    args = node.args
+    args.defaults = [simplify_default(d) for d in args.defaults]
+    args.kw_defaults = [d if d is None else simplify_default(d) for d in args.kw_defaults]
+
+    return type(node)(
+        name=node.name,
+        args=args,
+        body=ellipsis_body(docstring),
+        decorator_list=node.decorator_list,
+        returns=returns,
+        type_comment=None,
+        **({"type_params": []} if "type_params" in node._fields else {}),
+    )
+
+
+def simplify_default(node):
+    if isinstance(node, ast.Constant) or (
+        isinstance(node, ast.UnaryOp) and isinstance(node.operand, ast.Constant)
+    ):
+        return node
+    return ast.Constant(...)
+
+
+def swizzle_properties(name, type_name, names):
+    """The property of a swizzle, writable when no axis repeats. The setter
+    takes any sequence of floats, like the runtime does."""
+
+    getter = f"@property\ndef {name}(self) -> {type_name}: ...\n"
+    if len(set(name)) == len(name):
+        names.uses_typing = True
+        getter += f"@{name}.setter\ndef {name}(self, value: {type_name} | typing.Sequence[float]) -> None: ...\n"
+    return ast.parse(getter).body
+
+
+def axes_properties(axes, type_name, names):
+    """Properties of the single axes and of every swizzle of 2 to 4 of them."""
+
+    fields = []
+    for axis in axes:
+        fields.extend(ast.parse(
+            f"@property\ndef {axis}(self) -> float: ...\n"
+            f"@{axis}.setter\ndef {axis}(self, value: float) -> None: ...\n"
+        ).body)
+    for size in range(2, 5):
+        for name in itertools.product(axes, repeat=size):
+            fields.extend(swizzle_properties("".join(name), type_name, names))
+    return fields
+
+
+def declaration(target, type_text):
+    return ast.AnnAssign(
+        target=ast.Name(target), annotation=annotation(type_text), value=None, simple=1
+    )
+
+
+def convert_class(node, names):
+    body = []
+    declared = set()
+    docstring = ast.get_docstring(node, clean=False)
+    if docstring is not None:
+        body.append(ast.Expr(ast.Constant(docstring)))
+
+    methods = {
+        child.name for child in node.body
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+    # Axes and swizzles a class gets as descriptors, see axes_properties
+    axes_fields = []
+    statements = node.body[1:] if docstring is not None else node.body
+    for child in statements:
+        if (
+            isinstance(child, ast.Assign)
+            and [ast.unparse(target) for target in child.targets] == ["_swizzle_axes"]
+            and isinstance(child.value, ast.Constant)
+        ):
+            axes_fields = axes_properties(child.value.value, node.name, names)
+            declared.update(field.name for field in axes_fields)
+        converted = []
+        if (
+            isinstance(child, ast.Assign)
+            and len(child.targets) == 1
+            and isinstance(child.targets[0], ast.Name)
+            and isinstance(child.value, ast.Name)
+            and child.value.id in methods
+        ):
+            # "__radd__ = __add__" declares the same method again under the new name
+            converted = [
+                copy.deepcopy(item) for item in body
+                if isinstance(item, ast.FunctionDef) and item.name == child.value.id
+                and not item.decorator_list
+            ]
+            for item in converted:
+                item.name = child.targets[0].id
+        if not converted:
+            converted = convert_statement(child, names, node.name)
+        for item in converted:
+            if isinstance(item, ast.AnnAssign):
+                declared.add(item.target.id)
+        body.extend(converted)
+
+    # Attributes assigned in __init__ become declarations on the class
+    attributes = []
+    for child in node.body:
+        if isinstance(child, ast.FunctionDef) and child.name == "__init__":
+            for assign in ast.walk(child):
+                targets, value = [], None
+                if isinstance(assign, ast.Assign):
+                    targets, value = assign.targets, assign.value
+                elif isinstance(assign, ast.AnnAssign) and assign.value is not None:
+                    targets, value = [assign.target], assign.value
+                for target in targets:
+                    if (
+                        isinstance(target, ast.Attribute)
+                        and isinstance(target.value, ast.Name)
+                        and target.value.id == "self"
+                        and target.attr not in declared
+                        and target.attr not in methods
+                    ):
+                        declared.add(target.attr)
+                        if isinstance(assign, ast.AnnAssign):
+                            type_text = ast.unparse(assign.annotation)
+                        else:
+                            type_text = attribute_type(value, names, node.name)
+                        attributes.append((target.attr, type_text))
+
+    fields = list(axes_fields)
+    for attr, type_text in attributes:
+        if SWIZZLE.match(attr) and {"x", "y"} <= declared:
+            fields.extend(swizzle_properties(attr, type_text, names))
+        else:
+            fields.append(declaration(attr, type_text))
+
+    # Keep the docstring first, then the attributes, then everything else
+    insert_at = 1 if docstring is not None else 0
+    body[insert_at:insert_at] = fields
+    if not body:
+        body = [ast.Expr(ast.Constant(...))]
+
+    return ast.ClassDef(
+        name=node.name,
+        bases=node.bases,
+        keywords=node.keywords,
+        body=body,
+        decorator_list=node.decorator_list,
+        **({"type_params": []} if "type_params" in node._fields else {}),
+    )
+
+
+def convert_statement(node, names, class_name=None):
+    """Return the declarations node contributes to the stub."""
+
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return [convert_function(node, names, class_name)]
+    if isinstance(node, ast.ClassDef):
+        return [convert_class(node, names)]
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        # Collected by the namespace and emitted at the top of the module
+        return []
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return [ast.AnnAssign(target=node.target, annotation=node.annotation, value=None, simple=1)]
+    if isinstance(node, ast.Assign):
+        type_text = attribute_type(node.value, names, class_name)
+        return [
+            declaration(target.id, type_text)
+            for target in node.targets
+            if isinstance(target, ast.Name)
+        ]
+    # Attribute docstrings ('''...''' after an assignment) are kept
+    if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+        return [node]
+    return []
+
+
+def annotations(tree):
+    """Every annotation of tree: arguments, returns and annotated assignments."""
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.arg) and node.annotation is not None:
+            yield node.annotation
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.returns is not None:
+            yield node.returns
+        elif isinstance(node, ast.AnnAssign):
+            yield node.annotation
+
+
+def used_names(tree):
+    """Names referenced by code or by string annotations, which the language
+    server resolves like code. Names only mentioned in other strings (such as
+    docstrings) don't count."""
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+    for annotation in annotations(tree):
+        for node in ast.walk(annotation):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                try:
+                    expression = ast.parse(node.value.strip(), mode="eval")
+                except SyntaxError:
+                    continue
+                names.update(used_names(expression))
+    return names
+
+
+
+
+def is_private(name):
+    """Underscore names, but not the special __names__."""
+
+    return name.startswith("_") and not (name.startswith("__") and name.endswith("__"))
+
+
+def declared_name(node):
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return node.name
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return node.target.id
+    return None
+
+
+def public_declarations(body, keep=()):
+    """body without its private declarations, except the names in keep, and
+    without the attribute docstrings that followed them."""
+
+    kept, dropped = [], False
+    for node in body:
+        name = declared_name(node)
+        if name is not None and is_private(name) and name not in keep:
+            dropped = True
+            continue
+        if dropped and isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) \
+                and isinstance(node.value.value, str):
+            dropped = False
+            continue
+        dropped = False
+        kept.append(node)
+    return kept
+
+
+def drop_private(body):
+    """The public declarations of a module body, and the private ones they refer to."""
+
+    for node in body:
+        if isinstance(node, ast.ClassDef):
+            node.body = public_declarations(node.body) or [ast.Expr(ast.Constant(...))]
+    private = {name for name in map(declared_name, body) if name is not None and is_private(name)}
+    keep = set()
+    while True:
+        kept = public_declarations(body, keep)
+        referenced = used_names(ast.Module(body=kept, type_ignores=[])) & private
+        if referenced <= keep:
+            return kept
+        keep |= referenced
+
+
+def private_module(module):
+    return any(is_private(part) for part in module.split("."))
+
+
+def generate_stub(source, filename="<stub>", package=None):
+    """Return the ``.pyi`` text for the python stub module source, a module
+    of the top level package package."""
+
+    tree = ast.parse(source, filename)
+    names = Namespace(tree, package)
+
+    docstring = ast.get_docstring(tree, clean=False)
+    statements = tree.body[1:] if docstring is not None else tree.body
+    body = []
+    for node in statements:
+        body.extend(convert_statement(node, names))
+    body = drop_private(body)
+    used = used_names(ast.Module(body=body, type_ignores=[]))
+
+    header = []
+    if docstring is not None:
+        header.append(ast.Expr(ast.Constant(docstring)))
+    uses_typing = names.uses_typing and "typing" not in names.modules
+    if uses_typing:
+        header.append(ast.Import(names=[ast.alias("typing")]))
+    for node in names.imports:
+        # Private names and what private modules provide may only have served the private helpers
+        if isinstance(node, ast.ImportFrom):
+            node.names = [
+                alias for alias in node.names
+                if (alias.asname or alias.name) in used
+                or not (private_module(node.module or "") or is_private(alias.name))
+            ]
+        if node.names:
+            header.append(node)
+
+    module = ast.Module(body=header + body, type_ignores=[])
+    text = ast.unparse(ast.fix_missing_locations(module)) + "\n"
+    # Make sure the result is valid before it is written anywhere
+    ast.parse(text, filename)
+    return text
+
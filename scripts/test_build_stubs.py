@@ -0,0 +1,121 @@
+"""Tests of the stub bundle manifest.
+
+Run with: python -m unittest discover -s scripts"""
+
+import ast
+import os
+import unittest
+
+import api_index
+import build_stubs
+import stubgen
+
+SOURCE = os.path.join(build_stubs.ROOT, "src", "stubs")
+PACKAGES = build_stubs.stub_packages(SOURCE)
+
+
+def dependencies(package):
+    return build_stubs.package_dependencies(package, os.path.join(SOURCE, package), PACKAGES)
+
+
+class ManifestTest(unittest.TestCase):
+    def test_string_annotations_are_dependencies(self):
+        # bmesh.ops only mentions mathutils in annotations like List['mathutils.Vector']
+        self.assertEqual(dependencies("bmesh"), ["bpy", "mathutils"])
+
+    def test_code_references_are_dependencies(self):
+        self.assertIn("mathutils", dependencies("Range"))
+
+    def test_unused_imports_are_not_dependencies(self):
+        tree = ast.parse("import bpy\nimport mathutils\n\ndef f(v: 'mathutils.Vector') -> None:\n    '''bpy.types'''\n")
+        names = build_stubs.used_names(tree)
+        self.assertIn("mathutils", names)
+        self.assertNotIn("bpy", names)
+
+    def test_runtime_tests_are_not_a_stub_package(self):
+        self.assertNotIn("tests", PACKAGES)
+        self.assertIn("Range", PACKAGES)
+
+    def test_dependencies_are_stub_packages(self):
+        for package in PACKAGES:
+            for dependency in dependencies(package):
+                self.assertIn(dependency, PACKAGES)
+                self.assertNotEqual(dependency, package)
+
+
+class StubgenTest(unittest.TestCase):
+    def test_swizzle_setters_take_sequences(self):
+        stub = ast.parse(stubgen.generate_stub("class Vector:\n    _swizzle_axes = 'xyz'\n"))
+        setters = {
+            node.name: ast.unparse(node.args.args[1].annotation)
+            for node in ast.walk(stub)
+            if isinstance(node, ast.FunctionDef) and node.decorator_list
+            and ast.unparse(node.decorator_list[0]).endswith(".setter")
+        }
+        self.assertEqual(setters["xy"], "Vector | typing.Sequence[float]")
+        self.assertEqual(setters["x"], "float")
+        # Swizzles repeating an axis are read-only
+        self.assertNotIn("xx", setters)
+        self.assertIn("typing", {alias.name for node in stub.body if isinstance(node, ast.Import) for alias in node.names})
+
+    def test_private_helpers_are_left_out(self):
+        source = (
+            "from ._store import Store, _helper\n"
+            "class _Access:\n    pass\n"
+            "class _Unused:\n    pass\n"
+            "def _make():\n    '''Return type: _Access'''\n"
+            "def rows(m) -> _Access:\n    pass\n"
+            "class Matrix:\n"
+            "    _cache = None\n"
+            "    '''The memoized values.'''\n"
+            "    def _compose(self) -> Store:\n        pass\n"
+            "    def __len__(self):\n        return 4\n"
+        )
+        stub = ast.parse(stubgen.generate_stub(source))
+        names = [node.name for node in stub.body if isinstance(node, (ast.ClassDef, ast.FunctionDef))]
+        # _Access is kept, the public rows() returns it
+        self.assertEqual(names, ["_Access", "rows", "Matrix"])
+        self.assertEqual([node.name for node in stub.body[-1].body], ["__len__"])
+        # Only private helpers used the private module
+        self.assertFalse([node for node in stub.body if isinstance(node, ast.ImportFrom)])
+
+    def test_own_package_types_resolve(self):
+        source = "from . import _vector\n\ndef point():\n    '''Return type: mathutils.Vector'''\n    return _vector([])\n"
+        stub = stubgen.generate_stub(source, package="mathutils")
+        self.assertIn("def point() -> mathutils.Vector:", stub)
+        self.assertIn("import mathutils\n", stub)
+
+
+class ShippedTest(unittest.TestCase):
+    def test_headless_runtime_is_not_shipped(self):
+        modules = [module for _, _, module, _ in build_stubs.shipped_sources("Range", os.path.join(SOURCE, "Range"))]
+        self.assertIn("Range.types", modules)
+        self.assertEqual([module for module in modules if module.startswith("Range.headless")], [])
+
+    def test_relative_imports_are_resolved(self):
+        text = "import typing\nfrom . import arrays\nfrom ..logic import Sensor\n"
+        self.assertEqual(
+            build_stubs.imported_modules("Range.types", True, text),
+            {"typing", "Range.types", "Range.types.arrays", "Range.logic", "Range.logic.Sensor"},
+        )
+
+
+class IndexTest(unittest.TestCase):
+    def test_cached_properties_are_properties(self):
+        source = (
+            "import functools\nfrom functools import cached_property\n"
+            "class KX_Scene: ...\n"
+            "class KX_GameObject:\n"
+            "    @cached_property\n    def scene(self) -> KX_Scene: ...\n"
+            "    @functools.cached_property\n    def parent(self) -> KX_GameObject: ...\n"
+            "    def endObject(self) -> None: ...\n"
+        )
+        index = {}
+        api_index.add_module(index, "Range.types", True, source)
+        self.assertEqual(index["Range.types.KX_GameObject.scene"], {"k": "property", "t": "Range.types.KX_Scene"})
+        self.assertEqual(index["Range.types.KX_GameObject.parent"]["k"], "property")
+        self.assertEqual(index["Range.types.KX_GameObject.endObject"]["k"], "method")
+
+
+if __name__ == "__main__":
+    unittest.main()
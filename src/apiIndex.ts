@@ -0,0 +1,76 @@
+import * as fs from 'fs';
+import * as path from 'path';
+
+// A record of dist/stubs/<version>/api-index.json, see scripts/api_index.py
+export interface ApiSymbol {
+    // Kind: module, class, function, method, property or variable
+    k: string;
+    // Docstring
+    d?: string;
+    // Signature of functions and methods
+    s?: string;
+    // Qualified type of the value, or return type of a function
+    t?: string;
+    // Member names of modules and classes
+    m?: string[];
+    // Qualified base classes
+    b?: string[];
+}
+
+/**
+ * In memory view of the API index generated from the stubs at package time.
+ * Every lookup is a map access, no language server is involved.
+ */
+export class ApiIndex {
+    private readonly memberCache = new Map<string, Map<string, string>>();
+
+    private constructor(private readonly symbols: Map<string, ApiSymbol>) {}
+
+    // The index of one bundled engine version
+    static load(extensionPath: string, version: string): ApiIndex | undefined {
+        try {
+            const file = path.join(extensionPath, 'dist', 'stubs', version, 'api-index.json');
+            return ApiIndex.fromSymbols(JSON.parse(fs.readFileSync(file, 'utf8')).symbols);
+        } catch {
+            return undefined;
+        }
+    }
+
+    // An index over records already in memory, by qualified name
+    static fromSymbols(symbols: { [qualname: string]: ApiSymbol }): ApiIndex {
+        return new ApiIndex(new Map(Object.entries(symbols)));
+    }
+
+    get(qualname: string): ApiSymbol | undefined {
+        return this.symbols.get(qualname);
+    }
+
+    /**
+     * Members of a module or class, including the ones inherited from base
+     * classes, as name -> qualified name. Cached per owner.
+     */
+    members(owner: string): Map<string, string> {
+        let members = this.memberCache.get(owner);
+        if (members) {
+            return members;
+        }
+        members = new Map<string, string>();
+        // Cached before walking the bases, so cyclic bases cannot recurse forever
+        this.memberCache.set(owner, members);
+        const symbol = this.symbols.get(owner);
+        for (const base of symbol?.b ?? []) {
+            for (const [name, qualname] of this.members(base)) {
+                members.set(name, qualname);
+            }
+        }
+        for (const name of symbol?.m ?? []) {
+            members.set(name, `${owner}.${name}`);
+        }
+        return members;
+    }
+
+    // Qualified name of a member, looking through base classes
+    member(owner: string, name: string): string | undefined {
+        return this.members(owner).get(name);
+    }
+}
@@ -0,0 +1,312 @@
+import * as vscode from 'vscode';
+import { ApiIndex, ApiSymbol } from './apiIndex';
+import { LineSource } from './importScanner';
+
+// How far back from the cursor imports and assignments are looked up
+const MAX_LOOKBACK_LINES = 2000;
+// Assignments resolving through other assignments, e.g. own = cont.owner
+const MAX_DEPTH = 4;
+
+const OPENING: { [closing: string]: string } = { ')': '(', ']': '[' };
+
+interface Segment {
+    name: string;
+    called: boolean;
+    subscripted: boolean;
+}
+
+/**
+ * Return the start of the dotted expression (`a.b(c).d`) that ends right
+ * before `end`, or -1 when the text there is not such an expression.
+ */
+export function expressionStart(text: string, end: number): number {
+    let index = end;
+    while (index > 0) {
+        const char = text[index - 1];
+        if (/\w/.test(char) || char === '.') {
+            index--;
+        } else if (char in OPENING) {
+            // Skip a balanced call or subscript
+            let depth = 0;
+            let cursor = index - 1;
+            for (; cursor >= 0; cursor--) {
+                if (text[cursor] === char) {
+                    depth++;
+                } else if (text[cursor] === OPENING[char] && --depth === 0) {
+                    break;
+                }
+            }
+            if (cursor < 0) {
+                return -1;
+            }
+            index = cursor;
+        } else {
+            break;
+        }
+    }
+    return /^[A-Za-z_]/.test(text.slice(index, end)) ? index : -1;
+}
+
+function splitSegments(expression: string): Segment[] | undefined {
+    const segments: Segment[] = [];
+    let depth = 0;
+    let current = '';
+    for (const char of expression + '.') {
+        if (char === '(' || char === '[') {
+            depth++;
+        } else if (char === ')' || char === ']') {
+            depth--;
+        }
+        if (char === '.' && depth === 0) {
+            const match = /^(\w+)(.*)$/.exec(current);
+            if (!match) {
+                return undefined;
+            }
+            segments.push({
+                name: match[1],
+                called: match[2].startsWith('('),
+                subscripted: match[2].includes('['),
+            });
+            current = '';
+        } else {
+            current += char;
+        }
+    }
+    return segments;
+}
+
+function escape(name: string): string {
+    return name.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+/**
+ * Resolves python expressions in a document against the API index, using
+ * the imports and simple assignments found above the position.
+ */
+export class ExpressionResolver {
+    constructor(private readonly index: ApiIndex) {}
+
+    /**
+     * The module or class whose members apply to the value of the
+     * expression, e.g. `Range.logic.getCurrentController().owner` ->
+     * `Range.types.KX_GameObject`.
+     */
+    scopeOf(expression: string, source: LineSource, line: number, depth = 0): string | undefined {
+        const segments = splitSegments(expression);
+        if (!segments || segments.length === 0 || depth > MAX_DEPTH) {
+            return undefined;
+        }
+        const [first, ...rest] = segments;
+        let scope = this.resolveName(first, source, line, depth);
+        for (const segment of rest) {
+            if (!scope) {
+                return undefined;
+            }
+            scope = this.valueScope(this.index.member(scope, segment.name), segment);
+        }
+        return scope;
+    }
+
+    // Qualified name of the symbol an expression refers to, for hovers
+    symbolOf(expression: string, source: LineSource, line: number): string | undefined {
+        const dot = expression.lastIndexOf('.');
+        if (dot === -1) {
+            return this.lookupName(expression, source, line)?.symbol;
+        }
+        const scope = this.scopeOf(expression.slice(0, dot), source, line);
+        return scope ? this.index.member(scope, expression.slice(dot + 1)) : undefined;
+    }
+
+    private valueScope(qualname: string | undefined, segment: Segment): string | undefined {
+        const symbol = qualname ? this.index.get(qualname) : undefined;
+        if (!qualname || !symbol || segment.subscripted) {
+            return undefined;
+        }
+        switch (symbol.k) {
+            case 'module':
+                return segment.called ? undefined : qualname;
+            case 'class':
+                return qualname;
+            case 'function':
+            case 'method':
+                return segment.called ? symbol.t : undefined;
+            default:
+                return segment.called ? undefined : symbol.t;
+        }
+    }
+
+    private resolveName(segment: Segment, source: LineSource, line: number, depth: number): string | undefined {
+        const found = this.lookupName(segment.name, source, line, depth);
+        if (!found) {
+            return undefined;
+        }
+        if (found.symbol) {
+            return this.valueScope(found.symbol, segment);
+        }
+        // Values of assignments are instances already
+        return segment.called || segment.subscripted ? undefined : found.scope;
+    }
+
+    /**
+     * Find what a name is bound to above the given line: an import gives the
+     * imported symbol, an assignment the scope of its annotation or value.
+     */
+    private lookupName(name: string, source: LineSource, line: number, depth = 0): { symbol?: string; scope?: string } | undefined {
+        const escaped = escape(name);
+        const assignment = new RegExp(`^\\s*${escaped}\\s*(?::\\s*([\\w.]+)\\s*)?(?:=(?!=)\\s*(.+))?$`);
+        const fromImport = /^\s*from\s+([\w.]+)\s+import\s+\(?([^)#]+)/;
+        const plainImport = /^\s*import\s+([^#]+)/;
+
+        const first = Math.max(0, line - MAX_LOOKBACK_LINES);
+        for (let current = line - 1; current >= first; current--) {
+            const text = source.lineAt(current).text;
+            if (!text.includes(name)) {
+                continue;
+            }
+            let match = fromImport.exec(text);
+            if (match) {
+                for (const part of match[2].split(',')) {
+                    const [imported, alias] = part.trim().split(/\s+as\s+/);
+                    if ((alias ?? imported) === name) {
+                        return { symbol: `${match[1]}.${imported}` };
+                    }
+                }
+                continue;
+            }
+            match = plainImport.exec(text);
+            if (match) {
+                for (const part of match[1].split(',')) {
+                    const [imported, alias] = part.trim().split(/\s+as\s+/);
+                    if (alias === name) {
+                        return { symbol: imported };
+                    }
+                    if (!alias && imported.split('.')[0] === name) {
+                        return { symbol: name };
+                    }
+                }
+                continue;
+            }
+            match = assignment.exec(text);
+            if (match && (match[1] || match[2])) {
+                if (match[1]) {
+                    const annotated = this.scopeOf(match[1], source, current, depth + 1);
+                    return { scope: annotated };
+                }
+                const value = match[2].trim();
+                const start = expressionStart(value, value.length);
+                return { scope: start === 0 ? this.scopeOf(value, source, current, depth + 1) : undefined };
+            }
+        }
+        // Modules are usable without a visible import, e.g. in the python
+        // controller namespace
+        return this.index.get(name)?.k === 'module' ? { symbol: name } : undefined;
+    }
+}
+
+const COMPLETION_KINDS: { [kind: string]: vscode.CompletionItemKind } = {
+    module: vscode.CompletionItemKind.Module,
+    class: vscode.CompletionItemKind.Class,
+    function: vscode.CompletionItemKind.Function,
+    method: vscode.CompletionItemKind.Method,
+    property: vscode.CompletionItemKind.Property,
+    variable: vscode.CompletionItemKind.Variable,
+};
+
+class ApiCompletionItem extends vscode.CompletionItem {
+    constructor(name: string, readonly qualname: string, readonly symbol: ApiSymbol) {
+        super(name, COMPLETION_KINDS[symbol.k] ?? vscode.CompletionItemKind.Field);
+        this.detail = symbol.s ?? (symbol.t ? `: ${symbol.t}` : undefined);
+    }
+}
+
+function describe(qualname: string, symbol: ApiSymbol): vscode.MarkdownString {
+    const markdown = new vscode.MarkdownString();
+    const type = symbol.s ?? (symbol.t ? `: ${symbol.t}` : '');
+    markdown.appendCodeblock(`(${symbol.k}) ${qualname}${type}`, 'python');
+    if (symbol.d) {
+        markdown.appendText(symbol.d);
+    }
+    return markdown;
+}
+
+/**
+ * Completion and hover for the Range Engine API, answered from the API index
+ * in memory, so they work before the language server has warmed up.
+ */
+export class ApiProviders implements vscode.CompletionItemProvider<ApiCompletionItem>, vscode.HoverProvider {
+    private index: ApiIndex | null | undefined;
+    private resolver: ExpressionResolver | undefined;
+    private version: string | undefined;
+
+    constructor(private readonly extensionPath: string) {}
+
+    // Answer from the index of another bundled engine version
+    useVersion(version: string | undefined) {
+        if (version !== this.version) {
+            this.version = version;
+            this.index = undefined;
+            this.resolver = undefined;
+        }
+    }
+
+    // The index is only read once something asks for it
+    private load(): ExpressionResolver | undefined {
+        if (this.index === undefined) {
+            this.index = (this.version && ApiIndex.load(this.extensionPath, this.version)) || null;
+            this.resolver = this.index ? new ExpressionResolver(this.index) : undefined;
+        }
+        return this.resolver;
+    }
+
+    provideCompletionItems(document: vscode.TextDocument, position: vscode.Position): ApiCompletionItem[] | undefined {
+        const text = document.lineAt(position.line).text.slice(0, position.character);
+        const partial = /\w*$/.exec(text)![0];
+        const dot = text.length - partial.length - 1;
+        if (dot < 0 || text[dot] !== '.') {
+            return undefined;
+        }
+        const start = expressionStart(text, dot);
+        if (start === -1) {
+            return undefined;
+        }
+        const resolver = this.load();
+        if (!resolver || !this.index) {
+            return undefined;
+        }
+        const scope = resolver.scopeOf(text.slice(start, dot), document, position.line);
+        if (!scope) {
+            return undefined;
+        }
+
+        const items: ApiCompletionItem[] = [];
+        for (const [name, qualname] of this.index.members(scope)) {
+            const symbol = this.index.get(qualname);
+            if (symbol && (!name.startsWith('_') || partial.startsWith('_'))) {
+                items.push(new ApiCompletionItem(name, qualname, symbol));
+            }
+        }
+        return items;
+    }
+
+    // Documentation is only rendered for the item that gets focused
+    resolveCompletionItem(item: ApiCompletionItem): ApiCompletionItem {
+        item.documentation = describe(item.qualname, item.symbol);
+        return item;
+    }
+
+    provideHover(document: vscode.TextDocument, position: vscode.Position): vscode.Hover | undefined {
+        const range = document.getWordRangeAtPosition(position, /\w+/);
+        if (!range) {
+            return undefined;
+        }
+        const text = document.lineAt(position.line).text;
+        const start = expressionStart(text, range.end.character);
+        const resolver = start === -1 ? undefined : this.load();
+        if (!resolver || !this.index) {
+            return undefined;
+        }
+        const qualname = resolver.symbolOf(text.slice(start, range.end.character), document, position.line);
+        const symbol = qualname ? this.index.get(qualname) : undefined;
+        return qualname && symbol ? new vscode.Hover(describe(qualname, symbol), range) : undefined;
+    }
+}
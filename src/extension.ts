@@ -1,47 +1,155 @@
 // The module 'vscode' contains the VS Code extensibility API
 // Import the module and reference it with the alias vscode in your code below
 import * as vscode from 'vscode';
-import * as path from 'path';
+import { ApiProviders } from './apiProviders';
+import { ExtraPathsWriter } from './extraPaths';
+import { ImportDetector } from './importScanner';
+import { FALLBACK_PACKAGES, StubBundles, bundledPackages, loadStubBundles, selectVersion, stubRoots } from './stubRoots';
+import { VERSION_FILE, WorkspaceIndexer, detectEngineVersion, hasProjectMarkers } from './workspaceIndex';
+
+let writer: ExtraPathsWriter | undefined;
+// The bundled engine version whose stubs this workspace uses
+let stubVersion: string | undefined;
+// Whether stub roots were requested in this session
+let stubsSet = false;
+let providers: ApiProviders | undefined;
+// Completion and hover providers, only registered while the workspace uses Range
+let registration: vscode.Disposable | undefined;
 
 // This method is called when your extension is activated
 // Your extension is activated the very first time the command is executed
 export function activate(context: vscode.ExtensionContext) {
-	// Event to monitor when a document is opened
-    vscode.workspace.onDidOpenTextDocument((document) => {
-        handleDocument(document, context);
+    const bundles = loadStubBundles(context.extensionPath);
+    const detector = new ImportDetector();
+    const indexer = new WorkspaceIndexer(
+        context.workspaceState,
+        bundles ? bundledPackages(bundles) : FALLBACK_PACKAGES
+    );
+    writer = new ExtraPathsWriter(context.extensionPath, context.extension.id);
+    context.subscriptions.push(detector, writer);
+    providers = new ApiProviders(context.extensionPath);
+    updateProviders(indexer.usedModules());
+
+    // Pick the stub bundle for the engine version of the workspace. A
+    // previous session may already know this workspace uses Range, in that
+    // case the stubs are configured before the first completion request.
+    const selectStubs = async () => {
+        const configured = vscode.workspace.getConfiguration('rangeEngine').get<string>('engineVersion', 'auto');
+        const wanted = configured && configured !== 'auto' ? configured : await detectEngineVersion();
+        stubVersion = bundles ? selectVersion(bundles, wanted) : undefined;
+        providers?.useVersion(stubVersion);
+        updateStubs(context, bundles, indexer);
+    };
+    selectStubs();
+
+    const versionFiles = vscode.workspace.createFileSystemWatcher(`**/${VERSION_FILE}`);
+    versionFiles.onDidCreate(selectStubs);
+    versionFiles.onDidChange(selectStubs);
+    versionFiles.onDidDelete(selectStubs);
+    context.subscriptions.push(versionFiles);
+
+    // The workspace is only walked for Range projects. Other python
+    // workspaces (activated by opening a python file) rely on the documents
+    // that get opened, starting with the ones open already. Until one of
+    // them imports Range nothing else is done, the API index is not loaded.
+    if (!indexer.built) {
+        hasProjectMarkers().then((isProject) => {
+            if (isProject) {
+                indexer.ensure().then(() => updateStubs(context, bundles, indexer));
+            }
+        });
+    }
+    vscode.workspace.textDocuments.forEach((document) => {
+        handleDocument(document, detector, indexer, bundles, context);
     });
+
+	// Event to monitor when a document is opened
+    context.subscriptions.push(vscode.workspace.onDidOpenTextDocument((document) => {
+        handleDocument(document, detector, indexer, bundles, context);
+    }));
+
+    // Edits only trigger a new scan when they touch the import header
+    context.subscriptions.push(vscode.workspace.onDidChangeTextDocument((event) => {
+        handleDocument(event.document, detector, indexer, bundles, context);
+    }));
+
+    // Manual fallback for workspaces that are not detected automatically
+    context.subscriptions.push(vscode.commands.registerCommand('range-engine-api.apirun', async () => {
+        await indexer.ensure();
+        updateStubs(context, bundles, indexer);
+        const found = indexer.usedModules().has('Range');
+        vscode.window.showInformationMessage(found ?
+            'Range Engine detected! Autocomplete enabled.' :
+            'No Range Engine scripts found in this workspace.');
+    }));
+
+    context.subscriptions.push(vscode.workspace.onDidChangeConfiguration((event) => {
+        if (event.affectsConfiguration('rangeEngine.engineVersion')) {
+            selectStubs();
+        } else if (event.affectsConfiguration('rangeEngine.stubs')) {
+            updateStubs(context, bundles, indexer);
+        }
+        if (event.affectsConfiguration('rangeEngine.completion')) {
+            updateProviders(indexer.usedModules());
+        }
+    }));
+    context.subscriptions.push({ dispose: () => updateProviders(new Set()) });
+}
+
+// Completions and hovers are answered from the bundled API index, which is
+// only read on the first request, so they are registered for Range workspaces
+function updateProviders(used: Set<string>) {
+    const enabled = used.has('Range') &&
+        vscode.workspace.getConfiguration('rangeEngine').get<boolean>('completion.enabled', true);
+    if (enabled && !registration && providers) {
+        const selector: vscode.DocumentSelector = { language: 'python' };
+        registration = vscode.Disposable.from(
+            vscode.languages.registerCompletionItemProvider(selector, providers, '.'),
+            vscode.languages.registerHoverProvider(selector, providers)
+        );
+    } else if (!enabled && registration) {
+        registration.dispose();
+        registration = undefined;
+    }
+}
+
+async function handleDocument(document: vscode.TextDocument, detector: ImportDetector, indexer: WorkspaceIndexer, bundles: StubBundles | undefined, context: vscode.ExtensionContext) {
+    if (document.languageId !== 'python') {
+        return;
+    }
+    if (await indexer.record(document.uri, detector.imports(document))) {
+        updateStubs(context, bundles, indexer);
+    }
 }
 
-async function handleDocument(document: vscode.TextDocument, context: vscode.ExtensionContext) {
-    if (document.languageId === 'python' &&
-        (document.getText().includes('import Range') || document.getText().includes('from Range import'))) {
-        const stubsPath = path.join(context.extensionPath, 'src/stubs');
-        const config = vscode.workspace.getConfiguration('python');
-        const extraPaths = config.get<string[]>('analysis.extraPaths') || [];
-
-        // Only add the path if it is not already configured
-        if (!extraPaths.includes(stubsPath)) {
-            await config.update(
-                'analysis.extraPaths',
-                [...extraPaths, stubsPath],
-                vscode.ConfigurationTarget.Workspace
-            );
-            //vscode.window.showInformationMessage('Range Engine detected! Autocomplete enabled.');
+// Requests are coalesced by the writer, calling this repeatedly is cheap
+function updateStubs(context: vscode.ExtensionContext, bundles: StubBundles | undefined, indexer: WorkspaceIndexer) {
+    const used = indexer.usedModules();
+    updateProviders(used);
+    // The roots go away again when the last Range import was removed
+    if (!used.has('Range')) {
+        if (stubsSet) {
+            writer?.set([]);
+            stubsSet = false;
         }
+        return;
     }
+    // Nothing is written before the engine version is known, writing another
+    // version's roots first would make the language server analyze twice
+    if (bundles && !stubVersion) {
+        return;
+    }
+    // Either the packages listed in the settings, or the ones the workspace imports
+    const configured = vscode.workspace.getConfiguration('rangeEngine').get<string[]>('stubs.modules') ?? [];
+    const packages = configured.length > 0 ? ['Range', ...configured] : used;
+    writer?.set(stubRoots(context.extensionPath, bundles, stubVersion, packages));
+    stubsSet = true;
 }
 
 // This method is called when your extension is deactivated
 export function deactivate() {
     vscode.window.showInformationMessage('Range Engine extension deactivated.');
 
-    const stubsPath = vscode.workspace.getConfiguration('python').get<string[]>('analysis.extraPaths') || [];
-
     // Remove path from stubs if it is set
-    const updatedPaths = stubsPath.filter((path) => !path.includes('src/stubs'));
-    vscode.workspace.getConfiguration('python').update(
-        'analysis.extraPaths',
-        updatedPaths,
-        vscode.ConfigurationTarget.Workspace
-    );
+    return writer?.clear();
 }
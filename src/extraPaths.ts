@@ -0,0 +1,104 @@
+import * as path from 'path';
+import * as vscode from 'vscode';
+
+// Requests arriving within this window are merged into a single write
+const DEBOUNCE_MS = 300;
+
+function sameEntries(a: readonly string[], b: readonly string[]): boolean {
+    return a.length === b.length && a.every((entry, index) => entry === b[index]);
+}
+
+// Where the entries are read from and written to
+export interface PathsSetting {
+    get(): string[];
+    update(value: string[] | undefined): Thenable<void>;
+}
+
+// `python.analysis.extraPaths` of the workspace. Without a workspace value
+// the inherited one is extended, so user level entries are not shadowed by
+// the workspace setting.
+const workspaceSetting: PathsSetting = {
+    get() {
+        const config = vscode.workspace.getConfiguration('python');
+        return config.inspect<string[]>('analysis.extraPaths')?.workspaceValue ??
+            config.get<string[]>('analysis.extraPaths') ?? [];
+    },
+    update(value) {
+        return vscode.workspace.getConfiguration('python').update(
+            'analysis.extraPaths', value, vscode.ConfigurationTarget.Workspace
+        );
+    },
+};
+
+/**
+ * Owns the stub entries of `python.analysis.extraPaths`.
+ *
+ * Every update of that setting makes the language server rebuild its
+ * analysis, so requests are debounced, writes are serialized, and nothing is
+ * written when the effective value would not change.
+ */
+export class ExtraPathsWriter implements vscode.Disposable {
+    private desired: string[] = [];
+    private timer: NodeJS.Timeout | undefined;
+    private queue: Promise<void> = Promise.resolve();
+
+    constructor(
+        private readonly extensionPath: string,
+        private readonly extensionId: string,
+        private readonly setting: PathsSetting = workspaceSetting
+    ) {}
+
+    // Request the given stub paths, replacing any earlier request
+    set(paths: string[]) {
+        this.desired = [...paths];
+        if (this.timer) {
+            clearTimeout(this.timer);
+        }
+        this.timer = setTimeout(() => this.flush(), DEBOUNCE_MS);
+    }
+
+    // Remove every stub path this extension has written
+    clear(): Promise<void> {
+        this.desired = [];
+        return this.flush();
+    }
+
+    // Write pending changes now, after any write already in progress
+    flush(): Promise<void> {
+        if (this.timer) {
+            clearTimeout(this.timer);
+            this.timer = undefined;
+        }
+        this.queue = this.queue.then(() => this.write()).catch((error) => {
+            console.error('Range Engine: failed to update python.analysis.extraPaths', error);
+        });
+        return this.queue;
+    }
+
+    // Whether an extraPaths entry points into (any version of) this extension.
+    // Installed versions live in folders named after the extension id, so
+    // entries written by older versions are recognized too; other paths,
+    // even ones ending in src/stubs, belong to the user.
+    private owns(entry: string): boolean {
+        const relative = path.relative(this.extensionPath, entry);
+        const inside = relative === '' || (!relative.startsWith('..') && !path.isAbsolute(relative));
+        return inside || entry.toLowerCase().includes(this.extensionId.toLowerCase());
+    }
+
+    private async write() {
+        const base = this.setting.get();
+        const updated = [...base.filter((entry) => !this.owns(entry)), ...this.desired];
+
+        if (sameEntries(base, updated)) {
+            return;
+        }
+        await this.setting.update(updated.length > 0 ? updated : undefined);
+    }
+
+    dispose() {
+        if (this.timer) {
+            clearTimeout(this.timer);
+            this.timer = undefined;
+        }
+    }
+}
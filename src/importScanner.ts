@@ -0,0 +1,170 @@
+import * as vscode from 'vscode';
+
+// Upper bound on the number of lines inspected, so a pathological header
+// (a huge docstring, thousands of imports) still costs a bounded amount.
+const MAX_HEADER_LINES = 400;
+
+// Statements that may appear between imports without ending the header,
+// e.g. the `try: import x / except ImportError: pass` pattern.
+const HEADER_KEYWORDS = /^(try|else|finally|pass|except\b.*)\s*:?\s*$/;
+
+export interface HeaderScan {
+    // Document version the scan is valid for
+    version: number;
+    // Index of the first line that is not part of the import header
+    endLine: number;
+    // Top level names of every absolute import found in the header
+    modules: Set<string>;
+}
+
+// Minimal view of a document, so the scanner can run on plain strings too
+export interface LineSource {
+    readonly lineCount: number;
+    lineAt(line: number): { readonly text: string };
+}
+
+function addImportedModules(statement: string, modules: Set<string>): boolean {
+    let match = /^from\s+([\w.]+)\s+import\b/.exec(statement);
+    if (match) {
+        // Relative imports (`from . import x`) never name a top level package
+        if (!match[1].startsWith('.')) {
+            modules.add(match[1].split('.')[0]);
+        }
+        return true;
+    }
+    match = /^import\s+(.+)$/.exec(statement);
+    if (match) {
+        for (const part of match[1].split(',')) {
+            const name = part.trim().split(/\s+/)[0];
+            if (name) {
+                modules.add(name.split('.')[0]);
+            }
+        }
+        return true;
+    }
+    return false;
+}
+
+/**
+ * Scan the import header of a python document: leading comments, docstrings
+ * and import statements. Scanning stops at the first other statement, so the
+ * cost does not depend on the size of the file.
+ */
+export function scanHeader(source: LineSource): { endLine: number; modules: Set<string> } {
+    const modules = new Set<string>();
+    const lastLine = Math.min(source.lineCount, MAX_HEADER_LINES);
+    let docstring: string | undefined;
+    let statement = '';
+    let openParens = 0;
+
+    for (let line = 0; line < lastLine; line++) {
+        let text = source.lineAt(line).text.trim();
+
+        // Inside a multi-line docstring, wait for the closing quotes
+        if (docstring) {
+            if (text.includes(docstring)) {
+                docstring = undefined;
+            }
+            continue;
+        }
+
+        if (!statement) {
+            if (!text || text.startsWith('#')) {
+                continue;
+            }
+            const quotes = /^[rRuUbB]?("""|''')/.exec(text);
+            if (quotes) {
+                if (text.indexOf(quotes[1], quotes[0].length) === -1) {
+                    docstring = quotes[1];
+                }
+                continue;
+            }
+        }
+
+        // Drop trailing comments and join continuation lines
+        const hash = text.indexOf('#');
+        if (hash !== -1) {
+            text = text.slice(0, hash).trim();
+        }
+        if (text.endsWith('\\')) {
+            statement += text.slice(0, -1) + ' ';
+            continue;
+        }
+        statement += text;
+        for (const char of text) {
+            if (char === '(') {
+                openParens++;
+            } else if (char === ')') {
+                openParens--;
+            }
+        }
+        if (openParens > 0) {
+            statement += ' ';
+            continue;
+        }
+
+        const parts = statement.replace(/[()]/g, ' ').split(';');
+        statement = '';
+        openParens = 0;
+        for (const part of parts) {
+            const trimmed = part.trim();
+            if (trimmed && !HEADER_KEYWORDS.test(trimmed) && !addImportedModules(trimmed, modules)) {
+                return { endLine: line, modules };
+            }
+        }
+    }
+    return { endLine: lastLine, modules };
+}
+
+/**
+ * Caches the import header of each open python document per URI and version.
+ * Edits that land below the header keep the cached result valid, so typing
+ * in the body of a large file never triggers a new scan.
+ */
+export class ImportDetector implements vscode.Disposable {
+    private readonly cache = new Map<string, HeaderScan>();
+    private readonly disposables: vscode.Disposable[] = [];
+
+    constructor() {
+        this.disposables.push(
+            vscode.workspace.onDidChangeTextDocument((event) => this.onDidChange(event)),
+            vscode.workspace.onDidCloseTextDocument((document) => {
+                this.cache.delete(document.uri.toString());
+            })
+        );
+    }
+
+    // Return the top level modules imported by the header of the document
+    imports(document: vscode.TextDocument): Set<string> {
+        const key = document.uri.toString();
+        const cached = this.cache.get(key);
+        if (cached && cached.version === document.version) {
+            return cached.modules;
+        }
+        const { endLine, modules } = scanHeader(document);
+        this.cache.set(key, { version: document.version, endLine, modules });
+        return modules;
+    }
+
+    private onDidChange(event: vscode.TextDocumentChangeEvent) {
+        const cached = this.cache.get(event.document.uri.toString());
+        if (!cached || event.contentChanges.length === 0) {
+            return;
+        }
+        // The line that ended the header may turn into an import, so an edit
+        // on it counts as touching the header as well.
+        const touchesHeader = event.contentChanges.some(
+            (change) => change.range.start.line <= cached.endLine
+        );
+        if (touchesHeader) {
+            this.cache.delete(event.document.uri.toString());
+        } else {
+            cached.version = event.document.version;
+        }
+    }
+
+    dispose() {
+        this.disposables.forEach((disposable) => disposable.dispose());
+        this.cache.clear();
+    }
+}
@@ -0,0 +1,102 @@
+import * as fs from 'fs';
+import * as path from 'path';
+
+// The packages of one engine release and what each of them depends on
+export interface StubManifest {
+    packages: { [name: string]: { dependencies: string[] } };
+}
+
+// Written by scripts/build_stubs.py, one bundle per Range Engine release
+export interface StubBundles {
+    // Version used when a workspace does not select one, the newest
+    default: string;
+    versions: { [version: string]: StubManifest };
+}
+
+// Packages the workspace index looks for when no stub bundle was built. No
+// roots are exposed then: the src/stubs sources are not shipped.
+export const FALLBACK_PACKAGES = [
+    'Range', 'aud', 'bgl', 'blf', 'bmesh', 'bpy', 'bpy_extras', 'freestyle', 'gpu', 'idprop', 'mathutils',
+];
+
+export function loadStubBundles(extensionPath: string): StubBundles | undefined {
+    try {
+        const manifest = path.join(extensionPath, 'dist', 'stubs', 'manifest.json');
+        return JSON.parse(fs.readFileSync(manifest, 'utf8')) as StubBundles;
+    } catch (error) {
+        console.error('Range Engine: no stub bundle found, run `npm run build-stubs`', error);
+        return undefined;
+    }
+}
+
+// Every package shipped for any of the bundled versions
+export function bundledPackages(bundles: StubBundles): string[] {
+    const packages = new Set<string>();
+    for (const manifest of Object.values(bundles.versions)) {
+        Object.keys(manifest.packages).forEach((name) => packages.add(name));
+    }
+    return [...packages].sort();
+}
+
+function versionKey(version: string): number[] {
+    return (version.match(/\d+/g) ?? []).map(Number);
+}
+
+export function compareVersions(a: string, b: string): number {
+    const left = versionKey(a);
+    const right = versionKey(b);
+    for (let i = 0; i < Math.max(left.length, right.length); i++) {
+        const difference = (left[i] ?? 0) - (right[i] ?? 0);
+        if (difference !== 0) {
+            return difference;
+        }
+    }
+    return 0;
+}
+
+/**
+ * The bundled version to use for the wanted engine version: the same
+ * version, else the newest older one, else the oldest bundled one. Without
+ * a wanted version the default bundle is used.
+ */
+export function selectVersion(bundles: StubBundles, wanted: string | undefined): string {
+    const versions = Object.keys(bundles.versions).sort(compareVersions);
+    if (!wanted || versionKey(wanted).length === 0) {
+        return bundles.default;
+    }
+    const older = versions.filter((version) => compareVersions(version, wanted) <= 0);
+    return older.length > 0 ? older[older.length - 1] : versions[0];
+}
+
+/**
+ * Expand the requested packages with everything they depend on. Unknown
+ * names (imports of modules that have no stubs) are dropped.
+ */
+export function resolvePackages(manifest: StubManifest, requested: Iterable<string>): string[] {
+    const resolved = new Set<string>();
+    const pending = [...requested];
+    while (pending.length > 0) {
+        const name = pending.pop()!;
+        const entry = manifest.packages[name];
+        if (entry && !resolved.has(name)) {
+            resolved.add(name);
+            pending.push(...entry.dependencies);
+        }
+    }
+    return [...resolved].sort();
+}
+
+/**
+ * The extraPaths entries exposing the given packages of one bundled engine
+ * version. Every package has its own root, so the language server only
+ * indexes the selected ones. Without a built bundle for the version there
+ * is nothing to expose.
+ */
+export function stubRoots(extensionPath: string, bundles: StubBundles | undefined, version: string | undefined, requested: Iterable<string>): string[] {
+    if (!bundles || !version || !bundles.versions[version]) {
+        return [];
+    }
+    return resolvePackages(bundles.versions[version], requested).map(
+        (name) => path.join(extensionPath, 'dist', 'stubs', version, name)
+    );
+}
@@ -0,0 +1,235 @@
+"""Headless Range runtime, to run game logic without the engine, e.g. in CI.
+
+The placeholders of the Range modules hold no state. This package is an
+opt-in runtime with real scenes, game objects, game properties, parenting,
+transforms and a logic frame loop, so scripts can be unit tested on plain
+Python at thousands of simulated frames per second. Nothing changes for
+code that does not import it.
+
+	from Range import headless
+
+	with headless.Game() as game:
+		scene = game.addScene("Scene")
+		player = scene.createObject("Player", position=(0, 0, 1), properties={"health": 100})
+		game.addController(player, "scripts.player.main")
+		game.run(600)
+		assert player["health"] == 100
+
+While a game is active its scenes answer Range.logic (getCurrentScene,
+getCurrentController, timing functions, ...), see Range.headless.logic.
+Nothing is rendered. Ray casts hit the meshes given to objects
+(Range.headless.meshes) through the BVH of their scene (Range.headless.bvh);
+objects without a mesh have no collision shape. Near and radar sensors and
+activity culling see objects as points, found through the spatial index of
+their scene (Range.headless.spatial)."""
+
+import random
+import time
+
+from . import logic
+from .bvh import SceneBVH
+from .meshes import Mesh, Polygon, Vertex
+from .objects import Actuator, GameObject, ListValue, NearSensor, PythonController, RadarSensor, Scene, Sensor
+from .spatial import SpatialIndex
+
+__all__ = [
+	"Actuator", "Game", "GameObject", "ListValue", "Mesh", "NearSensor", "Polygon", "PythonController", "RadarSensor",
+	"Scene", "SceneBVH", "Sensor", "SpatialIndex", "Vertex",
+]
+
+
+class Game:
+	"""A headless game: its scenes and the logic frame loop.
+
+	Every logic frame evaluates, per scene, the near and radar sensors, runs
+	the python components, then the python controllers (high priority ones
+	first), then moves dynamic objects and removes ended objects. Simulation time advances by timeScale / ticRate
+	per frame, independent of the wall clock.
+
+	Parameters:
+	ticRate (float) - Logic frames per simulated second (optional).
+	seed (int) - Seed of getRandomFloat (optional)."""
+
+	def __init__(self, ticRate=60.0, seed=0):
+		self.scenes = ListValue()
+		self.ticRate = float(ticRate)
+		self.timeScale = 1.0
+		self.frame = 0
+		self.frameTime = 0.0
+		self.running = True
+		self.globalDict = {}
+		self.messages = []
+		self.random = random.Random(seed)
+		self._savedGlobalDict = {}
+		self._pendingScenes = []
+		self._controller = None
+		self._scene = None
+		self._previous = None
+		self._started = time.perf_counter()
+
+	def __enter__(self):
+		self.activate()
+		return self
+
+	def __exit__(self, *exc_info):
+		self.deactivate()
+
+	def activate(self):
+		"""Answer Range.logic from this game until deactivate() is called."""
+		if logic._game is not self:
+			self._previous = logic._game
+			logic.install(self)
+
+	def deactivate(self):
+		"""Give Range.logic back to the previously active game, or the placeholders."""
+		if logic._game is self:
+			if self._previous is not None:
+				logic.install(self._previous)
+			else:
+				logic.uninstall()
+			self._previous = None
+
+	def addScene(self, name):
+		"""Add an empty scene.
+
+		Return type: Scene"""
+		scene = Scene(self, name)
+		self.scenes.append(scene)
+		return scene
+
+	def addController(self, owner, script, sensors=(), actuators=(), name="", state=1, useHighPriority=False):
+		"""Attach a python controller to a game object.
+
+		Parameters:
+		owner (KX_GameObject) - The object owning the controller.
+		script (callable or string) - A function, "module.function" like the Module mode, or the path of a .py file like the Script mode. Functions taking an argument are passed the controller.
+		sensors (list of strings or Sensor) - Sensors linked to the controller, it runs when any of them is positive, every frame without sensors (optional).
+		actuators (list of strings or Actuator) - Actuators linked to the controller (optional).
+		state (int) - State mask, the controller runs while the owner's state matches it (optional).
+		useHighPriority (boolean) - Run before the other controllers (optional).
+
+		Return type: PythonController"""
+		controller = PythonController(owner, script, name, sensors, actuators, state, useHighPriority)
+		owner._scene._controllers.append(controller)
+		return controller
+
+	def addNearSensor(self, owner, name="Near", distance=1.0, resetDistance=None, propName=""):
+		"""Attach a near sensor to a game object, link it to controllers with addController.
+
+		Parameters:
+		owner (KX_GameObject) - The object owning the sensor.
+		name (string) - The sensor name (optional).
+		distance (float) - The distance at which the sensor becomes positive (optional).
+		resetDistance (float) - The distance at which it becomes negative again, distance when None (optional).
+		propName (string) - Only detect objects with this property, any object when empty (optional).
+
+		Return type: NearSensor"""
+		sensor = NearSensor(name, owner, distance, resetDistance, propName)
+		owner._scene._sensors.append(sensor)
+		return sensor
+
+	def addRadarSensor(self, owner, name="Radar", distance=10.0, angle=30.0, axis=1, propName=""):
+		"""Attach a radar sensor to a game object, link it to controllers with addController.
+
+		Parameters:
+		owner (KX_GameObject) - The object owning the sensor.
+		name (string) - The sensor name (optional).
+		distance (float) - The height of the cone (optional).
+		angle (float) - The opening angle of the cone, in degrees (optional).
+		axis (int) - The axis of the cone, 0 to 2 for +X, +Y and +Z, 3 to 5 for -X, -Y and -Z (optional).
+		propName (string) - Only detect objects with this property, any object when empty (optional).
+
+		Return type: RadarSensor"""
+		sensor = RadarSensor(name, owner, distance, angle, axis, propName)
+		owner._scene._sensors.append(sensor)
+		return sensor
+
+	def addComponent(self, owner, component, args=None):
+		"""Attach a python component to a game object, its start() runs on the next frame.
+
+		Parameters:
+		owner (KX_GameObject) - The object owning the component.
+		component (KX_PythonComponent subclass) - The component class.
+		args (dict) - Values overriding the defaults of the class args (optional).
+
+		Return type: KX_PythonComponent"""
+		instance = component.__new__(component)
+		instance.object = owner
+		instance.args = dict(getattr(component, "args", {}))
+		instance.args.update(args or {})
+		instance._started = False
+		owner.components.append(instance)
+		owner._scene._components.append(instance)
+		return instance
+
+	def sendMessage(self, subject, body="", to="", message_from=""):
+		"""Record a message, the messages list keeps every message sent."""
+		self.messages.append((subject, body, to, message_from))
+
+	def step(self):
+		"""Run one logic frame."""
+
+		active = logic._game is self
+		if not active:
+			self.activate()
+		try:
+			dt = self.timeScale / self.ticRate
+			self.frame += 1
+			self.frameTime += dt
+			while self._pendingScenes:
+				self.addScene(self._pendingScenes.pop(0)[0])
+			for scene in list(self.scenes):
+				if not scene.suspended and not scene._ended:
+					self._runScene(scene, dt)
+			for scene in [scene for scene in self.scenes if scene._ended]:
+				scene._removeObjects(scene.objects._items)
+				self.scenes._remove(scene)
+		finally:
+			self._scene = None
+			self._controller = None
+			if not active:
+				self.deactivate()
+
+	def _runScene(self, scene, dt):
+		self._scene = scene
+		scene._sense()
+		# Activity culling suspends the logic of objects far from the active camera
+		active = scene._activeObjects()
+		for component in list(scene._components):
+			if component.object._invalid or (active is not None and id(component.object) not in active):
+				continue
+			if not component._started:
+				component._started = True
+				component.start(component.args)
+			component.update()
+		controllers = sorted(scene._controllers, key=lambda controller: not controller.useHighPriority)
+		for controller in controllers:
+			if controller._owner._invalid or not controller._shouldRun():
+				continue
+			if active is not None and id(controller._owner) not in active:
+				continue
+			self._controller = controller
+			try:
+				controller._run()
+			finally:
+				self._controller = None
+		scene._update(dt)
+
+	def run(self, frames):
+		"""Run logic frames until frames have run or endGame() was called.
+
+		Returns: The number of frames that ran.
+
+		Return type: int"""
+		active = logic._game is self
+		if not active:
+			self.activate()
+		try:
+			count = 0
+			while count < frames and self.running:
+				self.step()
+				count += 1
+			return count
+		finally:
+			if not active:
+				self.deactivate()
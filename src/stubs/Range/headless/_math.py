@@ -0,0 +1,65 @@
+"""Matrix helpers of the headless runtime.
+
+Game objects keep their rotation as rows of floats and hand out mathutils
+types: matrices read from a game object are copies, vectors are wrapped so
+changing them in place (obj.worldPosition.z += 1) writes the change back to
+the object."""
+
+import math
+
+
+def identity(size=3):
+	return [[1.0 if row == column else 0.0 for column in range(size)] for row in range(size)]
+
+
+def cross(a, b):
+	return [a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]]
+
+
+def multiply(a, b):
+	columns = list(zip(*b))
+	return [[sum(x * y for x, y in zip(row, column)) for column in columns] for row in a]
+
+
+def transform(rows, vector):
+	return [sum(x * y for x, y in zip(row, vector)) for row in rows]
+
+
+def euler_matrix(angles):
+	"""3x3 rotation of an XYZ euler, rotating around X first."""
+
+	x, y, z = angles
+	cx, sx = math.cos(x), math.sin(x)
+	cy, sy = math.cos(y), math.sin(y)
+	cz, sz = math.cos(z), math.sin(z)
+	return [
+		[cy * cz, sx * sy * cz - cx * sz, cx * sy * cz + sx * sz],
+		[cy * sz, sx * sy * sz + cx * cz, cx * sy * sz - sx * cz],
+		[-sy, sx * cy, cx * cy],
+	]
+
+
+def quaternion_matrix(quaternion):
+	w, x, y, z = quaternion
+	length = math.sqrt(w * w + x * x + y * y + z * z)
+	w, x, y, z = w / length, x / length, y / length, z / length
+	return [
+		[1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)],
+		[2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)],
+		[2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)],
+	]
+
+
+def to_rotation(value):
+	"""A 3x3 rotation from a matrix, an euler (XYZ when a plain sequence) or a (w, x, y, z) quaternion."""
+
+	if hasattr(value, "to_matrix"):
+		value = value.to_matrix()
+	values = list(value)
+	if values and hasattr(values[0], "__len__"):
+		return [[float(element) for element in row][:3] for row in values[:3]]
+	if len(values) == 3:
+		return euler_matrix(values)
+	if len(values) == 4:
+		return quaternion_matrix(values)
+	raise ValueError("expected a 3x3 matrix, a 3D euler or a quaternion")
@@ -0,0 +1,380 @@
+"""Ray casts of the headless runtime.
+
+Rays are cast in two levels. SceneBVH is a bounding volume hierarchy over the
+world bounds of the objects of a scene that have a mesh, rebuilt when objects
+come and go and refitted, the tree kept as is and only its boxes recomputed,
+before the first ray after objects of the tree moved. Objects without a mesh
+move freely, they never cause a refit. The leaves it reaches hand the ray,
+moved into mesh space, to the BVH tree of the mesh (mathutils.bvhtree),
+which meshes share between the objects using them."""
+
+import math
+
+from mathutils import Vector
+from mathutils.arrays import numpy
+from mathutils.bvhtree import _HUGE, _slab
+
+from .meshes import Mesh
+
+# Leaves hold this many objects or less
+_LEAF_SIZE = 2
+_MISS = (None, None, None, None, None)
+
+
+def _merge(boxes, box):
+	for axis in range(3):
+		if box[axis] < boxes[axis]:
+			boxes[axis] = box[axis]
+		if box[axis + 3] > boxes[axis + 3]:
+			boxes[axis + 3] = box[axis + 3]
+
+
+def _barycentric(a, b, c, p):
+	"""Weights of b and c for the point p of the plane of the triangle a b c."""
+
+	e1 = [b[axis] - a[axis] for axis in range(3)]
+	e2 = [c[axis] - a[axis] for axis in range(3)]
+	d = [p[axis] - a[axis] for axis in range(3)]
+	d11, d12, d22 = (sum(x * y for x, y in zip(u, v)) for u, v in ((e1, e1), (e1, e2), (e2, e2)))
+	d1, d2 = sum(x * y for x, y in zip(d, e1)), sum(x * y for x, y in zip(d, e2))
+	determinant = d11 * d22 - d12 * d12
+	if not determinant:
+		return 0.0, 0.0
+	return (d22 * d1 - d12 * d2) / determinant, (d11 * d2 - d12 * d1) / determinant
+
+
+def _uv(polygon, point):
+	"""UV coordinates of a point of a polygon, interpolated over the triangle of the polygon holding it.
+
+	Return type: Vector"""
+
+	mesh, material = polygon._mesh, polygon.material_id
+	vertices = [mesh.getVertex(material, index) for index in polygon._vertices]
+	best = None
+	for corner in range(1, len(vertices) - 1):
+		triangle = (vertices[0], vertices[corner], vertices[corner + 1])
+		u, v = _barycentric(*(vertex._position for vertex in triangle), point)
+		# The triangle the point is the least outside of
+		outside = max(0.0, -u, -v, u + v - 1.0)
+		if best is None or outside < best[0]:
+			best = (outside, triangle, u, v)
+	_, triangle, u, v = best
+	w = 1.0 - u - v
+	return Vector([w * a + u * b + v * c for a, b, c in zip(triangle[0].UV, triangle[1].UV, triangle[2].UV)])
+
+
+class SceneBVH:
+	"""The ray caster of a headless scene, over its objects with a mesh.
+
+	Objects are hit through their first mesh, the physics mesh of the engine.
+
+	Parameters:
+	transforms (TransformStore) - The transform store of the scene."""
+
+	def __init__(self, transforms):
+		self._transforms = transforms
+		# Slot: object, for the objects with a mesh
+		self._members = {}
+		# Objects in leaf order
+		self._objects = []
+		# min x, y, z, max x, y, z of every node, the root first
+		self._boxes = []
+		# Leaves: first object and count, other nodes: first of two children and 0
+		self._first = []
+		self._count = []
+		self._built = False
+		# Mesh edits the boxes were computed for
+		self._edits = None
+		self.builds = 0
+		self.refits = 0
+		self.rays = 0
+		self.nodesVisited = 0
+		self.meshTests = 0
+		# Start tracking the moves, the tree is built from scratch on the first ray
+		transforms.takeMoved(self)
+
+	def __len__(self):
+		return len(self._members)
+
+	def _add(self, obj):
+		if obj._hasMeshes():
+			self._members[obj._slot] = obj
+			self._built = False
+
+	def _remove(self, obj):
+		if self._members.pop(obj._slot, None) is not None:
+			self._built = False
+
+	def _objectBoxes(self, objects):
+		"""The world bounds of the meshes of objects, 6 floats each.
+
+		Return type: list"""
+
+		store = self._transforms
+		local = [obj.meshes[0]._box() for obj in objects]
+		if numpy is not None and objects:
+			slots = numpy.array([obj._slot for obj in objects], numpy.intp)
+			bounds = numpy.array(local)
+			center = (bounds[:, :3] + bounds[:, 3:]) * 0.5
+			half = (bounds[:, 3:] - bounds[:, :3]) * 0.5
+			matrices = store.worldOrientations.reshape(-1, 3, 3)[slots] * store.worldScales.reshape(-1, 3)[slots][:, None, :]
+			center = store.worldPositions.reshape(-1, 3)[slots] + numpy.einsum("nij,nj->ni", matrices, center)
+			half = numpy.einsum("nij,nj->ni", numpy.abs(matrices), half)
+			return numpy.concatenate((center - half, center + half), axis=1).tolist()
+		boxes = []
+		for obj, box in zip(objects, local):
+			position, rotation, scale = store.world(obj._slot)
+			center = [(box[axis] + box[axis + 3]) * 0.5 for axis in range(3)]
+			half = [(box[axis + 3] - box[axis]) * 0.5 for axis in range(3)]
+			rows = [[rotation[row * 3 + column] * scale[column] for column in range(3)] for row in range(3)]
+			middle = [position[row] + sum(rows[row][column] * center[column] for column in range(3)) for row in range(3)]
+			extent = [sum(abs(rows[row][column]) * half[column] for column in range(3)) for row in range(3)]
+			boxes.append([m - e for m, e in zip(middle, extent)] + [m + e for m, e in zip(middle, extent)])
+		return boxes
+
+	def _build(self):
+		"""Split the objects at the median of their centers along the widest axis, down to small leaves."""
+
+		objects = list(self._members.values())
+		boxes = self._objectBoxes(objects)
+		order = list(range(len(objects)))
+		first, counts = [], []
+		stack = [(0, 0, len(order))] if order else []
+		if order:
+			first.append(0)
+			counts.append(len(order))
+		while stack:
+			current, lo, hi = stack.pop()
+			if hi - lo <= _LEAF_SIZE:
+				continue
+			part = order[lo:hi]
+			centers = [[boxes[item][axis] + boxes[item][axis + 3] for axis in range(3)] for item in part]
+			extent = [max(center[axis] for center in centers) - min(center[axis] for center in centers) for axis in range(3)]
+			axis = extent.index(max(extent))
+			part = [item for _, item in sorted(zip((center[axis] for center in centers), part))]
+			order[lo:hi] = part
+			middle = (lo + hi) // 2
+			first[current], counts[current] = len(counts), 0
+			for start, end in ((lo, middle), (middle, hi)):
+				first.append(start)
+				counts.append(end - start)
+			stack.append((first[current], lo, middle))
+			stack.append((first[current] + 1, middle, hi))
+		self._objects = [objects[item] for item in order]
+		self._first, self._count = first, counts
+		self._built = True
+		self.builds += 1
+		self._refit([boxes[item] for item in order])
+
+	def _refit(self, boxes=None):
+		"""Recompute the node boxes from the object bounds, children before parents."""
+
+		if boxes is None:
+			boxes = self._objectBoxes(self._objects)
+			self.refits += 1
+		first, counts = self._first, self._count
+		nodes = [None] * len(counts)
+		# Children come after their parent in the node lists
+		for node in range(len(counts) - 1, -1, -1):
+			if counts[node]:
+				box = list(boxes[first[node]])
+				for item in range(first[node] + 1, first[node] + counts[node]):
+					_merge(box, boxes[item])
+			else:
+				box = list(nodes[first[node]])
+				_merge(box, nodes[first[node] + 1])
+			nodes[node] = box
+		self._boxes = [value for box in nodes for value in box]
+		self._edits = Mesh._edits
+
+	def _update(self):
+		moved = self._transforms.takeMoved(self)
+		if not self._built:
+			self._build()
+		elif self._edits != Mesh._edits or not self._members.keys().isdisjoint(moved):
+			self._refit()
+
+	def _meshHit(self, obj, origin, direction, limit):
+		"""(distance, local location, local normal, polygon index) of the hit of a ray with the mesh of obj, None when it misses.
+
+		Return type: tuple"""
+
+		position, rotation, scale = self._transforms.world(obj._slot)
+		if not all(scale):
+			return None
+		offset = [o - p for o, p in zip(origin, position)]
+		# Into mesh space: the inverse rotation is the transpose, then the inverse scale
+		start = [sum(rotation[row * 3 + column] * offset[row] for row in range(3)) / scale[column] for column in range(3)]
+		way = [sum(rotation[row * 3 + column] * direction[row] for row in range(3)) / scale[column] for column in range(3)]
+		length = math.sqrt(sum(value * value for value in way))
+		if not length:
+			return None
+		self.meshTests += 1
+		location, normal, index, distance = obj.meshes[0]._bvh().ray_cast(start, [value / length for value in way], limit * length)
+		if index is None:
+			return None
+		return distance / length, location, normal, index
+
+	def _cast(self, origin, direction, limit, prop, xray, mask, ignore):
+		"""The nearest hit of a ray with a unit direction, as (distance, object, local location, local normal, polygon index), None when it misses.
+
+		Return type: tuple"""
+
+		self.rays += 1
+		boxes, first, counts, objects = self._boxes, self._first, self._count, self._objects
+		if not counts:
+			return None
+		ox, oy, oz = origin
+		dx, dy, dz = direction
+		ix = 1.0 / dx if dx else _HUGE
+		iy = 1.0 / dy if dy else _HUGE
+		iz = 1.0 / dz if dz else _HUGE
+		best, found = limit, None
+		entry = _slab(boxes, 0, ox, oy, oz, ix, iy, iz, best)
+		stack = [(entry, 0)] if entry is not None else []
+		while stack:
+			entry, node = stack.pop()
+			if entry > best:
+				continue
+			self.nodesVisited += 1
+			count = counts[node]
+			if count:
+				for obj in objects[first[node]:first[node] + count]:
+					if obj is ignore or obj._invalid or not obj.collisionGroup & mask:
+						continue
+					# An xray passes through the objects without the property
+					if xray and prop and prop not in obj._properties:
+						continue
+					hit = self._meshHit(obj, origin, direction, best)
+					if hit is not None and hit[0] < best:
+						best, found = hit[0], (obj,) + hit
+				continue
+			left = first[node]
+			near = _slab(boxes, left, ox, oy, oz, ix, iy, iz, best)
+			far = _slab(boxes, left + 1, ox, oy, oz, ix, iy, iz, best)
+			if near is not None and far is not None and far < near:
+				near, far, order = far, near, (left, left + 1)
+			else:
+				order = (left + 1, left)
+			# The nearer child is visited first, so it is pushed last
+			for value, child in zip((far, near), order):
+				if value is not None:
+					stack.append((value, child))
+		if found is None:
+			return None
+		obj, distance, location, normal, index = found
+		# Without xray the first object hit must have the property
+		if prop and prop not in obj._properties:
+			return None
+		return distance, obj, location, normal, index
+
+	def _result(self, origin, direction, hit, face, uv):
+		"""(object, point, normal, polygon, uv) of a hit in world space.
+
+		Return type: tuple"""
+
+		distance, obj, location, normal, index = hit
+		_, rotation, scale = self._transforms.world(obj._slot)
+		# Normals transform by the inverse transpose: the rotation and the inverse scale
+		local = [normal[axis] / scale[axis] for axis in range(3)]
+		normal = [sum(rotation[row * 3 + column] * local[column] for column in range(3)) for row in range(3)]
+		length = math.sqrt(sum(value * value for value in normal)) or 1.0
+		normal = [value / length for value in normal]
+		if not face and sum(n * d for n, d in zip(normal, direction)) > 0.0:
+			# Oriented towards the origin of the ray
+			normal = [-value for value in normal]
+		polygon = obj.meshes[0].getPolygon(index)
+		return (
+			obj,
+			Vector([o + d * distance for o, d in zip(origin, direction)]),
+			Vector(normal),
+			polygon,
+			_uv(polygon, list(location)) if uv else None,
+		)
+
+	@staticmethod
+	def _ray(origin, target, dist):
+		"""Unit direction and length of a ray from origin towards target, None for a zero length ray.
+
+		Return type: tuple"""
+
+		direction = [t - o for o, t in zip(origin, target)]
+		length = math.sqrt(sum(value * value for value in direction))
+		if not length:
+			return None
+		direction = [value / length for value in direction]
+		if dist < 0.0:
+			# A negative distance looks behind
+			return [-value for value in direction], -dist
+		return direction, float(dist) if dist else length
+
+	def rayCast(self, origin, target, dist=0.0, prop="", face=False, xray=False, mask=0xFFFF, ignore=None, uv=False):
+		"""Cast a ray from origin towards target, like KX_GameObject.rayCast.
+
+		Parameters:
+		origin (3D vector) - The start of the ray.
+		target (3D vector) - The point the ray goes towards.
+		dist (float) - The length of the ray, negative to look behind, 0 to stop at target (optional).
+		prop (string) - Only objects with this property are hit (optional).
+		face (boolean) - Return the face normal rather than the normal facing the ray origin (optional).
+		xray (boolean) - Pass through the objects without prop, else the first object hit must have it (optional).
+		mask (int) - Only objects whose collisionGroup shares a bit with mask are hit (optional).
+		ignore (KX_GameObject) - An object the ray passes through, the caster (optional).
+		uv (boolean) - Interpolate the UV coordinates of the hit point (optional).
+
+		Returns: (object, point, normal, polygon, uv) or 5 None when the ray hits nothing.
+
+		Return type: tuple"""
+
+		origin = [float(value) for value in origin][:3]
+		ray = self._ray(origin, [float(value) for value in target][:3], dist)
+		if ray is None:
+			return _MISS
+		self._update()
+		hit = self._cast(origin, ray[0], ray[1], prop, xray, mask, ignore)
+		return self._result(origin, ray[0], hit, face, uv) if hit is not None else _MISS
+
+	def rayCastMany(self, origins, targets, dist=0.0, prop="", face=False, xray=False, mask=0xFFFF, ignore=None):
+		"""Cast many rays at once, the tree is brought up to date once for all of them.
+
+		Parameters:
+		origins (sequence of 3D vectors) - The start of every ray.
+		targets (sequence of 3D vectors) - The point every ray goes towards.
+		dist (float) - The length of the rays, negative to look behind, 0 to stop at their target (optional).
+		prop (string) - Only objects with this property are hit (optional).
+		face (boolean) - Return the face normals rather than the normals facing the ray origins (optional).
+		xray (boolean) - Pass through the objects without prop, else the first object hit must have it (optional).
+		mask (int) - Only objects whose collisionGroup shares a bit with mask are hit (optional).
+		ignore (KX_GameObject) - An object the rays pass through, the caster (optional).
+
+		Returns: One (object, point, normal, polygon) tuple per ray, 4 None for the rays which hit nothing.
+
+		Return type: list"""
+
+		if len(origins) != len(targets):
+			raise ValueError("SceneBVH.rayCastMany(origins, targets): expected as many origins as targets")
+		self._update()
+		results = []
+		for origin, target in zip(origins, targets):
+			origin = [float(value) for value in origin][:3]
+			ray = self._ray(origin, [float(value) for value in target][:3], dist)
+			hit = self._cast(origin, ray[0], ray[1], prop, xray, mask, ignore) if ray is not None else None
+			results.append(self._result(origin, ray[0], hit, face, False)[:4] if hit is not None else _MISS[:4])
+		return results
+
+	def stats(self):
+		"""Return the size of the tree and the ray counters.
+
+		Returns: objects, nodes, builds, refits, rays, nodesVisited (top level nodes reached by the rays) and meshTests (rays handed to the tree of a mesh).
+
+		Return type: dict"""
+
+		return {
+			"objects": len(self._members),
+			"nodes": len(self._count),
+			"builds": self.builds,
+			"refits": self.refits,
+			"rays": self.rays,
+			"nodesVisited": self.nodesVisited,
+			"meshTests": self.meshTests,
+		}
@@ -0,0 +1,192 @@
+"""Range.logic functions answered by the active headless game.
+
+Game.activate() puts these functions in place of the placeholders in
+Range.logic, Game.deactivate() puts the placeholders back. Scripts calling
+range functions through the module (Range.logic.getCurrentScene()) see the
+headless game; names imported with "from Range.logic import ..." before the
+game was activated keep pointing at the placeholders."""
+
+import time
+
+from .. import logic
+
+# The game whose functions are installed, see Game.activate
+_game = None
+_placeholders = {}
+
+
+def getCurrentController():
+	"""Gets the Python controller whose script is running.
+
+	Return type:
+	range.types.SCA_PythonController"""
+	if _game._controller is None:
+		raise SystemError("range.logic.getCurrentController(), this function is being run outside the python controllers context, or blenders internal state is corrupt.")
+	return _game._controller
+
+
+def getCurrentScene():
+	"""Gets the scene whose logic is running, else the first scene.
+
+	Return type:
+	range.types.KX_Scene"""
+	if _game._scene is not None:
+		return _game._scene
+	return _game.scenes[0] if _game.scenes else None
+
+
+def getSceneList():
+	"""Gets a list of the scenes of the game.
+
+	Return type:
+	list of range.types.KX_Scene"""
+	return list(_game.scenes)
+
+
+def addScene(name, overlay=1):
+	"""Queues a new, empty scene, it is added on the next logic frame."""
+	_game._pendingScenes.append((name, overlay))
+
+
+def endGame():
+	"""Ends the current game, run() stops after the current logic frame."""
+	_game.running = False
+
+
+def restartGame():
+	"""Ends the current game, the headless runtime cannot reload it."""
+	_game.running = False
+
+
+def sendMessage(subject, body="", to="", message_from=""):
+	"""Sends a message, recorded in the messages of the headless game."""
+	_game.sendMessage(subject, body, to, message_from)
+
+
+def setGravity(gravity):
+	"""Sets the gravity of every scene."""
+	for scene in _game.scenes:
+		scene.gravity = type(scene.gravity)(gravity)
+
+
+def loadGlobalDict():
+	"""Restores globalDict from the last saveGlobalDict() of this game."""
+	logic.globalDict.clear()
+	logic.globalDict.update(_game._savedGlobalDict)
+
+
+def saveGlobalDict():
+	"""Keeps a copy of globalDict in memory."""
+	_game._savedGlobalDict = dict(logic.globalDict)
+
+
+def getLogicTicRate():
+	"""Gets the logic update frequency in Hz.
+
+	Return type:
+	float"""
+	return _game.ticRate
+
+
+def setLogicTicRate(ticrate):
+	"""Sets the logic update frequency in Hz."""
+	_game.ticRate = float(ticrate)
+
+
+def getPhysicsTicRate():
+	"""Gets the physics update frequency, the logic one in the headless runtime.
+
+	Return type:
+	float"""
+	return _game.ticRate
+
+
+def setPhysicsTicRate(ticrate):
+	"""Sets the physics update frequency, the logic one in the headless runtime."""
+	_game.ticRate = float(ticrate)
+
+
+def getClockTime():
+	"""Simulation time of the next logic frame, in seconds.
+
+	Return type:
+	double"""
+	return _game.frameTime + _game.timeScale / _game.ticRate
+
+
+def getFrameTime():
+	"""Simulation time of the current logic frame, in seconds.
+
+	Return type:
+	double"""
+	return _game.frameTime
+
+
+def getRealTime():
+	"""Get the number of real (system-clock) seconds elapsed since the game was created."""
+	return time.perf_counter() - _game._started
+
+
+def getTimeScale():
+	"""Get the time multiplier between real-time and simulation time.
+
+	Return type:
+	double"""
+	return _game.timeScale
+
+
+def setTimeScale(time_scale):
+	"""Set the time multiplier between real-time and simulation time."""
+	_game.timeScale = float(time_scale)
+
+
+def deltaTime():
+	"""The interval in seconds from the last frame to the current one.
+
+	Return type:
+	float"""
+	return _game.timeScale / _game.ticRate
+
+
+def getAverageFrameRate():
+	"""The logic tic rate, frames are not rendered.
+
+	Return type:
+	float"""
+	return _game.ticRate
+
+
+def getRandomFloat():
+	"""Returns a random floating point value in the range [0 - 1), from the seeded generator of the game."""
+	return _game.random.random()
+
+
+FUNCTIONS = (
+	getCurrentController, getCurrentScene, getSceneList, addScene, endGame, restartGame,
+	sendMessage, setGravity, loadGlobalDict, saveGlobalDict, getLogicTicRate, setLogicTicRate,
+	getPhysicsTicRate, setPhysicsTicRate, getClockTime, getFrameTime, getRealTime, getTimeScale,
+	setTimeScale, deltaTime, getAverageFrameRate, getRandomFloat,
+)
+
+
+def install(game):
+	"""Answer Range.logic from game."""
+
+	global _game
+	if _game is None:
+		for function in FUNCTIONS:
+			_placeholders[function.__name__] = getattr(logic, function.__name__)
+			setattr(logic, function.__name__, function)
+		_placeholders["globalDict"] = logic.globalDict
+	_game = game
+	logic.globalDict = game.globalDict
+
+
+def uninstall():
+	"""Put the placeholders back into Range.logic."""
+
+	global _game
+	for name, value in _placeholders.items():
+		setattr(logic, name, value)
+	_placeholders.clear()
+	_game = None
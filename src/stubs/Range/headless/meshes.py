@@ -0,0 +1,247 @@
+"""Meshes of the headless runtime.
+
+Like the engine, a mesh keeps one vertex array per material: a vertex used by
+polygons of two materials is two vertices. Polygons index the vertex array
+of their material. The BVH tree of a mesh, built from this data for ray
+casts, is kept until a vertex moves."""
+
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+from .. import types
+
+
+class Vertex(types.KX_VertexProxy):
+	"""A vertex of a headless mesh, a position, UV coordinates, a normal and a color."""
+
+	def __init__(self, mesh, position, uv=(0.0, 0.0), normal=(0.0, 0.0, 1.0), color=(1.0, 1.0, 1.0, 1.0)):
+		self._mesh = mesh
+		self._position = [float(value) for value in position]
+		self.UV = Vector(uv)
+		self.normal = Vector(normal)
+		self.color = Vector(color)
+
+	@property
+	def XYZ(self):
+		"""The position of this vertex, setting its components moves the vertex.
+
+		Return type: Vector"""
+		return Vector._wrap(self._position, self, self.setXYZ)
+
+	@XYZ.setter
+	def XYZ(self, value):
+		self.setXYZ(value)
+
+	x = property(lambda self: self._position[0], lambda self, value: self.setXYZ((value, self._position[1], self._position[2])))
+	y = property(lambda self: self._position[1], lambda self, value: self.setXYZ((self._position[0], value, self._position[2])))
+	z = property(lambda self: self._position[2], lambda self, value: self.setXYZ((self._position[0], self._position[1], value)))
+
+	def getXYZ(self):
+		"""Gets the position of this vertex.
+
+		Return type: Vector((x, y, z))"""
+		return Vector(self._position)
+
+	def setXYZ(self, pos):
+		"""Sets the position of this vertex, the BVH tree of the mesh is built again on the next ray cast."""
+		self._position = [float(value) for value in pos][:3]
+		self._mesh._edited()
+
+	def getUV(self):
+		"""Gets the UV (texture) coordinates of this vertex.
+
+		Return type: Vector((u, v))"""
+		return Vector(self.UV)
+
+	def setUV(self, uv):
+		"""Sets the UV (texture) coordinates of this vertex."""
+		self.UV = Vector(uv)
+
+	def getNormal(self):
+		"""Gets the normal vector of this vertex.
+
+		Return type: Vector((nx, ny, nz))"""
+		return Vector(self.normal)
+
+	def setNormal(self, normal):
+		"""Sets the normal vector of this vertex."""
+		self.normal = Vector(normal)
+
+
+class Polygon(types.KX_PolyProxy):
+	"""A polygon of a headless mesh, indexing the vertex array of its material."""
+
+	def __init__(self, mesh, index, material, vertices):
+		self._mesh = mesh
+		self._index = index
+		self._vertices = vertices
+		self.material_id = material
+		self.material_name = mesh._materials[material]
+		self.material = None
+		self.texture_name = ""
+		corners = list(vertices) + [0] * (4 - len(vertices))
+		self.v1, self.v2, self.v3, self.v4 = corners[:4]
+		self.visible = True
+		self.collide = True
+
+	def __repr__(self):
+		return "%s[%d]" % (self._mesh.name, self._index)
+
+	def getMaterialName(self):
+		"""Returns the polygon material name with MA prefix.
+
+		Return type: string"""
+		return "MA" + self.material_name
+
+	def getTextureName(self):
+		"""Return type: string"""
+		return self.texture_name
+
+	def getMaterialIndex(self):
+		"""Returns the material bucket index of the polygon.
+
+		Return type: integer"""
+		return self.material_id
+
+	def getNumVertex(self):
+		"""Returns the number of vertex of the polygon.
+
+		Return type: integer"""
+		return len(self._vertices)
+
+	def isVisible(self):
+		"""Return type: boolean"""
+		return self.visible
+
+	def isCollider(self):
+		"""Return type: boolean"""
+		return self.collide
+
+	def getVertexIndex(self, vertex):
+		"""Returns the mesh vertex index of a polygon vertex, in the vertex array of the polygon material.
+
+		Return type: integer"""
+		return self._vertices[vertex]
+
+	def getMesh(self):
+		"""Return type: Mesh"""
+		return self._mesh
+
+
+class Mesh(types.KX_MeshProxy):
+	"""A mesh for the objects of a headless scene, shared by every object using it.
+
+	Parameters:
+	name (string) - The mesh name.
+	vertices (sequence of 3D vectors) - The vertex positions.
+	polygons (sequence of sequences of ints) - The vertex indices of every polygon, 3 or 4 of them.
+	materials (sequence of strings) - The material names (optional).
+	polygonMaterials (sequence of ints) - The material of every polygon, the first material when omitted (optional).
+	uvs (sequence of 2D vectors) - The UV coordinates of every vertex (optional)."""
+
+	# Counts the vertex edits of all the meshes, for the scene trees over their bounds
+	_edits = 0
+
+	def __init__(self, name, vertices, polygons, materials=("Material",), polygonMaterials=None, uvs=None):
+		self.name = name
+		self._materials = list(materials)
+		vertices = [[float(value) for value in vertex] for vertex in vertices]
+		arrays = [[] for _ in self._materials]
+		slots = {}
+		self._polygons = []
+		for index, corners in enumerate(polygons):
+			material = polygonMaterials[index] if polygonMaterials is not None else 0
+			if not 3 <= len(corners) <= 4:
+				raise ValueError("Mesh(): polygon %d has %d vertices, expected 3 or 4" % (index, len(corners)))
+			local = []
+			for corner in corners:
+				key = (material, corner)
+				slot = slots.get(key)
+				if slot is None:
+					slot = slots[key] = len(arrays[material])
+					uv = uvs[corner] if uvs is not None else (0.0, 0.0)
+					arrays[material].append(Vertex(self, vertices[corner], uv))
+				local.append(slot)
+			self._polygons.append(Polygon(self, index, material, local))
+		self._arrays = arrays
+		self._tree = None
+		self._bounds = None
+
+	def __repr__(self):
+		return self.name
+
+	def _edited(self):
+		self._tree = None
+		self._bounds = None
+		Mesh._edits += 1
+
+	@property
+	def materials(self):
+		return list(self._materials)
+
+	@property
+	def numMaterials(self):
+		return len(self._materials)
+
+	@property
+	def numPolygons(self):
+		return len(self._polygons)
+
+	def getMaterialName(self, matid):
+		"""Gets the name of the specified material.
+
+		Return type: string"""
+		return "MA" + self._materials[matid]
+
+	def getTextureName(self, matid):
+		"""Return type: string"""
+		return ""
+
+	def getVertexArrayLength(self, matid):
+		"""Gets the length of the vertex array associated with the specified material.
+
+		Return type: integer"""
+		return len(self._arrays[matid])
+
+	def getVertex(self, matid, index):
+		"""Gets the specified vertex from the mesh object.
+
+		Return type: Vertex"""
+		return self._arrays[matid][index]
+
+	def getPolygon(self, index):
+		"""Gets the specified polygon from the mesh.
+
+		Return type: Polygon"""
+		return self._polygons[index]
+
+	def transform(self, matid, matrix):
+		"""Transforms the vertices of a mesh, of every material when matid is -1."""
+		for material, array in enumerate(self._arrays):
+			if matid in (-1, material):
+				for vertex in array:
+					vertex._position = list(matrix @ Vector(vertex._position))[:3]
+		self._edited()
+
+	def _bvh(self):
+		"""The BVH tree of the polygons, in mesh space, built on first use.
+
+		Return type: BVHTree"""
+
+		if self._tree is None:
+			self._tree = BVHTree.FromMeshProxy(self)
+		return self._tree
+
+	def _box(self):
+		"""The bounds of the vertices in mesh space: min x, y, z, max x, y, z.
+
+		Return type: list"""
+
+		if self._bounds is None:
+			points = [vertex._position for array in self._arrays for vertex in array]
+			if not points:
+				self._bounds = [0.0] * 6
+			else:
+				self._bounds = [min(point[axis] for point in points) for axis in range(3)] + [
+					max(point[axis] for point in points) for axis in range(3)]
+		return self._bounds
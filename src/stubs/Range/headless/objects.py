@@ -0,0 +1,920 @@
+"""Scene graph of the headless runtime.
+
+The classes derive from their Range.types counterparts, so isinstance checks
+in game logic keep working, and implement the state the placeholders only
+describe: object lists, game properties, parenting, transforms, velocities
+and ray casts against the meshes of the objects."""
+
+import importlib
+import inspect
+import math
+from functools import cached_property
+
+from mathutils import Vector
+
+from .. import types
+from ._math import cross, euler_matrix, multiply, to_rotation, transform
+from .bvh import SceneBVH
+from .spatial import SpatialIndex
+
+
+def _transposed(rows):
+	return [list(column) for column in zip(*rows)]
+
+
+def _point(value):
+	"""World position of a game object or a 3D point."""
+
+	if isinstance(value, GameObject):
+		return value._world()[0]
+	return [float(component) for component in value][:3]
+
+
+class ListValue(types.CListValue):
+	"""CListValue of runtime values, indexed by position, by name or by id."""
+
+
+class GameObject(types.KX_GameObject):
+	"""A game object of a headless scene.
+
+	Transforms are stored relative to the parent (local) in the transform
+	store of the scene, which composes the world ones. Dynamic objects integrate their velocities, the forces applied
+	to them and the scene gravity every logic frame; other objects only move
+	when logic moves them. Rays hit the objects with a mesh, through their
+	first mesh.
+
+	Accessing an object removed from its scene raises SystemError, like the
+	engine does.
+
+	Spawning only stores the name, scene, transform and what was passed in.
+	Other state starts as the class defaults below and the collections are
+	made when first read."""
+
+	_parent = None
+	_invalid = False
+	_ended = False
+	_lifetime = 0
+	_dynamic = False
+	_suspended = False
+	# Replaced, never changed in place
+	_linearVelocity = _angularVelocity = _force = _torque = (0.0, 0.0, 0.0)
+	mass = 1.0
+	linearDamping = 0.0
+	angularDamping = 0.0
+	visible = True
+	occlusion = False
+	state = 1
+	collisionGroup = 1
+	collisionMask = 0xFFFF
+	timeOffset = 0.0
+	debug = False
+	debugRecursive = False
+	groupObject = None
+	groupMembers = None
+
+	def __init__(self, name, scene, position=(0.0, 0.0, 0.0), rotation=None, scale=(1.0, 1.0, 1.0), properties=None, dynamic=False, mesh=None):
+		self._name = name
+		self._scene = scene
+		store = scene._transforms
+		self._slot = store.allocate()
+		store.setPosition(self._slot, [float(value) for value in position])
+		if rotation is not None:
+			store.setOrientation(self._slot, [value for row in to_rotation(rotation) for value in row])
+		store.setScale(self._slot, [float(value) for value in scale])
+		if properties:
+			self._properties = dict(properties)
+		if dynamic:
+			self._dynamic = True
+		if mesh is not None:
+			self.meshes = ListValue([mesh])
+
+	@cached_property
+	def _children(self):
+		return []
+
+	@cached_property
+	def _properties(self):
+		return {}
+
+	@cached_property
+	def meshes(self):
+		return ListValue()
+
+	def _hasMeshes(self):
+		# Without making the list of an object that never had a mesh
+		return bool(self.__dict__.get("meshes"))
+
+	@cached_property
+	def sensors(self):
+		return ListValue()
+
+	@cached_property
+	def controllers(self):
+		return ListValue()
+
+	@cached_property
+	def actuators(self):
+		return ListValue()
+
+	@cached_property
+	def components(self):
+		return ListValue()
+
+	def __repr__(self):
+		return self._name
+
+	def _alive(self):
+		if self._invalid:
+			raise SystemError("Blender Game Object \"%s\" has been freed" % self._name)
+
+	@property
+	def invalid(self):
+		return self._invalid
+
+	@property
+	def name(self):
+		self._alive()
+		return self._name
+
+	@property
+	def scene(self):
+		self._alive()
+		return self._scene
+
+	@property
+	def life(self):
+		"""Frames until the object ends, 0 for objects that last forever."""
+		self._alive()
+		return self._lifetime
+
+	@property
+	def isSuspendedDynamics(self):
+		return self._suspended
+
+	# Game properties
+
+	def __getitem__(self, key):
+		self._alive()
+		return self._properties[key]
+
+	def __setitem__(self, key, value):
+		self._alive()
+		self._properties[key] = value
+
+	def __delitem__(self, key):
+		self._alive()
+		del self._properties[key]
+
+	def __contains__(self, key):
+		self._alive()
+		return key in self._properties
+
+	def get(self, key, default=None):
+		"""Return the value matching key, or the default value if its not found."""
+		self._alive()
+		return self._properties.get(key, default)
+
+	def getPropertyNames(self):
+		"""Gets a list of all property names.
+
+		Return type: list"""
+		self._alive()
+		return list(self._properties)
+
+	# Parenting
+
+	@property
+	def parent(self):
+		self._alive()
+		return self._parent
+
+	@property
+	def children(self):
+		self._alive()
+		return ListValue(self._children)
+
+	@property
+	def childrenRecursive(self):
+		self._alive()
+		found = []
+		pending = list(self._children)
+		while pending:
+			child = pending.pop(0)
+			found.append(child)
+			pending.extend(child._children)
+		return ListValue(found)
+
+	def setParent(self, parent, compound=True, ghost=True):
+		"""Sets this object's parent, keeping the world transform."""
+		self._alive()
+		if parent is self._parent:
+			return
+		node = parent
+		while node is not None:
+			if node is self:
+				# Parenting to a descendant would make a cycle, the engine ignores it
+				return
+			node = node._parent
+		position, rotation, scale = self._world()
+		if self._parent is not None:
+			self._parent._children.remove(self)
+		self._parent = parent
+		parent._children.append(self)
+		self._scene._transforms.setParent(self._slot, parent._transform())
+		self._setWorld(position, rotation, scale)
+
+	def removeParent(self):
+		"""Removes this objects parent, keeping the world transform."""
+		self._alive()
+		if self._parent is None:
+			return
+		position, rotation, scale = self._world()
+		self._parent._children.remove(self)
+		self._parent = None
+		self._scene._transforms.setParent(self._slot, -1)
+		self._setWorld(position, rotation, scale)
+
+	# Transforms
+
+	def _store(self):
+		return self._scene._transforms
+
+	def _transform(self):
+		self._alive()
+		return self._slot
+
+	def _world(self):
+		"""World position, rotation (3x3 rows) and scale."""
+
+		position, orientation, scale = self._scene._transforms.world(self._transform())
+		return position, [orientation[0:3], orientation[3:6], orientation[6:9]], scale
+
+	def _setWorld(self, position=None, rotation=None, scale=None):
+		if rotation is not None:
+			rotation = [value for row in rotation for value in row]
+		self._scene._transforms.setWorld(self._transform(), position, rotation, scale)
+
+	def applyMovement(self, movement, local=False):
+		"""Moves the object, along its own axes when local is True."""
+		self._alive()
+		position, rotation, _ = self._world()
+		movement = [float(component) for component in movement]
+		if local:
+			movement = transform(rotation, movement)
+		self._setWorld(position=[a + b for a, b in zip(position, movement)])
+
+	def applyRotation(self, rotation, local=False):
+		"""Rotates the object by an XYZ euler, around its own axes when local is True."""
+		self._alive()
+		current = self._world()[1]
+		delta = to_rotation(rotation)
+		self._setWorld(rotation=multiply(current, delta) if local else multiply(delta, current))
+
+	def getAxisVect(self, vect):
+		"""Returns the axis vector rotated by the objects worldspace orientation.
+
+		Return type: 3d vector."""
+		self._alive()
+		return Vector(transform(self._world()[1], list(vect)))
+
+	def alignAxisToVect(self, vect, axis=2, factor=1.0):
+		"""Aligns any of the game object's axis along the given vector."""
+		self.lookAt(vect, axis, factor)
+
+	def lookAt(self, vect, axis=2, factor=1.0):
+		"""Aligns any of the game object's axis along the given vector, the other axes are rotated as little as possible."""
+		self._alive()
+		target = [float(component) for component in vect]
+		length = math.sqrt(sum(component * component for component in target))
+		if not length:
+			return
+		rotation = self._world()[1]
+		columns = [list(column) for column in zip(*rotation)]
+		current = columns[axis]
+		target = [c + (t / length - c) * factor for c, t in zip(current, target)]
+		length = math.sqrt(sum(component * component for component in target))
+		if not length:
+			return
+		columns[axis] = [component / length for component in target]
+		# Rebuild an orthonormal basis around the aligned axis
+		following, last = (axis + 1) % 3, (axis + 2) % 3
+		columns[last] = cross(columns[axis], columns[following])
+		length = math.sqrt(sum(component * component for component in columns[last]))
+		if length < 1e-9:
+			columns[last] = cross(columns[axis], [1.0, 0.0, 0.0] if abs(columns[axis][0]) < 0.9 else [0.0, 1.0, 0.0])
+			length = math.sqrt(sum(component * component for component in columns[last]))
+		columns[last] = [component / length for component in columns[last]]
+		columns[following] = cross(columns[last], columns[axis])
+		self._setWorld(rotation=_transposed(columns))
+
+	def getDistanceTo(self, other):
+		"""Distance to another object or point.
+
+		Return type: float"""
+		self._alive()
+		return math.dist(self._world()[0], _point(other))
+
+	def getVectTo(self, other):
+		"""Returns the distance to another object or point, the normalized world vector to it and the same vector in local coordinates.
+
+		Return type: 3-tuple (float, 3-tuple (x, y, z), 3-tuple (x, y, z))"""
+		self._alive()
+		position, rotation, _ = self._world()
+		vector = [b - a for a, b in zip(position, _point(other))]
+		distance = math.sqrt(sum(component * component for component in vector))
+		if distance:
+			vector = [component / distance for component in vector]
+		return distance, Vector(vector), Vector(transform(_transposed(rotation), vector))
+
+	# Velocities
+
+	def _velocity(self, values, local):
+		if local:
+			return Vector(transform(_transposed(self._world()[1]), values))
+		return Vector(values)
+
+	def _toWorld(self, value, local):
+		value = [float(component) for component in value]
+		return transform(self._world()[1], value) if local else value
+
+	def getLinearVelocity(self, local=False):
+		"""Gets the game object's linear velocity.
+
+		Return type: Vector((vx, vy, vz))"""
+		self._alive()
+		return self._velocity(self._linearVelocity, local)
+
+	def setLinearVelocity(self, velocity, local=False):
+		"""Sets the game object's linear velocity, only dynamic objects move by it."""
+		self._alive()
+		self._linearVelocity = self._toWorld(velocity, local)
+
+	def getAngularVelocity(self, local=False):
+		"""Gets the game object's angular velocity.
+
+		Return type: Vector((vx, vy, vz))"""
+		self._alive()
+		return self._velocity(self._angularVelocity, local)
+
+	def setAngularVelocity(self, velocity, local=False):
+		"""Sets the game object's angular velocity, only dynamic objects rotate by it."""
+		self._alive()
+		self._angularVelocity = self._toWorld(velocity, local)
+
+	worldLinearVelocity = property(
+		lambda self: self.getLinearVelocity(), lambda self, value: self.setLinearVelocity(value))
+	localLinearVelocity = property(
+		lambda self: self.getLinearVelocity(True), lambda self, value: self.setLinearVelocity(value, True))
+	worldAngularVelocity = property(
+		lambda self: self.getAngularVelocity(), lambda self, value: self.setAngularVelocity(value))
+	localAngularVelocity = property(
+		lambda self: self.getAngularVelocity(True), lambda self, value: self.setAngularVelocity(value, True))
+
+	def getVelocity(self, point=(0, 0, 0)):
+		"""Gets the game object's velocity at the specified point, including angular components.
+
+		Return type: Vector((vx, vy, vz))"""
+		self._alive()
+		arm = [b - a for a, b in zip(self._world()[0], point)]
+		return Vector([a + b for a, b in zip(self._linearVelocity, cross(self._angularVelocity, arm))])
+
+	def applyForce(self, force, local=False):
+		"""Applies a force to the game object for the next logic frame."""
+		self._alive()
+		self._force = [a + b for a, b in zip(self._force, self._toWorld(force, local))]
+
+	def applyTorque(self, torque, local=False):
+		"""Applies a torque to the game object for the next logic frame."""
+		self._alive()
+		self._torque = [a + b for a, b in zip(self._torque, self._toWorld(torque, local))]
+
+	def applyImpulse(self, point, impulse, local=False):
+		"""Applies an impulse to the game object, changing its velocity at once."""
+		self._alive()
+		impulse = self._toWorld(impulse, local)
+		mass = self.mass or 1.0
+		self._linearVelocity = [v + i / mass for v, i in zip(self._linearVelocity, impulse)]
+		arm = [b - a for a, b in zip(self._world()[0], point)]
+		self._angularVelocity = [v + t / mass for v, t in zip(self._angularVelocity, cross(arm, impulse))]
+
+	def setDamping(self, linear_damping, angular_damping):
+		"""Sets both the linearDamping and angularDamping simultaneously."""
+		self.linearDamping = linear_damping
+		self.angularDamping = angular_damping
+
+	def suspendDynamics(self, ghost=False):
+		"""Suspends physics for this object, it stops integrating its velocities."""
+		self._suspended = True
+
+	def restoreDynamics(self):
+		"""Resumes physics for this object."""
+		self._suspended = False
+
+	def suspendPhysics(self, freeConstraints=False):
+		"""Suspends physics for this object."""
+		self._suspended = True
+
+	def restorePhysics(self):
+		"""Resumes physics for this object."""
+		self._suspended = False
+
+	def _integrate(self, dt, gravity):
+		if not self._dynamic or self._suspended:
+			self._force = [0.0, 0.0, 0.0]
+			self._torque = [0.0, 0.0, 0.0]
+			return
+		mass = self.mass or 1.0
+		linear = [v + (f / mass + g) * dt for v, f, g in zip(self._linearVelocity, self._force, gravity)]
+		angular = [v + t / mass * dt for v, t in zip(self._angularVelocity, self._torque)]
+		if self.linearDamping:
+			linear = [v * (1.0 - self.linearDamping) ** dt for v in linear]
+		if self.angularDamping:
+			angular = [v * (1.0 - self.angularDamping) ** dt for v in angular]
+		self._linearVelocity, self._angularVelocity = linear, angular
+		self._force = [0.0, 0.0, 0.0]
+		self._torque = [0.0, 0.0, 0.0]
+
+		position, rotation, _ = self._world()
+		position = [p + v * dt for p, v in zip(position, linear)]
+		if any(angular):
+			rotation = multiply(euler_matrix([w * dt for w in angular]), rotation)
+			self._setWorld(position=position, rotation=rotation)
+		else:
+			self._setWorld(position=position)
+
+	# Life cycle
+
+	def setVisible(self, visible, recursive=False):
+		"""Sets the game object's visible flag."""
+		self._alive()
+		self.visible = visible
+		if recursive:
+			for child in self._children:
+				child.setVisible(visible, True)
+
+	def setOcclusion(self, occlusion, recursive=False):
+		"""Sets the game object's occlusion capability."""
+		self._alive()
+		self.occlusion = occlusion
+		if recursive:
+			for child in self._children:
+				child.setOcclusion(occlusion, True)
+
+	def endObject(self):
+		"""Delete this object at the end of the logic frame, with its children."""
+		self._alive()
+		self._ended = True
+
+	def sendMessage(self, subject, body="", to=""):
+		"""Sends a message, recorded in the messages of the headless game."""
+		self._alive()
+		self._scene._game.sendMessage(subject, body, to, self._name)
+
+	def replaceMesh(self, mesh, useDisplayMesh=True, usePhysicsMesh=False):
+		"""Replace the mesh of this object, rays hit the new mesh when usePhysicsMesh is enabled.
+
+		Parameters:
+		mesh (Mesh or string) - The mesh, or the name of a mesh of an object of the scene.
+		useDisplayMesh (boolean) - Replace the display mesh, which the headless runtime does not draw (optional).
+		usePhysicsMesh (boolean) - Replace the physics mesh (optional)."""
+		self._alive()
+		if isinstance(mesh, str):
+			scene = self._scene
+			found = [item for obj in scene.objects._items + scene.objectsInactive._items for item in obj.meshes._items if item.name == mesh]
+			if not found:
+				raise ValueError("gameOb.replaceMesh(mesh, useDisplayMesh, usePhysicsMesh): KX_GameObject, the mesh \"%s\" does not exist" % mesh)
+			mesh = found[0]
+		if not usePhysicsMesh:
+			return
+		bvh = self._scene.bvh
+		bvh._remove(self)
+		self.meshes = ListValue([mesh])
+		if self in self._scene.objects:
+			bvh._add(self)
+
+	def rayCastTo(self, other, dist=0, prop=""):
+		"""Look towards another point/object and find first object hit within dist that matches prop.
+
+		The ray is casted from the center of the object, ignoring the object itself, and hits the meshes of the other objects.
+
+		Return type: GameObject"""
+		self._alive()
+		return self._scene.bvh.rayCast(self._world()[0], _point(other), dist, prop, ignore=self)[0]
+
+	def rayCast(self, objto, objfrom=None, dist=0, prop="", face=False, xray=False, poly=0, mask=0xFFFF):
+		"""Look from a point/object to another point/object and find first object hit within dist that matches prop.
+
+		Returns the object, hit point and normal, with the Polygon hit when poly is 1 or more and the UV coordinates of the hit point when poly is 2, or as many None when nothing is hit. The ray ignores the object on which the method is called.
+
+		Return type: tuple"""
+		self._alive()
+		poly = min(max(poly, 0), 2)
+		origin = _point(self if objfrom is None else objfrom)
+		hit = self._scene.bvh.rayCast(origin, _point(objto), dist, prop, face, xray, mask, self, poly == 2)
+		return hit[:3 + poly]
+
+	def rayCastMany(self, objto, objfrom=None, dist=0, prop="", face=False, xray=False, mask=0xFFFF):
+		"""Cast a batch of rays like rayCast with poly 1, bringing the scene ray cast tree up to date once for all of them.
+
+		Parameters:
+		objto (sequence of KX_GameObject or 3D vectors) - The objects or points the rays go towards.
+		objfrom (KX_GameObject, 3D vector or sequence of them) - The start of every ray, or one start for all of them, this object when omitted (optional).
+		dist (float) - The length of the rays, negative to look behind, 0 to stop at their target (optional).
+		prop (string) - Only objects with this property are hit (optional).
+		face (boolean) - Return the face normals rather than the normals facing the ray origins (optional).
+		xray (boolean) - Pass through the objects without prop, else the first object hit must have it (optional).
+		mask (int) - Only objects whose collisionGroup shares a bit with mask are hit (optional).
+
+		Returns: One (object, point, normal, polygon) tuple per ray, 4 None for the rays which hit nothing.
+
+		Return type: list"""
+		self._alive()
+		targets = [_point(target) for target in objto]
+		if objfrom is None:
+			objfrom = self
+		if isinstance(objfrom, GameObject) or not any(isinstance(value, (GameObject, list, tuple, Vector)) for value in objfrom):
+			origins = [_point(objfrom)] * len(targets)
+		else:
+			origins = [_point(origin) for origin in objfrom]
+		return self._scene.bvh.rayCastMany(origins, targets, dist, prop, face, xray, mask, self)
+
+
+class Scene(types.KX_Scene):
+	"""A scene of the headless runtime.
+
+	Objects are made with createObject; the ones created inactive are the
+	templates addObject copies, like objects on hidden layers in the engine."""
+
+	def __init__(self, game, name):
+		self._game = game
+		self._name = name
+		self._properties = {}
+		self._controllers = []
+		self._components = []
+		self._sensors = []
+		self._ended = False
+		# Local and world transforms of the objects, by their slot
+		self._transforms = types.TransformStore()
+		# The active objects by position, for near and radar sensors and activity culling
+		self.spatialIndex = SpatialIndex(self._transforms)
+		# The active objects with a mesh, for ray casts
+		self.bvh = SceneBVH(self._transforms)
+		self.objects = ListValue()
+		self.objectsInactive = ListValue()
+		self.lights = ListValue()
+		self.cameras = ListValue()
+		self.active_camera = None
+		self.world = None
+		self.suspended = False
+		self.activity_culling = False
+		self.activity_culling_radius = 0.0
+		self.dbvt_culling = False
+		self.pre_draw = []
+		self.post_draw = []
+		self.pre_draw_setup = []
+		self.gravity = Vector((0.0, 0.0, -9.8))
+
+	def __repr__(self):
+		return self._name
+
+	@property
+	def name(self):
+		return self._name
+
+	@property
+	def invalid(self):
+		return self._ended
+
+	def __getitem__(self, key):
+		return self._properties[key]
+
+	def __setitem__(self, key, value):
+		self._properties[key] = value
+
+	def __delitem__(self, key):
+		del self._properties[key]
+
+	def __contains__(self, key):
+		return key in self._properties
+
+	def get(self, key, default=None):
+		"""Return the value matching key, or the default value if its not found."""
+		return self._properties.get(key, default)
+
+	def createObject(self, name, position=(0.0, 0.0, 0.0), rotation=None, scale=(1.0, 1.0, 1.0), properties=None, parent=None, dynamic=False, inactive=False, mesh=None):
+		"""Create a game object, as if it was converted from the blend file.
+
+		Parameters:
+		name (string) - The object name.
+		position (3D vector) - World position (optional).
+		rotation (3x3 matrix, euler or quaternion) - World orientation (optional).
+		scale (3D vector) - World scale (optional).
+		properties (dict) - Game properties of the object (optional).
+		parent (KX_GameObject) - Parent object, keeping the given world transform (optional).
+		dynamic (boolean) - Whether velocities, forces and gravity move the object (optional).
+		inactive (boolean) - Put the object on an inactive layer, as a template for addObject (optional).
+		mesh (Mesh) - The mesh of the object, which rays hit (optional).
+
+		Return type: GameObject"""
+		obj = GameObject(name, self, position, rotation, scale, properties, dynamic, mesh)
+		if inactive:
+			self.objectsInactive.append(obj)
+		else:
+			self.objects.append(obj)
+			self.spatialIndex._add(obj)
+			self.bvh._add(obj)
+		if parent is not None:
+			obj.setParent(parent)
+		return obj
+
+	def addObject(self, object, reference=None, time=0):
+		"""Adds a copy of an inactive object to the scene like the Add Object Actuator would.
+
+		Parameters:
+		object (KX_GameObject or string) - The (name of the) object to add.
+		reference (KX_GameObject or string) - The (name of the) object which position, orientation, and scale to copy (optional).
+		time (integer) - The lifetime of the added object, in frames. A time of 0 means the object will last forever (optional).
+
+		Returns: The newly added object.
+
+		Return type: GameObject"""
+		template = self.objectsInactive.get(object) if isinstance(object, str) else object
+		if template is None or template not in self.objectsInactive:
+			raise ValueError("scene.addObject(object, reference, time): KX_Scene (first argument): object must be in an inactive layer")
+		if isinstance(reference, str):
+			reference = self.objects[reference]
+		position, rotation, scale = (reference or template)._world()
+		obj = GameObject(template._name, self, position, rotation, scale, template._properties, template._dynamic)
+		obj.mass = template.mass
+		obj.state = template.state
+		obj.collisionGroup = template.collisionGroup
+		obj.collisionMask = template.collisionMask
+		obj.meshes = ListValue(template.meshes)
+		obj._lifetime = int(time)
+		self.objects.append(obj)
+		self.spatialIndex._add(obj)
+		self.bvh._add(obj)
+		return obj
+
+	def end(self):
+		"""Removes the scene from the game at the end of the logic frame."""
+		self._ended = True
+
+	def suspend(self):
+		"""Suspends this scene."""
+		self.suspended = True
+
+	def resume(self):
+		"""Resume this scene."""
+		self.suspended = False
+
+	def _sense(self):
+		"""Evaluate the sensors reacting to the world, before the logic of the frame."""
+
+		index = self.spatialIndex
+		for sensor in self._sensors:
+			if not sensor.owner._invalid:
+				sensor._sense(index)
+
+	def _activeObjects(self):
+		"""The ids of the objects whose logic runs this frame, None when activity culling is off.
+
+		Return type: set"""
+
+		camera = self.active_camera
+		if not self.activity_culling or not isinstance(camera, GameObject) or camera._invalid:
+			return None
+		nearby = self.spatialIndex.radius(camera._world()[0], self.activity_culling_radius)
+		return {id(obj) for obj in nearby}
+
+	def _update(self, dt):
+		"""Advance objects by one logic frame, then remove the ended ones."""
+
+		gravity = list(self.gravity)
+		ended = []
+		for obj in self.objects._items:
+			obj._integrate(dt, gravity)
+			if obj._lifetime > 0:
+				obj._lifetime -= 1
+				if obj._lifetime == 0:
+					obj._ended = True
+			if obj._ended:
+				ended.append(obj)
+		self._removeObjects(ended)
+		# One propagation pass for everything moved this frame
+		self._transforms.update()
+
+	def _removeObjects(self, objects):
+		"""Remove objects with their children, in one pass over the object list."""
+
+		removed = []
+		pending = list(objects)
+		while pending:
+			obj = pending.pop()
+			if obj._invalid:
+				continue
+			obj._invalid = True
+			removed.append(obj)
+			pending.extend(obj._children)
+		if not removed:
+			return
+		transforms, index = self._transforms, self.spatialIndex
+		for obj in removed:
+			if obj._parent is not None and not obj._parent._invalid:
+				obj._parent._children.remove(obj)
+			obj._parent = None
+			obj._children = []
+			index._remove(obj)
+			self.bvh._remove(obj)
+			transforms.release(obj._slot)
+			del obj._slot
+		self.objects._removeMany(removed)
+		gone = {id(obj) for obj in removed}
+		self._controllers = [controller for controller in self._controllers if id(controller._owner) not in gone]
+		self._components = [component for component in self._components if id(component.object) not in gone]
+		self._sensors = [sensor for sensor in self._sensors if id(sensor.owner) not in gone]
+
+
+class Sensor(types.SCA_ISensor):
+	"""A sensor whose state is set by the test, positive unless told otherwise."""
+
+	def __init__(self, name, owner, positive=True):
+		self.name = name
+		self.owner = owner
+		self.positive = positive
+		self.triggered = positive
+		self.status = 2 if positive else 0
+		self.usePosPulseMode = True
+		self.useNegPulseMode = False
+		self.frequency = 0
+		self.invert = False
+		self.level = False
+		self.tap = False
+		self.executePriority = 0
+
+	def __repr__(self):
+		return self.name
+
+	def reset(self):
+		"""Reset sensor internal state."""
+		self.triggered = self.positive
+
+	def _setPositive(self, positive):
+		"""Set the state of a sensor evaluated by the runtime, for this frame."""
+
+		changed = positive != self.positive
+		self.positive = positive
+		self.triggered = changed
+		if changed:
+			self.status = 1 if positive else 3
+		else:
+			self.status = 2 if positive else 0
+
+
+class NearSensor(Sensor, types.KX_NearSensor):
+	"""A near sensor, evaluated at the start of every logic frame.
+
+	It is positive while an object with the property propName (any object
+	when propName is empty) is within distance of the owner, then stays
+	positive until all of them are beyond resetDistance. Objects count as
+	points at their world position."""
+
+	def __init__(self, name, owner, distance=1.0, resetDistance=None, propName=""):
+		Sensor.__init__(self, name, owner, False)
+		self.distance = float(distance)
+		self.resetDistance = float(distance if resetDistance is None else resetDistance)
+		self.propName = propName
+		self.useMaterial = False
+		self.usePulseCollision = False
+		self.hitObject = None
+		self.hitObjectList = ListValue()
+
+	def _candidates(self, index, position):
+		return index.radius(position, self.resetDistance if self.positive else self.distance, sort=True)
+
+	def _sense(self, index):
+		owner, prop = self.owner, self.propName
+		hits = [
+			obj for obj in self._candidates(index, owner._world()[0])
+			if obj is not owner and (not prop or prop in obj._properties)
+		]
+		self.hitObjectList = ListValue(hits)
+		self.hitObject = hits[0] if hits else None
+		self._setPositive(bool(hits))
+
+
+class RadarSensor(NearSensor, types.KX_RadarSensor):
+	"""A radar sensor, evaluated at the start of every logic frame.
+
+	It is positive while an object with the property propName (any object
+	when propName is empty) is inside the cone of height distance and
+	opening angle (in degrees) along the axis of the owner: 0 to 2 for +X,
+	+Y and +Z, 3 to 5 for -X, -Y and -Z."""
+
+	def __init__(self, name, owner, distance=10.0, angle=30.0, axis=1, propName=""):
+		NearSensor.__init__(self, name, owner, distance, distance, propName)
+		self.angle = float(angle)
+		self.axis = axis
+
+	def _direction(self):
+		rotation = self.owner._world()[1]
+		sign = -1.0 if self.axis >= 3 else 1.0
+		return [sign * row[self.axis % 3] for row in rotation]
+
+	@property
+	def coneOrigin(self):
+		"""The origin of the cone, the world position of the owner.
+
+		Return type: list [x, y, z]"""
+		return self.owner._world()[0]
+
+	@property
+	def coneTarget(self):
+		"""The center of the bottom face of the cone.
+
+		Return type: list [x, y, z]"""
+		return [a + b * self.distance for a, b in zip(self.owner._world()[0], self._direction())]
+
+	def _candidates(self, index, position):
+		return index.cone(position, self._direction(), math.radians(self.angle) / 2.0, self.distance, sort=True)
+
+
+class Actuator(types.SCA_IActuator):
+	"""An actuator recording whether controllers activated it."""
+
+	def __init__(self, name, owner):
+		self.name = name
+		self.owner = owner
+		self.active = False
+		self.activations = 0
+		self.executePriority = 0
+
+	def __repr__(self):
+		return self.name
+
+
+class PythonController(types.SCA_PythonController):
+	"""A python controller running a function, a "module.function" or a script file."""
+
+	def __init__(self, owner, script, name="", sensors=(), actuators=(), state=1, useHighPriority=False):
+		self._owner = owner
+		self.name = name
+		self.state = state
+		self.useHighPriority = useHighPriority
+		self.executePriority = 0
+		self.sensors = ListValue(
+			sensor if isinstance(sensor, Sensor) else Sensor(sensor, owner) for sensor in sensors)
+		self.actuators = ListValue(
+			actuator if isinstance(actuator, Actuator) else Actuator(actuator, owner) for actuator in actuators)
+		for sensor in self.sensors:
+			owner.sensors.append(sensor)
+		for actuator in self.actuators:
+			owner.actuators.append(actuator)
+		owner.controllers.append(self)
+		self._bind(script)
+
+	def __repr__(self):
+		return self.name
+
+	@property
+	def owner(self):
+		return self._owner
+
+	def _bind(self, script):
+		if callable(script):
+			self.script = getattr(script, "__qualname__", repr(script))
+			self.mode = 1
+			function = script
+		elif script.endswith(".py"):
+			self.script = script
+			self.mode = 0
+			with open(script, encoding="utf-8") as file:
+				code = compile(file.read(), script, "exec")
+			self._run = lambda: exec(code, {"__name__": "__main__", "__file__": script})
+			return
+		else:
+			self.script = script
+			self.mode = 1
+			module, _, name = script.rpartition(".")
+			function = getattr(importlib.import_module(module), name)
+		try:
+			takesController = len(inspect.signature(function).parameters) > 0
+		except (TypeError, ValueError):
+			takesController = False
+		self._run = (lambda: function(self)) if takesController else function
+
+	def _shouldRun(self):
+		if not self._owner.state & self.state:
+			return False
+		return not self.sensors._items or any(sensor.positive for sensor in self.sensors._items)
+
+	def activate(self, actuator):
+		"""Activates an actuator attached to this controller."""
+		actuator = self.actuators[actuator] if isinstance(actuator, str) else actuator
+		actuator.active = True
+		actuator.activations += 1
+
+	def deactivate(self, actuator):
+		"""Deactivates an actuator attached to this controller."""
+		actuator = self.actuators[actuator] if isinstance(actuator, str) else actuator
+		actuator.active = False
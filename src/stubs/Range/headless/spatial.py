@@ -0,0 +1,316 @@
+"""Spatial index of the headless runtime.
+
+Near and radar sensors and activity culling ask which objects are close to
+a point. SpatialIndex answers these queries from a uniform grid of cubic
+cells keyed by their integer coordinates, so a query only tests the objects
+of the cells it overlaps instead of every object of the scene. The grid
+follows the transform store of its scene: before a query, only the objects
+whose world transform changed since the previous one are moved between
+cells."""
+
+import heapq
+import itertools
+import math
+
+from mathutils.arrays import numpy
+
+
+def _coordinates(value):
+	values = [float(component) for component in value]
+	if len(values) != 3:
+		raise ValueError("expected a 3D point")
+	return values
+
+
+class SpatialIndex:
+	"""A uniform grid over the world positions of the objects of a scene, objects count as points.
+
+	Parameters:
+	transforms (TransformStore) - The transform store of the scene.
+	cellSize (float) - The edge length of the cells, about the usual query radius works best (optional)."""
+
+	def __init__(self, transforms, cellSize=4.0):
+		if cellSize <= 0.0:
+			raise ValueError("SpatialIndex(): cellSize must be positive")
+		self.cellSize = float(cellSize)
+		self._transforms = transforms
+		# Slot: object, for the objects of the index
+		self._objects = {}
+		# Slot: world position when the object was last binned
+		self._points = {}
+		# Slot: key of the cell holding it
+		self._keys = {}
+		# Cell key: slots of the objects in the cell
+		self._cells = {}
+		# Slots added since the last refresh
+		self._added = []
+		self.queries = 0
+		self.cellsVisited = 0
+		self.candidates = 0
+		self.results = 0
+		self.moves = 0
+		# Start tracking the moves, the objects are binned as they are added
+		transforms.takeMoved(self)
+
+	def __len__(self):
+		return len(self._objects)
+
+	def _add(self, obj):
+		self._objects[obj._slot] = obj
+		self._added.append(obj._slot)
+
+	def _remove(self, obj):
+		slot = obj._slot
+		if self._objects.pop(slot, None) is None:
+			return
+		self._points.pop(slot, None)
+		key = self._keys.pop(slot, None)
+		if key is not None:
+			self._unbin(slot, key)
+
+	def _unbin(self, slot, key):
+		cell = self._cells[key]
+		cell.remove(slot)
+		if not cell:
+			del self._cells[key]
+
+	def refresh(self):
+		"""Move the objects whose world position changed to their new cells, queries call it."""
+
+		moved = self._transforms.takeMoved(self)
+		if self._added:
+			moved.extend(self._added)
+			self._added = []
+		objects = self._objects
+		slots = [slot for slot in dict.fromkeys(moved) if slot in objects]
+		if not slots:
+			return
+		positions = self._transforms.worldPositions
+		if numpy is not None:
+			points = positions.reshape(-1, 3)[slots].tolist()
+		else:
+			points = [positions[slot * 3:slot * 3 + 3].tolist() for slot in slots]
+		size, keys, cells, stored = self.cellSize, self._keys, self._cells, self._points
+		for slot, point in zip(slots, points):
+			stored[slot] = point
+			key = (int(point[0] // size), int(point[1] // size), int(point[2] // size))
+			previous = keys.get(slot)
+			if previous == key:
+				continue
+			if previous is not None:
+				self._unbin(slot, previous)
+			keys[slot] = key
+			cells.setdefault(key, []).append(slot)
+			self.moves += 1
+
+	def rebuild(self, cellSize=None):
+		"""Bin every object again, in cells of a new size when cellSize is given."""
+
+		if cellSize is not None:
+			if cellSize <= 0.0:
+				raise ValueError("SpatialIndex.rebuild(): cellSize must be positive")
+			self.cellSize = float(cellSize)
+		self._keys.clear()
+		self._cells.clear()
+		self._points.clear()
+		self._added = list(self._objects)
+		self.refresh()
+
+	def _gather(self, low, high):
+		"""The slot lists of the cells overlapping the box from low to high."""
+
+		cells = self._cells
+		if not all(math.isfinite(value) for value in low + high):
+			found = list(cells.values())
+		else:
+			size = self.cellSize
+			first = [int(value // size) for value in low]
+			last = [int(value // size) for value in high]
+			span = (last[0] - first[0] + 1) * (last[1] - first[1] + 1) * (last[2] - first[2] + 1)
+			if span > len(cells):
+				# Fewer occupied cells than cells in the box, test the occupied ones
+				found = [
+					slots for key, slots in cells.items()
+					if all(first[axis] <= key[axis] <= last[axis] for axis in range(3))
+				]
+			else:
+				found = []
+				for key in itertools.product(*(range(a, b + 1) for a, b in zip(first, last))):
+					slots = cells.get(key)
+					if slots is not None:
+						found.append(slots)
+		self.cellsVisited += len(found)
+		return found
+
+	def _finish(self, found, tested, sort):
+		self.queries += 1
+		self.candidates += tested
+		self.results += len(found)
+		if sort:
+			found.sort()
+		objects = self._objects
+		return [objects[slot] for _, slot in found]
+
+	def radius(self, center, radius, sort=False):
+		"""Return the objects within radius of center.
+
+		Parameters:
+		center (3D vector) - The center of the sphere.
+		radius (float) - The radius of the sphere.
+		sort (boolean) - Sort the objects from the nearest, else they come in no particular order (optional).
+
+		Return type: list"""
+
+		self.refresh()
+		cx, cy, cz = _coordinates(center)
+		limit = radius * radius
+		points, found, tested = self._points, [], 0
+		for slots in self._gather([cx - radius, cy - radius, cz - radius], [cx + radius, cy + radius, cz + radius]):
+			tested += len(slots)
+			for slot in slots:
+				x, y, z = points[slot]
+				distance = (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2
+				if distance <= limit:
+					found.append((distance, slot))
+		return self._finish(found, tested, sort)
+
+	def box(self, minimum, maximum):
+		"""Return the objects inside an axis aligned box, in no particular order.
+
+		Parameters:
+		minimum (3D vector) - The corner of the box with the lowest coordinates.
+		maximum (3D vector) - The corner of the box with the highest coordinates.
+
+		Return type: list"""
+
+		self.refresh()
+		low, high = _coordinates(minimum), _coordinates(maximum)
+		points, found, tested = self._points, [], 0
+		for slots in self._gather(low, high):
+			tested += len(slots)
+			for slot in slots:
+				point = points[slot]
+				if all(low[axis] <= point[axis] <= high[axis] for axis in range(3)):
+					found.append((0.0, slot))
+		return self._finish(found, tested, False)
+
+	def cone(self, origin, direction, angle, distance, sort=False):
+		"""Return the objects inside a cone, like a radar sensor sees them.
+
+		Parameters:
+		origin (3D vector) - The apex of the cone.
+		direction (3D vector) - The axis of the cone, from the apex.
+		angle (float) - The angle between the axis and the side of the cone, in radians.
+		distance (float) - The height of the cone, the objects are within this distance of the apex.
+		sort (boolean) - Sort the objects from the nearest, else they come in no particular order (optional).
+
+		Return type: list"""
+
+		self.refresh()
+		ox, oy, oz = _coordinates(origin)
+		dx, dy, dz = _coordinates(direction)
+		length = math.sqrt(dx * dx + dy * dy + dz * dz)
+		if not length:
+			raise ValueError("SpatialIndex.cone(): direction must not be a zero vector")
+		dx, dy, dz = dx / length, dy / length, dz / length
+		cosine, limit = math.cos(angle), distance * distance
+		points, found, tested = self._points, [], 0
+		for slots in self._gather([ox - distance, oy - distance, oz - distance], [ox + distance, oy + distance, oz + distance]):
+			tested += len(slots)
+			for slot in slots:
+				x, y, z = points[slot]
+				x, y, z = x - ox, y - oy, z - oz
+				squared = x * x + y * y + z * z
+				if not squared or squared > limit:
+					continue
+				if x * dx + y * dy + z * dz >= cosine * math.sqrt(squared):
+					found.append((squared, slot))
+		return self._finish(found, tested, sort)
+
+	def nearest(self, point, count=1, distance=math.inf):
+		"""Return the count objects nearest to point with their distance, from the nearest.
+
+		Parameters:
+		point (3D vector) - The point to search around.
+		count (int) - The number of objects to find (optional).
+		distance (float) - Only find objects within this distance of point (optional).
+
+		Returns: A list of (KX_GameObject, distance) tuples.
+
+		Return type: list"""
+
+		self.refresh()
+		px, py, pz = _coordinates(point)
+		size, cells, points = self.cellSize, self._cells, self._points
+		center = (int(px // size), int(py // size), int(pz // size))
+		limit = distance * distance
+		# Max-heap of the best candidates so far, by negated squared distance
+		best, seen, tested, ring = [], 0, 0, 0
+		while count > 0 and seen < len(self._objects):
+			width = 2 * ring + 1
+			if width ** 3 > 2 * len(cells):
+				# The shell has more cells than the grid, test the remaining occupied cells at once
+				shell = [
+					slots for key, slots in cells.items()
+					if max(abs(key[axis] - center[axis]) for axis in range(3)) >= ring
+				]
+			else:
+				shell = []
+				for offset in itertools.product(range(-ring, ring + 1), repeat=3):
+					if max(abs(value) for value in offset) != ring:
+						continue
+					slots = cells.get((center[0] + offset[0], center[1] + offset[1], center[2] + offset[2]))
+					if slots is not None:
+						shell.append(slots)
+			self.cellsVisited += len(shell)
+			for slots in shell:
+				seen += len(slots)
+				tested += len(slots)
+				for slot in slots:
+					x, y, z = points[slot]
+					squared = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+					if squared > limit:
+						continue
+					if len(best) < count:
+						heapq.heappush(best, (-squared, slot))
+					elif squared < -best[0][0]:
+						heapq.heapreplace(best, (-squared, slot))
+			if width ** 3 > 2 * len(cells):
+				break
+			# The cells of the next shells are at least ring cells away
+			reach = (ring * size) ** 2
+			if reach > limit or (len(best) == count and -best[0][0] <= reach):
+				break
+			ring += 1
+		found = sorted((-squared, slot) for squared, slot in best)
+		self.queries += 1
+		self.candidates += tested
+		self.results += len(found)
+		objects = self._objects
+		return [(objects[slot], math.sqrt(squared)) for squared, slot in found]
+
+	def stats(self):
+		"""Return the cell occupancy and the query counters.
+
+		Returns: objects and cells (the occupied cells), meanOccupancy and maxOccupancy (objects per occupied cell), queries, cellsVisited, candidates (objects tested), results (objects found), candidatesPerQuery and moves (objects moved to another cell).
+
+		Return type: dict"""
+
+		occupancy = [len(slots) for slots in self._cells.values()]
+		return {
+			"objects": len(self._objects),
+			"cells": len(occupancy),
+			"meanOccupancy": sum(occupancy) / len(occupancy) if occupancy else 0.0,
+			"maxOccupancy": max(occupancy, default=0),
+			"queries": self.queries,
+			"cellsVisited": self.cellsVisited,
+			"candidates": self.candidates,
+			"results": self.results,
+			"candidatesPerQuery": self.candidates / self.queries if self.queries else 0.0,
+			"moves": self.moves,
+		}
+
+	def resetStats(self):
+		"""Set the query and move counters back to 0."""
+
+		self.queries = self.cellsVisited = self.candidates = self.results = self.moves = 0
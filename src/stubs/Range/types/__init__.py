@@ -1,6 +1,71 @@
 """This module contains the classes that appear as instances in the Game Engine. A script must interact with these classes if it is to affect the behaviour of objects in a game."""
 
+from __future__ import annotations
+
+import math
+from functools import cached_property
+
+from mathutils import Euler, Matrix, Quaternion, Vector
+
+from ._transforms import TransformStore
+
 __shared__ = {}
+# Transforms of the placeholder game objects, which have no parent
+_transforms = TransformStore()
+
+def _components(value, size):
+	"""The floats of a vector of the given size.
+
+	Return type: list"""
+
+	values = [float(component) for component in value]
+	if len(values) != size:
+		raise ValueError("expected a %dD vector" % size)
+	return values
+
+def _rotation(value):
+	"""The 9 floats of a 3x3 orientation, from a matrix, an euler or a quaternion, plain sequences of 3 and 4 floats being an XYZ euler and a (w, x, y, z) quaternion.
+
+	Return type: list"""
+
+	if not isinstance(value, (Euler, Quaternion, Matrix)):
+		value = list(value)
+		if value and not hasattr(value[0], "__len__"):
+			if len(value) == 3:
+				value = Euler(value)
+			elif len(value) == 4:
+				value = Quaternion(value).normalized()
+	if isinstance(value, (Euler, Quaternion)):
+		value = value.to_matrix()
+	rows = [list(row)[:3] for row in value][:3]
+	if len(rows) != 3 or any(len(row) != 3 for row in rows):
+		raise ValueError("expected a 3x3 matrix, an euler or a quaternion")
+	return [float(component) for row in rows for component in row]
+
+def _compose(position, orientation, scale):
+	"""The 4x4 matrix of a position, a 3x3 row-major orientation and a scale.
+
+	Return type: Matrix"""
+
+	return Matrix([
+		[orientation[row * 3 + column] * scale[column] for column in range(3)] + [position[row]]
+		for row in range(3)
+	] + [[0.0, 0.0, 0.0, 1.0]])
+
+def _decompose(value):
+	"""The position, 3x3 row-major orientation and scale of a 4x4 matrix, scale being the length of the axes.
+
+	Return type: tuple"""
+
+	rows = [[float(element) for element in row] for row in value]
+	if len(rows) != 4 or any(len(row) != 4 for row in rows):
+		raise ValueError("expected a 4x4 matrix")
+	scale = [math.sqrt(sum(rows[row][column] ** 2 for row in range(3))) for column in range(3)]
+	orientation = [
+		rows[row][column] / scale[column] if scale[column] else 0.0
+		for row in range(3) for column in range(3)
+	]
+	return [rows[row][3] for row in range(3)], orientation, scale
 
 class PyObjectPlus:
 	
@@ -39,48 +104,225 @@ class CListValue(CPropValue):
 
 	As well as the normal index lookup (val= clist[i]), CListValue supports string lookups (val= scene.objects["Cube"])
 
-	Other operations such as len(clist), list(clist), clist[0:10] are also supported."""
-	
-	def append(self):
+	Other operations such as len(clist), list(clist), clist[0:10] are also supported.
+
+	The items are kept in order, with a map from each name to the items of that name and a map from id() to item, both updated by append, reverse and removals: string lookups, get(), from_id(), count() and `in` take constant time. Items are compared by identity. Slices are read-only views of the list, they do not copy it."""
+
+	def __init__(self, items=()):
+		self._items = []
+		# name: items of that name, in list order
+		self._names = {}
+		# id(item): [item, name, occurrences]
+		self._ids = {}
+		for item in items:
+			self.append(item)
+
+	def __len__(self):
+		return len(self._items)
+
+	def __iter__(self):
+		# Iterating a copy lets logic remove objects while looping over a list
+		return iter(list(self._items))
+
+	def __bool__(self):
+		return bool(self._items)
+
+	def __getitem__(self, key):
+		if isinstance(key, str):
+			found = self._names.get(key)
+			if not found:
+				raise KeyError("CList[key]: '%s' key not in list" % key)
+			return found[0]
+		if isinstance(key, slice):
+			return _CListView(self, range(len(self._items))[key])
+		return self._items[key]
+
+	def __contains__(self, value):
+		if isinstance(value, str):
+			return value in self._names
+		return id(value) in self._ids
+
+	def __repr__(self):
+		return repr(self._items)
+
+	def append(self, value):
 		"""Add an item to the list (like pythons append)
 
 		Warning: Appending values to the list can cause crashes when the list is used internally by the game engine."""
-		pass
-		
-	def count(self):
+
+		entry = self._ids.get(id(value))
+		if entry is None:
+			name = getattr(value, "name", None)
+			entry = self._ids[id(value)] = [value, name, 0]
+		entry[2] += 1
+		self._names.setdefault(entry[1], []).append(value)
+		self._items.append(value)
+
+	def count(self, value):
 		"""Count the number of instances of a value in the list.
 
 		Returns:number of instances
 
 		Return type: integer"""
-		return int()
-		
-	def index(self):
+
+		entry = self._ids.get(id(value))
+		return entry[2] if entry is not None else 0
+
+	def index(self, value):
 		"""Return the index of a value in the list.
 
 		Returns: The index of the value in the list.
 
 		Return type: integer"""
-		return int()
-		
+
+		if id(value) in self._ids:
+			for position, item in enumerate(self._items):
+				if item is value:
+					return position
+		raise ValueError("CList.index(x): x not in CListValue")
+
 	def reverse(self):
 		"""Reverse the order of the list."""
-		pass
-		
-	def get(self):
+
+		self._items.reverse()
+		for found in self._names.values():
+			found.reverse()
+
+	def get(self, key, default=None):
 		"""Return the value matching key, or the default value if its not found.
 
 		Returns:	
 		The key value or a default."""
-		return CValue()
-		
-	def from_id(self):
+
+		found = self._names.get(key)
+		return found[0] if found else default
+
+	def from_id(self, id):
 		"""This is a funtion especially for the game engine to return a value with a spesific id.
 
 		Since object names are not always unique, the id of an object can be used to get an object from the CValueList."""
-		return CValue()
-		
-	pass
+
+		entry = self._ids.get(id)
+		if entry is None:
+			raise IndexError("from_id(#): id not found in CValueList")
+		return entry[0]
+
+	def _forget(self, value):
+		"""Drop one occurrence of value from the maps."""
+
+		entry = self._ids[id(value)]
+		found = self._names[entry[1]]
+		# The occurrences of a name are in list order, drop the first one of value
+		for position, item in enumerate(found):
+			if item is value:
+				del found[position]
+				break
+		if not found:
+			del self._names[entry[1]]
+		entry[2] -= 1
+		if not entry[2]:
+			del self._ids[id(value)]
+
+	def _remove(self, value):
+		"""Remove the first occurrence of value, the engine removing an object from a scene."""
+
+		if id(value) not in self._ids:
+			raise ValueError("CList.remove(x): x not in CListValue")
+		for position, item in enumerate(self._items):
+			if item is value:
+				del self._items[position]
+				break
+		self._forget(value)
+
+	def _removeMany(self, values):
+		"""Remove every occurrence of values, in one pass over the list."""
+
+		removed = {id(value) for value in values if id(value) in self._ids}
+		if not removed:
+			return
+		kept = []
+		for item in self._items:
+			if id(item) in removed:
+				self._forget(item)
+			else:
+				kept.append(item)
+		self._items = kept
+
+class _CListView(CListValue):
+	"""A read-only view of positions of a CListValue, the result of slicing one.
+
+	The view reads the list when used: it shows the items now at its positions."""
+
+	def __init__(self, source, positions):
+		self._source = source
+		self._positions = positions
+
+	def _live(self):
+		"""The positions of the view that are still in the list."""
+
+		count, positions = len(self._source._items), self._positions
+		if positions.step > 0:
+			return positions[:len(range(positions.start, count, positions.step))]
+		return positions[len(range(positions.start, count - 1, positions.step)):]
+
+	@property
+	def _items(self):
+		items = self._source._items
+		return [items[position] for position in self._live()]
+
+	def __len__(self):
+		return len(self._live())
+
+	def __bool__(self):
+		return bool(self._live())
+
+	def __getitem__(self, key):
+		if isinstance(key, str):
+			found = self.get(key)
+			if found is None:
+				raise KeyError("CList[key]: '%s' key not in list" % key)
+			return found
+		if isinstance(key, slice):
+			return _CListView(self._source, self._live()[key])
+		return self._source._items[self._live()[key]]
+
+	def __contains__(self, value):
+		if isinstance(value, str):
+			return self.get(value) is not None
+		return any(item is value for item in self._items)
+
+	def append(self, value):
+		raise TypeError("CListValue slices are read-only")
+
+	def reverse(self):
+		raise TypeError("CListValue slices are read-only")
+
+	def count(self, value):
+		return sum(item is value for item in self._items)
+
+	def index(self, value):
+		for position, item in enumerate(self._items):
+			if item is value:
+				return position
+		raise ValueError("CList.index(x): x not in CListValue")
+
+	def get(self, key, default=None):
+		for item in self._items:
+			if getattr(item, "name", None) == key:
+				return item
+		return default
+
+	def from_id(self, id):
+		entry = self._source._ids.get(id)
+		if entry is None or entry[0] not in self:
+			raise IndexError("from_id(#): id not found in CValueList")
+		return entry[0]
+
+	def _remove(self, value):
+		raise TypeError("CListValue slices are read-only")
+
+	def _removeMany(self, values):
+		raise TypeError("CListValue slices are read-only")
 
 class SCA_IObject(CValue):
 	
@@ -104,64 +346,322 @@ class KX_GameObject(SCA_IObject):
 
 	Note: Calling ANY method or attribute on an object that has been removed from a scene will raise a SystemError, if an object may have been removed since last accessing it use the invalid attribute to check.
 
-	KX_GameObject can be subclassed to extend functionality."""
-	
-	def __init__(self):
-		from mathutils import Vector, Matrix
-		
-		if not "KX_GameObject" in __shared__.keys():
-			__shared__["KX_GameObject"] = None
-			__shared__["KX_GameObject"] = KX_GameObject()
+	KX_GameObject can be subclassed to extend functionality.
+
+	The placeholder object is built on demand: its transform is a slot of a shared TransformStore, allocated on first use, and its scene, meshes, logic bricks and vectors are made when first read, then kept."""
+
+	mass = float()
+	isSuspendedDynamics = bool()
+	linearDamping = float()
+	angularDamping = float()
+	linVelocityMin = float()
+	linVelocityMax = float()
+	angularVelocityMin = float()
+	angularVelocityMax = float()
+	collisionGroup = int()
+	collisionMask = int()
+	visible = bool()
+	record_animation = bool()
+	occlusion = bool()
+	timeOffset = float()
+	state = int()
+	life = float()
+	debug = bool()
+	debugRecursive = bool()
+	currentLodLevel = int()
 
-		self.parent = __shared__["KX_GameObject"]
-		self.groupMembers = {"key" : __shared__["KX_GameObject"]}
-		self.groupObject = __shared__["KX_GameObject"]
-		self.children = {"key" : __shared__["KX_GameObject"]}
-		self.childrenRecursive = {"key" : __shared__["KX_GameObject"]}
-		self.scene = KX_Scene()
-		self.name = str()
-		self.mass = float()
-		self.isSuspendedDynamics = bool()
-		self.linearDamping = float()
-		self.angularDamping = float()
-		self.linVelocityMin = float()
-		self.linVelocityMax = float()
-		self.angularVelocityMin = float()
-		self.angularVelocityMax = float()
-		self.localInertia = Vector(None)
-		self.collisionGroup = int()
-		self.collisionMask = int()
-		self.collisionCallbacks = []
-		self.visible = bool()
-		self.record_animation = bool()
-		self.color = Vector(None)
-		self.occlusion = bool()
-		self.position = Vector(None)
-		self.orientation = Matrix(None)
-		self.scaling = Vector(None)
-		self.localOrientation = Matrix(None)
-		self.worldOrientation = Matrix(None)
-		self.localScale = Vector(None)
-		self.worldScale = Vector(None)
-		self.localPosition = Vector(None)
-		self.worldPosition = Vector(None)
-		self.localTransform = Matrix(None)
-		self.worldTransform = Matrix(None)
-		self.localLinearVelocity = Vector(None)
-		self.worldLinearVelocity = Vector(None)
-		self.localAngularVelocity = Vector(None)
-		self.worldAngularVelocity = Vector(None)
-		self.timeOffset = float()
-		self.state = int()
-		self.meshes = {"key" : KX_MeshProxy()}
-		self.sensors = {"key" : SCA_ISensor()}
-		self.controllers = {"key" : SCA_IController()}
-		self.actuators = {"key" : SCA_IActuator()}
-		self.attrDict = dict()
-		self.life = float()
-		self.debug = bool()
-		self.debugRecursive = bool()
-		self.currentLodLevel = int()
+	def __del__(self):
+		slot = getattr(self, "_slot", None)
+		# The store may be gone already when the interpreter exits
+		if slot is not None and _transforms is not None:
+			self._store().release(slot)
+
+	@cached_property
+	def parent(self):
+		"""The object's parent object. (read-only).
+
+		Return type: KX_GameObject"""
+		return __shared__["KX_GameObject"]
+
+	@cached_property
+	def groupMembers(self):
+		"""Returns the list of group members if the object is a group object (dupli group instance), otherwise None is returned.
+
+		Return type: CListValue"""
+		return CListValue([__shared__["KX_GameObject"]])
+
+	@cached_property
+	def groupObject(self):
+		"""Returns the group object (dupli group instance) that the object belongs to or None if the object is not part of a group.
+
+		Return type: KX_GameObject"""
+		return __shared__["KX_GameObject"]
+
+	@cached_property
+	def children(self):
+		"""direct children of this object, (read-only).
+
+		Return type: CListValue"""
+		return CListValue([__shared__["KX_GameObject"]])
+
+	@cached_property
+	def childrenRecursive(self):
+		"""all children of this object including children's children, (read-only).
+
+		Return type: CListValue"""
+		return CListValue([__shared__["KX_GameObject"]])
+
+	@cached_property
+	def scene(self):
+		"""The object's scene. (read-only).
+
+		Return type: KX_Scene"""
+		if "KX_Scene" not in __shared__:
+			__shared__["KX_Scene"] = KX_Scene()
+		return __shared__["KX_Scene"]
+
+	@cached_property
+	def localInertia(self):
+		"""the object's inertia vector in local coordinates. Read only.
+
+		Return type: Vector"""
+		return Vector()
+
+	@cached_property
+	def collisionCallbacks(self):
+		"""A list of functions to be called when a collision occurs.
+
+		Return type: list"""
+		return []
+
+	@cached_property
+	def color(self):
+		"""The object color of the object. [r, g, b, a]
+
+		Return type: Vector"""
+		return Vector((1.0, 1.0, 1.0, 1.0))
+
+	@cached_property
+	def localLinearVelocity(self):
+		"""The object's local linear velocity. [x, y, z]
+
+		Return type: Vector"""
+		return Vector()
+
+	@cached_property
+	def worldLinearVelocity(self):
+		"""The object's world linear velocity. [x, y, z]
+
+		Return type: Vector"""
+		return Vector()
+
+	@cached_property
+	def localAngularVelocity(self):
+		"""The object's local angular velocity. [x, y, z]
+
+		Return type: Vector"""
+		return Vector()
+
+	@cached_property
+	def worldAngularVelocity(self):
+		"""The object's world angular velocity. [x, y, z]
+
+		Return type: Vector"""
+		return Vector()
+
+	@cached_property
+	def meshes(self):
+		"""a list meshes for this object.
+
+		Return type: CListValue"""
+		return CListValue([KX_MeshProxy()])
+
+	@cached_property
+	def sensors(self):
+		"""a sequence of SCA_ISensor objects with string/index lookups and iterator support.
+
+		Return type: CListValue"""
+		return CListValue([SCA_ISensor()])
+
+	@cached_property
+	def controllers(self):
+		"""a sequence of SCA_IController objects with string/index lookups and iterator support.
+
+		Return type: CListValue"""
+		return CListValue([SCA_IController()])
+
+	@cached_property
+	def actuators(self):
+		"""a list of SCA_IActuator with string/index lookups and iterator support.
+
+		Return type: CListValue"""
+		return CListValue([SCA_IActuator()])
+
+	@cached_property
+	def attrDict(self):
+		"""get the objects internal python attribute dictionary for direct (faster) access.
+
+		Return type: dict"""
+		return {}
+
+	def _store(self):
+		"""The transform store holding the object's transform.
+
+		Return type: TransformStore"""
+		return _transforms
+
+	def _transform(self):
+		"""The slot of the object in its transform store, allocated on first use.
+
+		Return type: int"""
+
+		try:
+			return self._slot
+		except AttributeError:
+			slot = self._slot = self._store().allocate()
+			return slot
+
+	@property
+	def localPosition(self):
+		"""The object's local position. [x, y, z]
+
+		Return type: Vector"""
+		slot, store = self._transform(), self._store()
+		return Vector._wrap(store.position(slot), self, lambda values: store.setPosition(slot, values))
+
+	@localPosition.setter
+	def localPosition(self, value):
+		slot = self._transform()
+		self._store().setPosition(slot, _components(value, 3))
+
+	@property
+	def localOrientation(self):
+		"""The object's local orientation. 3x3 Matrix.
+
+		Return type: Matrix"""
+		slot = self._transform()
+		values = self._store().orientation(slot)
+		return Matrix((values[0:3], values[3:6], values[6:9]))
+
+	@localOrientation.setter
+	def localOrientation(self, value):
+		slot = self._transform()
+		self._store().setOrientation(slot, _rotation(value))
+
+	@property
+	def localScale(self):
+		"""The object's local scaling factor. [sx, sy, sz]
+
+		Return type: Vector"""
+		slot, store = self._transform(), self._store()
+		return Vector._wrap(store.scale(slot), self, lambda values: store.setScale(slot, values))
+
+	@localScale.setter
+	def localScale(self, value):
+		slot = self._transform()
+		self._store().setScale(slot, _components(value, 3))
+
+	@property
+	def localTransform(self):
+		"""The object's local space transform matrix. 4x4 Matrix.
+
+		Return type: Matrix"""
+		slot, store = self._transform(), self._store()
+		return _compose(store.position(slot), store.orientation(slot), store.scale(slot))
+
+	@localTransform.setter
+	def localTransform(self, value):
+		slot, store = self._transform(), self._store()
+		position, orientation, scale = _decompose(value)
+		store.setPosition(slot, position)
+		store.setOrientation(slot, orientation)
+		store.setScale(slot, scale)
+
+	@property
+	def worldPosition(self):
+		"""The object's world position. [x, y, z]
+
+		Return type: Vector"""
+		slot, store = self._transform(), self._store()
+		return Vector._wrap(store.world(slot)[0], self, lambda values: store.setWorld(slot, position=values))
+
+	@worldPosition.setter
+	def worldPosition(self, value):
+		slot = self._transform()
+		self._store().setWorld(slot, position=_components(value, 3))
+
+	@property
+	def worldOrientation(self):
+		"""The object's world orientation. 3x3 Matrix.
+
+		Return type: Matrix"""
+		slot = self._transform()
+		values = self._store().world(slot)[1]
+		return Matrix((values[0:3], values[3:6], values[6:9]))
+
+	@worldOrientation.setter
+	def worldOrientation(self, value):
+		slot = self._transform()
+		self._store().setWorld(slot, orientation=_rotation(value))
+
+	@property
+	def worldScale(self):
+		"""The object's world scaling factor. [sx, sy, sz]
+
+		Return type: Vector"""
+		slot, store = self._transform(), self._store()
+		return Vector._wrap(store.world(slot)[2], self, lambda values: store.setWorld(slot, scale=values))
+
+	@worldScale.setter
+	def worldScale(self, value):
+		slot = self._transform()
+		self._store().setWorld(slot, scale=_components(value, 3))
+
+	@property
+	def worldTransform(self):
+		"""The object's world space transform matrix. 4x4 Matrix.
+
+		Return type: Matrix"""
+		slot = self._transform()
+		return _compose(*self._store().world(slot))
+
+	@worldTransform.setter
+	def worldTransform(self, value):
+		slot = self._transform()
+		self._store().setWorld(slot, *_decompose(value))
+
+	@property
+	def position(self):
+		"""The object's world position. (DEPRECATED, please use worldPosition)
+
+		Return type: Vector"""
+		return self.worldPosition
+
+	@position.setter
+	def position(self, value):
+		self.worldPosition = value
+
+	@property
+	def orientation(self):
+		"""The object's world orientation. (DEPRECATED, please use worldOrientation)
+
+		Return type: Matrix"""
+		return self.worldOrientation
+
+	@orientation.setter
+	def orientation(self, value):
+		self.worldOrientation = value
+
+	@property
+	def scaling(self):
+		"""The object's world scaling factor. (DEPRECATED, please use worldScale)
+
+		Return type: Vector"""
+		return self.worldScale
+
+	@scaling.setter
+	def scaling(self, value):
+		self.worldScale = value
 		
 	def endObject(self):
 		"""Delete this object, can be used in place of the EndObject Actuator.
@@ -221,7 +721,7 @@ class KX_GameObject(SCA_IObject):
 
 		Return type: 3d vector."""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def applyMovement(self, movement, local=False):
 		"""Sets the game object's movement.
@@ -283,7 +783,7 @@ class KX_GameObject(SCA_IObject):
 		
 		Return type: Vector((vx, vy, vz))"""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def setLinearVelocity(self, velocity, local=False):
 		"""Sets the game object's linear velocity.
@@ -311,7 +811,7 @@ class KX_GameObject(SCA_IObject):
 
 		Return type: Vector((vx, vy, vz))"""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def setAngularVelocity(self, velocity, local=False):
 		"""Sets the game object's angular velocity.
@@ -337,7 +837,7 @@ class KX_GameObject(SCA_IObject):
 
 		Return type: Vector((vx, vy, vz))"""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def getReactionForce(self):
 		"""Gets the game object's reaction force.
@@ -350,7 +850,7 @@ class KX_GameObject(SCA_IObject):
 
 		Note: This is not implimented at the moment."""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def applyImpulse(self, point, impulse, local=False):
 		"""Applies an impulse to the game object.
@@ -466,7 +966,7 @@ class KX_GameObject(SCA_IObject):
 		Return type:
 		3-tuple (float, 3-tuple (x, y, z), 3-tuple (x, y, z))"""
 		from mathutils import Vector
-		return (float(), Vector(None), Vector(None))
+		return (float(), Vector(), Vector())
 		
 	def rayCastTo(self, other, dist=0, prop=""):
 		"""Look towards another point/object and find first object hit within dist that matches prop.
@@ -495,7 +995,7 @@ class KX_GameObject(SCA_IObject):
 
 		Note: The ray ignores the object on which the method is called. It is casted from/to object center or explicit [x, y, z] points."""
 		from mathutils import Vector
-		return (KX_GameObject(), Vector(None), Vector(None), KX_PolyProxy(), Vector(None))
+		return (KX_GameObject(), Vector(), Vector(), KX_PolyProxy(), Vector())
 	
 	def setCollisionMargin(self, margin):
 		"""Set the objects collision margin.
@@ -1222,11 +1722,11 @@ class BL_ArmatureBone(PyObjectPlus):
 		self.inherit_scale = bool()
 		self.bbone_segments = int()
 		self.roll = float()
-		self.head = Vector(None)
-		self.tail = Vector(None)
+		self.head = Vector()
+		self.tail = Vector()
 		self.length = float()
-		self.arm_head = Vector(None)
-		self.arm_tail = Vector(None)
+		self.arm_head = Vector()
+		self.arm_tail = Vector()
 		self.arm_mat = Matrix(None)
 		self.bone_mat = Matrix(None)
 
@@ -1774,7 +2274,7 @@ class KX_Camera(KX_GameObject):
 		# Gets the vector of the camera front direction:
 		m_vect = camera.getScreenVect(0.5, 0.5)"""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def getScreenRay(self, x, y, dist=999.0, property=None):
 		"""Look towards a screen coordinate (x, y) and find first object hit within dist that matches prop. The ray is similar to KX_GameObject->rayCastTo.
@@ -2274,7 +2774,7 @@ class KX_MeshProxy(SCA_IObject):
 		"""
 		pass
 
-	def constructBvh(self):
+	def constructBvh(self, transform=None, epsilon=0.0):
 		"""Return a BVH tree based on mesh geometry. Indices of tree elements match polygons indices.
 
 		Parameters:
@@ -2286,7 +2786,9 @@ class KX_MeshProxy(SCA_IObject):
 
 		Return type: mathutils.bvhtree.BVHTree
 		"""
-		pass
+
+		from mathutils.bvhtree import BVHTree
+		return BVHTree.FromMeshProxy(self, transform, epsilon)
 	pass
 
 class KX_MouseActuator(SCA_IActuator):
@@ -2708,10 +3210,10 @@ class KX_Scene(PyObjectPlus):
 		
 		gameObj = __shared__["KX_GameObject"]
 		self.name = str()
-		self.objects = {"key" : gameObj}
-		self.objectsInactive = {"key" : gameObj}
-		self.lights = {"key" : KX_LightObject()}
-		self.cameras = {"key" : KX_Camera()}
+		self.objects = CListValue([gameObj])
+		self.objectsInactive = CListValue([gameObj])
+		self.lights = CListValue([KX_LightObject()])
+		self.cameras = CListValue([KX_Camera()])
 		self.active_camera = KX_Camera()
 		self.world = KX_WorldInfo()
 		self.suspended = bool()
@@ -2721,7 +3223,7 @@ class KX_Scene(PyObjectPlus):
 		self.pre_draw = list()
 		self.post_draw = list()
 		self.pre_draw_setup = list()
-		self.gravity = Vector(None)
+		self.gravity = Vector()
 	
 	def addObject(self, object, reference, time=0):
 		"""Adds an object to the scene like the Add Object Actuator would.
@@ -3082,7 +3584,7 @@ class KX_VertexProxy(SCA_IObject):
 		Return type:
 		Vector((x, y, z))"""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def setXYZ(self):
 		"""Sets the position of this vertex.
@@ -3103,7 +3605,7 @@ class KX_VertexProxy(SCA_IObject):
 		Return type:
 		Vector((u, v))"""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def setUV(self):
 		"""Sets the UV (texture) coordinates of this vertex.
@@ -3121,7 +3623,7 @@ class KX_VertexProxy(SCA_IObject):
 		Return type:
 		Vector((u, v))"""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def setUV2(self):
 		"""Sets the 2nd UV (texture) coordinates of this vertex.
@@ -3181,7 +3683,7 @@ class KX_VertexProxy(SCA_IObject):
 		Return type:
 		Vector((nx, ny, nz))"""
 		from mathutils import Vector
-		return Vector(None)
+		return Vector()
 		
 	def setNormal(self):
 		"""Sets the normal vector of this vertex.
@@ -3265,3 +3767,6 @@ class KX_PythonComponent(CValue):
 
 		Warning: This function must be inherited in the python component class."""
 		pass
+
+# The placeholder object the other placeholders refer to
+__shared__["KX_GameObject"] = KX_GameObject()
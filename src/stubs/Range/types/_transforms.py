@@ -0,0 +1,312 @@
+"""Compact storage of the transforms of game objects.
+
+A game object keeps a slot number only. The local and world positions,
+orientations and scales of all the objects of a scene are packed in flat
+arrays of a TransformStore, next to the parent of each slot, so an object
+costs a few dozen floats rather than a dozen Vector and Matrix instances,
+and the slots of freed objects are reused.
+
+Changing a local transform only flags its slot. World transforms are
+brought up to date when one is read, in waves going down the hierarchy:
+the flagged slots first, then their children, then the children of these.
+Each wave is one batch of numpy operations when numpy is installed, so
+moving a parent with a thousand descendants costs a few array operations
+rather than a thousand Python calls."""
+
+from array import array
+
+from mathutils.arrays import numpy
+
+_IDENTITY = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+# Below this many slots a wave is updated in Python, numpy calls cost more than the arithmetic
+_BATCH = 32
+
+
+def _buffer(typecode):
+	"""An empty buffer of the backend: floats ("d"), slots ("q") or flags ("b")."""
+
+	if numpy is not None:
+		return numpy.zeros(0, {"d": numpy.float64, "q": numpy.intp, "b": bool}[typecode])
+	return bytearray() if typecode == "b" else array(typecode)
+
+
+def _put(buffer, start, values):
+	if numpy is None:
+		values = array("d", values)
+	buffer[start:start + len(values)] = values
+
+
+def _grown(buffer, count, fill):
+	if numpy is not None:
+		return numpy.concatenate((buffer, numpy.full(count, fill, buffer.dtype)))
+	buffer.extend([fill] * count)
+	return buffer
+
+
+class TransformStore:
+	"""Local and world transforms of game objects, by slot, in struct of arrays.
+
+	Positions and scales are 3 floats per slot, orientations 9 (a 3x3
+	matrix, row after row). The buffers are numpy arrays when numpy is
+	installed, else array.array, and grow as slots are allocated. The world
+	buffers are only current after update()."""
+
+	__slots__ = (
+		"positions", "orientations", "scales",
+		"worldPositions", "worldOrientations", "worldScales",
+		"parents", "dirty", "version", "_children", "_pending", "_moved", "_count", "_free",
+	)
+
+	def __init__(self):
+		self.positions = _buffer("d")
+		self.orientations = _buffer("d")
+		self.scales = _buffer("d")
+		self.worldPositions = _buffer("d")
+		self.worldOrientations = _buffer("d")
+		self.worldScales = _buffer("d")
+		# Parent slot of each slot, -1 for none
+		self.parents = _buffer("q")
+		# Slots whose world transform is out of date
+		self.dirty = _buffer("b")
+		# Counts the updates that changed world transforms
+		self.version = 0
+		# Child slots of each slot, in parenting order
+		self._children = []
+		# Slots flagged since the last update, a slot may be listed more than once
+		self._pending = []
+		# Consumer: slots composed since its last takeMoved(), consumers are added by their first call
+		self._moved = {}
+		self._count = 0
+		self._free = []
+
+	def __len__(self):
+		return self._count - len(self._free)
+
+	def _grow(self):
+		count = max(64, self._count)
+		for name, size in (("positions", 3), ("orientations", 9), ("scales", 3)):
+			setattr(self, name, _grown(getattr(self, name), count * size, 0.0))
+			world = "world" + name[0].upper() + name[1:]
+			setattr(self, world, _grown(getattr(self, world), count * size, 0.0))
+		self.parents = _grown(self.parents, count, -1)
+		self.dirty = _grown(self.dirty, count, False)
+		self._children.extend([] for _ in range(count))
+
+	def _flag(self, slot):
+		if not self.dirty[slot]:
+			self.dirty[slot] = True
+			self._pending.append(slot)
+
+	def allocate(self):
+		"""Return the slot of a new identity transform, without parent.
+
+		Return type: int"""
+
+		if self._free:
+			slot = self._free.pop()
+		else:
+			slot = self._count
+			if slot >= len(self.parents):
+				self._grow()
+			self._count += 1
+		_put(self.positions, slot * 3, (0.0, 0.0, 0.0))
+		_put(self.orientations, slot * 9, _IDENTITY)
+		_put(self.scales, slot * 3, (1.0, 1.0, 1.0))
+		self._flag(slot)
+		return slot
+
+	def release(self, slot):
+		"""Give a slot back, to be reused by the next allocation. Its children lose their parent."""
+
+		self.setParent(slot, -1)
+		for child in self._children[slot]:
+			self.parents[child] = -1
+			self._flag(child)
+		self._children[slot] = []
+		self.dirty[slot] = False
+		self._free.append(slot)
+
+	def parent(self, slot):
+		"""The parent slot, -1 for none.
+
+		Return type: int"""
+
+		return int(self.parents[slot])
+
+	def setParent(self, slot, parent):
+		"""Attach a slot to a parent slot, -1 to detach it. The local transform is kept, the world one follows the parent."""
+
+		previous = int(self.parents[slot])
+		if previous == parent:
+			return
+		if previous >= 0:
+			self._children[previous].remove(slot)
+		if parent >= 0:
+			self._children[parent].append(slot)
+		self.parents[slot] = parent
+		self._flag(slot)
+
+	def position(self, slot):
+		"""Return type: list"""
+
+		return self.positions[slot * 3:slot * 3 + 3].tolist()
+
+	def setPosition(self, slot, values):
+		_put(self.positions, slot * 3, values)
+		self._flag(slot)
+
+	def orientation(self, slot):
+		"""The orientation as 9 floats, row after row.
+
+		Return type: list"""
+
+		return self.orientations[slot * 9:slot * 9 + 9].tolist()
+
+	def setOrientation(self, slot, values):
+		_put(self.orientations, slot * 9, values)
+		self._flag(slot)
+
+	def scale(self, slot):
+		"""Return type: list"""
+
+		return self.scales[slot * 3:slot * 3 + 3].tolist()
+
+	def setScale(self, slot, values):
+		_put(self.scales, slot * 3, values)
+		self._flag(slot)
+
+	def world(self, slot):
+		"""The world position, orientation (9 floats, row after row) and scale of a slot.
+
+		Return type: tuple"""
+
+		if self._pending:
+			self.update()
+		return (
+			self.worldPositions[slot * 3:slot * 3 + 3].tolist(),
+			self.worldOrientations[slot * 9:slot * 9 + 9].tolist(),
+			self.worldScales[slot * 3:slot * 3 + 3].tolist(),
+		)
+
+	def setWorld(self, slot, position=None, orientation=None, scale=None):
+		"""Set the local transform of a slot so that its world transform is the given one, None keeps a part."""
+
+		parent = int(self.parents[slot])
+		if parent < 0:
+			if position is not None:
+				self.setPosition(slot, position)
+			if orientation is not None:
+				self.setOrientation(slot, orientation)
+			if scale is not None:
+				self.setScale(slot, scale)
+			return
+		origin, rotation, factors = self.world(parent)
+		# Rotations are orthonormal, their transpose is the inverse
+		if position is not None:
+			offset = [a - b for a, b in zip(position, origin)]
+			local = [sum(rotation[row * 3 + column] * offset[row] for row in range(3)) for column in range(3)]
+			self.setPosition(slot, [value / s if s else 0.0 for value, s in zip(local, factors)])
+		if orientation is not None:
+			self.setOrientation(slot, [
+				sum(rotation[inner * 3 + row] * orientation[inner * 3 + column] for inner in range(3))
+				for row in range(3) for column in range(3)
+			])
+		if scale is not None:
+			self.setScale(slot, [value / s if s else 0.0 for value, s in zip(scale, factors)])
+
+	def update(self):
+		"""Bring the world transforms of the flagged slots and of their descendants up to date."""
+
+		pending, dirty, parents = self._pending, self.dirty, self.parents
+		if not pending:
+			return
+		wave = []
+		for slot in dict.fromkeys(pending):
+			if not dirty[slot]:
+				continue
+			# Slots below another flagged slot are updated with it
+			above = int(parents[slot])
+			while above >= 0 and not dirty[above]:
+				above = int(parents[above])
+			if above < 0:
+				wave.append(slot)
+		children, consumers = self._children, self._moved.values()
+		while wave:
+			for moved in consumers:
+				moved.extend(wave)
+			if numpy is not None and len(wave) >= _BATCH:
+				self._composeMany(wave)
+			else:
+				for slot in wave:
+					self._compose(slot)
+			wave = [child for slot in wave for child in children[slot]]
+		for slot in pending:
+			dirty[slot] = False
+		self._pending = []
+		self.version += 1
+
+	def takeMoved(self, consumer):
+		"""Return the slots whose world transform changed since the previous call by consumer, in any order and possibly repeated.
+
+		Every consumer sees every move. Slots are only tracked for a consumer once it called this: its first call returns every allocated slot.
+
+		Parameters:
+		consumer (object) - The index kept up to date with the moves, any hashable key.
+
+		Return type: list"""
+
+		if self._pending:
+			self.update()
+		moved = self._moved.get(consumer)
+		if moved is None:
+			self._moved[consumer] = []
+			free = set(self._free)
+			return [slot for slot in range(self._count) if slot not in free]
+		self._moved[consumer] = []
+		return moved
+
+	def _compose(self, slot):
+		start, parent = slot * 3, int(self.parents[slot])
+		position = self.positions[start:start + 3].tolist()
+		orientation = self.orientations[slot * 9:slot * 9 + 9].tolist()
+		scale = self.scales[start:start + 3].tolist()
+		if parent >= 0:
+			origin, rotation, factors = (
+				self.worldPositions[parent * 3:parent * 3 + 3].tolist(),
+				self.worldOrientations[parent * 9:parent * 9 + 9].tolist(),
+				self.worldScales[parent * 3:parent * 3 + 3].tolist(),
+			)
+			offset = [f * p for f, p in zip(factors, position)]
+			position = [
+				origin[row] + sum(rotation[row * 3 + column] * offset[column] for column in range(3))
+				for row in range(3)
+			]
+			orientation = [
+				sum(rotation[row * 3 + inner] * orientation[inner * 3 + column] for inner in range(3))
+				for row in range(3) for column in range(3)
+			]
+			scale = [f * s for f, s in zip(factors, scale)]
+		_put(self.worldPositions, start, position)
+		_put(self.worldOrientations, slot * 9, orientation)
+		_put(self.worldScales, start, scale)
+
+	def _composeMany(self, slots):
+		slots = numpy.array(slots, numpy.intp)
+		above = self.parents[slots]
+		positions, scales = self.positions.reshape(-1, 3), self.scales.reshape(-1, 3)
+		orientations = self.orientations.reshape(-1, 3, 3)
+		worldPositions, worldScales = self.worldPositions.reshape(-1, 3), self.worldScales.reshape(-1, 3)
+		worldOrientations = self.worldOrientations.reshape(-1, 3, 3)
+		rooted = above < 0
+		if rooted.any():
+			roots = slots[rooted]
+			worldPositions[roots] = positions[roots]
+			worldOrientations[roots] = orientations[roots]
+			worldScales[roots] = scales[roots]
+			slots, above = slots[~rooted], above[~rooted]
+		if not len(slots):
+			return
+		rotation, factors = worldOrientations[above], worldScales[above]
+		worldPositions[slots] = worldPositions[above] + numpy.einsum("nij,nj->ni", rotation, factors * positions[slots])
+		worldOrientations[slots] = numpy.matmul(rotation, orientations[slots])
+		worldScales[slots] = factors * scales[slots]
@@ -11,6 +11,7 @@ Submodules:
 - KDTree Utilities (mathutils.kdtree)
 - Interpolation Utilities (mathutils.interpolate)
 - Noise Utilities (mathutils.noise)
+- Array Utilities (mathutils.arrays)
 
 The mathutils module provides the following classes:
 
@@ -18,9 +19,15 @@ The mathutils module provides the following classes:
 - Euler
 - Matrix
 - Quaternion
-- Vector"""
+- Vector
+- VectorArray, QuaternionArray, MatrixArray (batches of vectors, quaternions and matrices, see mathutils.arrays)"""
 
-from . import bvhtree, geometry, interpolate, kdtree, noise
+import itertools
+import math
+
+_new = object.__new__
+# Below this, lengths and dot products are treated as zero by the interpolations
+_EPSILON = 1.1920929e-07
 
 class Color:
 	"""This object gives access to Colors in Blender.
@@ -58,1192 +65,2679 @@ class Color:
 		return self
 	pass
 
+def _euler(values, order):
+	"""An euler owning values, a list of 3 floats, which is neither copied nor checked.
+
+	Return type: Euler"""
+
+	euler = _new(Euler)
+	euler._e = values
+	euler._order = order
+	euler._frozen = False
+	euler._cache = None
+	euler._owner = None
+	euler._callback = None
+	return euler
+
+def _memo(value, key, compute):
+	"""compute(), remembered under key once value, a Matrix, Euler or Quaternion, is frozen."""
+
+	if not value._frozen:
+		return compute()
+	try:
+		return value._cache[key]
+	except KeyError:
+		result = value._cache[key] = compute()
+		return result
+
 class Euler:
 	"""This object gives access to Eulers in Blender.
 
+	The matrix and quaternion of a frozen euler are computed once and
+	remembered.
+
 	Parameters:
 	angles (3d vector) - Three angles, in radians.
 	order (str) - Optional order of the angles, a permutation of XYZ."""
-	
-	def __init__(self, angles, order="XYZ"):
-		self.is_frozen = False
-		self.is_wrapped = False
-		self.order = self
-		self.owner = self
-		self.x = 1.0
-		self.y = 1.0
-		self.z = 1.0
-		
+
+	__slots__ = ("_e", "_order", "_frozen", "_cache", "_owner", "_callback")
+
+	def __init__(self, angles=(0.0, 0.0, 0.0), order="XYZ"):
+		values = [float(value) for value in angles]
+		if len(values) != 3:
+			raise ValueError("Euler(): 3d sequence expected")
+		_euler_order(order)
+		self._e = values
+		self._order = order
+		self._frozen = False
+		self._cache = None
+		self._owner = None
+		self._callback = None
+
+	@classmethod
+	def _wrap(cls, values, order, owner, callback):
+		"""An euler of values which calls callback with its angles whenever it changes.
+
+		Return type: Euler"""
+
+		euler = _euler([float(value) for value in values], order)
+		euler._owner = owner
+		euler._callback = callback
+		return euler
+
+	def _assign(self, values):
+		"""Replace the angles, a wrapped euler passes them to its owner."""
+
+		if self._frozen:
+			raise TypeError("Euler is frozen, cannot modify")
+		self._e = values
+		if self._callback is not None:
+			self._callback(values)
+
+	def _set(self, index, value):
+		values = list(self._e)
+		values[index] = float(value)
+		self._assign(values)
+
+	@property
+	def is_frozen(self):
+		"""True when this object has been frozen (read-only).
+
+		Return type: bool"""
+
+		return self._frozen
+
+	@property
+	def is_wrapped(self):
+		"""True when this object wraps external data (read-only).
+
+		Return type: bool"""
+
+		return self._callback is not None
+
+	@property
+	def owner(self):
+		"""The item this is wrapping or None (read-only)."""
+
+		return self._owner
+
+	@property
+	def order(self):
+		"""Euler rotation order.
+
+		One of 'XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX'.
+
+		Return type: str"""
+
+		return self._order
+
+	@order.setter
+	def order(self, value):
+		if self._frozen:
+			raise TypeError("Euler is frozen, cannot modify")
+		_euler_order(value)
+		self._order = value
+
+	@property
+	def x(self):
+		"""Euler axis angle in radians.
+
+		Return type: float"""
+
+		return self._e[0]
+
+	@x.setter
+	def x(self, value):
+		self._set(0, value)
+
+	@property
+	def y(self):
+		"""Euler axis angle in radians.
+
+		Return type: float"""
+
+		return self._e[1]
+
+	@y.setter
+	def y(self, value):
+		self._set(1, value)
+
+	@property
+	def z(self):
+		"""Euler axis angle in radians.
+
+		Return type: float"""
+
+		return self._e[2]
+
+	@z.setter
+	def z(self, value):
+		self._set(2, value)
+
+	def __len__(self):
+		return 3
+
+	def __iter__(self):
+		return iter(list(self._e))
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return tuple(self._e[index])
+		try:
+			return self._e[index]
+		except IndexError:
+			raise IndexError("euler[attribute]: array index out of range") from None
+
+	def __setitem__(self, index, value):
+		values = list(self._e)
+		if isinstance(index, slice):
+			items = [float(item) for item in value]
+			values[index] = items
+			if len(values) != 3:
+				raise ValueError("euler[begin:end] = []: size mismatch in slice assignment")
+		else:
+			try:
+				values[index] = float(value)
+			except IndexError:
+				raise IndexError("euler[attribute] = x: array assignment index out of range") from None
+		self._assign(values)
+
+	def __repr__(self):
+		return "Euler((%r, %r, %r), %r)" % (self._e[0], self._e[1], self._e[2], self._order)
+
+	def __str__(self):
+		return "<Euler (x=%.4f, y=%.4f, z=%.4f), order=%r>" % (self._e[0], self._e[1], self._e[2], self._order)
+
+	def __eq__(self, other):
+		if isinstance(other, Euler):
+			return self._order == other._order and self._e == other._e
+		return NotImplemented
+
+	def __ne__(self, other):
+		if isinstance(other, Euler):
+			return not self == other
+		return NotImplemented
+
+	def __hash__(self):
+		if not self._frozen:
+			raise TypeError("Euler must be frozen to be hashable")
+		return hash((tuple(self._e), self._order))
+
+	def __copy__(self):
+		return self.copy()
+
+	def __deepcopy__(self, memo):
+		return self.copy()
+
+	def __reduce__(self):
+		return Euler, (list(self._e), self._order)
+
 	def copy(self):
 		"""Returns a copy of this euler.
 
 		Returns: A copy of the euler.
-		
+
 		Return type: Euler
-		
+
 		Note: use this to get a copy of a wrapped euler with no reference to the original data."""
-		
-		return self
-		
+
+		return _euler(list(self._e), self._order)
+
 	def freeze(self):
 		"""Make this object immutable.
 
 		After this the object can be hashed, used in dictionaries & sets.
 
 		Returns: An instance of this object."""
-		
+
+		if self._callback is not None:
+			raise TypeError("Euler.freeze(): cannot freeze wrapped data")
+		if not self._frozen:
+			self._frozen = True
+			self._cache = {}
 		return self
-		
+
 	def make_compatible(self, other):
 		"""Make this euler compatible with another, so interpolating between them works as intended.
 
 		Note: the rotation order is not taken into account for this function."""
-		
-		pass
-		
+
+		old = [float(value) for value in other]
+		if len(old) != 3:
+			raise ValueError("Euler.make_compatible(other): 3d sequence expected")
+		self._assign(_compatible_euler(self._e, old))
+
 	def rotate(self, other):
 		"""Rotates the euler by another mathutils value.
 
 		Parameters:
 		other (Euler, Quaternion or Matrix) - rotation component of mathutils value"""
-		
-		pass
-		
+
+		rotation = _multiply(_rotation_of(other), _euler_rotation(self._e, self._order), 3, 3, 3)
+		self._assign(_euler_from_rotation(rotation, self._order, self._e))
+
 	def rotate_axis(self, axis, angle):
 		"""Rotates the euler a certain amount and returning a unique euler rotation (no 720 degree pitches).
 
 		Parameters:
 		axis (string) - single character in ['X, 'Y', 'Z'].
 		angle (float) - angle in radians."""
-		
-		pass
-		
+
+		if axis not in ("X", "Y", "Z"):
+			raise ValueError("Euler.rotate_axis(): expected axis to be 'X', 'Y' or 'Z'")
+		rotation = _multiply(_euler_rotation(self._e, self._order), _axis_rotation("XYZ".index(axis), angle), 3, 3, 3)
+		self._assign(_euler_from_rotation(rotation, self._order))
+
 	def to_matrix(self):
 		"""Return a matrix representation of the euler.
 
 		Returns: A 3x3 roation matrix representation of the euler.
-		
+
 		Return type: Matrix"""
-		
-		return Matrix(False)
-		
+
+		values = _memo(self, "matrix", lambda: _euler_rotation(self._e, self._order))
+		return _matrix(list(values), 3, 3)
+
 	def to_quaternion(self):
 		"""Return a quaternion representation of the euler.
 
 		Returns: Quaternion representation of the euler.
 		Return type: Quaternion"""
-		
-		return Quaternion(False, False)
-		
+
+		return _quaternion(list(_memo(self, "quaternion", lambda: _euler_quaternion(self._e, self._order))))
+
 	def zero(self):
 		"""Set all values to zero."""
-		
-		pass
-	pass
+
+		self._assign([0.0, 0.0, 0.0])
+
+def _matrix(values, rows, columns):
+	"""A matrix owning values, a flat row-major list of floats, which is neither copied nor checked.
+
+	Return type: Matrix"""
+
+	matrix = _new(Matrix)
+	matrix._m = values
+	matrix._nrows = rows
+	matrix._ncols = columns
+	matrix._frozen = False
+	matrix._cache = None
+	return matrix
+
+def _identity(size):
+	values = [0.0] * (size * size)
+	values[::size + 1] = [1.0] * size
+	return values
+
+def _extend(values, size, target):
+	"""Flat square matrix of size target from a size x size one, the new parts from the identity."""
+
+	result = _identity(target)
+	for row in range(min(size, target)):
+		result[row * target:row * target + min(size, target)] = values[row * size:row * size + min(size, target)]
+	return result
+
+def _multiply(a, b, rows, inner, columns):
+	"""Product of the flat row-major matrices a (rows x inner) and b (inner x columns)."""
+
+	if rows == inner == columns == 4:
+		a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15 = a
+		b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15 = b
+		return [
+			a0 * b0 + a1 * b4 + a2 * b8 + a3 * b12, a0 * b1 + a1 * b5 + a2 * b9 + a3 * b13,
+			a0 * b2 + a1 * b6 + a2 * b10 + a3 * b14, a0 * b3 + a1 * b7 + a2 * b11 + a3 * b15,
+			a4 * b0 + a5 * b4 + a6 * b8 + a7 * b12, a4 * b1 + a5 * b5 + a6 * b9 + a7 * b13,
+			a4 * b2 + a5 * b6 + a6 * b10 + a7 * b14, a4 * b3 + a5 * b7 + a6 * b11 + a7 * b15,
+			a8 * b0 + a9 * b4 + a10 * b8 + a11 * b12, a8 * b1 + a9 * b5 + a10 * b9 + a11 * b13,
+			a8 * b2 + a9 * b6 + a10 * b10 + a11 * b14, a8 * b3 + a9 * b7 + a10 * b11 + a11 * b15,
+			a12 * b0 + a13 * b4 + a14 * b8 + a15 * b12, a12 * b1 + a13 * b5 + a14 * b9 + a15 * b13,
+			a12 * b2 + a13 * b6 + a14 * b10 + a15 * b14, a12 * b3 + a13 * b7 + a14 * b11 + a15 * b15,
+		]
+	if rows == inner == columns == 3:
+		a0, a1, a2, a3, a4, a5, a6, a7, a8 = a
+		b0, b1, b2, b3, b4, b5, b6, b7, b8 = b
+		return [
+			a0 * b0 + a1 * b3 + a2 * b6, a0 * b1 + a1 * b4 + a2 * b7, a0 * b2 + a1 * b5 + a2 * b8,
+			a3 * b0 + a4 * b3 + a5 * b6, a3 * b1 + a4 * b4 + a5 * b7, a3 * b2 + a4 * b5 + a5 * b8,
+			a6 * b0 + a7 * b3 + a8 * b6, a6 * b1 + a7 * b4 + a8 * b7, a6 * b2 + a7 * b5 + a8 * b8,
+		]
+	b_columns = [b[column::columns] for column in range(columns)]
+	return [
+		sum(x * y for x, y in zip(a[row * inner:(row + 1) * inner], b_column))
+		for row in range(rows) for b_column in b_columns
+	]
+
+def _determinant(values, size):
+	if size == 4:
+		a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15 = values
+		c0 = a8 * a13 - a12 * a9
+		c1 = a8 * a14 - a12 * a10
+		c2 = a8 * a15 - a12 * a11
+		c3 = a9 * a14 - a13 * a10
+		c4 = a9 * a15 - a13 * a11
+		c5 = a10 * a15 - a14 * a11
+		return (
+			(a0 * a5 - a4 * a1) * c5 - (a0 * a6 - a4 * a2) * c4 + (a0 * a7 - a4 * a3) * c3
+			+ (a1 * a6 - a5 * a2) * c2 - (a1 * a7 - a5 * a3) * c1 + (a2 * a7 - a6 * a3) * c0
+		)
+	if size == 3:
+		a0, a1, a2, a3, a4, a5, a6, a7, a8 = values
+		return a0 * (a4 * a8 - a5 * a7) - a1 * (a3 * a8 - a5 * a6) + a2 * (a3 * a7 - a4 * a6)
+	if size == 2:
+		return values[0] * values[3] - values[1] * values[2]
+	# Gaussian elimination with partial pivoting for any other size
+	work = [values[row * size:(row + 1) * size] for row in range(size)]
+	determinant = 1.0
+	for column in range(size):
+		pivot = max(range(column, size), key=lambda row: abs(work[row][column]))
+		if not work[pivot][column]:
+			return 0.0
+		if pivot != column:
+			work[column], work[pivot] = work[pivot], work[column]
+			determinant = -determinant
+		determinant *= work[column][column]
+		for row in range(column + 1, size):
+			factor = work[row][column] / work[column][column]
+			work[row] = [x - factor * y for x, y in zip(work[row], work[column])]
+	return determinant
+
+def _inverse(values, size):
+	"""Flat inverse of a square matrix, None when it has no inverse."""
+
+	if size == 4:
+		a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15 = values
+		s0 = a0 * a5 - a4 * a1
+		s1 = a0 * a6 - a4 * a2
+		s2 = a0 * a7 - a4 * a3
+		s3 = a1 * a6 - a5 * a2
+		s4 = a1 * a7 - a5 * a3
+		s5 = a2 * a7 - a6 * a3
+		c0 = a8 * a13 - a12 * a9
+		c1 = a8 * a14 - a12 * a10
+		c2 = a8 * a15 - a12 * a11
+		c3 = a9 * a14 - a13 * a10
+		c4 = a9 * a15 - a13 * a11
+		c5 = a10 * a15 - a14 * a11
+		determinant = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+		if not determinant:
+			return None
+		d = 1.0 / determinant
+		return [
+			(a5 * c5 - a6 * c4 + a7 * c3) * d, (-a1 * c5 + a2 * c4 - a3 * c3) * d,
+			(a13 * s5 - a14 * s4 + a15 * s3) * d, (-a9 * s5 + a10 * s4 - a11 * s3) * d,
+			(-a4 * c5 + a6 * c2 - a7 * c1) * d, (a0 * c5 - a2 * c2 + a3 * c1) * d,
+			(-a12 * s5 + a14 * s2 - a15 * s1) * d, (a8 * s5 - a10 * s2 + a11 * s1) * d,
+			(a4 * c4 - a5 * c2 + a7 * c0) * d, (-a0 * c4 + a1 * c2 - a3 * c0) * d,
+			(a12 * s4 - a13 * s2 + a15 * s0) * d, (-a8 * s4 + a9 * s2 - a11 * s0) * d,
+			(-a4 * c3 + a5 * c1 - a6 * c0) * d, (a0 * c3 - a1 * c1 + a2 * c0) * d,
+			(-a12 * s3 + a13 * s1 - a14 * s0) * d, (a8 * s3 - a9 * s1 + a10 * s0) * d,
+		]
+	if size == 3:
+		a0, a1, a2, a3, a4, a5, a6, a7, a8 = values
+		c0 = a4 * a8 - a5 * a7
+		c1 = a5 * a6 - a3 * a8
+		c2 = a3 * a7 - a4 * a6
+		determinant = a0 * c0 + a1 * c1 + a2 * c2
+		if not determinant:
+			return None
+		d = 1.0 / determinant
+		return [
+			c0 * d, (a2 * a7 - a1 * a8) * d, (a1 * a5 - a2 * a4) * d,
+			c1 * d, (a0 * a8 - a2 * a6) * d, (a2 * a3 - a0 * a5) * d,
+			c2 * d, (a1 * a6 - a0 * a7) * d, (a0 * a4 - a1 * a3) * d,
+		]
+	if size == 2:
+		determinant = values[0] * values[3] - values[1] * values[2]
+		if not determinant:
+			return None
+		d = 1.0 / determinant
+		return [values[3] * d, -values[1] * d, -values[2] * d, values[0] * d]
+	# Gauss-Jordan elimination for any other size
+	work = [values[row * size:(row + 1) * size] + _identity(size)[row * size:(row + 1) * size] for row in range(size)]
+	for column in range(size):
+		pivot = max(range(column, size), key=lambda row: abs(work[row][column]))
+		if not work[pivot][column]:
+			return None
+		work[column], work[pivot] = work[pivot], work[column]
+		scale = 1.0 / work[column][column]
+		work[column] = [value * scale for value in work[column]]
+		for row in range(size):
+			if row != column and work[row][column]:
+				factor = work[row][column]
+				work[row] = [x - factor * y for x, y in zip(work[row], work[column])]
+	return [value for row in work for value in row[size:]]
+
+def _adjugate(values, size):
+	"""Flat adjugate (transposed cofactors) of a square matrix, defined even when it is singular."""
+
+	if size == 2:
+		return [values[3], -values[1], -values[2], values[0]]
+	result = [0.0] * (size * size)
+	for row in range(size):
+		for column in range(size):
+			minor = [
+				values[r * size + c]
+				for r in range(size) if r != row
+				for c in range(size) if c != column
+			]
+			sign = -1.0 if (row + column) % 2 else 1.0
+			result[column * size + row] = sign * _determinant(minor, size - 1)
+	return result
+
+def _rotation_3x3(values, rows, columns):
+	"""The upper 3x3 of a flat matrix with at least 3 rows and columns."""
+
+	return values[0:3] + values[columns:columns + 3] + values[2 * columns:2 * columns + 3]
+
+def _normalized_columns(values):
+	"""The columns of a flat 3x3 normalized, with the column lengths."""
+
+	lengths = [math.hypot(values[column], values[column + 3], values[column + 6]) for column in range(3)]
+	result = list(values)
+	for column, length in enumerate(lengths):
+		if length:
+			for row in range(3):
+				result[row * 3 + column] /= length
+	return result, lengths
+
+def _quaternion_from_rotation(m):
+	"""(w, x, y, z) of a flat, orthonormal 3x3 rotation, w is never negative."""
+
+	trace = m[0] + m[4] + m[8]
+	if trace > 0.0:
+		s = 2.0 * math.sqrt(trace + 1.0)
+		q = [0.25 * s, (m[7] - m[5]) / s, (m[2] - m[6]) / s, (m[3] - m[1]) / s]
+	elif m[0] > m[4] and m[0] > m[8]:
+		s = 2.0 * math.sqrt(1.0 + m[0] - m[4] - m[8])
+		q = [(m[7] - m[5]) / s, 0.25 * s, (m[1] + m[3]) / s, (m[2] + m[6]) / s]
+	elif m[4] > m[8]:
+		s = 2.0 * math.sqrt(1.0 + m[4] - m[0] - m[8])
+		q = [(m[2] - m[6]) / s, (m[1] + m[3]) / s, 0.25 * s, (m[5] + m[7]) / s]
+	else:
+		s = 2.0 * math.sqrt(1.0 + m[8] - m[0] - m[4])
+		q = [(m[3] - m[1]) / s, (m[2] + m[6]) / s, (m[5] + m[7]) / s, 0.25 * s]
+	if q[0] < 0.0:
+		q = [-value for value in q]
+	length = math.hypot(*q)
+	return [value / length for value in q] if length else [1.0, 0.0, 0.0, 0.0]
+
+def _quaternion_rotation(q):
+	"""Flat 3x3 rotation of a (w, x, y, z) quaternion, which is normalized first."""
+
+	length = math.hypot(*q)
+	if not length:
+		return _identity(3)
+	w, x, y, z = (value / length for value in q)
+	return [
+		1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z), 2.0 * (x * z + w * y),
+		2.0 * (x * y + w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x),
+		2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y),
+	]
+
+def _quaternion_slerp(a, b, factor):
+	"""Spherical interpolation of two unit (w, x, y, z) quaternions, along the shortest path."""
+
+	cosine = a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3]
+	if cosine < 0.0:
+		cosine, b = -cosine, [-value for value in b]
+	if cosine < 1.0 - 0.0001:
+		omega = math.acos(cosine)
+		sine = math.sin(omega)
+		wa, wb = math.sin((1.0 - factor) * omega) / sine, math.sin(factor * omega) / sine
+	else:
+		wa, wb = 1.0 - factor, factor
+	return [x * wa + y * wb for x, y in zip(a, b)]
+
+# Axes of the rotation orders, and whether the order is an odd permutation of XYZ
+_EULER_ORDERS = {
+	"XYZ": ((0, 1, 2), False),
+	"XZY": ((0, 2, 1), True),
+	"YXZ": ((1, 0, 2), True),
+	"YZX": ((1, 2, 0), False),
+	"ZXY": ((2, 0, 1), False),
+	"ZYX": ((2, 1, 0), True),
+}
+
+def _euler_order(order):
+	try:
+		return _EULER_ORDERS[order]
+	except KeyError:
+		raise ValueError("Euler order must be one of %s, not %r" % (", ".join(_EULER_ORDERS), order)) from None
+
+def _euler_pair(m, order):
+	"""The two (x, y, z) euler solutions of a flat, orthonormal 3x3 rotation."""
+
+	(i, j, k), parity = _euler_order(order)
+	# mat(a, b) is the element of column a, row b
+	def mat(a, b):
+		return m[b * 3 + a]
+	cy = math.hypot(mat(i, i), mat(i, j))
+	first, second = [0.0] * 3, [0.0] * 3
+	if cy > 16.0 * _EPSILON:
+		first[i] = math.atan2(mat(j, k), mat(k, k))
+		first[j] = math.atan2(-mat(i, k), cy)
+		first[k] = math.atan2(mat(i, j), mat(i, i))
+		second[i] = math.atan2(-mat(j, k), -mat(k, k))
+		second[j] = math.atan2(-mat(i, k), -cy)
+		second[k] = math.atan2(-mat(i, j), -mat(i, i))
+	else:
+		# Gimbal lock, the first and last rotations share an axis
+		first[i] = math.atan2(-mat(k, j), mat(j, j))
+		first[j] = math.atan2(-mat(i, k), cy)
+		second = list(first)
+	if parity:
+		first = [-value for value in first]
+		second = [-value for value in second]
+	return first, second
+
+def _compatible_euler(euler, old):
+	"""euler adjusted to the closest equivalent of old, without flipping an axis."""
+
+	euler = list(euler)
+	difference = [0.0] * 3
+	for axis in range(3):
+		difference[axis] = euler[axis] - old[axis]
+		if difference[axis] > 5.1:
+			euler[axis] -= math.floor(difference[axis] / (2.0 * math.pi) + 0.5) * 2.0 * math.pi
+			difference[axis] = euler[axis] - old[axis]
+		elif difference[axis] < -5.1:
+			euler[axis] += math.floor(-difference[axis] / (2.0 * math.pi) + 0.5) * 2.0 * math.pi
+			difference[axis] = euler[axis] - old[axis]
+	for axis in range(3):
+		others = [abs(difference[other]) for other in range(3) if other != axis]
+		if abs(difference[axis]) > 3.2 and max(others) < 1.6:
+			euler[axis] += -2.0 * math.pi if difference[axis] > 0.0 else 2.0 * math.pi
+	return euler
+
+def _euler_from_rotation(m, order="XYZ", compatible=None):
+	"""(x, y, z) euler angles of a flat, orthonormal 3x3 rotation."""
+
+	first, second = _euler_pair(m, order)
+	if compatible is not None:
+		first = _compatible_euler(first, compatible)
+		second = _compatible_euler(second, compatible)
+		reference = list(compatible)
+	else:
+		reference = [0.0, 0.0, 0.0]
+	distance = lambda euler: sum(abs(a - b) for a, b in zip(euler, reference))
+	return first if distance(first) <= distance(second) else second
+
+def _euler_rotation(angles, order="XYZ"):
+	"""Flat 3x3 rotation of euler angles, applied in the given order."""
+
+	axes, _ = _euler_order(order)
+	result = _identity(3)
+	for axis in axes:
+		result = _multiply(_axis_rotation(axis, angles[axis]), result, 3, 3, 3)
+	return result
+
+def _axis_rotation(axis, angle):
+	c, s = math.cos(angle), math.sin(angle)
+	if axis == 0:
+		return [1.0, 0.0, 0.0, 0.0, c, -s, 0.0, s, c]
+	if axis == 1:
+		return [c, 0.0, s, 0.0, 1.0, 0.0, -s, 0.0, c]
+	return [c, -s, 0.0, s, c, 0.0, 0.0, 0.0, 1.0]
+
+def _check_size(size, name):
+	if size not in (2, 3, 4):
+		raise ValueError("%s(): can only return a 2x2 3x3 or 4x4 matrix" % name)
+
+def _axis_angle_quaternion(axis, angle):
+	"""(w, x, y, z) of a rotation of angle radians around axis, a 3D vector."""
+
+	axis = [float(value) for value in axis]
+	if len(axis) != 3:
+		raise ValueError("expected a 3D axis")
+	length = math.hypot(*axis)
+	if not length:
+		return [1.0, 0.0, 0.0, 0.0]
+	s = math.sin(angle / 2.0) / length
+	return [math.cos(angle / 2.0), axis[0] * s, axis[1] * s, axis[2] * s]
+
+def _rotation_of(value):
+	"""Flat 3x3 rotation of a Matrix, Euler or Quaternion."""
+
+	if isinstance(value, Matrix):
+		if value._nrows < 3 or value._ncols < 3:
+			raise ValueError("expected a 3x3 or 4x4 matrix")
+		return _rotation_3x3(value._m, value._nrows, value._ncols)
+	if isinstance(value, (Euler, Quaternion)):
+		return _rotation_of(value.to_matrix())
+	raise TypeError("expected an Euler, Quaternion or Matrix, not %s" % type(value).__name__)
+
+class _MatrixAccess:
+	"""The rows or columns of a matrix (Matrix.row, Matrix.col), as vectors writing back to it."""
+
+	__slots__ = ("_matrix", "_columns")
+
+	def __init__(self, matrix, columns):
+		self._matrix = matrix
+		self._columns = columns
+
+	def __len__(self):
+		return self._matrix._ncols if self._columns else self._matrix._nrows
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return tuple(self[i] for i in range(*index.indices(len(self))))
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError("matrix[attribute]: array index out of range")
+		matrix = self._matrix
+		if self._columns:
+			values = matrix._m[index::matrix._ncols]
+			return Vector._wrap(values, matrix, lambda changed: matrix._set_column(index, changed))
+		values = matrix._m[index * matrix._ncols:(index + 1) * matrix._ncols]
+		return Vector._wrap(values, matrix, lambda changed: matrix._set_row(index, changed))
+
+	def __setitem__(self, index, value):
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError("matrix[attribute] = x: array assignment index out of range")
+		values = [float(item) for item in value]
+		if self._columns:
+			self._matrix._set_column(index, values)
+		else:
+			self._matrix._set_row(index, values)
+
+	def __iter__(self):
+		for index in range(len(self)):
+			yield self[index]
 
 class Matrix:
 	"""This object gives access to Matrices in Blender, supporting square and rectangular matrices from 2x2 up to 4x4.
 
+	Values are kept row-major in one flat list of floats. Products,
+	inverses and determinants of 3x3 and 4x4 matrices have unrolled fast
+	paths. The inverse, determinant and decomposition of a frozen matrix
+	are computed once and memoized.
+
 	Parameters:
 	rows (2d number sequence) - Sequence of rows. When ommitted, a 4x4 identity matrix is constructed."""
-	
-	def __init__(self, rows):
-		self.col = self
-		self.is_frozen = False
-		self.is_negative = False
-		self.is_orthogonal = False
-		self.is_orthogonal_axis_vectors = False
-		self.is_wrapped = False
-		self.median_scale = 1.0
-		self.owner = self
-		self.row = self
-		self.translation = Vector(False)
-		
+
+	__slots__ = ("_m", "_nrows", "_ncols", "_frozen", "_cache")
+
+	def __init__(self, rows=None):
+		if rows is None:
+			values, count, size = _identity(4), 4, 4
+		else:
+			rows = [[float(value) for value in row] for row in rows]
+			count = len(rows)
+			size = len(rows[0]) if rows else 0
+			if not 2 <= count <= 4 or not 2 <= size <= 4 or any(len(row) != size for row in rows):
+				raise ValueError("Matrix(): expects 2 to 4 rows of 2 to 4 numbers, all rows of the same size")
+			values = [value for row in rows for value in row]
+		self._m = values
+		self._nrows = count
+		self._ncols = size
+		self._frozen = False
+		self._cache = None
+
+	def _assign(self, values, rows=None, columns=None):
+		"""Replace the values, and the size when given."""
+
+		if self._frozen:
+			raise TypeError("Matrix is frozen, cannot modify")
+		self._m = values
+		if rows is not None:
+			self._nrows, self._ncols = rows, columns
+
+	def _set_row(self, index, values):
+		if len(values) != self._ncols:
+			raise ValueError("matrix[row] = x: size mismatch")
+		updated = list(self._m)
+		updated[index * self._ncols:(index + 1) * self._ncols] = values
+		self._assign(updated)
+
+	def _set_column(self, index, values):
+		if len(values) != self._nrows:
+			raise ValueError("matrix.col[column] = x: size mismatch")
+		updated = list(self._m)
+		updated[index::self._ncols] = values
+		self._assign(updated)
+
+	def _square(self, name):
+		if self._nrows != self._ncols:
+			raise ValueError("Matrix.%s: only square matrices are supported" % name)
+		return self._nrows
+
+	@property
+	def col(self):
+		"""Access the matrix by columns, 3x3 and 4x4 only, (read-only).
+
+		Return type: Matrix Access"""
+
+		return _MatrixAccess(self, True)
+
+	@property
+	def row(self):
+		"""Access the matrix by rows (default), (read-only).
+
+		Return type: Matrix Access"""
+
+		return _MatrixAccess(self, False)
+
+	@property
+	def is_frozen(self):
+		"""True when this object has been frozen (read-only).
+
+		Return type: bool"""
+
+		return self._frozen
+
+	@property
+	def is_wrapped(self):
+		"""True when this object wraps external data (read-only).
+
+		Return type: bool"""
+
+		return False
+
+	@property
+	def owner(self):
+		"""The item this is wrapping or None (read-only)."""
+
+		return None
+
+	@property
+	def is_negative(self):
+		"""True if this matrix results in a negative scale, 3x3 and 4x4 only, (read-only).
+
+		Return type: bool"""
+
+		return self._determinant_3x3("is_negative") < 0.0
+
+	@property
+	def is_orthogonal(self):
+		"""True if this matrix is orthogonal, 3x3 and 4x4 only, (read-only).
+
+		Return type: bool"""
+
+		m = self._upper_3x3("is_orthogonal")
+		columns = [m[column::3] for column in range(3)]
+		if any(abs(sum(value * value for value in column) - 1.0) > 1.5e-5 for column in columns):
+			return False
+		return self._perpendicular(columns)
+
+	@property
+	def is_orthogonal_axis_vectors(self):
+		"""True if this matrix has got orthogonal axis vectors, 3x3 and 4x4 only, (read-only).
+
+		Return type: bool"""
+
+		m = self._upper_3x3("is_orthogonal_axis_vectors")
+		return self._perpendicular([m[column::3] for column in range(3)])
+
+	@staticmethod
+	def _perpendicular(columns):
+		for a in range(3):
+			for b in range(a + 1, 3):
+				if abs(sum(x * y for x, y in zip(columns[a], columns[b]))) > 1.5e-5:
+					return False
+		return True
+
+	@property
+	def median_scale(self):
+		"""The average scale applied to each axis (read-only).
+
+		Return type: float"""
+
+		m = self._upper_3x3("median_scale")
+		unit = 1.0 / math.sqrt(3.0)
+		return math.hypot(*(unit * (m[row * 3] + m[row * 3 + 1] + m[row * 3 + 2]) for row in range(3)))
+
+	@property
+	def translation(self):
+		"""The translation component of the matrix.
+
+		Return type: Vector"""
+
+		if self._nrows != 4 or self._ncols != 4:
+			raise AttributeError("Matrix.translation: matrix must be 4x4")
+		m = self._m
+		return Vector._wrap((m[3], m[7], m[11]), self, self._set_translation)
+
+	@translation.setter
+	def translation(self, value):
+		if self._nrows != 4 or self._ncols != 4:
+			raise AttributeError("Matrix.translation: matrix must be 4x4")
+		self._set_translation([float(item) for item in value])
+
+	def _set_translation(self, values):
+		if len(values) != 3:
+			raise ValueError("Matrix.translation = x: expected a 3D vector")
+		updated = list(self._m)
+		updated[3], updated[7], updated[11] = values
+		self._assign(updated)
+
+	def _upper_3x3(self, name):
+		if self._nrows < 3 or self._ncols < 3:
+			raise AttributeError("Matrix.%s: inappropriate matrix size, 3x3 and 4x4 only" % name)
+		return _rotation_3x3(self._m, self._nrows, self._ncols)
+
+	def _determinant_3x3(self, name):
+		return _memo(self, "determinant_3x3", lambda: _determinant(self._upper_3x3(name), 3))
+
 	@classmethod
-	def Identity(self, size):
+	def Identity(cls, size):
 		"""Create an identity matrix.
 
 		Parameters:
 		size (int) - The size of the identity matrix to construct [2, 4].
-		
+
 		Returns: A new identity matrix.
-		
+
 		Return type: Matrix"""
-		
-		return self
-		
+
+		_check_size(size, "Matrix.Identity")
+		return _matrix(_identity(size), size, size)
+
 	@classmethod
-	def OrthoProjection(self, axis, size):
+	def OrthoProjection(cls, axis, size):
 		"""Create a matrix to represent an orthographic projection.
 
 		Parameters:
 		axis (string or Vector) - Can be any of the following: ['X', 'Y', 'XY', 'XZ', 'YZ'], where a single axis is for a 2D matrix. Or a vector for an arbitrary axis
 		size (int) - The size of the projection matrix to construct [2, 4].
-		
+
 		Returns: A new projection matrix.
 
 		Return type: Matrix"""
-		
-		return self
-		
+
+		_check_size(size, "Matrix.OrthoProjection")
+		base = 2 if size == 2 else 3
+		if isinstance(axis, str):
+			planes = {2: {"X": (1.0, 0.0), "Y": (0.0, 1.0)}, 3: {"XY": (1.0, 1.0, 0.0), "XZ": (1.0, 0.0, 1.0), "YZ": (0.0, 1.0, 1.0)}}
+			if axis not in planes[base]:
+				raise ValueError("Matrix.OrthoProjection(): unknown plane %r for a %dD matrix" % (axis, size))
+			values = [0.0] * (base * base)
+			values[::base + 1] = planes[base][axis]
+		else:
+			normal = [float(value) for value in axis]
+			if len(normal) != base:
+				raise ValueError("Matrix.OrthoProjection(): the axis must be a %dD vector" % base)
+			length = math.hypot(*normal)
+			if length:
+				normal = [value / length for value in normal]
+			values = [
+				(1.0 if row == column else 0.0) - normal[row] * normal[column]
+				for row in range(base) for column in range(base)
+			]
+		return _matrix(_extend(values, base, size), size, size)
+
 	@classmethod
-	def Rotation(self, angle, size, axis):
+	def Rotation(cls, angle, size, axis=None):
 		"""Create a matrix representing a rotation.
 
 		Parameters:
 		angle (float) - The angle of rotation desired, in radians.
 		size (int) - The size of the rotation matrix to construct [2, 4].
 		axis (string or Vector) - a string in ['X', 'Y', 'Z'] or a 3D Vector Object (optional when size is 2).
-		
+
 		Returns: A new rotation matrix.
 
 		Return type: Matrix"""
-		
-		return self
-		
+
+		_check_size(size, "Matrix.Rotation")
+		if size == 2:
+			c, s = math.cos(angle), math.sin(angle)
+			return _matrix([c, -s, s, c], 2, 2)
+		if isinstance(axis, str):
+			if axis not in ("X", "Y", "Z"):
+				raise ValueError("Matrix.Rotation(): axis must be 'X', 'Y' or 'Z', not %r" % axis)
+			values = _axis_rotation("XYZ".index(axis), angle)
+		else:
+			if axis is None:
+				raise ValueError("Matrix.Rotation(): an axis is needed for 3x3 and 4x4 matrices")
+			values = _quaternion_rotation(_axis_angle_quaternion(axis, angle))
+		return _matrix(_extend(values, 3, size), size, size)
+
 	@classmethod
-	def Scale(self, factor, size, axis):
+	def Scale(cls, factor, size, axis=None):
 		"""Create a matrix representing a scaling.
 
 		Parameters:
 		factor (float) - The factor of scaling to apply.
 		size (int) - The size of the scale matrix to construct [2, 4].
 		axis (Vector) - Direction to influence scale. (optional).
-		
+
 		Returns: A new scale matrix.
 
 		Return type: Matrix"""
-		
-		return self
-		
+
+		_check_size(size, "Matrix.Scale")
+		base = 2 if size == 2 else 3
+		if axis is None:
+			values = _identity(base)
+			values[::base + 1] = [float(factor)] * base
+		else:
+			direction = [float(value) for value in axis]
+			if len(direction) != base:
+				raise ValueError("Matrix.Scale(): the axis must be a %dD vector" % base)
+			length = math.hypot(*direction)
+			if length:
+				direction = [value / length for value in direction]
+			values = [
+				(1.0 if row == column else 0.0) + (factor - 1.0) * direction[row] * direction[column]
+				for row in range(base) for column in range(base)
+			]
+		return _matrix(_extend(values, base, size), size, size)
+
 	@classmethod
-	def Shear(self, plane, size, factor):
+	def Shear(cls, plane, size, factor):
 		"""Create a matrix to represent an shear transformation.
 
 		Parameters:
 		plane (string) - Can be any of the following: ['X', 'Y', 'XY', 'XZ', 'YZ'], where a single axis is for a 2D matrix only.
 		size (int) - The size of the shear matrix to construct [2, 4].
 		factor (float or float pair) - The factor of shear to apply. For a 3 or 4 size matrix pass a pair of floats corresponding with the plane axis.
-		
+
 		Returns: A new shear matrix.
 
 		Return type: Matrix"""
-		
-		return self
-		
+
+		_check_size(size, "Matrix.Shear")
+		if size == 2:
+			positions = {"X": (1,), "Y": (2,)}
+			factors = [float(factor)]
+			base = 2
+		else:
+			positions = {"XY": (2, 5), "XZ": (1, 7), "YZ": (3, 6)}
+			factors = [float(value) for value in factor]
+			base = 3
+			if len(factors) != 2:
+				raise ValueError("Matrix.Shear(): expected a pair of factors for a %dD matrix" % size)
+		if plane not in positions:
+			raise ValueError("Matrix.Shear(): unknown plane %r for a %dD matrix" % (plane, size))
+		values = _identity(base)
+		for position, value in zip(positions[plane], factors):
+			values[position] = value
+		return _matrix(_extend(values, base, size), size, size)
+
 	@classmethod
-	def Translation(self, vector):
+	def Translation(cls, vector):
 		"""Create a matrix representing a translation.
 
 		Parameters:
 		vector (Vector) - The translation vector.
-		
+
 		Returns: An identity matrix with a translation.
 		Return type: Matrix"""
-		
+
+		values = _identity(4)
+		for row, value in enumerate(list(vector)[:3]):
+			values[row * 4 + 3] = float(value)
+		return _matrix(values, 4, 4)
+
+	def __len__(self):
+		return self._nrows
+
+	def __iter__(self):
+		return iter(_MatrixAccess(self, False))
+
+	def __getitem__(self, index):
+		return _MatrixAccess(self, False)[index]
+
+	def __setitem__(self, index, value):
+		_MatrixAccess(self, False)[index] = value
+
+	def __repr__(self):
+		rows = ",\n        ".join(
+			"(%s)" % ", ".join(repr(value) for value in self._m[row * self._ncols:(row + 1) * self._ncols])
+			for row in range(self._nrows)
+		)
+		return "Matrix((%s))" % rows
+
+	def __str__(self):
+		rows = "\n            ".join(
+			"(%s)" % ", ".join("%.4f" % value for value in self._m[row * self._ncols:(row + 1) * self._ncols])
+			for row in range(self._nrows)
+		)
+		return "<Matrix %dx%d %s>" % (self._nrows, self._ncols, rows)
+
+	def __eq__(self, other):
+		if isinstance(other, Matrix):
+			return self._nrows == other._nrows and self._ncols == other._ncols and self._m == other._m
+		return NotImplemented
+
+	def __ne__(self, other):
+		if isinstance(other, Matrix):
+			return not self == other
+		return NotImplemented
+
+	def __hash__(self):
+		if not self._frozen:
+			raise TypeError("Matrix must be frozen to be hashable")
+		return hash((self._nrows, self._ncols, tuple(self._m)))
+
+	def __add__(self, other):
+		if not isinstance(other, Matrix):
+			return NotImplemented
+		if (self._nrows, self._ncols) != (other._nrows, other._ncols):
+			raise ValueError("Matrix addition: matrices must have the same dimensions for this operation")
+		return _matrix([a + b for a, b in zip(self._m, other._m)], self._nrows, self._ncols)
+
+	def __sub__(self, other):
+		if not isinstance(other, Matrix):
+			return NotImplemented
+		if (self._nrows, self._ncols) != (other._nrows, other._ncols):
+			raise ValueError("Matrix subtraction: matrices must have the same dimensions for this operation")
+		return _matrix([a - b for a, b in zip(self._m, other._m)], self._nrows, self._ncols)
+
+	def __mul__(self, other):
+		if isinstance(other, (int, float)):
+			return _matrix([value * other for value in self._m], self._nrows, self._ncols)
+		if isinstance(other, Matrix):
+			# Element-wise, products of matrices are spelled with @
+			if (self._nrows, self._ncols) != (other._nrows, other._ncols):
+				raise ValueError("Matrix multiplication: matrices must have the same dimensions for this operation")
+			return _matrix([a * b for a, b in zip(self._m, other._m)], self._nrows, self._ncols)
+		return NotImplemented
+
+	__rmul__ = __mul__
+
+	def __matmul__(self, other):
+		rows, columns = self._nrows, self._ncols
+		if isinstance(other, Matrix):
+			if columns != other._nrows:
+				raise ValueError("Matrix multiplication: the columns of the first matrix must match the rows of the second")
+			return _matrix(_multiply(self._m, other._m, rows, columns, other._ncols), rows, other._ncols)
+		if isinstance(other, (Vector, list, tuple)):
+			values = other._v if isinstance(other, Vector) else [float(value) for value in other]
+			m = self._m
+			if len(values) == 3 and rows == columns == 4:
+				# A 3D point transformed by a 4x4 matrix, w is dropped
+				x, y, z = values
+				return _vector([
+					m[0] * x + m[1] * y + m[2] * z + m[3],
+					m[4] * x + m[5] * y + m[6] * z + m[7],
+					m[8] * x + m[9] * y + m[10] * z + m[11],
+				])
+			if len(values) != columns:
+				raise ValueError("Matrix multiplication: len(matrix.col) and len(vector) must be the same")
+			if columns == 3:
+				x, y, z = values
+				return _vector([m[row * 3] * x + m[row * 3 + 1] * y + m[row * 3 + 2] * z for row in range(rows)])
+			return _vector([
+				sum(a * b for a, b in zip(m[row * columns:(row + 1) * columns], values))
+				for row in range(rows)
+			])
+		return NotImplemented
+
+	def __rmatmul__(self, other):
+		"""vector @ matrix, the vector is a row vector."""
+
+		if not isinstance(other, (Vector, list, tuple)):
+			return NotImplemented
+		values = other._v if isinstance(other, Vector) else [float(value) for value in other]
+		rows, columns = self._nrows, self._ncols
+		size = len(values)
+		if size == 3 and rows == columns == 4:
+			values = values + [1.0]
+		elif size != rows:
+			raise ValueError("Vector multiplication: len(vector) and len(matrix.row) must be the same")
+		result = [sum(values[row] * self._m[row * columns + column] for row in range(rows)) for column in range(columns)]
+		return _vector(result[:size])
+
+	def __imatmul__(self, other):
+		if not isinstance(other, Matrix):
+			return NotImplemented
+		result = self @ other
+		self._assign(result._m, result._nrows, result._ncols)
 		return self
-		
+
+	def __copy__(self):
+		return self.copy()
+
+	def __deepcopy__(self, memo):
+		return self.copy()
+
+	def __reduce__(self):
+		return Matrix, ([self._m[row * self._ncols:(row + 1) * self._ncols] for row in range(self._nrows)],)
+
 	def adjugate(self):
 		"""Set the matrix to its adjugate.
 
 		Note: When the matrix cannot be adjugated a ValueError exception is raised."""
-		
-		pass
-		
+
+		self._assign(_adjugate(self._m, self._square("adjugate()")))
+
 	def adjugated(self):
 		"""Return an adjugated copy of the matrix.
 
 		Returns: the adjugated matrix.
 		Return type: Matrix
-		
+
 		Note: When the matrix cant be adjugated a ValueError exception is raised."""
-		
-		return self
-		
+
+		size = self._square("adjugated()")
+		return _matrix(_adjugate(self._m, size), size, size)
+
 	def copy(self):
 		"""Returns a copy of this matrix.
 
 		Returns: an instance of itself
 		Return type: Matrix"""
-		
-		return self
-		
+
+		return _matrix(list(self._m), self._nrows, self._ncols)
+
+	def _decomposition(self):
+		def compute():
+			if self._nrows < 3 or self._ncols < 3:
+				raise ValueError("Matrix.decompose(): inappropriate matrix size, 3x3 and 4x4 only")
+			m = self._m
+			translation = [m[3], m[7], m[11]] if self._nrows == self._ncols == 4 else [0.0, 0.0, 0.0]
+			rotation, scale = _normalized_columns(_rotation_3x3(m, self._nrows, self._ncols))
+			if _determinant(rotation, 3) < 0.0:
+				rotation = [-value for value in rotation]
+				scale = [-value for value in scale]
+			return translation, _quaternion_from_rotation(rotation), scale
+		return _memo(self, "decompose", compute)
+
 	def decompose(self):
 		"""Return the translation, rotation and scale components of this matrix.
 
 		Returns: trans, rot, scale triple.
 		Return type: (Vector, Quaternion, Vector)"""
-		
-		return (Vector(False), Quaternion(False, False), Vector(False))
-		
+
+		translation, rotation, scale = self._decomposition()
+		return _vector(list(translation)), _quaternion(list(rotation)), _vector(list(scale))
+
 	def determinant(self):
 		"""Return the determinant of a matrix.
 
 		Returns: Return the determinant of a matrix.
 		Return type: float"""
-		
-		return 1.0
-		
+
+		size = self._square("determinant()")
+		return _memo(self, "determinant", lambda: _determinant(self._m, size))
+
 	def freeze(self):
 		"""Make this object immutable.
 
 		After this the object can be hashed, used in dictionaries & sets.
+		Derived values (inverse, determinant, decomposition) are then
+		computed once and remembered.
 
 		Returns: An instance of this object."""
-		
+
+		if not self._frozen:
+			self._frozen = True
+			self._cache = {}
 		return self
-		
+
 	def identity(self):
 		"""Set the matrix to the identity matrix.
 
 		Note: An object with a location and rotation of zero, and a scale of one will have an identity matrix."""
-		
-		pass
-		
+
+		self._assign(_identity(self._square("identity()")))
+
+	def _inverse(self, name):
+		size = self._square(name)
+		return _memo(self, "inverse", lambda: _inverse(self._m, size))
+
 	def invert(self, fallback=None):
 		"""Set the matrix to its inverse.
 
 		Parameters:
 		fallback (Matrix) - Set the matrix to this value when the inverse cannot be calculated (instead of raising a ValueError exception)."""
-		
-		pass
-		
+
+		inverse = self._inverse("invert(ed)")
+		if inverse is None:
+			if fallback is None:
+				raise ValueError("Matrix.invert(ed): matrix does not have an inverse")
+			if not isinstance(fallback, Matrix) or (fallback._nrows, fallback._ncols) != (self._nrows, self._ncols):
+				raise TypeError("Matrix.invert(fallback): fallback must be a matrix of the same size")
+			inverse = fallback._m
+		self._assign(list(inverse))
+
 	def invert_safe(self):
 		"""Set the matrix to its inverse, will never error. If degenerated (e.g. zero scale on an axis), add some epsilon to its diagonal, to get an invertible one. If tweaked matrix is still degenerated, set to the identity matrix instead."""
-		
-		pass
-		
+
+		self._assign(self.inverted_safe()._m)
+
 	def inverted(self, fallback=None):
 		"""Return an inverted copy of the matrix.
 
 		Parameters:
 		fallback (any) - return this when the inverse can't be calculated (instead of raising a ValueError).
-		
+
 		Returns: the inverted matrix or fallback when given.
 		Return type: Matrix"""
-		
-		return self
-		
+
+		inverse = self._inverse("invert(ed)")
+		if inverse is None:
+			if fallback is None:
+				raise ValueError("Matrix.invert(ed): matrix does not have an inverse")
+			return fallback
+		return _matrix(list(inverse), self._nrows, self._ncols)
+
 	def inverted_safe(self):
 		"""Return an inverted copy of the matrix, will never error. If degenerated (e.g. zero scale on an axis), add some epsilon to its diagonal, to get an invertible one. If tweaked matrix is still degenerated, return the identity matrix instead.
 
 		Returns: the inverted matrix.
 		Return type: Matrix"""
-		
-		return self
-		
+
+		size = self._square("inverted_safe()")
+		inverse = self._inverse("inverted_safe()")
+		if inverse is None:
+			tweaked = list(self._m)
+			for index in range(0, size * size, size + 1):
+				tweaked[index] += 1e-8
+			inverse = _inverse(tweaked, size) or _identity(size)
+		return _matrix(list(inverse), size, size)
+
 	def lerp(self, other, factor):
 		"""Returns the interpolation of two matrices.
 
+		3x3 and 4x4 matrices are decomposed, their rotations are interpolated
+		spherically and their translations and scales linearly.
+
 		Parameters:
 		other (Matrix) - value to interpolate with.
 		factor (float) - The interpolation value in [0.0, 1.0].
-		
+
 		Returns: The interpolated matrix.
 		Return type: Matrix"""
-		
-		return self
-		
+
+		if not isinstance(other, Matrix) or (other._nrows, other._ncols) != (self._nrows, self._ncols):
+			raise ValueError("Matrix.lerp(other, factor): expects both matrices to be the same dimensions")
+		rows, columns = self._nrows, self._ncols
+		if rows == columns and rows in (3, 4):
+			translation_a, rotation_a, scale_a = self._decomposition()
+			translation_b, rotation_b, scale_b = other._decomposition()
+			rotation = _quaternion_rotation(_quaternion_slerp(rotation_a, rotation_b, factor))
+			scale = [a + (b - a) * factor for a, b in zip(scale_a, scale_b)]
+			values = [rotation[row * 3 + column] * scale[column] for row in range(3) for column in range(3)]
+			if rows == 3:
+				return _matrix(values, 3, 3)
+			translation = [a + (b - a) * factor for a, b in zip(translation_a, translation_b)]
+			result = _extend(values, 3, 4)
+			result[3], result[7], result[11] = translation
+			return _matrix(result, 4, 4)
+		return _matrix([a + (b - a) * factor for a, b in zip(self._m, other._m)], rows, columns)
+
 	def normalize(self):
 		"""Normalize each of the matrix columns."""
-		
-		pass
-		
+
+		self._assign(self.normalized()._m)
+
 	def normalized(self):
 		"""Return a column normalized matrix
 
 		Returns: a column normalized matrix
 		Return type: Matrix"""
-		
-		return self
-		
+
+		rows, columns = self._nrows, self._ncols
+		if rows != columns or rows not in (3, 4):
+			raise ValueError("Matrix.normalize(): can only use a 3x3 or 4x4 matrix")
+		values = list(self._m)
+		normalized, _ = _normalized_columns(_rotation_3x3(values, rows, columns))
+		for row in range(3):
+			values[row * columns:row * columns + 3] = normalized[row * 3:row * 3 + 3]
+		return _matrix(values, rows, columns)
+
 	def resize_4x4(self):
 		"""Resize the matrix to 4x4."""
-		
-		pass
-		
+
+		rows, columns = self._nrows, self._ncols
+		values = _identity(4)
+		for row in range(rows):
+			values[row * 4:row * 4 + columns] = self._m[row * columns:(row + 1) * columns]
+		self._assign(values, 4, 4)
+
 	def rotate(self, other):
 		"""Rotates the matrix by another mathutils value.
 
 		Parameters:
 		other (Euler, Quaternion or Matrix) - rotation component of mathutils value
-		
+
 		Note: If any of the columns are not unit length this may not have desired results."""
-		
-		pass
-		
+
+		if self._nrows != 3 or self._ncols != 3:
+			raise ValueError("Matrix.rotate(): must have 3x3 dimensions")
+		self._assign(_multiply(_rotation_of(other), self._m, 3, 3, 3))
+
 	def to_3x3(self):
 		"""Return a 3x3 copy of this matrix.
 
 		Returns: a new matrix.
 		Return type: Matrix"""
-		
-		return self
-		
+
+		values = _identity(3)
+		for row in range(min(self._nrows, 3)):
+			size = min(self._ncols, 3)
+			values[row * 3:row * 3 + size] = self._m[row * self._ncols:row * self._ncols + size]
+		return _matrix(values, 3, 3)
+
 	def to_4x4(self):
 		"""Return a 4x4 copy of this matrix.
 
 		Returns: a new matrix.
 		Return type: Matrix"""
-		
-		return self
-		
-	def to_euler(self):
+
+		values = _identity(4)
+		for row in range(self._nrows):
+			values[row * 4:row * 4 + self._ncols] = self._m[row * self._ncols:(row + 1) * self._ncols]
+		return _matrix(values, 4, 4)
+
+	def to_euler(self, order="XYZ", euler_compat=None):
 		"""Return an Euler representation of the rotation matrix (3x3 or 4x4 matrix only).
 
 		Parameters:
 		order (string) - Optional rotation order argument in ['XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX'].
 		euler_compat (Euler) - Optional euler argument the new euler will be made compatible with (no axis flipping between them). Useful for converting a series of matrices to animation curves.
-		
+
 		Returns: Euler representation of the matrix.
-		
+
 		Return type: Euler"""
-		
-		return Euler(False)
-		
+
+		rotation, _ = _normalized_columns(self._upper_3x3("to_euler()"))
+		compatible = None if euler_compat is None else [float(value) for value in euler_compat]
+		return _euler(_euler_from_rotation(rotation, order, compatible), order)
+
 	def to_quaternion(self):
 		"""Return a quaternion representation of the rotation matrix.
 
 		Returns: Quaternion representation of the rotation matrix.
-		
+
 		Return type: Quaternion"""
-		
-		return Quaternion(False, False)
-		
+
+		rotation, _ = _normalized_columns(self._upper_3x3("to_quaternion()"))
+		if _determinant(rotation, 3) < 0.0:
+			rotation = [-value for value in rotation]
+		return _quaternion(_quaternion_from_rotation(rotation))
+
 	def to_scale(self):
 		"""Return the scale part of a 3x3 or 4x4 matrix.
 
 		Returns: Return the scale of a matrix.
-		
+
 		Return type: Vector
-		
+
 		Note: This method does not return a negative scale on any axis because it is not possible to obtain this data from the matrix alone."""
-		
-		return Vector(False)
-		
+
+		m = self._upper_3x3("to_scale()")
+		return _vector([math.hypot(m[column], m[column + 3], m[column + 6]) for column in range(3)])
+
 	def to_translation(self):
 		"""Return the translation part of a 4 row matrix.
 
 		Returns: Return the translation of a matrix.
-		
+
 		Return type: Vector"""
-		
-		return Vector(False)
-		
+
+		if self._nrows != 4 or self._ncols < 3:
+			raise ValueError("Matrix.to_translation(): inappropriate matrix size")
+		m, columns = self._m, self._ncols
+		return _vector([m[columns - 1], m[2 * columns - 1], m[3 * columns - 1]])
+
 	def transpose(self):
 		"""Set the matrix to its transpose."""
-		
-		pass
-		
+
+		transposed = self.transposed()
+		self._assign(transposed._m, transposed._nrows, transposed._ncols)
+
 	def transposed(self):
 		"""Return a new, transposed matrix.
 
 		Returns: a transposed matrix
-		
+
 		Return type: Matrix"""
-		
-		return self
-		
+
+		rows, columns = self._nrows, self._ncols
+		return _matrix([self._m[row * columns + column] for column in range(columns) for row in range(rows)], columns, rows)
+
 	def zero(self):
 		"""Set all the matrix values to zero."""
-		
+
+		self._assign([0.0] * (self._nrows * self._ncols))
 		return self
-		
-	pass
+
+def _quaternion(values):
+	"""A quaternion owning values, a (w, x, y, z) list of floats, which is neither copied nor checked.
+
+	Return type: Quaternion"""
+
+	quaternion = _new(Quaternion)
+	quaternion._q = values
+	quaternion._frozen = False
+	quaternion._cache = None
+	quaternion._owner = None
+	quaternion._callback = None
+	return quaternion
+
+def _quaternion_multiply(a, b):
+	aw, ax, ay, az = a
+	bw, bx, by, bz = b
+	return [
+		aw * bw - ax * bx - ay * by - az * bz,
+		aw * bx + ax * bw + ay * bz - az * by,
+		aw * by + ay * bw + az * bx - ax * bz,
+		aw * bz + az * bw + ax * by - ay * bx,
+	]
+
+def _euler_quaternion(angles, order="XYZ"):
+	"""(w, x, y, z) of euler angles, without going through a matrix."""
+
+	(i, j, k), parity = _euler_order(order)
+	ti = angles[i] * 0.5
+	tj = angles[j] * (-0.5 if parity else 0.5)
+	th = angles[k] * 0.5
+	ci, cj, ch = math.cos(ti), math.cos(tj), math.cos(th)
+	si, sj, sh = math.sin(ti), math.sin(tj), math.sin(th)
+	cc, cs, sc, ss = ci * ch, ci * sh, si * ch, si * sh
+	vector = [0.0] * 3
+	vector[i] = cj * sc - sj * cs
+	vector[j] = cj * ss + sj * cc
+	vector[k] = cj * cs - sj * sc
+	if parity:
+		vector[j] = -vector[j]
+	return [cj * cc + sj * ss] + vector
+
+def _wrap_angle(angle):
+	"""angle in [-pi, pi]."""
+
+	return angle - 2.0 * math.pi * math.floor((angle + math.pi) / (2.0 * math.pi))
+
+def _axis_angle(q):
+	"""(axis, angle) of a (w, x, y, z) quaternion, which is normalized first.
+
+	A rotation without a usable axis gives the X axis and an angle of zero."""
+
+	length = math.hypot(*q)
+	if not length:
+		return [1.0, 0.0, 0.0], 0.0
+	w, x, y, z = (value / length for value in q)
+	half = math.acos(max(-1.0, min(1.0, w)))
+	sine = math.sin(half)
+	if abs(sine) < _EPSILON:
+		sine = 1.0
+	axis = [x / sine, y / sine, z / sine]
+	if not any(axis):
+		return [1.0, 0.0, 0.0], 0.0
+	return axis, 2.0 * half
+
+def _quaternion_values(other, operation):
+	"""The (w, x, y, z) floats of other, a quaternion or a 4d sequence."""
+
+	values = other._q if isinstance(other, Quaternion) else [float(value) for value in other]
+	if len(values) != 4:
+		raise ValueError("%s: expected a quaternion" % operation)
+	return values
 
 class Quaternion:
 	"""This object gives access to Quaternions in Blender.
 
+	The matrix and euler conversions of a frozen quaternion are computed once
+	and remembered.
+
 	Parameters:
 	seq (Vector) - size 3 or 4
 	angle (float) - rotation angle, in radians
-	
+
 	The constructor takes arguments in various forms:
-	
+
 	(), no args - Create an identity quaternion
 	(wxyz) - Create a quaternion from a (w, x, y, z) vector.
 	(exponential_map) - Create a quaternion from a 3d exponential map vector.
 	(axis, angle) - Create a quaternion representing a rotation of angle radians over axis."""
-	
-	def __init__(self, seq, angle):
-		self.angle = 1.0
-		self.axis = Vector(False)
-		self.is_frozen = False
-		self.is_wrapped = False
-		self.magnitude = 1.0
-		self.owner = self
-		self.w = 1.0
-		self.x = 1.0
-		self.y = 1.0
-		self.z = 1.0
-		
+
+	__slots__ = ("_q", "_frozen", "_cache", "_owner", "_callback")
+
+	def __init__(self, seq=(1.0, 0.0, 0.0, 0.0), angle=None):
+		values = [float(value) for value in seq]
+		if angle is not None:
+			if len(values) != 3:
+				raise ValueError("Quaternion(axis, angle): expected a 3d axis")
+			values = _axis_angle_quaternion(values, _wrap_angle(angle))
+		elif len(values) == 3:
+			# An exponential map, the axis scaled by the angle
+			length = math.hypot(*values)
+			values = _axis_angle_quaternion(values, _wrap_angle(length)) if length else [1.0, 0.0, 0.0, 0.0]
+		elif len(values) != 4:
+			raise ValueError("Quaternion(): expected a 4d (w, x, y, z) sequence or a 3d exponential map")
+		self._q = values
+		self._frozen = False
+		self._cache = None
+		self._owner = None
+		self._callback = None
+
+	@classmethod
+	def _wrap(cls, values, owner, callback):
+		"""A quaternion of values which calls callback with its components whenever it changes.
+
+		Return type: Quaternion"""
+
+		quaternion = _quaternion([float(value) for value in values])
+		quaternion._owner = owner
+		quaternion._callback = callback
+		return quaternion
+
+	def _assign(self, values):
+		"""Replace the components, a wrapped quaternion passes them to its owner."""
+
+		if self._frozen:
+			raise TypeError("Quaternion is frozen, cannot modify")
+		self._q = values
+		if self._callback is not None:
+			self._callback(values)
+
+	def _set(self, index, value):
+		values = list(self._q)
+		values[index] = float(value)
+		self._assign(values)
+
+	@property
+	def is_frozen(self):
+		"""True when this object has been frozen (read-only).
+
+		Return type: bool"""
+
+		return self._frozen
+
+	@property
+	def is_wrapped(self):
+		"""True when this object wraps external data (read-only).
+
+		Return type: bool"""
+
+		return self._callback is not None
+
+	@property
+	def owner(self):
+		"""The item this is wrapping or None (read-only)."""
+
+		return self._owner
+
+	@property
+	def w(self):
+		"""Quaternion axis value.
+
+		Return type: float"""
+
+		return self._q[0]
+
+	@w.setter
+	def w(self, value):
+		self._set(0, value)
+
+	@property
+	def x(self):
+		"""Quaternion axis value.
+
+		Return type: float"""
+
+		return self._q[1]
+
+	@x.setter
+	def x(self, value):
+		self._set(1, value)
+
+	@property
+	def y(self):
+		"""Quaternion axis value.
+
+		Return type: float"""
+
+		return self._q[2]
+
+	@y.setter
+	def y(self, value):
+		self._set(2, value)
+
+	@property
+	def z(self):
+		"""Quaternion axis value.
+
+		Return type: float"""
+
+		return self._q[3]
+
+	@z.setter
+	def z(self, value):
+		self._set(3, value)
+
+	@property
+	def angle(self):
+		"""Angle of the quaternion.
+
+		Return type: float"""
+
+		return _axis_angle(self._q)[1]
+
+	@angle.setter
+	def angle(self, value):
+		length = math.hypot(*self._q)
+		axis, _ = _axis_angle(self._q)
+		self._assign([component * length for component in _axis_angle_quaternion(axis, _wrap_angle(value))])
+
+	@property
+	def axis(self):
+		"""Quaternion axis as a vector.
+
+		Return type: Vector"""
+
+		return _vector(_axis_angle(self._q)[0])
+
+	@axis.setter
+	def axis(self, value):
+		length = math.hypot(*self._q)
+		_, angle = _axis_angle(self._q)
+		self._assign([component * length for component in _axis_angle_quaternion(value, angle)])
+
+	@property
+	def magnitude(self):
+		"""Size of the quaternion (read-only).
+
+		Return type: float"""
+
+		return math.hypot(*self._q)
+
+	def __len__(self):
+		return 4
+
+	def __iter__(self):
+		return iter(list(self._q))
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return tuple(self._q[index])
+		try:
+			return self._q[index]
+		except IndexError:
+			raise IndexError("quaternion[attribute]: array index out of range") from None
+
+	def __setitem__(self, index, value):
+		values = list(self._q)
+		if isinstance(index, slice):
+			values[index] = [float(item) for item in value]
+			if len(values) != 4:
+				raise ValueError("quaternion[begin:end] = []: size mismatch in slice assignment")
+		else:
+			try:
+				values[index] = float(value)
+			except IndexError:
+				raise IndexError("quaternion[attribute] = x: array assignment index out of range") from None
+		self._assign(values)
+
+	def __repr__(self):
+		return "Quaternion((%r, %r, %r, %r))" % tuple(self._q)
+
+	def __str__(self):
+		return "<Quaternion (w=%.4f, x=%.4f, y=%.4f, z=%.4f)>" % tuple(self._q)
+
+	def __eq__(self, other):
+		if isinstance(other, Quaternion):
+			return self._q == other._q
+		return NotImplemented
+
+	def __ne__(self, other):
+		if isinstance(other, Quaternion):
+			return not self == other
+		return NotImplemented
+
+	def __hash__(self):
+		if not self._frozen:
+			raise TypeError("Quaternion must be frozen to be hashable")
+		return hash(tuple(self._q))
+
+	def __neg__(self):
+		return _quaternion([-value for value in self._q])
+
+	def __add__(self, other):
+		if not isinstance(other, Quaternion):
+			return NotImplemented
+		return _quaternion([a + b for a, b in zip(self._q, other._q)])
+
+	def __sub__(self, other):
+		if not isinstance(other, Quaternion):
+			return NotImplemented
+		return _quaternion([a - b for a, b in zip(self._q, other._q)])
+
+	def __mul__(self, other):
+		if isinstance(other, (int, float)):
+			return _quaternion([value * other for value in self._q])
+		if isinstance(other, Quaternion):
+			# Element-wise, the product of rotations is spelled with @
+			return _quaternion([a * b for a, b in zip(self._q, other._q)])
+		return NotImplemented
+
+	__rmul__ = __mul__
+
+	def __truediv__(self, other):
+		if not isinstance(other, (int, float)):
+			return NotImplemented
+		if other == 0:
+			raise ZeroDivisionError("Quaternion division: divide by zero error")
+		return _quaternion([value / other for value in self._q])
+
+	def __matmul__(self, other):
+		if isinstance(other, Quaternion):
+			return _quaternion(_quaternion_multiply(self._q, other._q))
+		if isinstance(other, (Vector, list, tuple)):
+			values = other._v if isinstance(other, Vector) else [float(value) for value in other]
+			if len(values) != 3:
+				raise ValueError("Quaternion multiplication: only 3D vector rotations currently supported")
+			w, qx, qy, qz = self._q
+			x, y, z = values
+			# v + 2w (q x v) + 2 q x (q x v), for a unit quaternion
+			tx = 2.0 * (qy * z - qz * y)
+			ty = 2.0 * (qz * x - qx * z)
+			tz = 2.0 * (qx * y - qy * x)
+			return _vector([
+				x + w * tx + qy * tz - qz * ty,
+				y + w * ty + qz * tx - qx * tz,
+				z + w * tz + qx * ty - qy * tx,
+			])
+		return NotImplemented
+
+	def __imatmul__(self, other):
+		if not isinstance(other, Quaternion):
+			return NotImplemented
+		self._assign(_quaternion_multiply(self._q, other._q))
+		return self
+
+	def __copy__(self):
+		return self.copy()
+
+	def __deepcopy__(self, memo):
+		return self.copy()
+
+	def __reduce__(self):
+		return Quaternion, (list(self._q),)
+
 	def conjugate(self):
 		"""Set the quaternion to its conjugate (negate x, y, z)."""
-		pass
-		
+
+		w, x, y, z = self._q
+		self._assign([w, -x, -y, -z])
+
 	def conjugated(self):
 		"""Return a new conjugated quaternion.
 
 		Returns: a new quaternion.
-		
+
 		Return type: Quaternion"""
-		
-		return self
-		
+
+		w, x, y, z = self._q
+		return _quaternion([w, -x, -y, -z])
+
 	def copy(self):
 		"""Returns a copy of this quaternion.
 
 		Returns: A copy of the quaternion.
-		
+
 		Return type: Quaternion
-		
+
 		Note use this to get a copy of a wrapped quaternion with no reference to the original data."""
-		
-		return self
-		
+
+		return _quaternion(list(self._q))
+
 	def cross(self, other):
 		"""Return the cross product of this quaternion and another.
 
 		Parameters:
 		other (Quaternion) - The other quaternion to perform the cross product with.
-		
+
 		Returns: The cross product.
-		
+
 		Return type: Quaternion"""
-		
-		return self
-		
+
+		return _quaternion(_quaternion_multiply(self._q, _quaternion_values(other, "Quaternion.cross(other)")))
+
 	def dot(self, other):
 		"""Return the dot product of this quaternion and another.
 
 		Parameters:
 		other (Quaternion) - The other quaternion to perform the dot product with.
-		
+
 		Returns: The dot product.
-		
-		Return type: Quaternion"""
-		
-		return self
-		
+
+		Return type: float"""
+
+		return sum(a * b for a, b in zip(self._q, _quaternion_values(other, "Quaternion.dot(other)")))
+
 	def freeze(self):
 		"""Make this object immutable.
 
 		After this the object can be hashed, used in dictionaries & sets.
 
 		Returns: An instance of this object."""
-		
+
+		if self._callback is not None:
+			raise TypeError("Quaternion.freeze(): cannot freeze wrapped data")
+		if not self._frozen:
+			self._frozen = True
+			self._cache = {}
 		return self
-		
+
 	def identity(self):
 		"""Set the quaternion to an identity quaternion.
 
 		Return type: Quaternion"""
-		
+
+		self._assign([1.0, 0.0, 0.0, 0.0])
 		return self
-		
+
 	def invert(self):
-		"""Set the quaternion to an identity quaternion.
+		"""Set the quaternion to its inverse.
 
 		Return type: Quaternion"""
-		
-		pass
-		
+
+		self._assign(self.inverted()._q)
+		return self
+
 	def inverted(self):
 		"""Return a new, inverted quaternion.
 
 		Returns: the inverted value.
-		
+
 		Return type: Quaternion"""
-		
-		return self
-		
+
+		w, x, y, z = self._q
+		squared = w * w + x * x + y * y + z * z
+		if not squared:
+			raise ValueError("Quaternion.invert(ed): a zero quaternion does not have an inverse")
+		return _quaternion([w / squared, -x / squared, -y / squared, -z / squared])
+
 	def negate(self):
 		"""Set the quaternion to its negative.
 
 		Return type: Quaternion"""
-		
+
+		self._assign([-value for value in self._q])
 		return self
-		
+
 	def normalize(self):
 		"""Normalize the quaternion."""
-		
-		pass
-		
+
+		self._assign(self.normalized()._q)
+
 	def normalized(self):
 		"""Return a new normalized quaternion.
 
 		Returns: a normalized copy.
-		
+
 		Return type: Quaternion"""
-		
-		return self
-		
+
+		length = math.hypot(*self._q)
+		if not length:
+			return _quaternion([1.0, 0.0, 0.0, 0.0])
+		return _quaternion([value / length for value in self._q])
+
 	def rotate(self, other):
 		"""Rotates the quaternion by another mathutils value.
 
 		Parameters:
 		other (Euler, Quaternion or Matrix) - rotation component of mathutils value"""
-		
-		pass
-		
+
+		length = math.hypot(*self._q)
+		rotation = _multiply(_rotation_of(other), _quaternion_rotation(self._q), 3, 3, 3)
+		self._assign([value * length for value in _quaternion_from_rotation(rotation)])
+
 	def rotation_difference(self, other):
 		"""Returns a quaternion representing the rotational difference.
 
 		Parameters:
 		other (Quaternion) - second quaternion.
-		
+
 		Returns: the rotational difference between the two quat rotations.
-		
+
 		Return type: Quaternion"""
-		
-		return self
-		
+
+		other = _quaternion_values(other, "Quaternion.rotation_difference(other)")
+		return _quaternion(_quaternion_multiply(self.inverted()._q, other))
+
 	def slerp(self, other, factor):
 		"""Returns the interpolation of two quaternions.
 
 		Parameters:
 		other (Quaternion) - value to interpolate with.
 		factor (float) - The interpolation value in [0.0, 1.0].
-		
+
 		Returns: The interpolated rotation.
 
 		Return type: Quaternion"""
-		
-		return self
-		
+
+		other = _quaternion(_quaternion_values(other, "Quaternion.slerp(other, factor)"))
+		return _quaternion(_quaternion_slerp(self.normalized()._q, other.normalized()._q, factor))
+
 	def to_axis_angle(self):
 		"""Return the axis, angle representation of the quaternion.
 
 		Returns: axis, angle.
-		
+
 		Return type: (Vector, float) pair"""
-		
-		return (Vector(False), 1.0)
-		
-	def to_euler(self, order, euler_compat):
+
+		axis, angle = _axis_angle(self._q)
+		return _vector(axis), angle
+
+	def to_euler(self, order="XYZ", euler_compat=None):
 		"""Return Euler representation of the quaternion.
 
 		Parameters:
 		order (string) - Optional rotation order argument in ['XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX'].
 		euler_compat (Euler) - Optional euler argument the new euler will be made compatible with (no axis flipping between them). Useful for converting a series of matrices to animation curves.
-		
+
 		Returns: Euler representation of the quaternion.
 
 		Return type: Euler"""
-		
-		return Euler(False)
-		
+
+		if euler_compat is not None:
+			compatible = [float(value) for value in euler_compat]
+			return _euler(_euler_from_rotation(_quaternion_rotation(self._q), order, compatible), order)
+		values = _memo(self, ("euler", order), lambda: _euler_from_rotation(_quaternion_rotation(self._q), order))
+		return _euler(list(values), order)
+
 	def to_exponential_map(self):
 		"""Return the exponential map representation of the quaternion.
 
 		This representation consist of the rotation axis multiplied by the rotation angle. Such a representation is useful for interpolation between multiple orientations.
 
 		Returns: exponential map.
-		
+
 		Return type: Vector of size 3
-		
+
 		To convert back to a quaternion, pass it to the Quaternion constructor."""
-		
-		return Vector(False)
-		
+
+		axis, angle = _axis_angle(self._q)
+		return _vector([component * angle for component in axis])
+
 	def to_matrix(self):
 		"""Return a matrix representation of the quaternion.
 
 		Returns: A 3x3 rotation matrix representation of the quaternion.
-		
+
 		Return type: Matrix"""
-		
-		return Matrix(False)
-		
+
+		return _matrix(list(_memo(self, "matrix", lambda: _quaternion_rotation(self._q))), 3, 3)
+
+def _vector(values):
+	"""A vector owning values, a list of floats, which is neither copied nor checked.
+
+	Return type: Vector"""
+
+	vector = _new(Vector)
+	vector._v = values
+	vector._frozen = False
+	vector._owner = None
+	vector._callback = None
+	return vector
+
+def _components(vector, other, operation):
+	"""The floats of other, a vector or a numeric sequence of the size of vector.
+
+	None when other is not a numeric sequence, so operators can return NotImplemented."""
+
+	if isinstance(other, Vector):
+		values = other._v
+	else:
+		try:
+			values = list(map(float, other))
+		except (TypeError, ValueError):
+			return None
+	if len(values) != len(vector._v):
+		raise ValueError("%s: vectors must have the same dimensions for this operation" % operation)
+	return values
+
+def _frozen_error():
+	return TypeError("Vector is frozen, cannot modify")
+
 class Vector:
 	"""This object gives access to Vectors in Blender.
 
+	Components are kept as floats in a slot of the instance. Most operations
+	have a fast path for 3D vectors, the axes and the swizzle attributes
+	(xy, zyx, wwzw, ...) are descriptors shared by every vector.
+
 	Parameters:
 	seq (sequence of numbers) - Components of the vector, must be a sequence of at least two"""
-	
-	def __init__(self, seq):
-		self.is_frozen = False
-		self.is_wrapped = False
-		self.length = 1.0
-		self.length_squared = 1.0
-		self.magnitude = 1.0
-		self.owner = self
-		self.w = 1.0
-		self.x = 1.0
-		self.y = 1.0
-		self.z = 1.0
-		self.ww = self
-		self.www = self
-		self.wwww = self
-		self.wwwx = self
-		self.wwwy = self
-		self.wwwz = self
-		self.wwx = self
-		self.wwxw = self
-		self.wwxx = self
-		self.wwxy = self
-		self.wwxz = self
-		self.wwy = self
-		self.wwyw = self
-		self.wwyx = self
-		self.wwyy = self
-		self.wwyz = self
-		self.wwz = self
-		self.wwzw = self
-		self.wwzx = self
-		self.wwzy = self
-		self.wwzz = self
-		self.wx = self
-		self.wxw = self
-		self.wxww = self
-		self.wxwx = self
-		self.wxwy = self
-		self.wxwz = self
-		self.wxx = self
-		self.wxxw = self
-		self.wxxx = self
-		self.wxxy = self
-		self.wxxz = self
-		self.wxy = self
-		self.wxyw = self
-		self.wxyx = self
-		self.wxyy = self
-		self.wxyz = self
-		self.wxz = self
-		self.wxzw = self
-		self.wxzx = self
-		self.wxzy = self
-		self.wxzz = self
-		self.wy = self
-		self.wyw = self
-		self.wyww = self
-		self.wywx = self
-		self.wywy = self
-		self.wywz = self
-		self.wyx = self
-		self.wyxw = self
-		self.wyxx = self
-		self.wyxy = self
-		self.wyxz = self
-		self.wyy = self
-		self.wyyw = self
-		self.wyyx = self
-		self.wyyy = self
-		self.wyyz = self
-		self.wyz = self
-		self.wyzw = self
-		self.wyzx = self
-		self.wyzy = self
-		self.wyzz = self
-		self.wz = self
-		self.wzw = self
-		self.wzww = self
-		self.wzwx = self
-		self.wzwy = self
-		self.wzwz = self
-		self.wzx = self
-		self.wzxw = self
-		self.wzxx = self
-		self.wzxy = self
-		self.wzxz = self
-		self.wzy = self
-		self.wzyw = self
-		self.wzyx = self
-		self.wzyy = self
-		self.wzyz = self
-		self.wzz = self
-		self.wzzw = self
-		self.wzzx = self
-		self.wzzy = self
-		self.wzzz = self
-		self.xw = self
-		self.xww = self
-		self.xwww = self
-		self.xwwx = self
-		self.xwwy = self
-		self.xwwz = self
-		self.xwx = self
-		self.xwxw = self
-		self.xwxx = self
-		self.xwxy = self
-		self.xwxz = self
-		self.xwy = self
-		self.xwyw = self
-		self.xwyx = self
-		self.xwyy = self
-		self.xwyz = self
-		self.xwz = self
-		self.xwzw = self
-		self.xwzx = self
-		self.xwzy = self
-		self.xwzz = self
-		self.xx = self
-		self.xxw = self
-		self.xxww = self
-		self.xxwx = self
-		self.xxwy = self
-		self.xxwz = self
-		self.xxx = self
-		self.xxxw = self
-		self.xxxx = self
-		self.xxxy = self
-		self.xxxz = self
-		self.xxy = self
-		self.xxyw = self
-		self.xxyx = self
-		self.xxyy = self
-		self.xxyz = self
-		self.xxz = self
-		self.xxzw = self
-		self.xxzx = self
-		self.xxzy = self
-		self.xxzz = self
-		self.xy = self
-		self.xyw = self
-		self.xyww = self
-		self.xywx = self
-		self.xywy = self
-		self.xywz = self
-		self.xyx = self
-		self.xyxw = self
-		self.xyxx = self
-		self.xyxy = self
-		self.xyxz = self
-		self.xyy = self
-		self.xyyw = self
-		self.xyyx = self
-		self.xyyy = self
-		self.xyyz = self
-		self.xyz = self
-		self.xyzw = self
-		self.xyzx = self
-		self.xyzy = self
-		self.xyzz = self
-		self.xz = self
-		self.xzw = self
-		self.xzww = self
-		self.xzwx = self
-		self.xzwy = self
-		self.xzwz = self
-		self.xzx = self
-		self.xzxw = self
-		self.xzxx = self
-		self.xzxy = self
-		self.xzxz = self
-		self.xzy = self
-		self.xzyw = self
-		self.xzyx = self
-		self.xzyy = self
-		self.xzyz = self
-		self.xzz = self
-		self.xzzw = self
-		self.xzzx = self
-		self.xzzy = self
-		self.xzzz = self
-		self.yw = self
-		self.yww = self
-		self.ywww = self
-		self.ywwx = self
-		self.ywwy = self
-		self.ywwz = self
-		self.ywx = self
-		self.ywxw = self
-		self.ywxx = self
-		self.ywxy = self
-		self.ywxz = self
-		self.ywy = self
-		self.ywyw = self
-		self.ywyx = self
-		self.ywyy = self
-		self.ywyz = self
-		self.ywz = self
-		self.ywzw = self
-		self.ywzx = self
-		self.ywzy = self
-		self.ywzz = self
-		self.yx = self
-		self.yxw = self
-		self.yxww = self
-		self.yxwx = self
-		self.yxwy = self
-		self.yxwz = self
-		self.yxx = self
-		self.yxxw = self
-		self.yxxx = self
-		self.yxxy = self
-		self.yxxz = self
-		self.yxy = self
-		self.yxyw = self
-		self.yxyx = self
-		self.yxyy = self
-		self.yxyz = self
-		self.yxz = self
-		self.yxzw = self
-		self.yxzx = self
-		self.yxzy = self
-		self.yxzz = self
-		self.yy = self
-		self.yyw = self
-		self.yyww = self
-		self.yywx = self
-		self.yywy = self
-		self.yywz = self
-		self.yyx = self
-		self.yyxw = self
-		self.yyxx = self
-		self.yyxy = self
-		self.yyxz = self
-		self.yyy = self
-		self.yyyw = self
-		self.yyyx = self
-		self.yyyy = self
-		self.yyyz = self
-		self.yyz = self
-		self.yyzw = self
-		self.yyzx = self
-		self.yyzy = self
-		self.yyzz = self
-		self.yz = self
-		self.yzw = self
-		self.yzww = self
-		self.yzwx = self
-		self.yzwy = self
-		self.yzwz = self
-		self.yzx = self
-		self.yzxw = self
-		self.yzxx = self
-		self.yzxy = self
-		self.yzxz = self
-		self.yzy = self
-		self.yzyw = self
-		self.yzyx = self
-		self.yzyy = self
-		self.yzyz = self
-		self.yzz = self
-		self.yzzw = self
-		self.yzzx = self
-		self.yzzy = self
-		self.yzzz = self
-		self.zw = self
-		self.zww = self
-		self.zwww = self
-		self.zwwx = self
-		self.zwwy = self
-		self.zwwz = self
-		self.zwx = self
-		self.zwxw = self
-		self.zwxx = self
-		self.zwxy = self
-		self.zwxz = self
-		self.zwy = self
-		self.zwyw = self
-		self.zwyx = self
-		self.zwyy = self
-		self.zwyz = self
-		self.zwz = self
-		self.zwzw = self
-		self.zwzx = self
-		self.zwzy = self
-		self.zwzz = self
-		self.zx = self
-		self.zxw = self
-		self.zxww = self
-		self.zxwx = self
-		self.zxwy = self
-		self.zxwz = self
-		self.zxx = self
-		self.zxxw = self
-		self.zxxx = self
-		self.zxxy = self
-		self.zxxz = self
-		self.zxy = self
-		self.zxyw = self
-		self.zxyx = self
-		self.zxyy = self
-		self.zxyz = self
-		self.zxz = self
-		self.zxzw = self
-		self.zxzx = self
-		self.zxzy = self
-		self.zxzz = self
-		self.zy = self
-		self.zyw = self
-		self.zyww = self
-		self.zywx = self
-		self.zywy = self
-		self.zywz = self
-		self.zyx = self
-		self.zyxw = self
-		self.zyxx = self
-		self.zyxy = self
-		self.zyxz = self
-		self.zyy = self
-		self.zyyw = self
-		self.zyyx = self
-		self.zyyy = self
-		self.zyyz = self
-		self.zyz = self
-		self.zyzw = self
-		self.zyzx = self
-		self.zyzy = self
-		self.zyzz = self
-		self.zz = self
-		self.zzw = self
-		self.zzww = self
-		self.zzwx = self
-		self.zzwy = self
-		self.zzwz = self
-		self.zzx = self
-		self.zzxw = self
-		self.zzxx = self
-		self.zzxy = self
-		self.zzxz = self
-		self.zzy = self
-		self.zzyw = self
-		self.zzyx = self
-		self.zzyy = self
-		self.zzyz = self
-		self.zzz = self
-		self.zzzw = self
-		self.zzzx = self
-		self.zzzy = self
-		self.zzzz = self
-		
+
+	__slots__ = ("_v", "_frozen", "_owner", "_callback")
+
+	# Axes of the x, y, z, w and swizzle descriptors, see _Axis and _Swizzle
+	_swizzle_axes = "xyzw"
+
+	def __init__(self, seq=(0.0, 0.0, 0.0)):
+		values = [float(value) for value in seq]
+		if len(values) < 2:
+			raise ValueError("Vector(): invalid size, must be a sequence of at least two")
+		self._v = values
+		self._frozen = False
+		self._owner = None
+		self._callback = None
+
 	@classmethod
-	def Fill(self, size, fill=0.0):
+	def _wrap(cls, values, owner, callback):
+		"""A vector of values which calls callback with its components whenever it changes.
+
+		Return type: Vector"""
+
+		vector = _vector([float(value) for value in values])
+		vector._owner = owner
+		vector._callback = callback
+		return vector
+
+	def _assign(self, values):
+		"""Replace the components, a wrapped vector passes them to its owner."""
+
+		if self._frozen:
+			raise _frozen_error()
+		self._v = values
+		if self._callback is not None:
+			self._callback(values)
+
+	@property
+	def is_frozen(self):
+		"""True when this object has been frozen (read-only).
+
+		Return type: bool"""
+
+		return self._frozen
+
+	@property
+	def is_wrapped(self):
+		"""True when this object wraps external data (read-only).
+
+		Return type: bool"""
+
+		return self._callback is not None
+
+	@property
+	def owner(self):
+		"""The item this is wrapping or None (read-only)."""
+
+		return self._owner
+
+	@property
+	def length(self):
+		"""Vector Length.
+
+		Return type: float"""
+
+		return math.hypot(*self._v)
+
+	@length.setter
+	def length(self, value):
+		if value < 0.0:
+			raise ValueError("Vector.length = value: can't be negative")
+		length = math.hypot(*self._v)
+		if length:
+			scale = value / length
+			self._assign([component * scale for component in self._v])
+
+	@property
+	def magnitude(self):
+		"""Vector Length.
+
+		Return type: float"""
+
+		return math.hypot(*self._v)
+
+	@magnitude.setter
+	def magnitude(self, value):
+		Vector.length.fset(self, value)
+
+	@property
+	def length_squared(self):
+		"""Vector length squared (v.dot(v)).
+
+		Return type: float"""
+
+		values = self._v
+		if len(values) == 3:
+			return values[0] * values[0] + values[1] * values[1] + values[2] * values[2]
+		return math.fsum(value * value for value in values)
+
+	@classmethod
+	def Fill(cls, size, fill=0.0):
 		"""Create a vector of length size with all values set to fill.
 
 		Parameters:
 		size (int) - The length of the vector to be created.
-		fill (float) - The value used to fill the vector."""
-		
-		return self
-		
+		fill (float) - The value used to fill the vector.
+
+		Return type: Vector"""
+
+		if size < 2:
+			raise ValueError("Vector.Fill(): invalid size")
+		return _vector([float(fill)] * size)
+
 	@classmethod
-	def Linspace(self, start, stop, size):
+	def Linspace(cls, start, stop, size):
 		"""Create a vector of the specified size which is filled with linearly spaced values between start and stop values.
 
 		Parameters:
 		start (int) - The start of the range used to fill the vector.
 		stop (int) - The end of the range used to fill the vector.
-		size (int) - The size of the vector to be created."""
-		
-		return self
-		
+		size (int) - The size of the vector to be created.
+
+		Return type: Vector"""
+
+		if size < 2:
+			raise ValueError("Vector.Linspace(): invalid size")
+		step = (stop - start) / (size - 1)
+		return _vector([start + step * index for index in range(size - 1)] + [float(stop)])
+
 	@classmethod
-	def Range(self, start, stop, step=1):
+	def Range(cls, start, stop=None, step=1):
 		"""Create a filled with a range of values.
 
-		Parameters:	
+		Parameters:
 		start (int) - The start of the range used to fill the vector.
 		stop (int) - The end of the range used to fill the vector.
-		step (int) - The step between successive values in the vector."""
-		
-		return self
-		
+		step (int) - The step between successive values in the vector.
+
+		Return type: Vector"""
+
+		if stop is None:
+			start, stop = 0, start
+		values = [float(value) for value in range(start, stop, step)]
+		if len(values) < 2:
+			raise ValueError("Vector.Range(): invalid size")
+		return _vector(values)
+
 	@classmethod
-	def Repeat(self, vector, size):
+	def Repeat(cls, vector, size):
 		"""Create a vector by repeating the values in vector until the required size is reached.
 
 		Parameters:
 		tuple (mathutils.Vector) - The vector to draw values from.
-		size (int) - The size of the vector to be created."""
-		
+		size (int) - The size of the vector to be created.
+
+		Return type: Vector"""
+
+		values = [float(value) for value in vector]
+		if not values or size < 2:
+			raise ValueError("Vector.Repeat(): invalid size")
+		return _vector((values * (size // len(values) + 1))[:size])
+
+	def __len__(self):
+		return len(self._v)
+
+	def __iter__(self):
+		return iter(self._v)
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return tuple(self._v[index])
+		try:
+			return self._v[index]
+		except IndexError:
+			raise IndexError("vector[index]: out of range") from None
+
+	def __setitem__(self, index, value):
+		values = list(self._v)
+		if isinstance(index, slice):
+			items = [float(item) for item in value]
+			if len(values[index]) != len(items):
+				raise ValueError("vector[begin:end] = []: size mismatch in slice assignment")
+			values[index] = items
+		else:
+			try:
+				values[index] = float(value)
+			except IndexError:
+				raise IndexError("vector[index] = x: assignment index out of range") from None
+		self._assign(values)
+
+	def __bool__(self):
+		return any(self._v)
+
+	def __repr__(self):
+		return "Vector((%s))" % ", ".join(repr(value) for value in self._v)
+
+	def __str__(self):
+		return "<Vector (%s)>" % ", ".join("%.4f" % value for value in self._v)
+
+	def __eq__(self, other):
+		if isinstance(other, Vector):
+			return self._v == other._v
+		return NotImplemented
+
+	def __ne__(self, other):
+		if isinstance(other, Vector):
+			return self._v != other._v
+		return NotImplemented
+
+	# Ordering compares lengths, like mathutils
+	def __lt__(self, other):
+		if isinstance(other, Vector):
+			return self.length_squared < other.length_squared
+		return NotImplemented
+
+	def __le__(self, other):
+		if isinstance(other, Vector):
+			return self.length_squared <= other.length_squared
+		return NotImplemented
+
+	def __gt__(self, other):
+		if isinstance(other, Vector):
+			return self.length_squared > other.length_squared
+		return NotImplemented
+
+	def __ge__(self, other):
+		if isinstance(other, Vector):
+			return self.length_squared >= other.length_squared
+		return NotImplemented
+
+	def __hash__(self):
+		if not self._frozen:
+			raise TypeError("Vector must be frozen to be hashable")
+		return hash(tuple(self._v))
+
+	def __neg__(self):
+		return _vector([-value for value in self._v])
+
+	def __pos__(self):
+		return _vector(list(self._v))
+
+	def __add__(self, other):
+		a = self._v
+		b = other._v if type(other) is Vector and len(other._v) == len(a) else _components(self, other, "Vector addition")
+		if b is None:
+			return NotImplemented
+		if len(a) == 3:
+			return _vector([a[0] + b[0], a[1] + b[1], a[2] + b[2]])
+		return _vector([x + y for x, y in zip(a, b)])
+
+	__radd__ = __add__
+
+	def __sub__(self, other):
+		a = self._v
+		b = other._v if type(other) is Vector and len(other._v) == len(a) else _components(self, other, "Vector subtraction")
+		if b is None:
+			return NotImplemented
+		if len(a) == 3:
+			return _vector([a[0] - b[0], a[1] - b[1], a[2] - b[2]])
+		return _vector([x - y for x, y in zip(a, b)])
+
+	def __rsub__(self, other):
+		b = _components(self, other, "Vector subtraction")
+		if b is None:
+			return NotImplemented
+		return _vector([y - x for x, y in zip(self._v, b)])
+
+	def __mul__(self, other):
+		a = self._v
+		if isinstance(other, (int, float)):
+			if len(a) == 3:
+				return _vector([a[0] * other, a[1] * other, a[2] * other])
+			return _vector([value * other for value in a])
+		# Rotating and transforming are spelled with @
+		if isinstance(other, (Matrix, Quaternion)):
+			return NotImplemented
+		b = other._v if type(other) is Vector and len(other._v) == len(a) else _components(self, other, "Vector multiplication")
+		if b is None:
+			return NotImplemented
+		return _vector([x * y for x, y in zip(a, b)])
+
+	__rmul__ = __mul__
+
+	def __truediv__(self, other):
+		if not isinstance(other, (int, float)):
+			return NotImplemented
+		if other == 0:
+			raise ZeroDivisionError("Vector division: divide by zero error")
+		scale = 1.0 / other
+		return _vector([value * scale for value in self._v])
+
+	def __matmul__(self, other):
+		if isinstance(other, Matrix):
+			return NotImplemented
+		b = _components(self, other, "Vector multiplication")
+		if b is None:
+			return NotImplemented
+		return self.dot(b)
+
+	__rmatmul__ = __matmul__
+
+	def __iadd__(self, other):
+		result = self.__add__(other)
+		if result is NotImplemented:
+			return NotImplemented
+		self._assign(result._v)
 		return self
-		
+
+	def __isub__(self, other):
+		result = self.__sub__(other)
+		if result is NotImplemented:
+			return NotImplemented
+		self._assign(result._v)
+		return self
+
+	def __imul__(self, other):
+		result = self.__mul__(other)
+		if result is NotImplemented:
+			return NotImplemented
+		self._assign(result._v)
+		return self
+
+	def __itruediv__(self, other):
+		result = self.__truediv__(other)
+		if result is NotImplemented:
+			return NotImplemented
+		self._assign(result._v)
+		return self
+
+	def __copy__(self):
+		return _vector(list(self._v))
+
+	def __deepcopy__(self, memo):
+		return _vector(list(self._v))
+
+	def __reduce__(self):
+		return Vector, (tuple(self._v),)
+
 	def angle(self, other, fallback=None):
 		"""Return the angle between two vectors.
 
 		Parameters:
 		other (Vector) - another vector to compare the angle with
 		fallback (any) - return this when the angle can't be calculated (zero length vector), (instead of raising a ValueError).
-		
+
 		Returns: angle in radians or fallback when given
 
 		Return type: float"""
-		
-		return 1.0
-		
-	def angle_signed(self, other, fallback):
+
+		b = _components(self, other, "Vector.angle(other)")
+		if b is None:
+			raise TypeError("Vector.angle(other): expected a vector")
+		lengths = self.length_squared * math.fsum(value * value for value in b)
+		if not lengths:
+			if fallback is not None:
+				return fallback
+			raise ValueError("Vector.angle(other): zero length vectors have no valid angle")
+		return math.acos(max(-1.0, min(1.0, self.dot(b) / math.sqrt(lengths))))
+
+	def angle_signed(self, other, fallback=None):
 		"""Return the signed angle between two 2D vectors (clockwise is positive).
 
 		Parameters:
 		other (Vector) - another vector to compare the angle with
 		fallback (any) - return this when the angle can't be calculated (zero length vector), (instead of raising a ValueError).
-		
+
 		Returns: angle in radians or fallback when given
 
 		Return type: float"""
-		
-		return 1.0
-		
+
+		if len(self._v) != 2:
+			raise ValueError("Vector.angle_signed(other): only 2D vectors are supported")
+		(x1, y1), (x2, y2) = self._v, _components(self, other, "Vector.angle_signed(other)")
+		if not (x1 or y1) or not (x2 or y2):
+			if fallback is not None:
+				return fallback
+			raise ValueError("Vector.angle_signed(other): zero length vectors have no valid angle")
+		return math.atan2(y1 * x2 - x1 * y2, x1 * x2 + y1 * y2)
+
 	def copy(self):
 		"""Returns a copy of this vector.
 
 		Returns: A copy of the vector.
-		
+
 		Return type: Vector
-		
+
 		Note: use this to get a copy of a wrapped vector with no reference to the original data."""
-		
-		return self
-		
+
+		return _vector(list(self._v))
+
 	def cross(self, other):
 		"""Return the cross product of this vector and another.
 
 		Parameters:
 		other (Vector) - The other vector to perform the cross product with.
-		
+
 		Returns: The cross product.
-		
+
 		Return type: Vector or float when 2D vectors are used
-		
+
 		Note: both vectors must be 2D or 3D"""
-		
-		return self
-		
+
+		a = self._v
+		b = other._v if type(other) is Vector and len(other._v) == len(a) else _components(self, other, "Vector.cross(other)")
+		if b is None:
+			raise TypeError("Vector.cross(other): expected a vector")
+		if len(a) == 3:
+			return _vector([a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]])
+		if len(a) == 2:
+			return a[0] * b[1] - a[1] * b[0]
+		raise ValueError("Vector.cross(other): vectors must be 2D or 3D")
+
 	def dot(self, other):
 		"""Return the dot product of this vector and another.
 
 		Parameters:
 		other (Vector) - The other vector to perform the dot product with.
-		
+
 		Returns: The dot product.
-		
-		Return type: Vector"""
-		
-		return self
-		
+
+		Return type: float"""
+
+		a = self._v
+		b = other._v if type(other) is Vector and len(other._v) == len(a) else _components(self, other, "Vector.dot(other)")
+		if b is None:
+			raise TypeError("Vector.dot(other): expected a vector")
+		if len(a) == 3:
+			return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+		return math.fsum(x * y for x, y in zip(a, b))
+
 	def freeze(self):
 		"""Make this object immutable.
 
 		After this the object can be hashed, used in dictionaries & sets.
 
 		Returns: An instance of this object."""
-		
+
+		if self._callback is not None:
+			raise TypeError("Vector.freeze(): cannot freeze wrapped data")
+		self._frozen = True
 		return self
-		
+
 	def lerp(self, other, factor):
 		"""Returns the interpolation of two vectors.
 
-		Parameters:	
+		Parameters:
 		other (Vector) - value to interpolate with.
 		factor (float) - The interpolation value in [0.0, 1.0].
-		
+
 		Returns: The interpolated vector.
 
 		Return type: Vector"""
-		
-		return self
-		
+
+		a = self._v
+		b = other._v if type(other) is Vector and len(other._v) == len(a) else _components(self, other, "Vector.lerp(other, factor)")
+		if b is None:
+			raise TypeError("Vector.lerp(other, factor): expected a vector")
+		keep = 1.0 - factor
+		if len(a) == 3:
+			return _vector([a[0] * keep + b[0] * factor, a[1] * keep + b[1] * factor, a[2] * keep + b[2] * factor])
+		return _vector([x * keep + y * factor for x, y in zip(a, b)])
+
 	def negate(self):
 		"""Set all values to their negative."""
-		
-		pass
-		
+
+		self._assign([-value for value in self._v])
+
 	def normalize(self):
 		"""Normalize the vector, making the length of the vector always 1.0.
 
 		Warning: Normalizing a vector where all values are zero has no effect.
-		
+
 		Note: Normalize works for vectors of all sizes, however 4D Vectors w axis is left untouched."""
-		
-		pass
-		
+
+		normalized = self.normalized()
+		if normalized._v != self._v:
+			self._assign(normalized._v)
+
 	def normalized(self):
 		"""Return a new, normalized vector.
 
 		Returns: a normalized copy of the vector
-		
+
 		Return type: Vector"""
-		
-		return self
-		
+
+		values = self._v
+		size = 3 if len(values) == 4 else len(values)
+		length = math.hypot(*values[:size])
+		if not length:
+			return _vector(list(values))
+		scale = 1.0 / length
+		if size == 3:
+			return _vector([values[0] * scale, values[1] * scale, values[2] * scale] + values[3:])
+		return _vector([value * scale for value in values])
+
 	def orthogonal(self):
 		"""Return a perpendicular vector.
 
 		Returns: a new vector 90 degrees from this vector.
-		
+
 		Return type: Vector
-		
+
 		Note: the axis is undefined, only use when any orthogonal vector is acceptable."""
-		
-		return self
-		
+
+		values = self._v
+		if len(values) == 2:
+			return _vector([-values[1], values[0]])
+		if len(values) != 3:
+			raise ValueError("Vector.orthogonal(): vector must be 2D or 3D")
+		x, y, z = values
+		# Built from the dominant axis, so the result is never zero for a non-zero vector
+		ax, ay, az = abs(x), abs(y), abs(z)
+		if ax > ay and ax > az:
+			return _vector([-y - z, x, x])
+		if ay > az and ay >= ax:
+			return _vector([y, -x - z, y])
+		return _vector([z, z, -x - y])
+
 	def project(self, other):
 		"""Return the projection of this vector onto the other.
 
 		Parameters:
 		other (Vector) - second vector.
-		
+
 		Returns: the parallel projection vector
 		Return type: Vector"""
-		
-		return self
-		
+
+		b = _components(self, other, "Vector.project(other)")
+		if b is None:
+			raise TypeError("Vector.project(other): expected a vector")
+		length_squared = math.fsum(value * value for value in b)
+		if not length_squared:
+			return _vector([0.0] * len(b))
+		scale = self.dot(b) / length_squared
+		return _vector([value * scale for value in b])
+
 	def reflect(self, mirror):
 		"""Return the reflection vector from the mirror argument.
 
 		Parameters:
 		mirror (Vector) - This vector could be a normal from the reflecting surface.
-		
+
 		Returns: The reflected vector matching the size of this vector.
-		
+
 		Return type: Vector"""
-		
-		return self
-		
+
+		normal = _components(self, mirror, "Vector.reflect(mirror)")
+		if normal is None:
+			raise TypeError("Vector.reflect(mirror): expected a vector")
+		length = math.hypot(*normal)
+		if not length:
+			return _vector(list(self._v))
+		normal = [value / length for value in normal]
+		twice_dot = 2.0 * math.fsum(x * y for x, y in zip(self._v, normal))
+		return _vector([x - twice_dot * n for x, n in zip(self._v, normal)])
+
+	def _resize(self, size, w=0.0):
+		if self._callback is not None:
+			raise TypeError("Vector.resize(): cannot resize wrapped data")
+		if size < 2:
+			raise ValueError("Vector.resize(): invalid size")
+		values = self._v[:size]
+		values.extend([0.0] * (size - len(values)))
+		if size == 4 and len(self._v) < 4:
+			values[3] = w
+		self._assign(values)
+
 	def resize(self, size=3):
 		"""Resize the vector to have size number of elements."""
-		
-		pass
-		
+
+		self._resize(size)
+
 	def resize_2d(self):
 		"""Resize the vector to 2D (x, y)."""
-		
-		pass
-		
+
+		self._resize(2)
+
 	def resize_3d(self):
 		"""Resize the vector to 3D (x, y, z)."""
-		
-		pass
-		
+
+		self._resize(3)
+
 	def resize_4d(self):
 		"""Resize the vector to 4D (x, y, z, w)."""
-		
-		pass
-		
+
+		self._resize(4, 1.0)
+
 	def resized(self, size=3):
 		"""Return a resized copy of the vector with size number of elements.
 
 		Returns: a new vector
-		
+
 		Return type: Vector"""
-		
-		return self
-		
+
+		if size < 2:
+			raise ValueError("Vector.resized(): invalid size")
+		values = self._v[:size]
+		values.extend([0.0] * (size - len(values)))
+		return _vector(values)
+
 	def rotate(self, other):
 		"""Rotate the vector by a rotation value.
 
 		Parameters:
 		other (Euler, Quaternion or Matrix) - rotation component of mathutils value"""
-		
-		pass
-		
+
+		v = self._v
+		if len(v) == 2 and isinstance(other, Matrix) and other._nrows == other._ncols == 2:
+			m = other._m
+			self._assign([m[0] * v[0] + m[1] * v[1], m[2] * v[0] + m[3] * v[1]])
+			return
+		if len(v) != 3:
+			raise ValueError("Vector.rotate(): must be a 3D vector, or 2D with a 2x2 matrix")
+		m = _rotation_of(other)
+		x, y, z = v
+		self._assign([m[0] * x + m[1] * y + m[2] * z, m[3] * x + m[4] * y + m[5] * z, m[6] * x + m[7] * y + m[8] * z])
+
 	def rotation_difference(self, other):
 		"""Returns a quaternion representing the rotational difference between this vector and another.
 
 		Parameters:
 		other (Vector) - second vector.
-		
+
 		Returns: the rotational difference between the two vectors.
-		
+
 		Return type: Quaternion
-		
+
 		Note: 2D vectors raise an AttributeError."""
-		
-		return Quaternion
-		
+
+		if len(self._v) != 3:
+			raise AttributeError("Vector.rotation_difference(): expects both vectors to be size 3")
+		b = _components(self, other, "Vector.rotation_difference(other)")
+		a = self.normalized()._v
+		b = _vector(list(b)).normalized()._v
+		axis = [a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]]
+		if math.hypot(*axis) > _EPSILON:
+			cosine = a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+			return _quaternion(_axis_angle_quaternion(axis, math.acos(max(-1.0, min(1.0, cosine)))))
+		if a[0] * b[0] + a[1] * b[1] + a[2] * b[2] > 0.0:
+			return _quaternion([1.0, 0.0, 0.0, 0.0])
+		# Opposite vectors, half a turn around any perpendicular axis
+		return _quaternion(_axis_angle_quaternion(_vector(list(a)).orthogonal()._v, math.pi))
+
 	def slerp(self, other, factor, fallback=None):
 		"""Returns the interpolation of two non-zero vectors (spherical coordinates).
 
@@ -1251,64 +2745,212 @@ class Vector:
 		other (Vector) - value to interpolate with.
 		factor (float) - The interpolation value typically in [0.0, 1.0].
 		fallback (any) - return this when the vector can't be calculated (zero length vector or direct opposites), (instead of raising a ValueError).
-		
+
 		Returns: The interpolated vector.
 
 		Return type: Vector"""
-		
-		return Vector(False)
-		
+
+		a = self._v
+		b = _components(self, other, "Vector.slerp(other, factor)")
+		if b is None:
+			raise TypeError("Vector.slerp(other, factor): expected a vector")
+		a_length, b_length = math.hypot(*a), math.hypot(*b)
+		if a_length < _EPSILON or b_length < _EPSILON:
+			if fallback is not None:
+				return fallback
+			raise ValueError("Vector.slerp(other, factor): zero length vectors unsupported")
+		a = [value / a_length for value in a]
+		b = [value / b_length for value in b]
+		cosine = math.fsum(x * y for x, y in zip(a, b))
+		if cosine < _EPSILON - 1.0:
+			if fallback is not None:
+				return fallback
+			raise ValueError("Vector.slerp(other, factor): opposite vectors unsupported")
+		if cosine < 1.0 - _EPSILON:
+			omega = math.acos(cosine)
+			sine = math.sin(omega)
+			wa, wb = math.sin((1.0 - factor) * omega) / sine, math.sin(factor * omega) / sine
+		else:
+			# Nearly parallel, the sine vanishes
+			wa, wb = 1.0 - factor, factor
+		return _vector([x * wa + y * wb for x, y in zip(a, b)])
+
 	def to_2d(self):
 		"""Return a 2d copy of the vector.
 
 		Returns: a new vector
-		
+
 		Return type: Vector"""
-		
-		return Vector(False)
-		
+
+		return _vector(self._v[:2])
+
 	def to_3d(self):
 		"""Return a 3d copy of the vector.
 
 		Returns: a new vector
 		Return type: Vector"""
-		
-		return Vector(False)
-		
+
+		values = self._v[:3]
+		values.extend([0.0] * (3 - len(values)))
+		return _vector(values)
+
 	def to_4d(self):
 		"""Return a 4d copy of the vector.
 
 		Returns: a new vector
 		Return type: Vector"""
-		
-		return Vector(False)
-		
-	def to_track_quat(self, track, up):
+
+		values = self._v[:4]
+		if len(values) == 2:
+			values.append(0.0)
+		if len(values) == 3:
+			values.append(1.0)
+		return _vector(values)
+
+	def to_track_quat(self, track="Z", up="Y"):
 		"""Return a quaternion rotation from the vector and the track and up axis.
 
 		Parameters:
 		track (string) - Track axis in ['X', 'Y', 'Z', '-X', '-Y', '-Z'].
 		up (string) - Up axis in ['X', 'Y', 'Z'].
-		
+
 		Returns: rotation from the vector and the track and up axis.
 
 		Return type: Quaternion"""
-		
-		return Quaternion(False, False)
-		
+
+		axes = {"X": 0, "Y": 1, "Z": 2, "-X": 3, "-Y": 4, "-Z": 5}
+		if track not in axes:
+			raise ValueError("Vector.to_track_quat(): only X, -X, Y, -Y, Z or -Z for track axis")
+		if up not in ("X", "Y", "Z"):
+			raise ValueError("Vector.to_track_quat(): only X, Y or Z for up axis")
+		if len(self._v) != 3:
+			raise ValueError("Vector.to_track_quat(): only for 3D vectors")
+		axis, up = axes[track], axes[up]
+		if axis == up:
+			raise ValueError("Vector.to_track_quat(): can't have the same axis for track and up")
+		length = math.hypot(*self._v)
+		if not length:
+			return _quaternion([1.0, 0.0, 0.0, 0.0])
+		tvec = list(self._v)
+		if axis > 2:
+			tvec = [-value for value in tvec]
+			axis -= 3
+		# The rotation taking the track axis onto the vector
+		if axis == 0:
+			normal = [0.0, -tvec[2], tvec[1]]
+			if abs(tvec[1]) + abs(tvec[2]) < 1e-4:
+				normal[1] = 1.0
+		elif axis == 1:
+			normal = [tvec[2], 0.0, -tvec[0]]
+			if abs(tvec[0]) + abs(tvec[2]) < 1e-4:
+				normal[2] = 1.0
+		else:
+			normal = [-tvec[1], tvec[0], 0.0]
+			if abs(tvec[0]) + abs(tvec[1]) < 1e-4:
+				normal[0] = 1.0
+		cosine = max(-1.0, min(1.0, tvec[axis] / length))
+		q = _axis_angle_quaternion(normal, math.acos(cosine))
+		if axis != up:
+			# Then the roll around the vector which points the up axis up
+			m = _quaternion_rotation(q)
+			z = (m[2], m[5], m[8])
+			if axis == 0:
+				angle = 0.5 * math.atan2(z[2], z[1]) if up == 1 else -0.5 * math.atan2(z[1], z[2])
+			elif axis == 1:
+				angle = -0.5 * math.atan2(z[2], z[0]) if up == 0 else 0.5 * math.atan2(z[0], z[2])
+			else:
+				angle = 0.5 * math.atan2(-z[1], -z[0]) if up == 0 else -0.5 * math.atan2(-z[0], -z[1])
+			sine = math.sin(angle) / length
+			q = _quaternion_multiply([math.cos(angle), tvec[0] * sine, tvec[1] * sine, tvec[2] * sine], q)
+		return _quaternion(q)
+
 	def to_tuple(self, precision=-1):
 		"""Return this vector as a tuple with.
 
 		Parameters:
 		precision (int) - The number to round the value to in [-1, 21].
-		
+
 		Returns: the values of the vector rounded by precision
-		
+
 		Return type: tuple"""
-		
-		return (0.0, 0.0, 0.0, 0.0)
-		
+
+		if not -1 <= precision <= 21:
+			raise ValueError("Vector.to_tuple(precision): precision must be between -1 and 21")
+		if precision == -1:
+			return tuple(self._v)
+		return tuple(round(value, precision) for value in self._v)
+
 	def zero(self):
 		"""Set all values to zero."""
-		
-		pass
\ No newline at end of file
+
+		self._assign([0.0] * len(self._v))
+
+class _Axis:
+	"""Class level descriptor of one axis of Vector (x, y, z, w)."""
+
+	__slots__ = ("index", "name")
+
+	def __init__(self, index, name):
+		self.index = index
+		self.name = name
+
+	def __get__(self, vector, owner=None):
+		if vector is None:
+			return self
+		try:
+			return vector._v[self.index]
+		except IndexError:
+			raise AttributeError("Vector.%s: axis does not exist for a %dD vector" % (self.name, len(vector._v))) from None
+
+	def __set__(self, vector, value):
+		if vector._frozen:
+			raise _frozen_error()
+		values = vector._v
+		if self.index >= len(values):
+			raise AttributeError("Vector.%s: axis does not exist for a %dD vector" % (self.name, len(values)))
+		values[self.index] = float(value)
+		if vector._callback is not None:
+			vector._callback(values)
+
+class _Swizzle:
+	"""Class level descriptor of a swizzle of Vector (xy, zyx, wwzw, ...).
+
+	Reading returns a new vector, assigning is allowed when no axis repeats."""
+
+	__slots__ = ("indices", "name")
+
+	def __init__(self, indices, name):
+		self.indices = indices
+		self.name = name
+
+	def __get__(self, vector, owner=None):
+		if vector is None:
+			return self
+		values = vector._v
+		try:
+			return _vector([values[index] for index in self.indices])
+		except IndexError:
+			raise AttributeError("Vector.%s: swizzle axis does not exist for a %dD vector" % (self.name, len(values))) from None
+
+	def __set__(self, vector, value):
+		if len(set(self.indices)) != len(self.indices):
+			raise AttributeError("Vector.%s: read-only swizzle, an axis repeats" % self.name)
+		items = [float(item) for item in value]
+		if len(items) != len(self.indices):
+			raise ValueError("Vector.%s = value: size mismatch in swizzle assignment" % self.name)
+		values = list(vector._v)
+		if max(self.indices) >= len(values):
+			raise AttributeError("Vector.%s: swizzle axis does not exist for a %dD vector" % (self.name, len(values)))
+		for index, item in zip(self.indices, items):
+			values[index] = item
+		vector._assign(values)
+
+# The descriptors are made once, here, and shared by every vector
+for _indices in itertools.chain.from_iterable(itertools.product(range(4), repeat=size) for size in range(1, 5)):
+	_name = "".join(Vector._swizzle_axes[index] for index in _indices)
+	setattr(Vector, _name, _Axis(_indices[0], _name) if len(_indices) == 1 else _Swizzle(_indices, _name))
+del _indices, _name
+
+# The arrays and the submodules build on the classes above
+from .arrays import MatrixArray, QuaternionArray, VectorArray
+from . import bvhtree, geometry, interpolate, kdtree, noise
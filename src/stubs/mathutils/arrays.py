@@ -0,0 +1,901 @@
+"""Array Utilities (mathutils.arrays)
+
+Batches of vectors, quaternions and 4x4 matrices stored in one contiguous
+buffer of 32 bit floats, so a crowd, a particle system or the bones of an
+animation blend are transformed, normalized or interpolated in a handful of
+bulk operations instead of one Python call per object.
+
+The buffer is a numpy.ndarray when numpy is installed, else an array.array
+('f'), where the operations run on whole components (every x, then every y,
+...) through map(). Indexing a batch makes regular mathutils types on demand:
+batch[i] is a Vector (or Quaternion) wrapping item i, changing it in place
+writes to the batch."""
+
+import math
+import operator
+from array import array
+
+from . import Matrix, Quaternion, Vector, _quaternion_slerp
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+_new = object.__new__
+
+def _zeros(count):
+	return array("f", bytes(4 * count))
+
+def _columns(data, size):
+	"""The components of a flat buffer of vectors, one array per axis."""
+
+	return [data[axis::size] for axis in range(size)]
+
+def _interleave(columns):
+	"""The flat buffer of the vectors whose components are columns."""
+
+	size = len(columns)
+	data = _zeros(size * len(columns[0]))
+	for axis, column in enumerate(columns):
+		data[axis::size] = column if isinstance(column, array) else array("f", column)
+	return data
+
+def _sum(columns):
+	"""Item-wise sum of columns, a list of iterables of floats."""
+
+	total = columns[0]
+	for column in columns[1:]:
+		total = map(operator.add, total, column)
+	return array("f", total)
+
+def _rows(matrix):
+	"""The rows of a 4x4 matrix as lists of floats, 3x3 matrices are extended."""
+
+	rows = [[float(value) for value in row] for row in matrix]
+	if len(rows) == 3:
+		rows = [row + [0.0] for row in rows] + [[0.0, 0.0, 0.0, 1.0]]
+	if len(rows) != 4 or any(len(row) != 4 for row in rows):
+		raise ValueError("expected a 3x3 or a 4x4 matrix")
+	return rows
+
+def _flat_points(points, operation):
+	"""The flat x, y, z floats of points: 3D vectors, numeric sequences, a VectorArray or an (n, 3) numpy array."""
+
+	if isinstance(points, VectorArray):
+		if points.size != 3:
+			raise ValueError("%s: expected 3D points" % operation)
+		points = points.buffer
+	if hasattr(points, "tolist"):
+		values = points.tolist()
+		if values and isinstance(values[0], list):
+			values = [value for point in values for value in point]
+		if len(values) % 3:
+			raise ValueError("%s: expected 3D points" % operation)
+		return [float(value) for value in values]
+	values = []
+	for point in points:
+		co = [float(value) for value in point]
+		if len(co) != 3:
+			raise ValueError("%s: expected 3D points, not %dD" % (operation, len(co)))
+		values.extend(co)
+	return values
+
+class VectorArray:
+	"""An array of vectors of the same size (2 to 4) in one buffer.
+
+	Parameters:
+	vectors (sequence of Vector or numeric sequences) - The items of the array, a numpy array of shape (count, size) is copied as is (optional).
+	size (int) - The size of the vectors, needed when vectors is empty (optional)."""
+
+	__slots__ = ("_data", "_size")
+
+	def __init__(self, vectors=(), size=None):
+		if isinstance(vectors, VectorArray):
+			self._size = vectors._size
+			self._data = vectors._data.copy() if numpy is not None else array("f", vectors._data)
+			return
+		if numpy is not None:
+			data = numpy.array(vectors, dtype=numpy.float32)
+			if data.size == 0:
+				data = data.reshape(0, 3 if size is None else size)
+			if data.ndim != 2:
+				raise ValueError("VectorArray(): expected a sequence of vectors of the same size")
+			size = data.shape[1]
+		else:
+			items = [[float(value) for value in vector] for vector in vectors]
+			if items:
+				size = len(items[0])
+			elif size is None:
+				size = 3
+			if any(len(item) != size for item in items):
+				raise ValueError("VectorArray(): expected a sequence of vectors of the same size")
+			data = array("f", [value for item in items for value in item])
+		if not 2 <= size <= 4:
+			raise ValueError("VectorArray(): vectors must have 2 to 4 components")
+		self._data = data
+		self._size = size
+
+	@classmethod
+	def _make(cls, data, size):
+		"""A VectorArray owning data, a buffer laid out for the current backend.
+
+		Return type: VectorArray"""
+
+		vectors = _new(VectorArray)
+		vectors._data = data
+		vectors._size = size
+		return vectors
+
+	@classmethod
+	def Fill(cls, count, size=3, fill=0.0):
+		"""Create an array of count vectors of the given size with all values set to fill.
+
+		Parameters:
+		count (int) - The number of vectors.
+		size (int) - The size of the vectors.
+		fill (float) - The value used to fill the vectors.
+
+		Return type: VectorArray"""
+
+		if not 2 <= size <= 4:
+			raise ValueError("VectorArray.Fill(): vectors must have 2 to 4 components")
+		if numpy is not None:
+			return cls._make(numpy.full((count, size), fill, dtype=numpy.float32), size)
+		return cls._make(array("f", [float(fill)]) * (count * size), size)
+
+	@property
+	def size(self):
+		"""The number of components of every vector.
+
+		Return type: int"""
+
+		return self._size
+
+	@property
+	def buffer(self):
+		"""The storage of the array: a numpy.ndarray of shape (count, size) when numpy is available, else a flat array.array of 32 bit floats."""
+
+		return self._data
+
+	def __len__(self):
+		return len(self._data) // self._size if numpy is None else len(self._data)
+
+	def _index(self, index):
+		count = len(self)
+		if index < 0:
+			index += count
+		if not 0 <= index < count:
+			raise IndexError("VectorArray[index]: out of range")
+		return index
+
+	def _item(self, index):
+		if numpy is not None:
+			return self._data[index].tolist()
+		start = index * self._size
+		return self._data[start:start + self._size].tolist()
+
+	def _store(self, index, values):
+		if numpy is not None:
+			self._data[index] = values
+		else:
+			start = index * self._size
+			self._data[start:start + self._size] = array("f", values)
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			if numpy is not None:
+				return self._make(self._data[index].copy(), self._size)
+			indices = range(*index.indices(len(self)))
+			return self._make(array("f", [value for i in indices for value in self._item(i)]), self._size)
+		index = self._index(index)
+		return Vector._wrap(self._item(index), self, lambda values: self._store(index, values))
+
+	def __setitem__(self, index, vector):
+		values = [float(value) for value in vector]
+		if len(values) != self._size:
+			raise ValueError("VectorArray[index] = vector: size mismatch")
+		self._store(self._index(index), values)
+
+	def __iter__(self):
+		for index in range(len(self)):
+			yield self[index]
+
+	def __repr__(self):
+		return "VectorArray(%r)" % [tuple(self._item(index)) for index in range(len(self))]
+
+	def copy(self):
+		"""Return a copy of the array.
+
+		Return type: VectorArray"""
+
+		return VectorArray(self)
+
+	def to_list(self):
+		"""Return the vectors as a list of new (unwrapped) vectors.
+
+		Return type: list of Vector"""
+
+		return [Vector(self._item(index)) for index in range(len(self))]
+
+	def _operand(self, other, operation):
+		"""The buffer of other, a VectorArray of the same shape or one vector repeated for every item."""
+
+		if isinstance(other, VectorArray):
+			if other._size != self._size or len(other) != len(self):
+				raise ValueError("%s: arrays must have the same shape" % operation)
+			return other._data
+		values = [float(value) for value in other]
+		if len(values) != self._size:
+			raise ValueError("%s: vectors must have the same dimensions for this operation" % operation)
+		if numpy is not None:
+			return numpy.array(values, dtype=numpy.float32)
+		return array("f", values) * len(self)
+
+	def __add__(self, other):
+		data = self._operand(other, "VectorArray addition")
+		if numpy is not None:
+			return self._make(self._data + data, self._size)
+		return self._make(array("f", map(operator.add, self._data, data)), self._size)
+
+	__radd__ = __add__
+
+	def __sub__(self, other):
+		data = self._operand(other, "VectorArray subtraction")
+		if numpy is not None:
+			return self._make(self._data - data, self._size)
+		return self._make(array("f", map(operator.sub, self._data, data)), self._size)
+
+	def __rsub__(self, other):
+		data = self._operand(other, "VectorArray subtraction")
+		if numpy is not None:
+			return self._make(data - self._data, self._size)
+		return self._make(array("f", map(operator.sub, data, self._data)), self._size)
+
+	def __mul__(self, other):
+		if isinstance(other, (int, float)):
+			if numpy is not None:
+				return self._make(self._data * numpy.float32(other), self._size)
+			return self._make(array("f", map(float(other).__mul__, self._data)), self._size)
+		data = self._operand(other, "VectorArray multiplication")
+		if numpy is not None:
+			return self._make(self._data * data, self._size)
+		return self._make(array("f", map(operator.mul, self._data, data)), self._size)
+
+	__rmul__ = __mul__
+
+	def __truediv__(self, other):
+		if not isinstance(other, (int, float)):
+			return NotImplemented
+		if other == 0:
+			raise ZeroDivisionError("VectorArray division: divide by zero error")
+		return self * (1.0 / other)
+
+	def __neg__(self):
+		return self * -1.0
+
+	def __rmatmul__(self, matrix):
+		"""Transform every vector by one matrix, 3D vectors by a 4x4 matrix as points."""
+
+		if isinstance(matrix, (VectorArray, Vector)):
+			return NotImplemented
+		rows = [[float(value) for value in row] for row in matrix]
+		size = self._size
+		if len(rows) != size and not (size == 3 and len(rows) == 4):
+			raise ValueError("matrix @ VectorArray: matrix size does not match the vectors")
+		if numpy is not None:
+			rows = numpy.array(rows, dtype=numpy.float32)
+			result = self._data @ rows[:size, :size].T
+			if len(rows) > size:
+				result += rows[:size, size]
+			return self._make(result, size)
+		columns = _columns(self._data, size)
+		out = []
+		for row in rows[:size]:
+			terms = [map(row[axis].__mul__, columns[axis]) for axis in range(size)]
+			if len(row) > size:
+				terms.append([row[size]] * len(self))
+			out.append(_sum(terms))
+		return self._make(_interleave(out), size)
+
+	@property
+	def length_squared(self):
+		"""The squared length of every vector.
+
+		Return type: numpy.ndarray or array.array of floats"""
+
+		return self.dot(self)
+
+	@property
+	def length(self):
+		"""The length of every vector.
+
+		Return type: numpy.ndarray or array.array of floats"""
+
+		if numpy is not None:
+			return numpy.sqrt(self.dot(self))
+		return array("f", map(math.sqrt, self.dot(self)))
+
+	def dot(self, other):
+		"""Return the dot product of every vector with the matching vector of other.
+
+		Parameters:
+		other (VectorArray or Vector) - The other vectors, a single vector is used for every item.
+
+		Return type: numpy.ndarray or array.array of floats"""
+
+		data = self._operand(other, "VectorArray.dot(other)")
+		if numpy is not None:
+			return numpy.einsum("ij,ij->i", self._data, numpy.broadcast_to(data, self._data.shape))
+		size = self._size
+		return _sum([map(operator.mul, a, b) for a, b in zip(_columns(self._data, size), _columns(data, size))])
+
+	def cross(self, other):
+		"""Return the cross product of every 3D vector with the matching vector of other.
+
+		Parameters:
+		other (VectorArray or Vector) - The other vectors, a single vector is used for every item.
+
+		Return type: VectorArray"""
+
+		if self._size != 3:
+			raise ValueError("VectorArray.cross(other): vectors must be 3D")
+		data = self._operand(other, "VectorArray.cross(other)")
+		if numpy is not None:
+			return self._make(numpy.cross(self._data, numpy.broadcast_to(data, self._data.shape)).astype(numpy.float32), 3)
+		ax, ay, az = _columns(self._data, 3)
+		bx, by, bz = _columns(data, 3)
+		mul, sub = operator.mul, operator.sub
+		return self._make(_interleave([
+			array("f", map(sub, map(mul, ay, bz), map(mul, az, by))),
+			array("f", map(sub, map(mul, az, bx), map(mul, ax, bz))),
+			array("f", map(sub, map(mul, ax, by), map(mul, ay, bx))),
+		]), 3)
+
+	def _scales(self):
+		"""1 / length of every vector, 1 for zero length vectors which normalizing leaves as they are."""
+
+		if numpy is not None:
+			lengths = numpy.sqrt(self.dot(self))
+			return numpy.divide(1.0, lengths, out=numpy.ones_like(lengths), where=lengths > 0.0)
+		return [1.0 / length if length else 1.0 for length in map(math.sqrt, self.dot(self))]
+
+	def normalize(self):
+		"""Normalize every vector in place, zero length vectors are left untouched."""
+
+		scales = self._scales()
+		if numpy is not None:
+			self._data *= scales[:, None]
+			return
+		for axis in range(self._size):
+			self._data[axis::self._size] = array("f", map(operator.mul, self._data[axis::self._size], scales))
+
+	def normalized(self):
+		"""Return a new array of the normalized vectors.
+
+		Return type: VectorArray"""
+
+		vectors = self.copy()
+		vectors.normalize()
+		return vectors
+
+	def lerp(self, other, factor):
+		"""Return the linear interpolation of every vector with the matching vector of other.
+
+		Parameters:
+		other (VectorArray or Vector) - The vectors to interpolate with, a single vector is used for every item.
+		factor (float or sequence of floats) - The interpolation value, one for every item or the same for all.
+
+		Return type: VectorArray"""
+
+		data = self._operand(other, "VectorArray.lerp(other, factor)")
+		if numpy is not None:
+			factors = numpy.asarray(factor, dtype=numpy.float32)
+			if factors.ndim:
+				factors = factors[:, None]
+			return self._make(self._data + (data - self._data) * factors, self._size)
+		difference = array("f", map(operator.sub, data, self._data))
+		if isinstance(factor, (int, float)):
+			return self._make(array("f", map(operator.add, self._data, map(float(factor).__mul__, difference))), self._size)
+		factors = [float(value) for value in factor]
+		if len(factors) != len(self):
+			raise ValueError("VectorArray.lerp(other, factor): one factor per vector expected")
+		size = self._size
+		return self._make(_interleave([
+			array("f", map(operator.add, self._data[axis::size], map(operator.mul, difference[axis::size], factors)))
+			for axis in range(size)
+		]), size)
+
+	def slerp(self, other, factor):
+		"""Return the spherical interpolation of every vector with the matching vector of other.
+
+		Like Vector.slerp the results are unit vectors. Items which cannot be
+		interpolated (zero length or opposite vectors) are linearly
+		interpolated instead of raising a ValueError.
+
+		Parameters:
+		other (VectorArray or Vector) - The vectors to interpolate with, a single vector is used for every item.
+		factor (float) - The interpolation value typically in [0.0, 1.0].
+
+		Return type: VectorArray"""
+
+		data = self._operand(other, "VectorArray.slerp(other, factor)")
+		if numpy is not None:
+			a = self._data.astype(numpy.float64)
+			b = numpy.broadcast_to(data, a.shape).astype(numpy.float64)
+			a_lengths = numpy.linalg.norm(a, axis=1)
+			b_lengths = numpy.linalg.norm(b, axis=1)
+			valid = (a_lengths > 1e-7) & (b_lengths > 1e-7)
+			a_unit = a / numpy.where(valid, a_lengths, 1.0)[:, None]
+			b_unit = b / numpy.where(valid, b_lengths, 1.0)[:, None]
+			cosine = numpy.clip(numpy.einsum("ij,ij->i", a_unit, b_unit), -1.0, 1.0)
+			valid &= cosine > -1.0 + 1e-7
+			# Nearly parallel vectors have no usable sine, their weights are linear
+			curved = valid & (cosine < 1.0 - 1e-7)
+			omega = numpy.arccos(cosine)
+			sine = numpy.where(curved, numpy.sin(omega), 1.0)
+			wa = numpy.where(curved, numpy.sin((1.0 - factor) * omega) / sine, 1.0 - factor)
+			wb = numpy.where(curved, numpy.sin(factor * omega) / sine, factor)
+			result = numpy.where(
+				valid[:, None], a_unit * wa[:, None] + b_unit * wb[:, None], a + (b - a) * factor,
+			)
+			return self._make(result.astype(numpy.float32), self._size)
+		size = self._size
+		result = []
+		for index in range(len(self)):
+			a = Vector(self._data[index * size:(index + 1) * size])
+			b = data[index * size:(index + 1) * size]
+			result.extend(a.slerp(b, factor, False) or a.lerp(b, factor))
+		return self._make(array("f", result), size)
+
+class MatrixArray:
+	"""An array of 4x4 matrices in one buffer, row-major.
+
+	Parameters:
+	matrices (sequence of Matrix or 2d number sequences) - The items of the array, 3x3 matrices are extended to 4x4 (optional)."""
+
+	__slots__ = ("_data",)
+
+	def __init__(self, matrices=()):
+		if isinstance(matrices, MatrixArray):
+			self._data = matrices._data.copy() if numpy is not None else array("f", matrices._data)
+			return
+		rows = [_rows(matrix) for matrix in matrices]
+		if numpy is not None:
+			self._data = numpy.array(rows, dtype=numpy.float32).reshape(len(rows), 4, 4)
+		else:
+			self._data = array("f", [value for matrix in rows for row in matrix for value in row])
+
+	@classmethod
+	def _make(cls, data):
+		"""A MatrixArray owning data, a buffer laid out for the current backend.
+
+		Return type: MatrixArray"""
+
+		matrices = _new(MatrixArray)
+		matrices._data = data
+		return matrices
+
+	@classmethod
+	def Identity(cls, count):
+		"""Create an array of count identity matrices.
+
+		Parameters:
+		count (int) - The number of matrices.
+
+		Return type: MatrixArray"""
+
+		if numpy is not None:
+			return cls._make(numpy.tile(numpy.identity(4, dtype=numpy.float32), (count, 1, 1)))
+		return cls._make(array("f", [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]) * count)
+
+	@property
+	def buffer(self):
+		"""The storage of the array: a numpy.ndarray of shape (count, 4, 4) when numpy is available, else a flat, row-major array.array of 32 bit floats."""
+
+		return self._data
+
+	def __len__(self):
+		return len(self._data) // 16 if numpy is None else len(self._data)
+
+	def _index(self, index):
+		count = len(self)
+		if index < 0:
+			index += count
+		if not 0 <= index < count:
+			raise IndexError("MatrixArray[index]: out of range")
+		return index
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			if numpy is not None:
+				return self._make(self._data[index].copy())
+			data = array("f")
+			for i in range(*index.indices(len(self))):
+				data.extend(self._data[i * 16:(i + 1) * 16])
+			return self._make(data)
+		index = self._index(index)
+		if numpy is not None:
+			return Matrix(self._data[index].tolist())
+		values = self._data[index * 16:(index + 1) * 16].tolist()
+		return Matrix([values[row * 4:row * 4 + 4] for row in range(4)])
+
+	def __setitem__(self, index, matrix):
+		index = self._index(index)
+		values = [value for row in _rows(matrix) for value in row]
+		if numpy is not None:
+			self._data[index] = numpy.array(values, dtype=numpy.float32).reshape(4, 4)
+		else:
+			self._data[index * 16:(index + 1) * 16] = array("f", values)
+
+	def __iter__(self):
+		for index in range(len(self)):
+			yield self[index]
+
+	def copy(self):
+		"""Return a copy of the array.
+
+		Return type: MatrixArray"""
+
+		return MatrixArray(self)
+
+	@property
+	def translation(self):
+		"""The translation of every matrix.
+
+		Return type: VectorArray"""
+
+		if numpy is not None:
+			return VectorArray._make(numpy.ascontiguousarray(self._data[:, :3, 3]), 3)
+		return VectorArray._make(_interleave([self._data[3::16], self._data[7::16], self._data[11::16]]), 3)
+
+	def _elements(self):
+		"""The 16 row-major elements of every matrix, one array per element."""
+
+		return [self._data[element::16] for element in range(16)]
+
+	def __matmul__(self, other):
+		if isinstance(other, MatrixArray):
+			if len(other) != len(self):
+				raise ValueError("MatrixArray @ MatrixArray: arrays must have the same length")
+			if numpy is not None:
+				return self._make(self._data @ other._data)
+			a, b = self._elements(), other._elements()
+			return self._make(_interleave([
+				_sum([map(operator.mul, a[row * 4 + k], b[k * 4 + column]) for k in range(4)])
+				for row in range(4) for column in range(4)
+			]))
+		if isinstance(other, Matrix):
+			return self @ MatrixArray([other] * len(self))
+		# Every matrix transforms its own vector, or the same vector, 3D vectors as points
+		vectors = other if isinstance(other, VectorArray) else VectorArray([other] * len(self))
+		size = vectors._size
+		if len(vectors) != len(self):
+			raise ValueError("MatrixArray @ VectorArray: arrays must have the same length")
+		if size not in (3, 4):
+			raise ValueError("MatrixArray @ VectorArray: vectors must be 3D or 4D")
+		if numpy is not None:
+			result = numpy.einsum("nij,nj->ni", self._data[:, :size, :size], vectors._data)
+			if size == 3:
+				result += self._data[:, :3, 3]
+			return VectorArray._make(result.astype(numpy.float32), size)
+		elements, columns = self._elements(), _columns(vectors._data, size)
+		out = []
+		for row in range(size):
+			terms = [map(operator.mul, elements[row * 4 + axis], columns[axis]) for axis in range(size)]
+			if size == 3:
+				terms.append(elements[row * 4 + 3])
+			out.append(_sum(terms))
+		return VectorArray._make(_interleave(out), size)
+
+class QuaternionArray:
+	"""An array of (w, x, y, z) quaternions in one buffer.
+
+	Parameters:
+	quaternions (sequence of Quaternion or 4d numeric sequences) - The items of the array, a numpy array of shape (count, 4) is copied as is (optional)."""
+
+	__slots__ = ("_data",)
+
+	def __init__(self, quaternions=()):
+		if isinstance(quaternions, QuaternionArray):
+			self._data = quaternions._data.copy() if numpy is not None else array("f", quaternions._data)
+			return
+		if numpy is not None:
+			data = numpy.array(quaternions, dtype=numpy.float32)
+			if data.size == 0:
+				data = data.reshape(0, 4)
+			if data.ndim != 2 or data.shape[1] != 4:
+				raise ValueError("QuaternionArray(): expected a sequence of (w, x, y, z) quaternions")
+		else:
+			items = [[float(value) for value in quaternion] for quaternion in quaternions]
+			if any(len(item) != 4 for item in items):
+				raise ValueError("QuaternionArray(): expected a sequence of (w, x, y, z) quaternions")
+			data = array("f", [value for item in items for value in item])
+		self._data = data
+
+	@classmethod
+	def _make(cls, data):
+		"""A QuaternionArray owning data, a buffer laid out for the current backend.
+
+		Return type: QuaternionArray"""
+
+		quaternions = _new(QuaternionArray)
+		quaternions._data = data
+		return quaternions
+
+	@classmethod
+	def Identity(cls, count):
+		"""Create an array of count identity quaternions.
+
+		Parameters:
+		count (int) - The number of quaternions.
+
+		Return type: QuaternionArray"""
+
+		if numpy is not None:
+			return cls._make(numpy.tile(numpy.array([1.0, 0.0, 0.0, 0.0], dtype=numpy.float32), (count, 1)))
+		return cls._make(array("f", [1.0, 0.0, 0.0, 0.0]) * count)
+
+	@property
+	def buffer(self):
+		"""The storage of the array: a numpy.ndarray of shape (count, 4) when numpy is available, else a flat array.array of 32 bit floats."""
+
+		return self._data
+
+	def __len__(self):
+		return len(self._data) // 4 if numpy is None else len(self._data)
+
+	def _index(self, index):
+		count = len(self)
+		if index < 0:
+			index += count
+		if not 0 <= index < count:
+			raise IndexError("QuaternionArray[index]: out of range")
+		return index
+
+	def _item(self, index):
+		if numpy is not None:
+			return self._data[index].tolist()
+		return self._data[index * 4:index * 4 + 4].tolist()
+
+	def _store(self, index, values):
+		if numpy is not None:
+			self._data[index] = values
+		else:
+			self._data[index * 4:index * 4 + 4] = array("f", values)
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			if numpy is not None:
+				return self._make(self._data[index].copy())
+			indices = range(*index.indices(len(self)))
+			return self._make(array("f", [value for i in indices for value in self._item(i)]))
+		index = self._index(index)
+		return Quaternion._wrap(self._item(index), self, lambda values: self._store(index, values))
+
+	def __setitem__(self, index, quaternion):
+		values = [float(value) for value in quaternion]
+		if len(values) != 4:
+			raise ValueError("QuaternionArray[index] = quaternion: expected a (w, x, y, z) quaternion")
+		self._store(self._index(index), values)
+
+	def __iter__(self):
+		for index in range(len(self)):
+			yield self[index]
+
+	def __repr__(self):
+		return "QuaternionArray(%r)" % [tuple(self._item(index)) for index in range(len(self))]
+
+	def copy(self):
+		"""Return a copy of the array.
+
+		Return type: QuaternionArray"""
+
+		return QuaternionArray(self)
+
+	def to_list(self):
+		"""Return the quaternions as a list of new (unwrapped) quaternions.
+
+		Return type: list of Quaternion"""
+
+		return [Quaternion(self._item(index)) for index in range(len(self))]
+
+	def _operand(self, other, operation):
+		"""The buffer of other, a QuaternionArray of the same length or one quaternion repeated for every item."""
+
+		if isinstance(other, QuaternionArray):
+			if len(other) != len(self):
+				raise ValueError("%s: arrays must have the same length" % operation)
+			return other._data
+		values = [float(value) for value in other]
+		if len(values) != 4:
+			raise ValueError("%s: expected a (w, x, y, z) quaternion" % operation)
+		if numpy is not None:
+			return numpy.broadcast_to(numpy.array(values, dtype=numpy.float32), self._data.shape)
+		return array("f", values) * len(self)
+
+	def _factors(self, factor, operation):
+		"""One interpolation factor per item, from a float or a sequence of floats."""
+
+		if isinstance(factor, (int, float)):
+			return [float(factor)] * len(self)
+		factors = [float(value) for value in factor]
+		if len(factors) != len(self):
+			raise ValueError("%s: one factor per quaternion expected" % operation)
+		return factors
+
+	def dot(self, other):
+		"""Return the dot product of every quaternion with the matching quaternion of other.
+
+		Parameters:
+		other (QuaternionArray or Quaternion) - The other quaternions, a single quaternion is used for every item.
+
+		Return type: numpy.ndarray or array.array of floats"""
+
+		data = self._operand(other, "QuaternionArray.dot(other)")
+		if numpy is not None:
+			return numpy.einsum("ij,ij->i", self._data, data)
+		return _sum([map(operator.mul, a, b) for a, b in zip(_columns(self._data, 4), _columns(data, 4))])
+
+	def normalize(self):
+		"""Normalize every quaternion in place, zero quaternions become the identity."""
+
+		self._data = self.normalized()._data
+
+	def normalized(self):
+		"""Return a new array of the normalized quaternions, zero quaternions become the identity.
+
+		Return type: QuaternionArray"""
+
+		if numpy is not None:
+			lengths = numpy.sqrt(numpy.einsum("ij,ij->i", self._data, self._data))
+			result = self._data / numpy.where(lengths > 0.0, lengths, 1.0)[:, None]
+			result[lengths == 0.0] = (1.0, 0.0, 0.0, 0.0)
+			return self._make(result.astype(numpy.float32))
+		columns = _columns(self._data, 4)
+		scales = [1.0 / length if length else 0.0 for length in map(math.hypot, *columns)]
+		result = _interleave([array("f", map(operator.mul, column, scales)) for column in columns])
+		# Zero quaternions, the scale 0 left them at zero, become the identity
+		for index, scale in enumerate(scales):
+			if not scale:
+				result[index * 4] = 1.0
+		return self._make(result)
+
+	def conjugated(self):
+		"""Return a new array of the conjugated quaternions (x, y, z negated).
+
+		Return type: QuaternionArray"""
+
+		if numpy is not None:
+			return self._make(self._data * numpy.array([1.0, -1.0, -1.0, -1.0], dtype=numpy.float32))
+		return self._make(array("f", map(operator.mul, self._data, [1.0, -1.0, -1.0, -1.0] * len(self))))
+
+	def __matmul__(self, other):
+		"""The products of the quaternions with other quaternions, or the rotations of vectors."""
+
+		if isinstance(other, VectorArray) or isinstance(other, (Vector, list, tuple)) and len(other) == 3:
+			vectors = other if isinstance(other, VectorArray) else VectorArray([other] * len(self))
+			if vectors._size != 3 or len(vectors) != len(self):
+				raise ValueError("QuaternionArray @ VectorArray: expected as many 3D vectors as quaternions")
+			return self.to_matrix() @ vectors
+		data = self._operand(other, "QuaternionArray @ QuaternionArray")
+		if numpy is not None:
+			aw, ax, ay, az = self._data.T
+			bw, bx, by, bz = data.T
+			return self._make(numpy.stack([
+				aw * bw - ax * bx - ay * by - az * bz,
+				aw * bx + ax * bw + ay * bz - az * by,
+				aw * by + ay * bw + az * bx - ax * bz,
+				aw * bz + az * bw + ax * by - ay * bx,
+			], axis=1))
+		aw, ax, ay, az = _columns(self._data, 4)
+		bw, bx, by, bz = _columns(data, 4)
+		mul, sub = operator.mul, operator.sub
+		return self._make(_interleave([
+			array("f", map(sub, _sum([map(mul, aw, bw)]), _sum([map(mul, ax, bx), map(mul, ay, by), map(mul, az, bz)]))),
+			array("f", map(sub, _sum([map(mul, aw, bx), map(mul, ax, bw), map(mul, ay, bz)]), map(mul, az, by))),
+			array("f", map(sub, _sum([map(mul, aw, by), map(mul, ay, bw), map(mul, az, bx)]), map(mul, ax, bz))),
+			array("f", map(sub, _sum([map(mul, aw, bz), map(mul, az, bw), map(mul, ax, by)]), map(mul, ay, bx))),
+		]))
+
+	def to_matrix(self):
+		"""Return the rotation matrices of the quaternions, which are normalized first.
+
+		Return type: MatrixArray"""
+
+		unit = self.normalized()._data
+		if numpy is not None:
+			w, x, y, z = unit.T
+			matrices = numpy.zeros((len(self), 4, 4), dtype=numpy.float32)
+			matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+			matrices[:, 0, 1] = 2.0 * (x * y - w * z)
+			matrices[:, 0, 2] = 2.0 * (x * z + w * y)
+			matrices[:, 1, 0] = 2.0 * (x * y + w * z)
+			matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+			matrices[:, 1, 2] = 2.0 * (y * z - w * x)
+			matrices[:, 2, 0] = 2.0 * (x * z - w * y)
+			matrices[:, 2, 1] = 2.0 * (y * z + w * x)
+			matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+			matrices[:, 3, 3] = 1.0
+			return MatrixArray._make(matrices)
+		data = array("f")
+		for index in range(len(self)):
+			w, x, y, z = unit[index * 4:index * 4 + 4]
+			data.extend((
+				1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z), 2.0 * (x * z + w * y), 0.0,
+				2.0 * (x * y + w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x), 0.0,
+				2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y), 0.0,
+				0.0, 0.0, 0.0, 1.0,
+			))
+		return MatrixArray._make(data)
+
+	def _aligned(self, other, operation):
+		"""Both sides normalized as float64 numpy arrays, other negated where needed to take the shortest path."""
+
+		a = self.normalized()._data.astype(numpy.float64)
+		b = QuaternionArray._make(numpy.ascontiguousarray(self._operand(other, operation))).normalized()._data.astype(numpy.float64)
+		cosine = numpy.einsum("ij,ij->i", a, b)
+		b = numpy.where((cosine < 0.0)[:, None], -b, b)
+		return a, b, numpy.abs(cosine)
+
+	def slerp(self, other, factor):
+		"""Return the spherical interpolation of every quaternion with the matching quaternion of other.
+
+		Like Quaternion.slerp both sides are normalized and the shortest path
+		is taken.
+
+		Parameters:
+		other (QuaternionArray or Quaternion) - The quaternions to interpolate with, a single quaternion is used for every item.
+		factor (float or sequence of floats) - The interpolation value, one for every item or the same for all.
+
+		Return type: QuaternionArray"""
+
+		operation = "QuaternionArray.slerp(other, factor)"
+		if numpy is not None:
+			factors = numpy.asarray(factor, dtype=numpy.float64)
+			if factors.ndim and len(factors) != len(self):
+				raise ValueError("%s: one factor per quaternion expected" % operation)
+			a, b, cosine = self._aligned(other, operation)
+			# Nearly equal rotations have no usable sine, their weights are linear
+			curved = cosine < 1.0 - 0.0001
+			omega = numpy.arccos(numpy.clip(cosine, -1.0, 1.0))
+			sine = numpy.where(curved, numpy.sin(omega), 1.0)
+			wa = numpy.where(curved, numpy.sin((1.0 - factors) * omega) / sine, 1.0 - factors)
+			wb = numpy.where(curved, numpy.sin(factors * omega) / sine, factors)
+			return self._make((a * wa[:, None] + b * wb[:, None]).astype(numpy.float32))
+		a, b = self.normalized()._data, self._make(array("f", self._operand(other, operation))).normalized()._data
+		result = []
+		for index, t in enumerate(self._factors(factor, operation)):
+			result.extend(_quaternion_slerp(a[index * 4:index * 4 + 4], b[index * 4:index * 4 + 4], t))
+		return self._make(array("f", result))
+
+	def nlerp(self, other, factor):
+		"""Return the normalized linear interpolation of every quaternion with the matching quaternion of other.
+
+		Cheaper than slerp and close to it for small angles; the shortest path
+		is taken.
+
+		Parameters:
+		other (QuaternionArray or Quaternion) - The quaternions to interpolate with, a single quaternion is used for every item.
+		factor (float or sequence of floats) - The interpolation value, one for every item or the same for all.
+
+		Return type: QuaternionArray"""
+
+		operation = "QuaternionArray.nlerp(other, factor)"
+		if numpy is not None:
+			factors = numpy.asarray(factor, dtype=numpy.float64)
+			if factors.ndim:
+				if len(factors) != len(self):
+					raise ValueError("%s: one factor per quaternion expected" % operation)
+				factors = factors[:, None]
+			a, b, _ = self._aligned(other, operation)
+			return self._make((a + (b - a) * factors).astype(numpy.float32)).normalized()
+		a, b = self.normalized(), self._make(array("f", self._operand(other, operation))).normalized()
+		# Flip the side of other which is more than a half turn away
+		signs = [-1.0 if cosine < 0.0 else 1.0 for cosine in a.dot(b)]
+		columns = [map(operator.mul, column, signs) for column in _columns(b._data, 4)]
+		factors = self._factors(factor, operation)
+		return self._make(_interleave([
+			array("f", map(lambda x, y, t: x + (y - x) * t, x, y, factors))
+			for x, y in zip(_columns(a._data, 4), columns)
+		])).normalized()
@@ -0,0 +1,689 @@
+"""BVHTree Utilities (mathutils.bvhtree)
+
+BVH tree structures for proximity searches and ray casts on geometry.
+
+Polygons are split into triangles, the tree over them is built with the
+surface area heuristic evaluated on a few bins per node. Nodes and triangles
+live in flat lists, the triangles of every leaf next to each other, and the
+queries walk the tree with an explicit stack. ray_cast_many and
+ray_test_many run many rays in one call."""
+
+import math
+import sys
+
+from . import Matrix, Vector, _vector
+from .arrays import _flat_points
+
+# Candidate split planes per node and axis
+_BINS = 12
+# Nodes with this many triangles or less are never split
+_LEAF_SIZE = 4
+# Nodes with more triangles are split even when the heuristic favours a leaf
+_MAX_LEAF_SIZE = 16
+_INFINITY = float("inf")
+# Stands in for 1 / 0 in the slab tests, finite so that 0 * it is not nan
+_HUGE = 1e300
+
+def _area(box):
+	dx, dy, dz = box[3] - box[0], box[4] - box[1], box[5] - box[2]
+	return dx * dy + dy * dz + dz * dx
+
+def _merge(box, other):
+	return [
+		min(box[0], other[0]), min(box[1], other[1]), min(box[2], other[2]),
+		max(box[3], other[3]), max(box[4], other[4]), max(box[5], other[5]),
+	]
+
+_EMPTY_BOX = [_INFINITY, _INFINITY, _INFINITY, -_INFINITY, -_INFINITY, -_INFINITY]
+
+def _slab(boxes, node, ox, oy, oz, ix, iy, iz, limit):
+	"""Distance along the ray to the box of node, None when the ray misses it within limit."""
+
+	b = node * 6
+	t1, t2 = (boxes[b] - ox) * ix, (boxes[b + 3] - ox) * ix
+	near, far = (t1, t2) if t1 < t2 else (t2, t1)
+	t1, t2 = (boxes[b + 1] - oy) * iy, (boxes[b + 4] - oy) * iy
+	if t1 > t2:
+		t1, t2 = t2, t1
+	if t1 > near:
+		near = t1
+	if t2 < far:
+		far = t2
+	t1, t2 = (boxes[b + 2] - oz) * iz, (boxes[b + 5] - oz) * iz
+	if t1 > t2:
+		t1, t2 = t2, t1
+	if t1 > near:
+		near = t1
+	if t2 < far:
+		far = t2
+	if far < 0.0 or near > far or near > limit:
+		return None
+	return near
+
+def _box_distance(boxes, node, x, y, z):
+	"""Squared distance from (x, y, z) to the box of node."""
+
+	b = node * 6
+	dx = boxes[b] - x if x < boxes[b] else (x - boxes[b + 3] if x > boxes[b + 3] else 0.0)
+	dy = boxes[b + 1] - y if y < boxes[b + 1] else (y - boxes[b + 4] if y > boxes[b + 4] else 0.0)
+	dz = boxes[b + 2] - z if z < boxes[b + 2] else (z - boxes[b + 5] if z > boxes[b + 5] else 0.0)
+	return dx * dx + dy * dy + dz * dz
+
+def _closest(tris, t, px, py, pz):
+	"""The point of triangle t nearest to (px, py, pz)."""
+
+	b = t * 9
+	ax, ay, az = tris[b], tris[b + 1], tris[b + 2]
+	abx, aby, abz = tris[b + 3], tris[b + 4], tris[b + 5]
+	acx, acy, acz = tris[b + 6], tris[b + 7], tris[b + 8]
+	apx, apy, apz = px - ax, py - ay, pz - az
+	d1 = abx * apx + aby * apy + abz * apz
+	d2 = acx * apx + acy * apy + acz * apz
+	if d1 <= 0.0 and d2 <= 0.0:
+		return ax, ay, az
+	bpx, bpy, bpz = apx - abx, apy - aby, apz - abz
+	d3 = abx * bpx + aby * bpy + abz * bpz
+	d4 = acx * bpx + acy * bpy + acz * bpz
+	if d3 >= 0.0 and d4 <= d3:
+		return ax + abx, ay + aby, az + abz
+	vc = d1 * d4 - d3 * d2
+	if vc <= 0.0 and d1 >= 0.0 and d3 <= 0.0:
+		v = d1 / (d1 - d3)
+		return ax + abx * v, ay + aby * v, az + abz * v
+	cpx, cpy, cpz = apx - acx, apy - acy, apz - acz
+	d5 = abx * cpx + aby * cpy + abz * cpz
+	d6 = acx * cpx + acy * cpy + acz * cpz
+	if d6 >= 0.0 and d5 <= d6:
+		return ax + acx, ay + acy, az + acz
+	vb = d5 * d2 - d1 * d6
+	if vb <= 0.0 and d2 >= 0.0 and d6 <= 0.0:
+		w = d2 / (d2 - d6)
+		return ax + acx * w, ay + acy * w, az + acz * w
+	va = d3 * d6 - d5 * d4
+	if va <= 0.0 and d4 - d3 >= 0.0 and d5 - d6 >= 0.0:
+		w = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+		return ax + abx + (acx - abx) * w, ay + aby + (acy - aby) * w, az + abz + (acz - abz) * w
+	denominator = 1.0 / (va + vb + vc)
+	v, w = vb * denominator, vc * denominator
+	return ax + abx * v + acx * w, ay + aby * v + acy * w, az + abz * v + acz * w
+
+def _segment_hits(tris, t, p, q):
+	"""True when the segment from p to q crosses triangle t."""
+
+	b = t * 9
+	dx, dy, dz = q[0] - p[0], q[1] - p[1], q[2] - p[2]
+	e1x, e1y, e1z = tris[b + 3], tris[b + 4], tris[b + 5]
+	e2x, e2y, e2z = tris[b + 6], tris[b + 7], tris[b + 8]
+	px, py, pz = dy * e2z - dz * e2y, dz * e2x - dx * e2z, dx * e2y - dy * e2x
+	determinant = e1x * px + e1y * py + e1z * pz
+	if -1e-12 < determinant < 1e-12:
+		return False
+	inverse = 1.0 / determinant
+	sx, sy, sz = p[0] - tris[b], p[1] - tris[b + 1], p[2] - tris[b + 2]
+	u = (sx * px + sy * py + sz * pz) * inverse
+	if u < 0.0 or u > 1.0:
+		return False
+	qx, qy, qz = sy * e1z - sz * e1y, sz * e1x - sx * e1z, sx * e1y - sy * e1x
+	v = (dx * qx + dy * qy + dz * qz) * inverse
+	if v < 0.0 or u + v > 1.0:
+		return False
+	return 0.0 <= (e2x * qx + e2y * qy + e2z * qz) * inverse <= 1.0
+
+def _corners(tris, t):
+	b = t * 9
+	a = (tris[b], tris[b + 1], tris[b + 2])
+	return (
+		a,
+		(a[0] + tris[b + 3], a[1] + tris[b + 4], a[2] + tris[b + 5]),
+		(a[0] + tris[b + 6], a[1] + tris[b + 7], a[2] + tris[b + 8]),
+	)
+
+def _triangles_intersect(tris, t, other_tris, u):
+	"""True when triangle t of tris and triangle u of other_tris intersect, coplanar contact is not detected."""
+
+	a, b = _corners(tris, t), _corners(other_tris, u)
+	for p, q in ((a[0], a[1]), (a[1], a[2]), (a[2], a[0])):
+		if _segment_hits(other_tris, u, p, q):
+			return True
+	for p, q in ((b[0], b[1]), (b[1], b[2]), (b[2], b[0])):
+		if _segment_hits(tris, t, p, q):
+			return True
+	return False
+
+def _direction(values):
+	x, y, z = values
+	length = math.sqrt(x * x + y * y + z * z)
+	if not length:
+		return None
+	return x / length, y / length, z / length
+
+def _point(co, operation):
+	co = [float(value) for value in co]
+	if len(co) != 3:
+		raise ValueError("%s: expected a 3D coordinate, not %dD" % (operation, len(co)))
+	return co
+
+class BVHTree:
+	"""A bounding volume hierarchy over the triangles of polygons, made by one of the From* class methods.
+
+	The indices given back by the queries are polygon indices."""
+
+	__slots__ = ("_tris", "_normals", "_polygons", "_vertices", "_boxes", "_first", "_count", "_epsilon")
+
+	def __init__(self):
+		# v0, v1 - v0, v2 - v0 of every triangle, in leaf order
+		self._tris = []
+		self._normals = []
+		self._polygons = []
+		# Vertex indices of every triangle, self overlap skips triangles sharing one
+		self._vertices = []
+		# min x, y, z, max x, y, z of every node, the root first
+		self._boxes = []
+		# Leaves: first triangle and count, other nodes: first of two children and 0
+		self._first = []
+		self._count = []
+		self._epsilon = 0.0
+
+	@classmethod
+	def FromBMesh(cls, bmesh, epsilon=0.0):
+		"""BVH tree based on BMesh data.
+
+		Parameters:
+		bmesh (BMesh) – BMesh data: any object with verts, each with a co, and faces, each with verts, is accepted.
+		epsilon (float) – Increase the threshold for detecting overlap and raycast hits.
+
+		Returns: A tree whose indices are the face indices.
+
+		Return type: BVHTree"""
+
+		try:
+			verts, faces = list(bmesh.verts), list(bmesh.faces)
+			slots = {id(vert): index for index, vert in enumerate(verts)}
+			vertices = [vert.co for vert in verts]
+			polygons = [[slots[id(vert)] for vert in face.verts] for face in faces]
+		except (AttributeError, KeyError, TypeError):
+			raise TypeError("BVHTree.FromBMesh(): expected a BMesh, with verts and faces using them, not %s" % type(bmesh).__name__) from None
+		return cls.FromPolygons(vertices, polygons, epsilon=epsilon)
+
+	@classmethod
+	def FromObject(cls, object, scene, deform=True, render=False, cage=False, epsilon=0.0):
+		"""BVH tree based on Object data.
+
+		Parameters:
+		object (KX_GameObject) – Object data, the first of its meshes is used.
+		scene (Scene) – Scene data to use for evaluating the mesh, unused in the game engine.
+		deform (bool) – Use mesh with deformations, unused in the game engine.
+		render (bool) – Use render settings, unused in the game engine.
+		cage (bool) – Use render settings, unused in the game engine.
+		epsilon (float) – Increase the threshold for detecting overlap and raycast hits.
+
+		Returns: A tree in object space, whose indices are the polygon indices of the mesh.
+
+		Return type: BVHTree"""
+
+		meshes = getattr(object, "meshes", None)
+		if not meshes:
+			raise TypeError("BVHTree.FromObject(): expected an object with a mesh, not %s" % type(object).__name__)
+		return cls.FromMeshProxy(meshes[0], epsilon=epsilon)
+
+	@classmethod
+	def FromPolygons(cls, vertices, polygons, all_triangles=False, epsilon=0.0):
+		"""BVH tree constructed geometry passed in as arguments.
+
+		Parameters:
+		vertices (float triplet sequence) – float triplets each representing (x, y, z)
+		polygons (Sequence of sequences containing ints) – Sequence of polyugons, each containing indices to the vertices argument.
+		all_triangles (bool) – Use when all polygons are triangles for more efficient conversion.
+		epsilon (float) – Increase the threshold for detecting overlap and raycast hits.
+
+		Return type: BVHTree"""
+
+		co = _flat_points(vertices, "BVHTree.FromPolygons()")
+		corners, owners = [], []
+		for index, polygon in enumerate(polygons):
+			polygon = [int(vertex) for vertex in polygon]
+			if all_triangles:
+				if len(polygon) != 3:
+					raise ValueError("BVHTree.FromPolygons(): polygon %d is not a triangle" % index)
+				corners.extend(polygon)
+				owners.append(index)
+				continue
+			# A fan from the first corner, polygons are expected to be convex
+			for corner in range(1, len(polygon) - 1):
+				corners.extend((polygon[0], polygon[corner], polygon[corner + 1]))
+				owners.append(index)
+		return cls._build(co, corners, owners, epsilon)
+
+	@classmethod
+	def FromBuffers(cls, vertices, indices, epsilon=0.0):
+		"""BVH tree of triangles given as a vertex buffer and an index buffer.
+
+		Parameters:
+		vertices (VectorArray, numpy array of shape (n, 3) or float triplet sequence) – The vertex positions.
+		indices (sequence of ints or of int triplets, or numpy array of shape (m, 3)) – Three vertex indices per triangle.
+		epsilon (float) – Increase the threshold for detecting overlap and raycast hits.
+
+		Returns: A tree whose polygon indices are the triangle indices.
+
+		Return type: BVHTree"""
+
+		co = _flat_points(vertices, "BVHTree.FromBuffers()")
+		if hasattr(indices, "tolist"):
+			indices = indices.tolist()
+		corners = []
+		for item in indices:
+			if isinstance(item, (list, tuple)):
+				corners.extend(int(value) for value in item)
+			else:
+				corners.append(int(item))
+		if len(corners) % 3:
+			raise ValueError("BVHTree.FromBuffers(): expected three indices per triangle")
+		return cls._build(co, corners, list(range(len(corners) // 3)), epsilon)
+
+	@classmethod
+	def FromMeshProxy(cls, mesh, transform=None, epsilon=0.0):
+		"""BVH tree of the polygons of a game engine mesh, see also KX_MeshProxy.constructBvh.
+
+		Parameters:
+		mesh (KX_MeshProxy) – The mesh.
+		transform (Matrix) – The transform 4x4 matrix applied to vertices (optional).
+		epsilon (float) – Increase the threshold for detecting overlap and raycast hits.
+
+		Returns: A tree whose indices are the polygon indices of the mesh.
+
+		Return type: BVHTree"""
+
+		matrix = None if transform is None else Matrix(transform)
+		vertices, polygons, slots = [], [], {}
+		for index in range(mesh.numPolygons):
+			polygon = mesh.getPolygon(index)
+			material = polygon.material_id
+			corners = []
+			# Vertices are stored per material, the same index in another material is another vertex
+			for corner in range(polygon.getNumVertex()):
+				key = (material, polygon.getVertexIndex(corner))
+				slot = slots.get(key)
+				if slot is None:
+					slot = slots[key] = len(vertices)
+					position = Vector(mesh.getVertex(material, key[1]).XYZ)
+					vertices.append(matrix @ position if matrix is not None else position)
+				corners.append(slot)
+			polygons.append(corners)
+		return cls.FromPolygons(vertices, polygons, epsilon=epsilon)
+
+	@classmethod
+	def _build(cls, co, corners, owners, epsilon):
+		"""The tree of the triangles whose vertex indices are corners (three each), owners are their polygon indices.
+
+		Return type: BVHTree"""
+
+		count = len(owners)
+		vertex_count = len(co) // 3
+		if any(not 0 <= corner < vertex_count for corner in corners):
+			raise ValueError("BVHTree: a polygon indexes a vertex out of range")
+		tri_boxes, centroids = [], []
+		for t in range(count):
+			points = [co[corners[t * 3 + k] * 3:corners[t * 3 + k] * 3 + 3] for k in range(3)]
+			tri_boxes.append([min(p[axis] for p in points) for axis in range(3)] + [max(p[axis] for p in points) for axis in range(3)])
+			centroids.append([(points[0][axis] + points[1][axis] + points[2][axis]) / 3.0 for axis in range(3)])
+
+		order = list(range(count))
+		boxes, first, counts = [], [], []
+
+		def node(lo, hi, box=None):
+			if box is None:
+				box = _EMPTY_BOX
+				for t in order[lo:hi]:
+					box = _merge(box, tri_boxes[t])
+			boxes.append(box)
+			first.append(lo)
+			counts.append(hi - lo)
+			return len(counts) - 1
+
+		stack = [(node(0, count), 0, count)] if count else []
+		while stack:
+			current, lo, hi = stack.pop()
+			size = hi - lo
+			if size <= _LEAF_SIZE:
+				continue
+			part = order[lo:hi]
+			low = [min(centroids[t][axis] for t in part) for axis in range(3)]
+			extent = [max(centroids[t][axis] for t in part) - low[axis] for axis in range(3)]
+			axis = extent.index(max(extent))
+			if extent[axis] <= 0.0:
+				# Every centroid at the same place, no plane separates them
+				continue
+			scale = _BINS / extent[axis]
+			bins = [min(_BINS - 1, int((centroids[t][axis] - low[axis]) * scale)) for t in part]
+			bin_counts = [0] * _BINS
+			bin_boxes = [_EMPTY_BOX] * _BINS
+			for t, slot in zip(part, bins):
+				bin_counts[slot] += 1
+				bin_boxes[slot] = _merge(bin_boxes[slot], tri_boxes[t])
+			# Cost of splitting after every bin, from sweeps in both directions
+			right_boxes, right_counts = [None] * _BINS, [0] * _BINS
+			box, total = _EMPTY_BOX, 0
+			for slot in range(_BINS - 1, 0, -1):
+				box, total = _merge(box, bin_boxes[slot]), total + bin_counts[slot]
+				right_boxes[slot], right_counts[slot] = box, total
+			best, split, left_box = _INFINITY, -1, None
+			box, total = _EMPTY_BOX, 0
+			for slot in range(_BINS - 1):
+				box, total = _merge(box, bin_boxes[slot]), total + bin_counts[slot]
+				if not total or not right_counts[slot + 1]:
+					continue
+				cost = total * _area(box) + right_counts[slot + 1] * _area(right_boxes[slot + 1])
+				if cost < best:
+					best, split, left_box = cost, slot, box
+			if split < 0 or (best >= size * _area(boxes[current]) and size <= _MAX_LEAF_SIZE):
+				continue
+			left = [t for t, slot in zip(part, bins) if slot <= split]
+			right = [t for t, slot in zip(part, bins) if slot > split]
+			order[lo:hi] = left + right
+			middle = lo + len(left)
+			first[current], counts[current] = len(counts), 0
+			left_node = node(lo, middle, left_box)
+			right_node = node(middle, hi, right_boxes[split + 1])
+			stack.append((left_node, lo, middle))
+			stack.append((right_node, middle, hi))
+
+		tree = cls()
+		tree._epsilon = float(epsilon)
+		tree._boxes = [
+			value + (epsilon if axis >= 3 else -epsilon)
+			for box in boxes for axis, value in enumerate(box)
+		]
+		tree._first, tree._count = first, counts
+		for t in order:
+			a, b, c = (co[corners[t * 3 + k] * 3:corners[t * 3 + k] * 3 + 3] for k in range(3))
+			e1 = [b[axis] - a[axis] for axis in range(3)]
+			e2 = [c[axis] - a[axis] for axis in range(3)]
+			tree._tris.extend(a + e1 + e2)
+			normal = [e1[1] * e2[2] - e1[2] * e2[1], e1[2] * e2[0] - e1[0] * e2[2], e1[0] * e2[1] - e1[1] * e2[0]]
+			length = math.sqrt(normal[0] * normal[0] + normal[1] * normal[1] + normal[2] * normal[2])
+			tree._normals.extend([value / length for value in normal] if length else normal)
+			tree._polygons.append(owners[t])
+			tree._vertices.append(tuple(corners[t * 3:t * 3 + 3]))
+		return tree
+
+	def _ray(self, ox, oy, oz, dx, dy, dz, limit, any_hit=False):
+		"""Distance and triangle of the nearest hit of a ray with a unit direction, triangle -1 when it misses."""
+
+		boxes, first, counts, tris = self._boxes, self._first, self._count, self._tris
+		if not counts:
+			return limit, -1
+		ix = 1.0 / dx if dx else _HUGE
+		iy = 1.0 / dy if dy else _HUGE
+		iz = 1.0 / dz if dz else _HUGE
+		epsilon = self._epsilon
+		best, found = limit, -1
+		entry = _slab(boxes, 0, ox, oy, oz, ix, iy, iz, best)
+		stack = [(entry, 0)] if entry is not None else []
+		while stack:
+			entry, node = stack.pop()
+			if entry > best:
+				continue
+			count = counts[node]
+			if count:
+				start = first[node]
+				for t in range(start, start + count):
+					b = t * 9
+					e1x, e1y, e1z = tris[b + 3], tris[b + 4], tris[b + 5]
+					e2x, e2y, e2z = tris[b + 6], tris[b + 7], tris[b + 8]
+					px, py, pz = dy * e2z - dz * e2y, dz * e2x - dx * e2z, dx * e2y - dy * e2x
+					determinant = e1x * px + e1y * py + e1z * pz
+					if -1e-12 < determinant < 1e-12:
+						continue
+					inverse = 1.0 / determinant
+					sx, sy, sz = ox - tris[b], oy - tris[b + 1], oz - tris[b + 2]
+					u = (sx * px + sy * py + sz * pz) * inverse
+					if u < -epsilon or u > 1.0 + epsilon:
+						continue
+					qx, qy, qz = sy * e1z - sz * e1y, sz * e1x - sx * e1z, sx * e1y - sy * e1x
+					v = (dx * qx + dy * qy + dz * qz) * inverse
+					if v < -epsilon or u + v > 1.0 + epsilon:
+						continue
+					distance = (e2x * qx + e2y * qy + e2z * qz) * inverse
+					if 0.0 <= distance < best:
+						best, found = distance, t
+						if any_hit:
+							return best, found
+				continue
+			left = first[node]
+			near = _slab(boxes, left, ox, oy, oz, ix, iy, iz, best)
+			far = _slab(boxes, left + 1, ox, oy, oz, ix, iy, iz, best)
+			# The nearer child is visited first, so it is pushed last
+			if near is not None and far is not None:
+				if near <= far:
+					stack.append((far, left + 1))
+					stack.append((near, left))
+				else:
+					stack.append((near, left))
+					stack.append((far, left + 1))
+			elif near is not None:
+				stack.append((near, left))
+			elif far is not None:
+				stack.append((far, left + 1))
+		return best, found
+
+	def _hit(self, ox, oy, oz, dx, dy, dz, distance, t):
+		"""(location, normal, index, distance) of a ray hit.
+
+		Return type: tuple"""
+
+		normals = self._normals
+		return (
+			_vector([ox + dx * distance, oy + dy * distance, oz + dz * distance]),
+			_vector(normals[t * 3:t * 3 + 3]),
+			self._polygons[t],
+			distance,
+		)
+
+	def ray_cast(self, origin, direction, distance=sys.float_info.max):
+		"""Cast a ray onto the mesh.
+
+		Parameters:
+		origin (Vector) – Start location of the ray in object space.
+		direction (Vector) – Direction of the ray in object space.
+		distance (float) – Maximum distance threshold.
+
+		Returns: Returns a tuple (Vector location, Vector normal, int index, float distance), Values will all be None if no hit is found.
+
+		Return type: tuple"""
+
+		ox, oy, oz = _point(origin, "BVHTree.ray_cast()")
+		unit = _direction(_point(direction, "BVHTree.ray_cast()"))
+		if unit is None:
+			return None, None, None, None
+		best, t = self._ray(ox, oy, oz, *unit, distance)
+		if t < 0:
+			return None, None, None, None
+		return self._hit(ox, oy, oz, *unit, best, t)
+
+	def _rays(self, origins, directions, operation):
+		"""(origin, unit direction or None) pairs of many rays, one direction may be shared by every ray."""
+
+		start = _flat_points(origins, operation)
+		if isinstance(directions, (Vector, list, tuple)) and len(directions) == 3 and not hasattr(directions[0], "__len__"):
+			way = _point(directions, operation) * (len(start) // 3)
+		else:
+			way = _flat_points(directions, operation)
+		if len(way) != len(start):
+			raise ValueError("%s: expected one direction per origin, or a single direction" % operation)
+		return [
+			(start[b:b + 3], _direction(way[b:b + 3]))
+			for b in range(0, len(start), 3)
+		]
+
+	def ray_cast_many(self, origins, directions, distance=sys.float_info.max):
+		"""Cast many rays onto the mesh in one call.
+
+		Parameters:
+		origins (VectorArray, numpy array of shape (n, 3) or sequence of Vector) – Start locations of the rays in object space.
+		directions (VectorArray, numpy array of shape (n, 3), sequence of Vector or one Vector) – Directions of the rays in object space, a single direction is used for every ray.
+		distance (float) – Maximum distance threshold.
+
+		Returns: One tuple (Vector location, Vector normal, int index, float distance) per ray, Values will all be None for a ray which hits nothing.
+
+		Return type: list"""
+
+		results = []
+		for (ox, oy, oz), unit in self._rays(origins, directions, "BVHTree.ray_cast_many()"):
+			best, t = self._ray(ox, oy, oz, *unit, distance) if unit is not None else (distance, -1)
+			results.append(self._hit(ox, oy, oz, *unit, best, t) if t >= 0 else (None, None, None, None))
+		return results
+
+	def ray_test_many(self, origins, directions, distance=sys.float_info.max):
+		"""Test whether many rays hit the mesh, stopping at the first hit of every ray.
+
+		Cheaper than ray_cast_many when only the fact of a hit matters, as for
+		line of sight checks.
+
+		Parameters:
+		origins (VectorArray, numpy array of shape (n, 3) or sequence of Vector) – Start locations of the rays in object space.
+		directions (VectorArray, numpy array of shape (n, 3), sequence of Vector or one Vector) – Directions of the rays in object space, a single direction is used for every ray.
+		distance (float) – Maximum distance threshold.
+
+		Returns: One bool per ray, True when it hits the mesh within distance.
+
+		Return type: list"""
+
+		return [
+			unit is not None and self._ray(ox, oy, oz, *unit, distance, True)[1] >= 0
+			for (ox, oy, oz), unit in self._rays(origins, directions, "BVHTree.ray_test_many()")
+		]
+
+	def _nearest(self, x, y, z, limit):
+		"""Squared distance, triangle and point of the triangle nearest to (x, y, z) within limit (squared), triangle -1 when there is none."""
+
+		boxes, first, counts, tris = self._boxes, self._first, self._count, self._tris
+		best, found, point = limit, -1, None
+		stack = [(0.0, 0)] if counts else []
+		while stack:
+			bound, node = stack.pop()
+			if bound > best:
+				continue
+			count = counts[node]
+			if count:
+				start = first[node]
+				for t in range(start, start + count):
+					px, py, pz = _closest(tris, t, x, y, z)
+					distance = (px - x) * (px - x) + (py - y) * (py - y) + (pz - z) * (pz - z)
+					if distance <= best:
+						best, found, point = distance, t, (px, py, pz)
+				continue
+			left = first[node]
+			near = _box_distance(boxes, left, x, y, z)
+			far = _box_distance(boxes, left + 1, x, y, z)
+			if near > far:
+				near, far, order = far, near, (left, left + 1)
+			else:
+				order = (left + 1, left)
+			if far <= best:
+				stack.append((far, order[0]))
+			if near <= best:
+				stack.append((near, order[1]))
+		return best, found, point
+
+	def _nearest_result(self, distance, t, point):
+		"""(location, normal, index, distance) of a nearest point.
+
+		Return type: tuple"""
+
+		return _vector(list(point)), _vector(self._normals[t * 3:t * 3 + 3]), self._polygons[t], math.sqrt(distance)
+
+	def find_nearest(self, origin, distance=1.84467e+19):
+		"""Find the nearest element to a point.
+
+		Parameters:
+		origin (Vector) – Find nearest element to this point.
+		distance (float) – Maximum distance threshold.
+
+		Returns: Returns a tuple (Vector location, Vector normal, int index, float distance), Values will all be None if no hit is found.
+
+		Return type: tuple"""
+
+		x, y, z = _point(origin, "BVHTree.find_nearest()")
+		best, t, point = self._nearest(x, y, z, distance * distance)
+		if t < 0:
+			return None, None, None, None
+		return self._nearest_result(best, t, point)
+
+	def find_nearest_range(self, origin, distance=1.84467e+19):
+		"""Find the nearest elements to a point in the distance range.
+
+		Parameters:
+		origin (Vector) – Find nearest elements to this point.
+		distance (float) – Maximum distance threshold.
+
+		Returns: Returns a list of tuples (Vector location, Vector normal, int index, float distance), one per polygon, nearest first.
+
+		Return type: list"""
+
+		x, y, z = _point(origin, "BVHTree.find_nearest_range()")
+		boxes, first, counts, tris = self._boxes, self._first, self._count, self._tris
+		limit = distance * distance
+		nearest = {}
+		stack = [0] if counts else []
+		while stack:
+			node = stack.pop()
+			if _box_distance(boxes, node, x, y, z) > limit:
+				continue
+			count = counts[node]
+			if not count:
+				stack.append(first[node])
+				stack.append(first[node] + 1)
+				continue
+			start = first[node]
+			for t in range(start, start + count):
+				px, py, pz = _closest(tris, t, x, y, z)
+				squared = (px - x) * (px - x) + (py - y) * (py - y) + (pz - z) * (pz - z)
+				polygon = self._polygons[t]
+				if squared <= limit and (polygon not in nearest or squared < nearest[polygon][0]):
+					nearest[polygon] = (squared, t, (px, py, pz))
+		return [self._nearest_result(*found) for found in sorted(nearest.values())]
+
+	def overlap(self, other_tree):
+		"""Find overlapping indices between 2 trees.
+
+		Parameters:	other_tree (BVHTree) – Other tree to preform overlap test on.
+
+		Returns: Returns a list of unique index pairs, the first index referencing this tree, the second referencing the other_tree.
+
+		Return type: list"""
+
+		if not isinstance(other_tree, BVHTree):
+			raise TypeError("BVHTree.overlap(): expected a BVHTree, not %s" % type(other_tree).__name__)
+		a_boxes, a_first, a_counts = self._boxes, self._first, self._count
+		b_boxes, b_first, b_counts = other_tree._boxes, other_tree._first, other_tree._count
+		same = other_tree is self
+		pairs = set()
+		stack = [(0, 0)] if a_counts and b_counts else []
+		while stack:
+			a, b = stack.pop()
+			i, j = a * 6, b * 6
+			if (
+				a_boxes[i] > b_boxes[j + 3] or b_boxes[j] > a_boxes[i + 3]
+				or a_boxes[i + 1] > b_boxes[j + 4] or b_boxes[j + 1] > a_boxes[i + 4]
+				or a_boxes[i + 2] > b_boxes[j + 5] or b_boxes[j + 2] > a_boxes[i + 5]
+			):
+				continue
+			a_leaf, b_leaf = a_counts[a], b_counts[b]
+			if a_leaf and b_leaf:
+				for t in range(a_first[a], a_first[a] + a_leaf):
+					for u in range(b_first[b], b_first[b] + b_leaf):
+						pair = (self._polygons[t], other_tree._polygons[u])
+						if pair in pairs:
+							continue
+						# Neighbours in the same mesh always touch, they do not count
+						if same and (t == u or set(self._vertices[t]) & set(self._vertices[u])):
+							continue
+						if _triangles_intersect(self._tris, t, other_tree._tris, u):
+							pairs.add(pair)
+			elif not a_leaf and (b_leaf or _area(a_boxes[i:i + 6]) >= _area(b_boxes[j:j + 6])):
+				stack.append((a_first[a], b))
+				stack.append((a_first[a] + 1, b))
+			else:
+				stack.append((a, b_first[b]))
+				stack.append((a, b_first[b] + 1))
+		return sorted(pairs)
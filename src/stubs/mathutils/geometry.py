@@ -0,0 +1,1025 @@
+"""Geometry Utilities (mathutils.geometry)
+
+The Blender geometry module
+
+The functions on 2D geometry use the x and y of longer vectors, the 3D ones
+read 2D vectors with z = 0. The *_many functions run a function on whole
+batches of primitives in one call: every argument is a sequence of vectors,
+a VectorArray, a numpy array of shape (n, size) or one vector shared by all
+the items. The intersections, areas and closest points are computed on whole
+numpy arrays when numpy is installed."""
+
+import itertools
+import math
+
+from . import Vector, _vector
+from .arrays import VectorArray, numpy
+from .bvhtree import _closest
+
+# Single precision epsilon, used where Blender compares with FLT_EPSILON
+_FLT_EPSILON = 1.1920929e-07
+
+def _co(value, size, operation):
+	"""The first size floats of a vector, 2D vectors get z = 0 where size is 3."""
+
+	co = [float(component) for component in value]
+	if len(co) < 2:
+		raise ValueError("%s: expected 2D or 3D vectors, not %dD" % (operation, len(co)))
+	if len(co) < size:
+		co.append(0.0)
+	return co[:size]
+
+def _points(values, size, operation):
+	"""The size-D coordinates of many points: vectors, a VectorArray or a numpy array."""
+
+	if isinstance(values, VectorArray):
+		data, step = values.buffer, values.size
+		values = data.tolist() if numpy is not None else [data[start:start + step].tolist() for start in range(0, len(data), step)]
+		return values if step == size else [_co(value, size, operation) for value in values]
+	if hasattr(values, "tolist"):
+		values = values.tolist()
+	return [_co(value, size, operation) for value in values]
+
+def _single(value):
+	"""True when value is one vector rather than a batch of them."""
+
+	if isinstance(value, Vector):
+		return True
+	if hasattr(value, "ndim"):
+		return value.ndim == 1
+	return isinstance(value, (list, tuple)) and len(value) > 0 and not hasattr(value[0], "__len__")
+
+def _batch(operation, size, *arguments):
+	"""Batches of the same length of size-D points, one vector is repeated for every item.
+
+	numpy arrays of shape (n, size) when numpy is installed, else lists of coordinate lists."""
+
+	singles = [_single(argument) for argument in arguments]
+	batches = []
+	for argument, single in zip(arguments, singles):
+		if single:
+			batches.append(_co(argument, size, operation))
+		elif numpy is not None:
+			data = numpy.asarray(argument.buffer if isinstance(argument, VectorArray) else argument, dtype=numpy.float64)
+			if data.size == 0:
+				data = data.reshape(0, size)
+			if data.ndim != 2 or data.shape[1] < 2:
+				raise ValueError("%s: expected a batch of 2D or 3D vectors" % operation)
+			if data.shape[1] < size:
+				data = numpy.hstack((data, numpy.zeros((len(data), 1))))
+			batches.append(data[:, :size])
+		else:
+			batches.append(_points(argument, size, operation))
+	counts = {len(batch) for batch, single in zip(batches, singles) if not single}
+	if len(counts) > 1:
+		raise ValueError("%s: the batches must have the same length" % operation)
+	count = counts.pop() if counts else 1
+	for index, single in enumerate(singles):
+		if single:
+			batches[index] = numpy.tile(batches[index], (count, 1)) if numpy is not None else [batches[index]] * count
+	return batches
+
+def _scalars(value, count, operation):
+	"""count floats from one number or a sequence of them, a numpy array when numpy is installed."""
+
+	if isinstance(value, (int, float)):
+		values = [float(value)] * count
+	else:
+		values = [float(item) for item in (value.tolist() if hasattr(value, "tolist") else value)]
+		if len(values) != count:
+			raise ValueError("%s: expected one value per item" % operation)
+	return numpy.array(values) if numpy is not None else values
+
+def _dots(a, b):
+	return numpy.einsum("ij,ij->i", a, b)
+
+def _vectors(points, hits):
+	"""A Vector per row of points where hits is True, None elsewhere.
+
+	Return type: list"""
+
+	return [_vector(point) if hit else None for point, hit in zip(points.tolist(), hits.tolist())]
+
+def _triangle_area(a, b, c):
+	ux, uy, uz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+	vx, vy, vz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+	x, y, z = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+	return 0.5 * math.sqrt(x * x + y * y + z * z)
+
+def area_tri(v1, v2, v3):
+	"""Returns the area size of the 2D or 3D triangle defined.
+
+	Parameters:
+	v1 (mathutils.Vector) – Point1
+	v2 (mathutils.Vector) – Point2
+	v3 (mathutils.Vector) – Point3
+
+	Return type: float"""
+
+	if not len(v1) == len(v2) == len(v3):
+		raise ValueError("area_tri(): vectors must be of equal length")
+	return _triangle_area(*(_co(v, 3, "area_tri()") for v in (v1, v2, v3)))
+
+def area_tri_many(v1s, v2s, v3s):
+	"""Returns the area sizes of many 2D or 3D triangles in one call.
+
+	Parameters:
+	v1s (VectorArray, numpy array of shape (n, 3) or sequence of mathutils.Vector) – First points of the triangles
+	v2s (VectorArray, numpy array of shape (n, 3) or sequence of mathutils.Vector) – Second points of the triangles
+	v3s (VectorArray, numpy array of shape (n, 3) or sequence of mathutils.Vector) – Third points of the triangles
+
+	Returns: One area per triangle
+
+	Return type: list of floats"""
+
+	a, b, c = _batch("area_tri_many()", 3, v1s, v2s, v3s)
+	if numpy is not None:
+		return (0.5 * numpy.linalg.norm(numpy.cross(b - a, c - a), axis=1)).tolist()
+	return [_triangle_area(*triangle) for triangle in zip(a, b, c)]
+
+def barycentric_transform(point, tri_a1, tri_a2, tri_a3, tri_b1, tri_b2, tri_b3):
+	"""Return a transformed point, the transformation is defined by 2 triangles.
+
+	Parameters:
+	point (mathutils.Vector) – The point to transform.
+	tri_a1 (mathutils.Vector) – source triangle vertex.
+	tri_a2 (mathutils.Vector) – source triangle vertex.
+	tri_a3 (mathutils.Vector) – source triangle vertex.
+	tri_b1 – target triangle vertex.
+	tri_b2 – target triangle vertex.
+	tri_b3 – target triangle vertex.
+
+	Returns: The transformed point
+
+	Return type: mathutils.Vector"""
+
+	operation = "barycentric_transform()"
+	p, a1, a2, a3, b1, b2, b3 = (_co(v, 3, operation) for v in (point, tri_a1, tri_a2, tri_a3, tri_b1, tri_b2, tri_b3))
+	e1, e2, d = Vector(a2) - Vector(a1), Vector(a3) - Vector(a1), Vector(p) - Vector(a1)
+	d00, d01, d11 = e1.dot(e1), e1.dot(e2), e2.dot(e2)
+	denominator = d00 * d11 - d01 * d01
+	if not denominator:
+		return _vector(b1)
+	d20, d21 = d.dot(e1), d.dot(e2)
+	v = (d11 * d20 - d01 * d21) / denominator
+	w = (d00 * d21 - d01 * d20) / denominator
+	result = Vector(b1) * (1.0 - v - w) + Vector(b2) * v + Vector(b3) * w
+	# The distance from the source plane, scaled like the triangle
+	source_normal, target_normal = e1.cross(e2), (Vector(b2) - Vector(b1)).cross(Vector(b3) - Vector(b1))
+	source_area, target_area = source_normal.length, target_normal.length
+	offset = d.dot(source_normal) / source_area
+	if target_area:
+		result += target_normal * (offset * math.sqrt(target_area / source_area) / target_area)
+	return result
+
+def _hull(points):
+	"""Indices of the convex hull of 2D points, counter-clockwise from the lowest x."""
+
+	order = sorted(range(len(points)), key=lambda index: points[index])
+	if len(order) < 3:
+		return order
+
+	def turn(o, a, b):
+		o, a, b = points[o], points[a], points[b]
+		return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+	lower, upper = [], []
+	for index in order:
+		while len(lower) >= 2 and turn(lower[-2], lower[-1], index) <= 0.0:
+			lower.pop()
+		lower.append(index)
+	for index in reversed(order):
+		while len(upper) >= 2 and turn(upper[-2], upper[-1], index) <= 0.0:
+			upper.pop()
+		upper.append(index)
+	return lower[:-1] + upper[:-1]
+
+def box_fit_2d(points):
+	"""Returns an angle that best fits the points to an axis aligned rectangle.
+
+	Parameters:
+	points (list) – list of 2d points.
+
+	Returns: angle
+
+	Return type: float"""
+
+	co = _points(points, 2, "box_fit_2d()")
+	hull = [co[index] for index in _hull(co)]
+	best, angle = float("inf"), 0.0
+	for index, (x, y) in enumerate(hull):
+		dx, dy = hull[index - 1][0] - x, hull[index - 1][1] - y
+		length = math.hypot(dx, dy)
+		if not length:
+			continue
+		dx, dy = dx / length, dy / length
+		# Extent of the hull in the frame of the edge
+		us = [px * dx + py * dy for px, py in hull]
+		vs = [py * dx - px * dy for px, py in hull]
+		area = (max(us) - min(us)) * (max(vs) - min(vs))
+		if area < best:
+			best, angle = area, math.atan2(dx, dy)
+	return angle
+
+def box_pack_2d(boxes):
+	"""Returns the width and height of the area the boxes are packed in, the boxes are moved in place.
+
+	Boxes are placed tallest first in rows of a width close to the side of a
+	square of the total area.
+
+	Parameters:
+	boxes (list) – list of boxes, each box is a list where the first 4 items are [x, y, width, height, …] other items are ignored.
+
+	Returns: the width and height of the packed bounding box
+
+	Return type: tuple, pair of floats"""
+
+	sizes = [(float(box[2]), float(box[3])) for box in boxes]
+	if not sizes:
+		return 0.0, 0.0
+	width = max(math.sqrt(sum(w * h for w, h in sizes)), max(w for w, h in sizes))
+	order = sorted(range(len(sizes)), key=lambda index: (-sizes[index][1], -sizes[index][0]))
+	x = y = row = used = 0.0
+	for index in order:
+		w, h = sizes[index]
+		if x > 0.0 and x + w > width:
+			x, y, row = 0.0, y + row, 0.0
+		boxes[index][0], boxes[index][1] = x, y
+		x += w
+		row, used = max(row, h), max(used, x)
+	return used, y + row
+
+def box_pack_2d_many(box_lists):
+	"""Packs many lists of boxes in one call, see box_pack_2d.
+
+	Parameters:
+	box_lists (list) – list of lists of boxes, each box is a list where the first 4 items are [x, y, width, height, …], or a numpy array of shape (n, 4) and more.
+
+	Returns: the width and height of the packed bounding box of every list
+
+	Return type: list of pairs of floats"""
+
+	return [box_pack_2d(boxes) for boxes in box_lists]
+
+def closest_point_on_tri(pt, tri_p1, tri_p2, tri_p3):
+	"""Takes 4 vectors: one is the point and the next 3 define the triangle.
+
+	Parameters:
+	pt (mathutils.Vector) – Point
+	tri_p1 (mathutils.Vector) – First point of the triangle
+	tri_p2 (mathutils.Vector) – Second point of the triangle
+	tri_p3 (mathutils.Vector) – Third point of the triangle
+
+	Returns: The closest point of the triangle.
+
+	Return type: mathutils.Vector"""
+
+	operation = "closest_point_on_tri()"
+	p, a, b, c = (_co(v, 3, operation) for v in (pt, tri_p1, tri_p2, tri_p3))
+	triangle = a + [b[axis] - a[axis] for axis in range(3)] + [c[axis] - a[axis] for axis in range(3)]
+	return _vector(list(_closest(triangle, 0, *p)))
+
+def closest_point_on_tri_many(pts, tri_p1s, tri_p2s, tri_p3s):
+	"""Takes many points and triangles, returns the closest point of every triangle to its point in one call.
+
+	Parameters:
+	pts (VectorArray, numpy array of shape (n, 3) or sequence of mathutils.Vector) – Points
+	tri_p1s (VectorArray, numpy array of shape (n, 3) or sequence of mathutils.Vector) – First points of the triangles
+	tri_p2s (VectorArray, numpy array of shape (n, 3) or sequence of mathutils.Vector) – Second points of the triangles
+	tri_p3s (VectorArray, numpy array of shape (n, 3) or sequence of mathutils.Vector) – Third points of the triangles
+
+	Returns: One closest point per item
+
+	Return type: list of mathutils.Vector"""
+
+	p, a, b, c = _batch("closest_point_on_tri_many()", 3, pts, tri_p1s, tri_p2s, tri_p3s)
+	if numpy is None:
+		return [
+			_vector(list(_closest(ai + [bi[axis] - ai[axis] for axis in range(3)] + [ci[axis] - ai[axis] for axis in range(3)], 0, *pi)))
+			for pi, ai, bi, ci in zip(p, a, b, c)
+		]
+	ab, ac, ap = b - a, c - a, p - a
+	d1, d2 = _dots(ab, ap), _dots(ac, ap)
+	bp, cp = p - b, p - c
+	d3, d4 = _dots(ab, bp), _dots(ac, bp)
+	d5, d6 = _dots(ab, cp), _dots(ac, cp)
+	va, vb, vc = d3 * d6 - d5 * d4, d5 * d2 - d1 * d6, d1 * d4 - d3 * d2
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		denominator = va + vb + vc
+		result = a + ab * (vb / denominator)[:, None] + ac * (vc / denominator)[:, None]
+		# The regions of the triangle, the earliest test of the scalar code wins so it is applied last
+		regions = [
+			((va <= 0.0) & (d4 - d3 >= 0.0) & (d5 - d6 >= 0.0), lambda: b + (c - b) * ((d4 - d3) / ((d4 - d3) + (d5 - d6)))[:, None]),
+			((vb <= 0.0) & (d2 >= 0.0) & (d6 <= 0.0), lambda: a + ac * (d2 / (d2 - d6))[:, None]),
+			((d6 >= 0.0) & (d5 <= d6), lambda: c),
+			((vc <= 0.0) & (d1 >= 0.0) & (d3 <= 0.0), lambda: a + ab * (d1 / (d1 - d3))[:, None]),
+			((d3 >= 0.0) & (d4 <= d3), lambda: b),
+			((d1 <= 0.0) & (d2 <= 0.0), lambda: a),
+		]
+		for mask, point in regions:
+			if mask.any():
+				result = numpy.where(mask[:, None], point(), result)
+	return [_vector(point) for point in result.tolist()]
+
+def convex_hull_2d(points):
+	"""Returns a list of indices into the list given
+
+	Parameters:
+	points (list) – list of 2d points, a VectorArray or a numpy array of shape (n, 2) also work.
+
+	Returns: a list of indices, counter-clockwise
+
+	Return type: list of ints"""
+
+	return _hull(_points(points, 2, "convex_hull_2d()"))
+
+def convex_hull_2d_many(point_lists):
+	"""Returns the convex hull of many lists of 2d points in one call, see convex_hull_2d.
+
+	Parameters:
+	point_lists (list) – list of lists of 2d points, VectorArrays or numpy arrays of shape (n, 2).
+
+	Returns: a list of indices per list of points
+
+	Return type: list of lists of ints"""
+
+	return [_hull(_points(points, 2, "convex_hull_2d_many()")) for points in point_lists]
+
+def distance_point_to_plane(pt, plane_co, plane_no):
+	"""Returns the signed distance between a point and a plane (negative when below the normal).
+
+	Parameters:
+	pt (mathutils.Vector) – Point
+	plane_co (mathutils.Vector) – A point on the plane
+	plane_no (mathutils.Vector) – The direction the plane is facing
+
+	Return type: float"""
+
+	operation = "distance_point_to_plane()"
+	p, co, no = (Vector(_co(v, 3, operation)) for v in (pt, plane_co, plane_no))
+	length = no.length
+	return (p - co).dot(no) / length if length else 0.0
+
+def interpolate_bezier(knot1, handle1, handle2, knot2, resolution):
+	"""Interpolate a bezier spline segment.
+
+	Parameters:
+	knot1 (mathutils.Vector) – First bezier spline point.
+	handle1 (mathutils.Vector) – First bezier spline handle.
+	handle2 (mathutils.Vector) – Second bezier spline handle.
+	knot2 (mathutils.Vector) – Second bezier spline point.
+	resolution (int) – Number of points to return.
+
+	Returns: The interpolated points
+
+	Return type: list of mathutils.Vector"""
+
+	if resolution < 2:
+		raise ValueError("resolution must be 2 or over")
+	points = [[float(value) for value in v] for v in (knot1, handle1, handle2, knot2)]
+	size = max(len(point) for point in points)
+	points = [point + [0.0] * (size - len(point)) for point in points]
+	result = []
+	for step in range(resolution):
+		t = step / (resolution - 1)
+		s = 1.0 - t
+		weights = (s * s * s, 3.0 * s * s * t, 3.0 * s * t * t, t * t * t)
+		result.append(_vector([sum(w * point[axis] for w, point in zip(weights, points)) for axis in range(size)]))
+	return result
+
+def intersect_line_line(v1, v2, v3, v4):
+	"""Returns a tuple with the points on each line respectively closest to the other.
+
+	Parameters:
+	v1 (mathutils.Vector) – First point of the first line
+	v2 (mathutils.Vector) – Second point of the first line
+	v3 (mathutils.Vector) – First point of the second line
+	v4 (mathutils.Vector) – Second point of the second line
+
+	Returns: The two closest points, None when the lines are parallel
+
+	Return type: (mathutils.Vector, mathutils.Vector) or None"""
+
+	size = 2 if all(len(v) == 2 for v in (v1, v2, v3, v4)) else 3
+	a1, a2, b1, b2 = (Vector(_co(v, 3, "intersect_line_line()")) for v in (v1, v2, v3, v4))
+	a, b, offset = a2 - a1, b2 - b1, a1 - b1
+	# |a x b|^2, zero for parallel lines and for lines of no length
+	denominator = a.cross(b).length_squared
+	if not denominator:
+		return None
+	aa, ab, bb = a.dot(a), a.dot(b), b.dot(b)
+	ao, bo = a.dot(offset), b.dot(offset)
+	first = a1 + a * ((ab * bo - bb * ao) / denominator)
+	second = b1 + b * ((aa * bo - ab * ao) / denominator)
+	if size == 2:
+		return first.to_2d(), second.to_2d()
+	return first, second
+
+def intersect_line_line_2d(lineA_p1, lineA_p2, lineB_p1, lineB_p2):
+	"""Takes 2 segments (defined by 4 vectors) and returns a vector for their point of intersection or None.
+
+	Warning: Despite its name, this function works on segments, and not on lines.
+
+	Parameters:
+	lineA_p1 (mathutils.Vector) – First point of the first line
+	lineA_p2 (mathutils.Vector) – Second point of the first line
+	lineB_p1 (mathutils.Vector) – First point of the second line
+	lineB_p2 (mathutils.Vector) – Second point of the second line
+
+	Returns: The point of intersection or None when not found
+
+	Return type: mathutils.Vector or None"""
+
+	operation = "intersect_line_line_2d()"
+	a1, a2, b1, b2 = (_co(v, 2, operation) for v in (lineA_p1, lineA_p2, lineB_p1, lineB_p2))
+	dax, day = a2[0] - a1[0], a2[1] - a1[1]
+	dbx, dby = b2[0] - b1[0], b2[1] - b1[1]
+	denominator = dax * dby - day * dbx
+	if not denominator:
+		return None
+	ox, oy = b1[0] - a1[0], b1[1] - a1[1]
+	t = (ox * dby - oy * dbx) / denominator
+	u = (ox * day - oy * dax) / denominator
+	if not (0.0 <= t <= 1.0 and 0.0 <= u <= 1.0):
+		return None
+	return _vector([a1[0] + dax * t, a1[1] + day * t])
+
+def _line_plane(a, b, co, no):
+	ux, uy, uz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+	dot = no[0] * ux + no[1] * uy + no[2] * uz
+	if abs(dot) <= _FLT_EPSILON:
+		return None
+	factor = -(no[0] * (a[0] - co[0]) + no[1] * (a[1] - co[1]) + no[2] * (a[2] - co[2])) / dot
+	return [a[0] + ux * factor, a[1] + uy * factor, a[2] + uz * factor]
+
+def intersect_line_plane(line_a, line_b, plane_co, plane_no, no_flip=False):
+	"""Calculate the intersection between a line (as 2 vectors) and a plane. Returns a vector for the intersection or None.
+
+	Parameters:
+	line_a (mathutils.Vector) – First point of the first line
+	line_b (mathutils.Vector) – Second point of the first line
+	plane_co (mathutils.Vector) – A point on the plane
+	plane_no (mathutils.Vector) – The direction the plane is facing
+	no_flip (bool) – Unused, kept for compatibility.
+
+	Returns: The point of intersection or None when not found
+
+	Return type: mathutils.Vector or None"""
+
+	operation = "intersect_line_plane()"
+	point = _line_plane(*(_co(v, 3, operation) for v in (line_a, line_b, plane_co, plane_no)))
+	return _vector(point) if point is not None else None
+
+def intersect_line_plane_many(line_as, line_bs, plane_cos, plane_nos):
+	"""Calculate the intersections between many lines and planes in one call, see intersect_line_plane.
+
+	Parameters:
+	line_as (VectorArray, numpy array of shape (n, 3), sequence of mathutils.Vector or one mathutils.Vector) – First points of the lines
+	line_bs (VectorArray, numpy array of shape (n, 3), sequence of mathutils.Vector or one mathutils.Vector) – Second points of the lines
+	plane_cos (VectorArray, numpy array of shape (n, 3), sequence of mathutils.Vector or one mathutils.Vector) – Points on the planes
+	plane_nos (VectorArray, numpy array of shape (n, 3), sequence of mathutils.Vector or one mathutils.Vector) – The directions the planes are facing
+
+	Returns: One point of intersection per item, None when not found
+
+	Return type: list of mathutils.Vector or None"""
+
+	a, b, co, no = _batch("intersect_line_plane_many()", 3, line_as, line_bs, plane_cos, plane_nos)
+	if numpy is None:
+		points = [_line_plane(*item) for item in zip(a, b, co, no)]
+		return [_vector(point) if point is not None else None for point in points]
+	u = b - a
+	dot = _dots(no, u)
+	hits = numpy.abs(dot) > _FLT_EPSILON
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		factor = -_dots(no, a - co) / dot
+	return _vectors(a + u * factor[:, None], hits)
+
+def _line_sphere(a, b, center, radius, clip):
+	"""The (first, second) points where the line from a to b enters a sphere, None for the missing ones."""
+
+	direction = [bi - ai for ai, bi in zip(a, b)]
+	offset = [ai - ci for ai, ci in zip(a, center)]
+	qa = sum(value * value for value in direction)
+	qb = 2.0 * sum(d * o for d, o in zip(direction, offset))
+	qc = sum(value * value for value in offset) - radius * radius
+	discriminant = qb * qb - 4.0 * qa * qc
+	if not qa or discriminant < 0.0:
+		return None, None
+	root = math.sqrt(discriminant)
+	factors = [(-qb + root) / (2.0 * qa), (-qb - root) / (2.0 * qa)]
+	if not root:
+		factors[1] = None
+	points = []
+	for factor in factors:
+		if factor is None or (clip and not 0.0 <= factor <= 1.0):
+			points.append(None)
+		else:
+			points.append(_vector([ai + di * factor for ai, di in zip(a, direction)]))
+	return points[0], points[1]
+
+def intersect_line_sphere(line_a, line_b, sphere_co, sphere_radius, clip=True):
+	"""Takes a line (as 2 points) and a sphere (as a point and a radius) and returns the intersection
+
+	Parameters:
+	line_a (mathutils.Vector) – First point of the line
+	line_b (mathutils.Vector) – Second point of the line
+	sphere_co (mathutils.Vector) – The center of the sphere
+	sphere_radius (sphere_radius) – Radius of the sphere
+	clip (bool) – Only return points between line_a and line_b.
+
+	Returns: The intersection points as a pair of vectors or None when there is no intersection
+
+	Return type: A tuple pair containing mathutils.Vector or None"""
+
+	operation = "intersect_line_sphere()"
+	a, b, center = (_co(v, 3, operation) for v in (line_a, line_b, sphere_co))
+	return _line_sphere(a, b, center, float(sphere_radius), clip)
+
+def intersect_line_sphere_2d(line_a, line_b, sphere_co, sphere_radius, clip=True):
+	"""Takes a line (as 2 points) and a sphere (as a point and a radius) and returns the intersection
+
+	Parameters:
+	line_a (mathutils.Vector) – First point of the line
+	line_b (mathutils.Vector) – Second point of the line
+	sphere_co (mathutils.Vector) – The center of the sphere
+	sphere_radius (sphere_radius) – Radius of the sphere
+	clip (bool) – Only return points between line_a and line_b.
+
+	Returns: The intersection points as a pair of vectors or None when there is no intersection
+
+	Return type: A tuple pair containing mathutils.Vector or None"""
+
+	operation = "intersect_line_sphere_2d()"
+	a, b, center = (_co(v, 2, operation) for v in (line_a, line_b, sphere_co))
+	return _line_sphere(a, b, center, float(sphere_radius), clip)
+
+def intersect_plane_plane(plane_a_co, plane_a_no, plane_b_co, plane_b_no):
+	"""Return the intersection between two planes
+
+	Parameters:
+	plane_a_co (mathutils.Vector) – Point on the first plane
+	plane_a_no (mathutils.Vector) – Normal of the first plane
+	plane_b_co (mathutils.Vector) – Point on the second plane
+	plane_b_no (mathutils.Vector) – Normal of the second plane
+
+	Returns: The line of the intersection represented as a point and a vector
+
+	Return type: tuple pair of mathutils.Vector or None if the intersection can’t be calculated"""
+
+	operation = "intersect_plane_plane()"
+	a_co, a_no, b_co, b_no = (Vector(_co(v, 3, operation)) for v in (plane_a_co, plane_a_no, plane_b_co, plane_b_no))
+	direction = a_no.cross(b_no)
+	determinant = direction.length_squared
+	if not determinant:
+		return None, None
+	# The point of the line nearest to the origin, from the plane equations n . x = n . co
+	point = (b_no.cross(direction) * a_no.dot(a_co) + direction.cross(a_no) * b_no.dot(b_co)) / determinant
+	return point, direction.normalized()
+
+def intersect_point_line(pt, line_p1, line_p2):
+	"""Takes a point and a line and returns a tuple with the closest point on the line and its distance from the first point of the line as a percentage of the length of the line.
+
+	Parameters:
+	pt (mathutils.Vector) – Point
+	line_p1 (mathutils.Vector) – First point of the line
+	line_p2 (mathutils.Vector) – Second point of the line
+
+	Return type: (mathutils.Vector, float)"""
+
+	size = 2 if all(len(v) == 2 for v in (pt, line_p1, line_p2)) else 3
+	p, a, b = (Vector(_co(v, size, "intersect_point_line()")) for v in (pt, line_p1, line_p2))
+	direction = b - a
+	length = direction.length_squared
+	factor = (p - a).dot(direction) / length if length else 0.0
+	return a + direction * factor, factor
+
+def _side(a, b, p):
+	return (b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0])
+
+def _inside_2d(point, corners):
+	"""1 when point is inside the counter-clockwise polygon corners, -1 inside the clockwise one, else 0."""
+
+	sides = [_side(corners[index - 1], corner, point) >= 0.0 for index, corner in enumerate(corners)]
+	if all(sides):
+		return 1
+	if not any(sides):
+		return -1
+	return 0
+
+def intersect_point_quad_2d(pt, quad_p1, quad_p2, quad_p3, quad_p4):
+	"""Takes 5 vectors (using only the x and y coordinates): one is the point and the next 4 define the quad, only the x and y are used from the vectors. Returns 1 if the point is within the quad, otherwise 0. Works only with convex quads without singular edges.
+
+	Parameters:
+	pt (mathutils.Vector) – Point
+	quad_p1 (mathutils.Vector) – First point of the quad
+	quad_p2 (mathutils.Vector) – Second point of the quad
+	quad_p3 (mathutils.Vector) – Third point of the quad
+	quad_p4 (mathutils.Vector) – Fourth point of the quad
+
+	Return type: int"""
+
+	operation = "intersect_point_quad_2d()"
+	p, *corners = (_co(v, 2, operation) for v in (pt, quad_p1, quad_p2, quad_p3, quad_p4))
+	return _inside_2d(p, corners)
+
+def intersect_point_tri(pt, tri_p1, tri_p2, tri_p3):
+	"""Takes 4 vectors: one is the point and the next 3 define the triangle.
+
+	Parameters:
+	pt (mathutils.Vector) – Point
+	tri_p1 (mathutils.Vector) – First point of the triangle
+	tri_p2 (mathutils.Vector) – Second point of the triangle
+	tri_p3 (mathutils.Vector) – Third point of the triangle
+
+	Returns: Point on the triangles plane or None if its outside the triangle
+
+	Return type: mathutils.Vector or None"""
+
+	operation = "intersect_point_tri()"
+	p, a, b, c = (Vector(_co(v, 3, operation)) for v in (pt, tri_p1, tri_p2, tri_p3))
+	normal = (b - a).cross(c - a)
+	length = normal.length_squared
+	if not length:
+		return None
+	sides = [(end - start).cross(p - start).dot(normal) for start, end in ((a, b), (b, c), (c, a))]
+	if not (all(side >= 0.0 for side in sides) or all(side <= 0.0 for side in sides)):
+		return None
+	return p - normal * ((p - a).dot(normal) / length)
+
+def intersect_point_tri_2d(pt, tri_p1, tri_p2, tri_p3):
+	"""Takes 4 vectors (using only the x and y coordinates): one is the point and the next 3 define the triangle. Returns 1 if the point is within the triangle, otherwise 0.
+
+	Parameters:
+	pt (mathutils.Vector) – Point
+	tri_p1 (mathutils.Vector) – First point of the triangle
+	tri_p2 (mathutils.Vector) – Second point of the triangle
+	tri_p3 (mathutils.Vector) – Third point of the triangle
+
+	Return type: int"""
+
+	operation = "intersect_point_tri_2d()"
+	p, *corners = (_co(v, 2, operation) for v in (pt, tri_p1, tri_p2, tri_p3))
+	return _inside_2d(p, corners)
+
+def _ray_tri(v1, v2, v3, ray, orig, clip):
+	"""The point where the ray hits the triangle, as a list, None when it does not."""
+
+	length = math.sqrt(ray[0] * ray[0] + ray[1] * ray[1] + ray[2] * ray[2])
+	if not length:
+		return None
+	dx, dy, dz = ray[0] / length, ray[1] / length, ray[2] / length
+	e1x, e1y, e1z = v2[0] - v1[0], v2[1] - v1[1], v2[2] - v1[2]
+	e2x, e2y, e2z = v3[0] - v1[0], v3[1] - v1[1], v3[2] - v1[2]
+	px, py, pz = dy * e2z - dz * e2y, dz * e2x - dx * e2z, dx * e2y - dy * e2x
+	determinant = e1x * px + e1y * py + e1z * pz
+	if -1e-6 < determinant < 1e-6:
+		return None
+	inverse = 1.0 / determinant
+	sx, sy, sz = orig[0] - v1[0], orig[1] - v1[1], orig[2] - v1[2]
+	u = (sx * px + sy * py + sz * pz) * inverse
+	if clip and (u < 0.0 or u > 1.0):
+		return None
+	qx, qy, qz = sy * e1z - sz * e1y, sz * e1x - sx * e1z, sx * e1y - sy * e1x
+	v = (dx * qx + dy * qy + dz * qz) * inverse
+	if clip and (v < 0.0 or u + v > 1.0):
+		return None
+	t = (e2x * qx + e2y * qy + e2z * qz) * inverse
+	if t < 0.0:
+		return None
+	return [orig[0] + dx * t, orig[1] + dy * t, orig[2] + dz * t]
+
+def intersect_ray_tri(v1, v2, v3, ray, orig, clip=True):
+	"""Returns the intersection between a ray and a triangle, if possible, returns None otherwise.
+
+	Parameters:
+	v1 (mathutils.Vector) – Point1
+	v2 (mathutils.Vector) – Point2
+	v3 (mathutils.Vector) – Point3
+	ray (mathutils.Vector) – Direction of the projection
+	orig (mathutils.Vector) – Origin
+	clip (boolean) – When False, don’t restrict the intersection to the area of the triangle, use the infinite plane defined by the triangle.
+
+	Returns: The point of intersection or None if no intersection is found
+
+	Return type: mathutils.Vector or None"""
+
+	point = _ray_tri(*(_co(v, 3, "intersect_ray_tri()") for v in (v1, v2, v3, ray, orig)), clip)
+	return _vector(point) if point is not None else None
+
+def intersect_ray_tri_many(v1s, v2s, v3s, rays, origs, clip=True):
+	"""Returns the intersections between many rays and triangles in one call, see intersect_ray_tri.
+
+	One ray cast against every triangle of a mesh, or many rays against one
+	triangle, are written with a single vector for the shared arguments.
+
+	Parameters:
+	v1s (VectorArray, numpy array of shape (n, 3), sequence of mathutils.Vector or one mathutils.Vector) – First points of the triangles
+	v2s (VectorArray, numpy array of shape (n, 3), sequence of mathutils.Vector or one mathutils.Vector) – Second points of the triangles
+	v3s (VectorArray, numpy array of shape (n, 3), sequence of mathutils.Vector or one mathutils.Vector) – Third points of the triangles
+	rays (VectorArray, numpy array of shape (n, 3), sequence of mathutils.Vector or one mathutils.Vector) – Directions of the projections
+	origs (VectorArray, numpy array of shape (n, 3), sequence of mathutils.Vector or one mathutils.Vector) – Origins
+	clip (boolean) – When False, don’t restrict the intersections to the area of the triangles.
+
+	Returns: One point of intersection per item, None where no intersection is found
+
+	Return type: list of mathutils.Vector or None"""
+
+	v1, v2, v3, ray, orig = _batch("intersect_ray_tri_many()", 3, v1s, v2s, v3s, rays, origs)
+	if numpy is None:
+		points = [_ray_tri(*item, clip) for item in zip(v1, v2, v3, ray, orig)]
+		return [_vector(point) if point is not None else None for point in points]
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		direction = ray / numpy.linalg.norm(ray, axis=1)[:, None]
+		e1, e2 = v2 - v1, v3 - v1
+		p = numpy.cross(direction, e2)
+		determinant = _dots(e1, p)
+		inverse = 1.0 / determinant
+		s = orig - v1
+		u = _dots(s, p) * inverse
+		q = numpy.cross(s, e1)
+		v = _dots(direction, q) * inverse
+		t = _dots(e2, q) * inverse
+		hits = (numpy.abs(determinant) >= 1e-6) & (t >= 0.0)
+		if clip:
+			hits &= (u >= 0.0) & (u <= 1.0) & (v >= 0.0) & (u + v <= 1.0)
+	return _vectors(orig + direction * t[:, None], hits)
+
+def _circles(a, radius_a, b, radius_b):
+	"""The two points where 2 circles cross, as lists, None when they do not."""
+
+	dx, dy = b[0] - a[0], b[1] - a[1]
+	distance = math.hypot(dx, dy)
+	if distance > radius_a + radius_b or distance < abs(radius_a - radius_b) or distance < _FLT_EPSILON:
+		return None
+	dx, dy = dx / distance, dy / distance
+	along = (radius_a * radius_a - radius_b * radius_b + distance * distance) / (2.0 * distance)
+	height = math.sqrt(abs(radius_a * radius_a - along * along))
+	cx, cy = a[0] + dx * along, a[1] + dy * along
+	return [cx + height * dy, cy - height * dx], [cx - height * dy, cy + height * dx]
+
+def intersect_sphere_sphere_2d(p_a, radius_a, p_b, radius_b):
+	"""Returns 2 points on between intersecting circles.
+
+	Parameters:
+	p_a (mathutils.Vector) – Center of the first circle
+	radius_a (float) – Radius of the first circle
+	p_b (mathutils.Vector) – Center of the second circle
+	radius_b (float) – Radius of the second circle
+
+	Return type: tuple of mathutils.Vector’s or None when there is no intersection"""
+
+	operation = "intersect_sphere_sphere_2d()"
+	points = _circles(_co(p_a, 2, operation), float(radius_a), _co(p_b, 2, operation), float(radius_b))
+	if points is None:
+		return None, None
+	return _vector(points[0]), _vector(points[1])
+
+def intersect_sphere_sphere_2d_many(p_as, radius_as, p_bs, radius_bs):
+	"""Returns the points where many pairs of circles cross in one call, see intersect_sphere_sphere_2d.
+
+	Parameters:
+	p_as (VectorArray, numpy array of shape (n, 2), sequence of mathutils.Vector or one mathutils.Vector) – Centers of the first circles
+	radius_as (float or sequence of floats) – Radii of the first circles
+	p_bs (VectorArray, numpy array of shape (n, 2), sequence of mathutils.Vector or one mathutils.Vector) – Centers of the second circles
+	radius_bs (float or sequence of floats) – Radii of the second circles
+
+	Returns: A pair of points per item, (None, None) when the circles do not cross
+
+	Return type: list of tuples of mathutils.Vector’s or None"""
+
+	operation = "intersect_sphere_sphere_2d_many()"
+	a, b = _batch(operation, 2, p_as, p_bs)
+	ra, rb = _scalars(radius_as, len(a), operation), _scalars(radius_bs, len(a), operation)
+	if numpy is None:
+		results = [_circles(*item) for item in zip(a, ra, b, rb)]
+		return [(_vector(points[0]), _vector(points[1])) if points is not None else (None, None) for points in results]
+	offset = b - a
+	distance = numpy.hypot(offset[:, 0], offset[:, 1])
+	hits = (distance <= ra + rb) & (distance >= numpy.abs(ra - rb)) & (distance >= _FLT_EPSILON)
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		unit = offset / distance[:, None]
+		along = (ra * ra - rb * rb + distance * distance) / (2.0 * distance)
+		height = numpy.sqrt(numpy.abs(ra * ra - along * along))
+	center = a + unit * along[:, None]
+	side = numpy.stack((unit[:, 1], -unit[:, 0]), axis=1) * height[:, None]
+	first, second = (center + side).tolist(), (center - side).tolist()
+	return [
+		(_vector(p), _vector(q)) if hit else (None, None)
+		for p, q, hit in zip(first, second, hits.tolist())
+	]
+
+def _newell(points):
+	"""The unnormalized normal of a polygon, from the Newell method."""
+
+	x = y = z = 0.0
+	for index, (cx, cy, cz) in enumerate(points):
+		px, py, pz = points[index - 1]
+		x += (py - cy) * (pz + cz)
+		y += (pz - cz) * (px + cx)
+		z += (px - cx) * (py + cy)
+	return [x, y, z]
+
+def normal(*vectors):
+	"""Returns the normal of a 3D polygon.
+
+	Parameters:
+	vectors (sequence of 3 or more 3d vector) – Vectors to calculate normals with
+
+	Return type: mathutils.Vector"""
+
+	if len(vectors) == 1:
+		vectors = vectors[0]
+	points = _points(vectors, 3, "normal()")
+	if len(points) < 3:
+		raise ValueError("normal(): 3 or more vectors expected")
+	return Vector(_newell(points)).normalized()
+
+def points_in_planes(planes):
+	"""Returns a list of points inside all planes given and a list of index values for the planes used.
+
+	Parameters:
+	planes (list of mathutils.Vector) – List of planes (4D vectors).
+
+	Returns: two lists, once containing the vertices inside the planes, another containing the plane indices used
+
+	Return type: pair of lists"""
+
+	planes = [[float(value) for value in plane] for plane in planes]
+	if any(len(plane) != 4 for plane in planes):
+		raise ValueError("points_in_planes(): expected 4D vectors")
+	points, used = [], set()
+	for i, j, k in itertools.combinations(range(len(planes)), 3):
+		n1, n2, n3 = (Vector(planes[index][:3]) for index in (i, j, k))
+		c23, c31, c12 = n2.cross(n3), n3.cross(n1), n1.cross(n2)
+		determinant = n1.dot(c23)
+		if abs(determinant) <= 1e-6:
+			continue
+		point = (c23 * -planes[i][3] + c31 * -planes[j][3] + c12 * -planes[k][3]) / determinant
+		if any(plane[0] * point.x + plane[1] * point.y + plane[2] * point.z + plane[3] > 1e-6 for plane in planes):
+			continue
+		if all((point - other).length_squared >= 1e-4 for other in points):
+			points.append(point)
+			used.update((i, j, k))
+	return points, sorted(used)
+
+def _crosses(a, b, c, d):
+	"""True when the segments a-b and c-d cross at a point inside both."""
+
+	return _side(a, b, c) * _side(a, b, d) < 0.0 and _side(c, d, a) * _side(c, d, b) < 0.0
+
+def _bridge(points, outer, holes):
+	"""One loop made of the counter-clockwise outer loop and the clockwise holes, joined by pairs of edges."""
+
+	loop = list(outer)
+	holes = sorted(holes, key=lambda hole: -max(points[index][0] for index in hole))
+	for number, hole in enumerate(holes):
+		# From the rightmost point of the hole to the nearest loop point it can see
+		start = max(range(len(hole)), key=lambda k: points[hole[k]])
+		m = points[hole[start]]
+		edges = [(loop[k - 1], loop[k]) for k in range(len(loop))]
+		for other in holes[number:]:
+			edges.extend((other[k - 1], other[k]) for k in range(len(other)))
+		order = sorted(range(len(loop)), key=lambda k: (points[loop[k]][0] < m[0], (points[loop[k]][0] - m[0]) ** 2 + (points[loop[k]][1] - m[1]) ** 2))
+		target = order[0]
+		for k in order:
+			p = points[loop[k]]
+			previous, following = points[loop[k - 1]], points[loop[(k + 1) % len(loop)]]
+			# The bridge must leave p inside its corner of the loop
+			if _side(previous, p, following) >= 0.0:
+				inside = _side(previous, p, m) >= 0.0 and _side(p, following, m) >= 0.0
+			else:
+				inside = _side(previous, p, m) >= 0.0 or _side(p, following, m) >= 0.0
+			if inside and not any(
+				_crosses(m, p, points[i], points[j]) for i, j in edges
+				if points[i] not in (m, p) and points[j] not in (m, p)
+			):
+				target = k
+				break
+		hole = hole[start:] + hole[:start + 1]
+		loop[target + 1:target + 1] = hole + [loop[target]]
+	return loop
+
+def _ear_clip(points, loop):
+	"""Triangles of a counter-clockwise loop of point indices, a loop joined to holes visits some points twice."""
+
+	triangles = []
+	loop = list(loop)
+	cursor = 0
+	while len(loop) > 3:
+		count = len(loop)
+		for step in range(count):
+			k = (cursor + step) % count
+			a, b, c = loop[k - 1], loop[k], loop[(k + 1) % count]
+			pa, pb, pc = points[a], points[b], points[c]
+			if _side(pa, pb, pc) <= 0.0:
+				continue
+			corners = (pa, pb, pc)
+			if any(
+				_side(pa, pb, points[i]) >= 0.0 and _side(pb, pc, points[i]) >= 0.0 and _side(pc, pa, points[i]) >= 0.0
+				for i in loop if i not in (a, b, c) and points[i] not in corners
+			):
+				continue
+			break
+		else:
+			# No ear in a degenerate or self intersecting loop, cut a corner anyway
+			k = cursor % count
+			a, b, c = loop[k - 1], loop[k], loop[(k + 1) % count]
+		triangles.append((a, b, c))
+		del loop[k]
+		cursor = k - 1 if k else 0
+	if len(loop) == 3:
+		triangles.append(tuple(loop))
+	return triangles
+
+def _area_2d(points, loop):
+	return 0.5 * sum(_side((0.0, 0.0), points[loop[k - 1]], points[loop[k]]) for k in range(len(loop)))
+
+def _tessellate(polylines, operation):
+	"""Triangles (index triplets into the points of all polylines) filling polylines, polylines inside others are holes."""
+
+	polylines = [_points(polyline, 3, operation) for polyline in polylines]
+	loops, start = [], 0
+	for polyline in polylines:
+		loops.append(list(range(start, start + len(polyline))))
+		start += len(polyline)
+	co = [point for polyline in polylines for point in polyline]
+	# Project on the plane facing the normal of the largest polyline
+	normal = max((_newell(polyline) for polyline in polylines if len(polyline) >= 3), key=lambda n: n[0] * n[0] + n[1] * n[1] + n[2] * n[2], default=None)
+	if normal is None:
+		return []
+	axis = max(range(3), key=lambda axis: abs(normal[axis]))
+	u, v = (axis + 1) % 3, (axis + 2) % 3
+	if normal[axis] < 0.0:
+		u, v = v, u
+	points = [(point[u], point[v]) for point in co]
+
+	loops = [loop for loop in loops if len(loop) >= 3 and _area_2d(points, loop)]
+	areas = [abs(_area_2d(points, loop)) for loop in loops]
+
+	def contains(outer, inner):
+		x, y = points[inner[0]]
+		crossings = False
+		for k in range(len(outer)):
+			ax, ay = points[outer[k - 1]]
+			bx, by = points[outer[k]]
+			if (ay > y) != (by > y) and x < ax + (y - ay) * (bx - ax) / (by - ay):
+				crossings = not crossings
+		return crossings
+
+	# Loops nested an odd number of times are holes of the smallest loop around them
+	parents = [[other for other in range(len(loops)) if other != index and contains(loops[other], loops[index])] for index in range(len(loops))]
+	holes = {index: [] for index in range(len(loops)) if len(parents[index]) % 2 == 0}
+	for index, around in enumerate(parents):
+		if len(around) % 2:
+			owner = min((other for other in around if other in holes), key=lambda other: areas[other], default=None)
+			if owner is not None:
+				holes[owner].append(index)
+
+	triangles = []
+	for index, inner in holes.items():
+		outer = loops[index]
+		flipped = _area_2d(points, outer) < 0.0
+		if flipped:
+			outer = outer[::-1]
+		bridged = _bridge(points, outer, [loops[hole] if _area_2d(points, loops[hole]) < 0.0 else loops[hole][::-1] for hole in inner])
+		# Keep the winding of the outer polyline
+		triangles.extend((a, c, b) if flipped else (a, b, c) for a, b, c in _ear_clip(points, bridged))
+	return triangles
+
+def tessellate_polygon(veclist_list):
+	"""Takes a list of polylines (each point a vector) and returns the point indices for a polyline filled with triangles.
+
+	Polylines inside another polyline are holes in it.
+
+	Parameters:
+	veclist_list – list of polylines, VectorArrays or numpy arrays of shape (n, 3) also work
+
+	Return type: list"""
+
+	return _tessellate(veclist_list, "tessellate_polygon()")
+
+def tessellate_polygon_many(veclist_lists):
+	"""Tessellates many lists of polylines in one call, see tessellate_polygon.
+
+	Parameters:
+	veclist_lists – list of lists of polylines
+
+	Returns: the triangles of every list of polylines
+
+	Return type: list of lists"""
+
+	return [_tessellate(veclist_list, "tessellate_polygon_many()") for veclist_list in veclist_lists]
+
+def volume_tetrahedron(v1, v2, v3, v4):
+	"""Return the volume formed by a tetrahedron (points can be in any order).
+
+	Parameters:
+	v1 (mathutils.Vector) – Point1
+	v2 (mathutils.Vector) – Point2
+	v3 (mathutils.Vector) – Point3
+	v4 (mathutils.Vector) – Point4
+
+	Return type: float"""
+
+	a, b, c, d = (Vector(_co(v, 3, "volume_tetrahedron()")) for v in (v1, v2, v3, v4))
+	return abs((b - a).dot((c - a).cross(d - a))) / 6.0
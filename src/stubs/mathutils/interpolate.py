@@ -0,0 +1,403 @@
+"""Interpolation Utilities (mathutils.interpolate)
+
+The Blender interpolate module
+
+BezierSpline and CatmullRomSpline turn control points into cubic segments
+once: the coefficients of every segment and a table of the arc length along
+the curve are computed at creation, so evaluating a point, by parameter or
+by distance along the curve, is a polynomial and a binary search. The *_many
+functions and methods evaluate whole arrays in one call, on numpy arrays
+when numpy is installed."""
+
+import bisect
+import math
+
+from . import _vector
+from .arrays import VectorArray, numpy
+
+_EPSILON = 1e-5
+
+# Gauss-Legendre nodes and weights on [0, 1], for the arc length of the segments
+_GAUSS = ((0.5 - 0.5 * math.sqrt(0.6), 5.0 / 18.0), (0.5, 8.0 / 18.0), (0.5 + 0.5 * math.sqrt(0.6), 5.0 / 18.0))
+
+def _co(value):
+	co = [float(component) for component in value]
+	if not 2 <= len(co) <= 3:
+		raise ValueError("poly_3d_calc: expected 2D or 3D vectors, not %dD" % len(co))
+	return co + [0.0] * (3 - len(co))
+
+def _half_tan(a, b, length_a, length_b):
+	"""tan of half the angle between a and b, 0 when they are parallel."""
+
+	cx = a[1] * b[2] - a[2] * b[1]
+	cy = a[2] * b[0] - a[0] * b[2]
+	cz = a[0] * b[1] - a[1] * b[0]
+	area = math.sqrt(cx * cx + cy * cy + cz * cz)
+	if area == 0.0:
+		return 0.0
+	result = (length_a * length_b - (a[0] * b[0] + a[1] * b[1] + a[2] * b[2])) / area
+	return result if math.isfinite(result) else 0.0
+
+def _segment_distance_squared(p, a, b):
+	ab = [b[axis] - a[axis] for axis in range(3)]
+	ap = [p[axis] - a[axis] for axis in range(3)]
+	length = ab[0] * ab[0] + ab[1] * ab[1] + ab[2] * ab[2]
+	t = 0.0 if length == 0.0 else min(max((ap[0] * ab[0] + ap[1] * ab[1] + ap[2] * ab[2]) / length, 0.0), 1.0)
+	return sum((ap[axis] - ab[axis] * t) ** 2 for axis in range(3))
+
+def _weights(vertices, co):
+	"""The mean value coordinates of co, linear along the edges it lies on."""
+
+	count = len(vertices)
+	directions = [[v[axis] - co[axis] for axis in range(3)] for v in vertices]
+	lengths = [math.sqrt(d[0] * d[0] + d[1] * d[1] + d[2] * d[2]) for d in directions]
+	# The mean value coordinates are unstable next to the border, interpolate linearly there
+	for i in range(count):
+		j = (i + 1) % count
+		if lengths[i] < _EPSILON:
+			weights = [0.0] * count
+			weights[i] = 1.0
+			return weights
+		if _segment_distance_squared(co, vertices[i], vertices[j]) < _EPSILON * _EPSILON:
+			weights = [0.0] * count
+			total = lengths[i] + lengths[j]
+			weights[i], weights[j] = lengths[j] / total, lengths[i] / total
+			return weights
+	tangents = [_half_tan(directions[i], directions[(i + 1) % count], lengths[i], lengths[(i + 1) % count]) for i in range(count)]
+	weights = [(tangents[i - 1] + tangents[i]) / lengths[i] for i in range(count)]
+	total = sum(weights)
+	return [weight / total for weight in weights] if total != 0.0 else weights
+
+def poly_3d_calc(veclist, pt):
+	"""Calculate barycentric weights for a point on a polygon.
+
+	Parameters:
+	veclist – list of vectors
+	pt – point :rtype: list of per-vector weights"""
+
+	vertices = [_co(v) for v in veclist]
+	if len(vertices) < 3:
+		raise ValueError("poly_3d_calc: expected at least 3 vectors")
+	return _weights(vertices, _co(pt))
+
+def poly_3d_calc_many(veclist, pts):
+	"""Calculate the barycentric weights of many points on one polygon, see poly_3d_calc.
+
+	Parameters:
+	veclist (sequence of mathutils.Vector) - The vertices of the polygon.
+	pts (VectorArray, numpy array of shape (n, 3) or sequence of mathutils.Vector) - The points.
+
+	Returns: The weights, one row of one weight per vertex for every point.
+
+	Return type: numpy array of shape (n, len(veclist)) when numpy is installed, else list of lists of float"""
+
+	vertices = [_co(v) for v in veclist]
+	if len(vertices) < 3:
+		raise ValueError("poly_3d_calc_many: expected at least 3 vectors")
+	if isinstance(pts, VectorArray):
+		pts = pts.buffer.tolist() if numpy is not None else [pts.buffer[start:start + pts.size].tolist() for start in range(0, len(pts.buffer), pts.size)]
+	elif hasattr(pts, "tolist"):
+		pts = pts.tolist()
+	points = [_co(point) for point in pts]
+	if numpy is None:
+		return [_weights(vertices, co) for co in points]
+	count = len(vertices)
+	result = numpy.zeros((len(points), count))
+	if not points:
+		return result
+	co = numpy.array(points)
+	polygon = numpy.array(vertices)
+	directions = polygon[None] - co[:, None]
+	lengths = numpy.linalg.norm(directions, axis=2)
+	# Distances to the edges i, i + 1
+	edges = numpy.roll(polygon, -1, axis=0) - polygon
+	edge_lengths = numpy.einsum("ij,ij->i", edges, edges)
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		t = numpy.clip(numpy.einsum("pij,ij->pi", -directions, edges) / edge_lengths, 0.0, 1.0)
+	t = numpy.where(edge_lengths > 0.0, t, 0.0)
+	edge_distances = numpy.sum((-directions - edges[None] * t[..., None]) ** 2, axis=2)
+	on_vertex = lengths < _EPSILON
+	on_edge = edge_distances < _EPSILON * _EPSILON
+	border = on_vertex | on_edge
+	first = numpy.argmax(border, axis=1)
+	rows = numpy.arange(len(points))
+	# The first vertex or edge in polygon order wins, as with one point
+	vertex = border.any(axis=1) & on_vertex[rows, first]
+	edge = border.any(axis=1) & ~on_vertex[rows, first]
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		following = numpy.roll(directions, -1, axis=1)
+		following_lengths = numpy.roll(lengths, -1, axis=1)
+		area = numpy.linalg.norm(numpy.cross(directions, following), axis=2)
+		dot = numpy.sum(directions * following, axis=2)
+		tangents = (lengths * following_lengths - dot) / area
+		tangents = numpy.where((area != 0.0) & numpy.isfinite(tangents), tangents, 0.0)
+		weights = (numpy.roll(tangents, 1, axis=1) + tangents) / lengths
+		total = weights.sum(axis=1)
+		weights = numpy.where((total != 0.0)[:, None], weights / total[:, None], weights)
+	inside = ~border.any(axis=1)
+	result[inside] = weights[inside]
+	result[rows[vertex], first[vertex]] = 1.0
+	edge_rows, i = rows[edge], first[edge]
+	j = (i + 1) % count
+	length_i, length_j = lengths[edge_rows, i], lengths[edge_rows, j]
+	result[edge_rows, i] = length_j / (length_i + length_j)
+	result[edge_rows, j] = length_i / (length_i + length_j)
+	return result
+
+def _control_points(points, operation):
+	"""The control points as lists of floats of the same size, 2D or 3D."""
+
+	if isinstance(points, VectorArray):
+		data, size = points.buffer, points.size
+		points = data.tolist() if numpy is not None else [data[start:start + size].tolist() for start in range(0, len(data), size)]
+	elif hasattr(points, "tolist"):
+		points = points.tolist()
+	points = [[float(value) for value in point] for point in points]
+	size = max((len(point) for point in points), default=3)
+	if not 2 <= size <= 3:
+		raise ValueError("%s: expected 2D or 3D points" % operation)
+	return [point + [0.0] * (size - len(point)) for point in points], size
+
+def _parameters(values):
+	"""Many floats, a numpy array when numpy is installed."""
+
+	if hasattr(values, "tolist"):
+		values = values.tolist()
+	values = [float(value) for value in values]
+	return numpy.array(values) if numpy is not None else values
+
+class _Spline:
+	"""A curve of cubic segments, each one stored as the coefficients a, b, c, d of a + b f + c f² + d f³.
+
+	The parameter t runs from 0 to 1 along the curve, each segment over an
+	equal part of it. The arc length is tabulated at samples points per
+	segment, distances are turned into parameters by interpolating the table."""
+
+	__slots__ = ("_size", "_segments", "_samples", "_lengths", "_arrays")
+
+	def __init__(self, segments, size, samples):
+		if not segments:
+			raise ValueError("%s: expected at least 2 points" % type(self).__name__)
+		if samples < 1:
+			raise ValueError("%s: samples must be positive" % type(self).__name__)
+		self._size = size
+		self._segments = segments
+		self._samples = samples
+		lengths = [0.0]
+		for a, b, c, d in segments:
+			for sample in range(samples):
+				start = sample / samples
+				length = 0.0
+				for node, weight in _GAUSS:
+					f = start + node / samples
+					speed = math.sqrt(sum((b[axis] + f * (2.0 * c[axis] + 3.0 * f * d[axis])) ** 2 for axis in range(size)))
+					length += weight * speed
+				lengths.append(lengths[-1] + length / samples)
+		self._lengths = lengths
+		self._arrays = None
+		if numpy is not None:
+			coefficients = numpy.array(segments)
+			table = numpy.array(lengths)
+			self._arrays = (coefficients, table, numpy.arange(len(lengths)) / (samples * len(segments)))
+
+	def __len__(self):
+		return len(self._segments)
+
+	@property
+	def length(self):
+		"""The length of the curve.
+
+		Type: float"""
+
+		return self._lengths[-1]
+
+	def _locate(self, t):
+		"""The segment and the parameter inside it of the curve parameter t."""
+
+		count = len(self._segments)
+		u = min(max(t, 0.0), 1.0) * count
+		segment = min(int(u), count - 1)
+		return self._segments[segment], u - segment
+
+	def parameter(self, distance):
+		"""Returns the parameter of the point at a distance along the curve, from the start.
+
+		Parameters:
+		distance (float) - The distance along the curve, clamped to 0 and the length of the curve.
+
+		Returns: The parameter, from 0 to 1.
+
+		Return type: float"""
+
+		lengths = self._lengths
+		distance = min(max(float(distance), 0.0), lengths[-1])
+		sample = min(bisect.bisect_right(lengths, distance), len(lengths) - 1) - 1
+		span = lengths[sample + 1] - lengths[sample]
+		fraction = (distance - lengths[sample]) / span if span > 0.0 else 0.0
+		return (sample + fraction) / (len(lengths) - 1)
+
+	def evaluate(self, t):
+		"""Returns the point of the curve at a parameter.
+
+		Parameters:
+		t (float) - The parameter, from 0 at the start of the curve to 1 at its end.
+
+		Returns: The point.
+
+		Return type: mathutils.Vector"""
+
+		(a, b, c, d), f = self._locate(float(t))
+		return _vector([a[axis] + f * (b[axis] + f * (c[axis] + f * d[axis])) for axis in range(self._size)])
+
+	def evaluate_distance(self, distance):
+		"""Returns the point at a distance along the curve, from the start.
+
+		Parameters:
+		distance (float) - The distance along the curve, clamped to 0 and the length of the curve.
+
+		Returns: The point.
+
+		Return type: mathutils.Vector"""
+
+		return self.evaluate(self.parameter(distance))
+
+	def tangent(self, t):
+		"""Returns the direction of the curve at a parameter.
+
+		Parameters:
+		t (float) - The parameter, from 0 at the start of the curve to 1 at its end.
+
+		Returns: The normalized direction, a zero vector where the curve stops.
+
+		Return type: mathutils.Vector"""
+
+		(a, b, c, d), f = self._locate(float(t))
+		direction = [b[axis] + f * (2.0 * c[axis] + 3.0 * f * d[axis]) for axis in range(self._size)]
+		length = math.sqrt(sum(value * value for value in direction))
+		return _vector([value / length for value in direction] if length > 0.0 else direction)
+
+	def _evaluate_many(self, t, derivative):
+		coefficients = self._arrays[0]
+		count = len(coefficients)
+		u = numpy.clip(t, 0.0, 1.0) * count
+		segment = numpy.minimum(u.astype(numpy.int64), count - 1)
+		f = (u - segment)[:, None]
+		a, b, c, d = (coefficients[segment, index] for index in range(4))
+		if not derivative:
+			return a + f * (b + f * (c + f * d))
+		direction = b + f * (2.0 * c + 3.0 * f * d)
+		length = numpy.linalg.norm(direction, axis=1)[:, None]
+		return numpy.divide(direction, length, out=direction, where=length > 0.0)
+
+	def parameter_many(self, distances):
+		"""Returns the parameters of the points at many distances along the curve, see parameter.
+
+		Parameters:
+		distances (sequence of float or numpy array) - The distances along the curve.
+
+		Returns: The parameters, from 0 to 1.
+
+		Return type: numpy array when numpy is installed, else list of float"""
+
+		distances = _parameters(distances)
+		if numpy is None:
+			return [self.parameter(distance) for distance in distances]
+		_, lengths, parameters = self._arrays
+		return numpy.interp(distances, lengths, parameters)
+
+	def evaluate_many(self, parameters):
+		"""Returns the points of the curve at many parameters, see evaluate.
+
+		Parameters:
+		parameters (sequence of float or numpy array) - The parameters, from 0 to 1.
+
+		Returns: The points.
+
+		Return type: VectorArray"""
+
+		t = _parameters(parameters)
+		if numpy is None:
+			return VectorArray([self.evaluate(value) for value in t], self._size)
+		return VectorArray._make(self._evaluate_many(t, False).astype(numpy.float32), self._size)
+
+	def evaluate_distance_many(self, distances):
+		"""Returns the points at many distances along the curve, see evaluate_distance.
+
+		Parameters:
+		distances (sequence of float or numpy array) - The distances along the curve.
+
+		Returns: The points.
+
+		Return type: VectorArray"""
+
+		return self.evaluate_many(self.parameter_many(distances))
+
+	def tangent_many(self, parameters):
+		"""Returns the directions of the curve at many parameters, see tangent.
+
+		Parameters:
+		parameters (sequence of float or numpy array) - The parameters, from 0 to 1.
+
+		Returns: The normalized directions.
+
+		Return type: VectorArray"""
+
+		t = _parameters(parameters)
+		if numpy is None:
+			return VectorArray([self.tangent(value) for value in t], self._size)
+		return VectorArray._make(self._evaluate_many(t, True).astype(numpy.float32), self._size)
+
+class BezierSpline(_Spline):
+	"""BezierSpline(points, samples=32) -> A chain of cubic Bezier segments.
+
+	Parameters:
+	points (sequence of mathutils.Vector, VectorArray or numpy array) - knot, right handle, left handle of the next knot, next knot... 3 n + 1 points for n segments.
+	samples (int) - The arc length samples per segment (optional)."""
+
+	__slots__ = ()
+
+	def __init__(self, points, samples=32):
+		points, size = _control_points(points, "BezierSpline")
+		if len(points) < 4 or (len(points) - 1) % 3:
+			raise ValueError("BezierSpline: expected 3 n + 1 points")
+		segments = []
+		for start in range(0, len(points) - 1, 3):
+			p0, p1, p2, p3 = points[start:start + 4]
+			segments.append((
+				p0,
+				[3.0 * (p1[axis] - p0[axis]) for axis in range(size)],
+				[3.0 * (p0[axis] - 2.0 * p1[axis] + p2[axis]) for axis in range(size)],
+				[p3[axis] - p0[axis] + 3.0 * (p1[axis] - p2[axis]) for axis in range(size)],
+			))
+		super().__init__(segments, size, samples)
+
+class CatmullRomSpline(_Spline):
+	"""CatmullRomSpline(points, cyclic=False, samples=32) -> A uniform Catmull-Rom spline through points.
+
+	Parameters:
+	points (sequence of mathutils.Vector, VectorArray or numpy array) - The points the curve passes through.
+	cyclic (boolean) - Close the curve, from the last point back to the first (optional).
+	samples (int) - The arc length samples per segment (optional)."""
+
+	__slots__ = ()
+
+	def __init__(self, points, cyclic=False, samples=32):
+		points, size = _control_points(points, "CatmullRomSpline")
+		if len(points) < 2:
+			raise ValueError("CatmullRomSpline: expected at least 2 points")
+		count = len(points)
+		if cyclic:
+			extended = [points[-1]] + points + points[:2]
+		else:
+			# The end tangents follow the end segments
+			extended = [[2.0 * a - b for a, b in zip(points[0], points[1])]] + points + [[2.0 * a - b for a, b in zip(points[-1], points[-2])]]
+		segments = []
+		for start in range(count if cyclic else count - 1):
+			p0, p1, p2, p3 = extended[start:start + 4]
+			segments.append((
+				p1,
+				[0.5 * (p2[axis] - p0[axis]) for axis in range(size)],
+				[p0[axis] - 2.5 * p1[axis] + 2.0 * p2[axis] - 0.5 * p3[axis] for axis in range(size)],
+				[0.5 * (p3[axis] - p0[axis]) + 1.5 * (p1[axis] - p2[axis]) for axis in range(size)],
+			))
+		super().__init__(segments, size, samples)
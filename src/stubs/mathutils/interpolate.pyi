@@ -1,12 +0,0 @@
-"""Interpolation Utilities (mathutils.interpolate)
-
-The Blender interpolate module"""
-
-def poly_3d_calc(veclist, pt):
-	"""Calculate barycentric weights for a point on a polygon.
-
-	Parameters:	
-	veclist – list of vectors
-	pt – point :rtype: list of per-vector weights"""
-
-	pass
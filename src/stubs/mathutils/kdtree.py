@@ -0,0 +1,324 @@
+"""KDTree Utilities (mathutils.kdtree)
+
+Generic 3-dimentional kd-tree to perform spatial searches.
+
+The tree has no node objects: balancing reorders the points so that every
+subtree is a contiguous range of one flat coordinate list, its root at the
+middle of the range, with the split axis kept per node. Queries walk the
+ranges without recursion. The batched find_*_many methods run many queries
+in one call, KDTree.FromPoints builds a balanced tree from a point buffer."""
+
+import heapq
+import math
+
+from . import _vector
+from .arrays import _flat_points
+
+_INFINITY = float("inf")
+
+def _point(co):
+	co = [float(value) for value in co]
+	if len(co) != 3:
+		raise ValueError("KDTree: expected a 3D coordinate, not %dD" % len(co))
+	return co
+
+class KDTree:
+	"""KdTree(size) -> new kd-tree initialized to hold size items.
+
+	Note: KDTree.balance must have been called before using any of the find methods."""
+
+	__slots__ = ("_size", "_co", "_index", "_axis", "_balanced")
+
+	def __init__(self, size):
+		if size < 0:
+			raise ValueError("KDTree(size): size must be positive or zero")
+		self._size = size
+		# x, y, z of every point, in tree order once balanced
+		self._co = []
+		self._index = []
+		# Split axis of the node at the same position
+		self._axis = []
+		self._balanced = False
+
+	@classmethod
+	def FromPoints(cls, points, indices=None):
+		"""Create a balanced tree from many points at once.
+
+		Parameters:
+		points (sequence of 3D vectors, VectorArray or numpy array of shape (n, 3)) - The points.
+		indices (sequence of int) - The index of every point, their position in points when omitted (optional).
+
+		Returns: A balanced tree, ready for the find methods.
+
+		Return type: KDTree"""
+
+		co = _flat_points(points, "KDTree.FromPoints()")
+		count = len(co) // 3
+		if indices is None:
+			indices = list(range(count))
+		else:
+			indices = [int(index) for index in indices]
+			if len(indices) != count:
+				raise ValueError("KDTree.FromPoints(): one index per point expected")
+		tree = cls(count)
+		tree._co = co
+		tree._index = indices
+		tree.balance()
+		return tree
+
+	def __len__(self):
+		return len(self._index)
+
+	def insert(self, co, index):
+		"""Insert a point into the KDTree.
+
+		Parameters:
+		co (float triplet) – 3d coordinates.
+		index (int) – Object Index.
+		"""
+
+		if index < 0:
+			raise ValueError("KDTree.insert(): negative index given")
+		if len(self._index) >= self._size:
+			raise ValueError("KDTree.insert(): size exceeded")
+		self._co.extend(_point(co))
+		self._index.append(index)
+		self._balanced = False
+
+	def balance(self):
+		"""Balance the tree.
+
+		Note: This builds the entire tree, avoid calling after each insertion."""
+
+		co, index = self._co, self._index
+		points = [(co[i * 3], co[i * 3 + 1], co[i * 3 + 2], index[i]) for i in range(len(index))]
+		axes = [0] * len(points)
+		ranges = [(0, len(points))]
+		while ranges:
+			lo, hi = ranges.pop()
+			if hi - lo < 2:
+				continue
+			# Split along the widest extent of the range
+			part = points[lo:hi]
+			spreads = [max(p[axis] for p in part) - min(p[axis] for p in part) for axis in range(3)]
+			axis = spreads.index(max(spreads))
+			part.sort(key=lambda p: p[axis])
+			points[lo:hi] = part
+			mid = (lo + hi) >> 1
+			axes[mid] = axis
+			ranges.append((lo, mid))
+			ranges.append((mid + 1, hi))
+		self._co = [value for p in points for value in p[:3]]
+		self._index = [p[3] for p in points]
+		self._axis = axes
+		self._balanced = True
+
+	def _check(self, name):
+		if not self._balanced:
+			raise RuntimeError("KDTree.%s(): must call balance() first" % name)
+
+	def _nearest(self, x, y, z, filter):
+		"""Tree position and squared distance of the point nearest to (x, y, z), -1 when there is none."""
+
+		co, axes, ids = self._co, self._axis, self._index
+		query = (x, y, z)
+		best, found = _INFINITY, -1
+		stack = [(0, len(ids), 0.0)]
+		while stack:
+			lo, hi, bound = stack.pop()
+			if bound >= best:
+				continue
+			while lo < hi:
+				mid = (lo + hi) >> 1
+				base = mid * 3
+				dx, dy, dz = co[base] - x, co[base + 1] - y, co[base + 2] - z
+				distance = dx * dx + dy * dy + dz * dz
+				if distance < best and (filter is None or filter(ids[mid])):
+					best, found = distance, mid
+				axis = axes[mid]
+				offset = query[axis] - co[base + axis]
+				if offset < 0.0:
+					far, lo, hi = (mid + 1, hi), lo, mid
+				else:
+					far, lo = (lo, mid), mid + 1
+				if offset * offset < best:
+					stack.append((far[0], far[1], offset * offset))
+		return found, best
+
+	def _nearest_n(self, x, y, z, n):
+		"""(squared distance, tree position) of the n points nearest to (x, y, z), nearest first."""
+
+		co, axes = self._co, self._axis
+		query = (x, y, z)
+		# Max-heap of the n best so far, by negated distance
+		heap = []
+		stack = [(0, len(self._index), 0.0)]
+		while stack:
+			lo, hi, bound = stack.pop()
+			if len(heap) == n and bound >= -heap[0][0]:
+				continue
+			while lo < hi:
+				mid = (lo + hi) >> 1
+				base = mid * 3
+				dx, dy, dz = co[base] - x, co[base + 1] - y, co[base + 2] - z
+				distance = dx * dx + dy * dy + dz * dz
+				if len(heap) < n:
+					heapq.heappush(heap, (-distance, mid))
+				elif distance < -heap[0][0]:
+					heapq.heapreplace(heap, (-distance, mid))
+				axis = axes[mid]
+				offset = query[axis] - co[base + axis]
+				if offset < 0.0:
+					far, lo, hi = (mid + 1, hi), lo, mid
+				else:
+					far, lo = (lo, mid), mid + 1
+				if len(heap) < n or offset * offset < -heap[0][0]:
+					stack.append((far[0], far[1], offset * offset))
+		return sorted((-distance, position) for distance, position in heap)
+
+	def _in_range(self, x, y, z, radius):
+		"""(squared distance, tree position) of the points within radius of (x, y, z), nearest first."""
+
+		co, axes = self._co, self._axis
+		query = (x, y, z)
+		limit = radius * radius
+		found = []
+		ranges = [(0, len(self._index))]
+		while ranges:
+			lo, hi = ranges.pop()
+			while lo < hi:
+				mid = (lo + hi) >> 1
+				base = mid * 3
+				dx, dy, dz = co[base] - x, co[base + 1] - y, co[base + 2] - z
+				distance = dx * dx + dy * dy + dz * dz
+				if distance <= limit:
+					found.append((distance, mid))
+				axis = axes[mid]
+				offset = query[axis] - co[base + axis]
+				if offset < 0.0:
+					far, lo, hi = (mid + 1, hi), lo, mid
+				else:
+					far, lo = (lo, mid), mid + 1
+				if offset * offset <= limit:
+					ranges.append(far)
+		found.sort()
+		return found
+
+	def _result(self, position, distance):
+		"""(Vector, index, distance) of the point at a tree position.
+
+		Return type: tuple"""
+
+		co = self._co
+		base = position * 3
+		return _vector(co[base:base + 3]), self._index[position], math.sqrt(distance)
+
+	def find(self, co, filter=None):
+		"""Find nearest point to co.
+
+		Parameters:
+		co (float triplet) – 3d coordinates.
+		filter (callable) – function which takes an index and returns True for indices to include in the search.
+
+		Returns: Returns (Vector, index, distance), (None, None, None) when no point is found.
+
+		Return type: tuple"""
+
+		self._check("find")
+		position, distance = self._nearest(*_point(co), filter)
+		if position < 0:
+			return None, None, None
+		return self._result(position, distance)
+
+	def find_n(self, co, n):
+		"""Find nearest n points to co.
+
+		Parameters:
+		co (float triplet) – 3d coordinates.
+		n (int) – Number of points to find.
+
+		Returns: Returns a list of tuples (Vector, index, distance), nearest first.
+
+		Return type: list"""
+
+		self._check("find_n")
+		if n < 0:
+			raise ValueError("KDTree.find_n(): negative number of points")
+		if not n:
+			return []
+		return [self._result(position, distance) for distance, position in self._nearest_n(*_point(co), n)]
+
+	def find_range(self, co, radius):
+		"""Find all points within radius of co.
+
+		Parameters:
+		co (float triplet) – 3d coordinates.
+		radius (float) – Distance to search for points.
+
+		Returns: Returns a list of tuples (Vector, index, distance), nearest first.
+
+		Return type: list"""
+
+		self._check("find_range")
+		if radius < 0.0:
+			raise ValueError("KDTree.find_range(): negative radius given")
+		return [self._result(position, distance) for distance, position in self._in_range(*_point(co), radius)]
+
+	def find_many(self, cos, filter=None):
+		"""Find the nearest point to each of many coordinates, in one call.
+
+		Parameters:
+		cos (sequence of 3D vectors, VectorArray or numpy array of shape (n, 3)) - The query coordinates.
+		filter (callable) – function which takes an index and returns True for indices to include in the search.
+
+		Returns: One (Vector, index, distance) tuple per coordinate, (None, None, None) when no point is found.
+
+		Return type: list"""
+
+		self._check("find_many")
+		query = _flat_points(cos, "KDTree.find_many()")
+		results = []
+		for base in range(0, len(query), 3):
+			position, distance = self._nearest(query[base], query[base + 1], query[base + 2], filter)
+			results.append(self._result(position, distance) if position >= 0 else (None, None, None))
+		return results
+
+	def find_n_many(self, cos, n):
+		"""Find the nearest n points to each of many coordinates, in one call.
+
+		Parameters:
+		cos (sequence of 3D vectors, VectorArray or numpy array of shape (n, 3)) - The query coordinates.
+		n (int) – Number of points to find for each coordinate.
+
+		Returns: One list of (Vector, index, distance) tuples per coordinate, nearest first.
+
+		Return type: list"""
+
+		self._check("find_n_many")
+		if n < 0:
+			raise ValueError("KDTree.find_n_many(): negative number of points")
+		query = _flat_points(cos, "KDTree.find_n_many()")
+		return [
+			[self._result(position, distance) for distance, position in self._nearest_n(query[base], query[base + 1], query[base + 2], n)] if n else []
+			for base in range(0, len(query), 3)
+		]
+
+	def find_range_many(self, cos, radius):
+		"""Find the points within radius of each of many coordinates, in one call.
+
+		Parameters:
+		cos (sequence of 3D vectors, VectorArray or numpy array of shape (n, 3)) - The query coordinates.
+		radius (float) – Distance to search for points.
+
+		Returns: One list of (Vector, index, distance) tuples per coordinate, nearest first.
+
+		Return type: list"""
+
+		self._check("find_range_many")
+		if radius < 0.0:
+			raise ValueError("KDTree.find_range_many(): negative radius given")
+		query = _flat_points(cos, "KDTree.find_range_many()")
+		return [
+			[self._result(position, distance) for distance, position in self._in_range(query[base], query[base + 1], query[base + 2], radius)]
+			for base in range(0, len(query), 3)
+		]
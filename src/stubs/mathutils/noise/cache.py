@@ -0,0 +1,230 @@
+"""Tiled noise cache (mathutils.noise.cache)
+
+Streamed terrain evaluates the same noise again and again: neighbour chunks
+share their border samples and revisited chunks repeat all of them.
+TileCache evaluates the noise functions by square tiles of samples of one
+lattice and keeps the most recently used tiles, keyed by the function, its
+arguments, the noise seed and the tile coordinate. Chunks are assembled from
+the tiles with region. Tiles evicted from memory can spill to a memory
+mapped file, from where they come back without being evaluated again."""
+
+import inspect
+import mmap
+import tempfile
+import typing
+from array import array
+from collections import OrderedDict
+
+from .. import noise as _noise
+from ..arrays import numpy
+
+# The functions giving one value per position, tiles of the vector functions are not cached
+_FUNCTIONS = frozenset((
+    "cell",
+    "fractal",
+    "hetero_terrain",
+    "hybrid_multi_fractal",
+    "multi_fractal",
+    "noise",
+    "ridged_multi_fractal",
+    "turbulence",
+    "variable_lacunarity",
+))
+
+_ITEM_BYTES = array("d").itemsize
+# Function name: signature of the function, arguments are bound to it to make the tile keys
+_SIGNATURES = {}
+
+
+class TileCache:
+    '''A cache of noise values by tiles of tile_size x tile_size samples.
+
+    The sample (column, row) of the lattice is at origin + (column * step[0], row * step[1], 0),
+    the tile (x, y) holds the columns x * tile_size to (x + 1) * tile_size - 1 and the rows alike.
+
+    :param tile_size: The number of samples along each side of a tile.
+    :type tile_size: int
+    :param step: The distance between neighbour samples along x and y.
+    :param origin: The position of the sample (0, 0).
+    :type origin: 'mathutils.Vector'
+    :param max_bytes: The memory held by the tiles in memory, the least recently used tiles are evicted beyond it.
+    :type max_bytes: int
+    :param spill: Where evicted tiles are kept: None to drop them, True for a temporary file or the path of a file.
+    :param spill_bytes: The size of the spill file, the least recently spilled tiles are dropped beyond it.
+    :type spill_bytes: int
+    '''
+
+    def __init__(self,
+                 tile_size: int = 64,
+                 step=(1.0, 1.0),
+                 origin=(0.0, 0.0, 0.0),
+                 max_bytes: int = 64 << 20,
+                 spill=None,
+                 spill_bytes: int = 256 << 20):
+        if tile_size < 1:
+            raise ValueError("TileCache(): tile_size must be positive")
+        self.tile_size = int(tile_size)
+        self.step = tuple(float(value) for value in step)[:2]
+        self.origin = (tuple(float(value) for value in origin) + (0.0,))[:3]
+        self._tile_bytes = self.tile_size * self.tile_size * _ITEM_BYTES
+        self._capacity = max(1, max_bytes // self._tile_bytes)
+        # Tile key: tile values, least recently used first
+        self._tiles = OrderedDict()
+        # Tile key: slot of the spill file, least recently spilled first
+        self._slots = OrderedDict()
+        self._free = []
+        self._file = self._map = None
+        if spill:
+            count = spill_bytes // self._tile_bytes
+            if count < 1:
+                raise ValueError("TileCache(): spill_bytes is smaller than a tile")
+            self._file = tempfile.TemporaryFile() if spill is True else open(spill, "w+b")
+            self._file.truncate(count * self._tile_bytes)
+            self._map = mmap.mmap(self._file.fileno(), count * self._tile_bytes)
+            self._free = list(range(count - 1, -1, -1))
+        self.hits = 0
+        self.spill_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._tiles) + len(self._slots)
+
+    def _key(self, function, coordinate, arguments, keywords):
+        name = function if isinstance(function, str) else getattr(function, "__name__", None)
+        if name not in _FUNCTIONS:
+            raise ValueError("TileCache: expected a mathutils.noise function giving values, not %r" % (function,))
+        signature = _SIGNATURES.get(name)
+        if signature is None:
+            signature = _SIGNATURES[name] = inspect.signature(getattr(_noise, name))
+        # The same call spelled with keywords or with its defaults left out shares the tiles
+        bound = signature.bind(None, *arguments, **keywords)
+        bound.apply_defaults()
+        x, y = (int(value) for value in coordinate)
+        return name, bound.args[1:], tuple(sorted(bound.kwargs.items())), _noise._seed, x, y
+
+    def _evaluate(self, key):
+        name, arguments, keywords, _, x, y = key
+        size = self.tile_size
+        (sx, sy), (ox, oy, oz) = self.step, self.origin
+        positions = _noise.grid((size, size), origin=(ox + x * size * sx, oy + y * size * sy, oz), step=(sx, sy, 1.0))
+        values = getattr(_noise, name + "_many")(positions, *arguments, **dict(keywords))
+        if numpy is not None:
+            values.flags.writeable = False
+        return values
+
+    def _unspill(self, slot):
+        start = slot * self._tile_bytes
+        if numpy is not None:
+            size = self.tile_size
+            values = numpy.frombuffer(self._map, numpy.float64, size * size, start).reshape(size, size).copy()
+            values.flags.writeable = False
+            return values
+        values = array("d")
+        values.frombytes(self._map[start:start + self._tile_bytes])
+        return values
+
+    def _evict(self):
+        key, values = self._tiles.popitem(last=False)
+        self.evictions += 1
+        if self._map is None:
+            return
+        if not self._free:
+            self._free.append(self._slots.popitem(last=False)[1])
+        slot = self._free.pop()
+        start = slot * self._tile_bytes
+        self._map[start:start + self._tile_bytes] = values.tobytes()
+        self._slots[key] = slot
+
+    def tile(self, function, coordinate, *arguments, **keywords) -> typing.Any:
+        '''Returns the values of a tile, from the cache when it holds them.
+
+        :param function: The noise function, such as mathutils.noise.fractal, or its name.
+        :param coordinate: The (x, y) coordinate of the tile.
+        :param arguments: The arguments of function after the position.
+        :return:  The values, a read only numpy array of shape (tile_size, tile_size) indexed by [row, column] when numpy is available, else an array.array of the rows one after the other, not to be modified.
+        '''
+
+        key = self._key(function, coordinate, arguments, keywords)
+        tiles = self._tiles
+        values = tiles.get(key)
+        if values is not None:
+            self.hits += 1
+            tiles.move_to_end(key)
+            return values
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self.spill_hits += 1
+            values = self._unspill(slot)
+            self._free.append(slot)
+        else:
+            self.misses += 1
+            values = self._evaluate(key)
+        if len(tiles) >= self._capacity:
+            self._evict()
+        tiles[key] = values
+        return values
+
+    def region(self, function, start, shape, *arguments, **keywords) -> typing.Any:
+        '''Returns the values of a block of samples, assembled from the tiles covering it.
+
+        :param function: The noise function, such as mathutils.noise.fractal, or its name.
+        :param start: The (column, row) of the first sample.
+        :param shape: The (rows, columns) of the block.
+        :param arguments: The arguments of function after the position.
+        :return:  The values, a numpy array of shape shape indexed by [row, column] when numpy is available, else an array.array of the rows one after the other.
+        '''
+
+        column, row = (int(value) for value in start)
+        rows, columns = (int(value) for value in shape)
+        size = self.tile_size
+        if numpy is not None:
+            result = numpy.empty((rows, columns))
+        else:
+            result = array("d", bytes(rows * columns * _ITEM_BYTES))
+        for y in range(row // size, (row + rows - 1) // size + 1):
+            top, bottom = max(row, y * size), min(row + rows, (y + 1) * size)
+            for x in range(column // size, (column + columns - 1) // size + 1):
+                left, right = max(column, x * size), min(column + columns, (x + 1) * size)
+                values = self.tile(function, (x, y), *arguments, **keywords)
+                if numpy is not None:
+                    result[top - row:bottom - row, left - column:right - column] = values[top - y * size:bottom - y * size, left - x * size:right - x * size]
+                    continue
+                for line in range(top, bottom):
+                    base = (line - y * size) * size - x * size
+                    target = (line - row) * columns - column
+                    result[target + left:target + right] = values[base + left:base + right]
+        return result
+
+    def stats(self) -> typing.Dict[str, int]:
+        '''Returns the counters of the cache.
+
+        :return:  hits (tiles found in memory), spill_hits (tiles read back from the spill file), misses (tiles evaluated), evictions (tiles evicted from memory), tiles and spilled (tiles held in memory and in the spill file) and bytes (memory held by the tiles).
+        '''
+
+        return {
+            "hits": self.hits,
+            "spill_hits": self.spill_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "tiles": len(self._tiles),
+            "spilled": len(self._slots),
+            "bytes": len(self._tiles) * self._tile_bytes,
+        }
+
+    def clear(self):
+        '''Drops all the tiles, in memory and spilled, the counters are kept.'''
+
+        self._tiles.clear()
+        self._free.extend(self._slots.values())
+        self._slots.clear()
+
+    def close(self):
+        '''Drops all the tiles and closes the spill file.'''
+
+        self.clear()
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+            self._free = []
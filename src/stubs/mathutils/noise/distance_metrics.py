@@ -0,0 +1,9 @@
+"""The distance metrics, values of the distance_metric argument of mathutils.noise.voronoi."""
+
+DISTANCE: int = 0
+DISTANCE_SQUARED: int = 1
+MANHATTAN: int = 2
+CHEBYCHEV: int = 3
+MINKOVSKY_HALF: int = 4
+MINKOVSKY_FOUR: int = 5
+MINKOVSKY: int = 6
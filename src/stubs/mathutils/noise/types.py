@@ -0,0 +1,12 @@
+"""The noise bases, values of the noise_basis arguments of mathutils.noise."""
+
+BLENDER: int = 0
+STDPERLIN: int = 1
+NEWPERLIN: int = 2
+VORONOI_F1: int = 3
+VORONOI_F2: int = 4
+VORONOI_F3: int = 5
+VORONOI_F4: int = 6
+VORONOI_F2F1: int = 7
+VORONOI_CRACKLE: int = 8
+CELLNOISE: int = 14
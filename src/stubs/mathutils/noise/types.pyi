@@ -1,3 +0,0 @@
-import sys
-import typing
-STDPERLIN: int = None
@@ -0,0 +1,16 @@
+"""Tests of the executable runtime: the headless Range runtime and mathutils.
+
+Run from src/stubs with: python -m unittest tests
+
+Plain discovery (python -m unittest) would import every stub package, and
+the declaration-only ones (bpy, bgl, ...) cannot be imported, so the
+package discovers its own modules. The directory is not a stub package,
+scripts/build_stubs.py leaves it out of the bundles."""
+
+import os
+
+
+def load_tests(loader, tests, pattern):
+	here = os.path.dirname(os.path.abspath(__file__))
+	tests.addTests(loader.discover(here, pattern or "test*.py", os.path.dirname(here)))
+	return tests
@@ -0,0 +1,214 @@
+import math
+import random
+import unittest
+from array import array
+
+from mathutils import Matrix, Quaternion, Vector, arrays
+from mathutils.arrays import MatrixArray, QuaternionArray, VectorArray, numpy
+
+
+def single(values):
+	"""values rounded to 32 bit floats, like the arrays keep them."""
+
+	return array("f", values).tolist()
+
+
+def close(test, a, b, places=5):
+	test.assertEqual(len(a), len(b))
+	for x, y in zip(a, b):
+		test.assertAlmostEqual(x, y, places)
+
+
+class ArrayTest(unittest.TestCase):
+	"""The batch operations against the scalar types, with the array.array buffers."""
+
+	COUNT = 40
+	backend = None
+
+	def setUp(self):
+		self.addCleanup(setattr, arrays, "numpy", arrays.numpy)
+		arrays.numpy = self.backend
+		self.random = random.Random(7)
+
+	def vectors(self, size=3):
+		return [Vector(single([self.random.uniform(-2.0, 2.0) for _ in range(size)])) for _ in range(self.COUNT)]
+
+	def quaternions(self):
+		return [
+			Quaternion(single(Quaternion(axis, self.random.uniform(-math.pi, math.pi))))
+			for axis in self.vectors()]
+
+	def matrices(self):
+		return [
+			Matrix.Translation(translation) @ quaternion.to_matrix().to_4x4() @ Matrix.Scale(scale, 4)
+			for translation, quaternion, scale in zip(
+				self.vectors(), self.quaternions(), single([self.random.uniform(0.5, 2.0) for _ in range(self.COUNT)]))]
+
+	def assertVectors(self, batch, expected, places=5):
+		self.assertIsInstance(batch, VectorArray)
+		self.assertEqual(len(batch), len(expected))
+		for vector, values in zip(batch, expected):
+			close(self, vector, values, places)
+
+	def assertQuaternions(self, batch, expected, places=5):
+		self.assertIsInstance(batch, QuaternionArray)
+		self.assertEqual(len(batch), len(expected))
+		for quaternion, values in zip(batch, expected):
+			close(self, quaternion, values, places)
+
+	def assertMatrices(self, batch, expected, places=5):
+		self.assertIsInstance(batch, MatrixArray)
+		self.assertEqual(len(batch), len(expected))
+		for matrix, values in zip(batch, expected):
+			for row, expected_row in zip(matrix, values):
+				close(self, row, expected_row, places)
+
+	def test_buffer(self):
+		batch = VectorArray(self.vectors())
+		if self.backend is None:
+			self.assertIsInstance(batch.buffer, array)
+		else:
+			self.assertEqual(batch.buffer.shape, (self.COUNT, 3))
+
+	def test_vector_arithmetic(self):
+		a, b = self.vectors(), self.vectors()
+		batch = VectorArray(a)
+		self.assertVectors(batch + VectorArray(b), [x + y for x, y in zip(a, b)])
+		self.assertVectors(batch - VectorArray(b), [x - y for x, y in zip(a, b)])
+		self.assertVectors(batch * VectorArray(b), [x * y for x, y in zip(a, b)])
+		self.assertVectors(batch * 2.5, [x * 2.5 for x in a])
+		self.assertVectors(batch / 4, [x / 4 for x in a])
+		self.assertVectors(-batch, [-x for x in a])
+		# One vector is used for every item
+		self.assertVectors(batch + b[0], [x + b[0] for x in a])
+		self.assertVectors(b[0] - batch, [b[0] - x for x in a])
+		with self.assertRaises(ValueError):
+			batch + VectorArray(b[1:])
+
+	def test_vector_products(self):
+		a, b = self.vectors(), self.vectors()
+		batch = VectorArray(a)
+		close(self, batch.dot(VectorArray(b)), [x.dot(y) for x, y in zip(a, b)])
+		close(self, batch.dot(b[0]), [x.dot(b[0]) for x in a])
+		close(self, batch.length, [x.length for x in a])
+		close(self, batch.length_squared, [x.length_squared for x in a])
+		self.assertVectors(batch.cross(VectorArray(b)), [x.cross(y) for x, y in zip(a, b)])
+		self.assertVectors(batch.cross(b[0]), [x.cross(b[0]) for x in a])
+		with self.assertRaises(ValueError):
+			VectorArray(self.vectors(2)).cross((1, 0))
+
+	def test_normalize(self):
+		a = self.vectors()
+		a[3] = Vector((0, 0, 0))
+		batch = VectorArray(a)
+		self.assertVectors(batch.normalized(), [x.normalized() for x in a])
+		self.assertVectors(batch, a)
+		batch.normalize()
+		self.assertVectors(batch, [x.normalized() for x in a])
+
+	def test_lerp(self):
+		a, b = self.vectors(4), self.vectors(4)
+		batch = VectorArray(a)
+		self.assertVectors(batch.lerp(VectorArray(b), 0.3), [x.lerp(y, 0.3) for x, y in zip(a, b)])
+		factors = single([self.random.random() for _ in range(self.COUNT)])
+		self.assertVectors(batch.lerp(b[0], factors), [x.lerp(b[0], t) for x, t in zip(a, factors)])
+
+	def test_slerp(self):
+		a, b = self.vectors(), self.vectors()
+		# Opposite and zero vectors are interpolated linearly
+		b[0], a[1] = -a[0], Vector((0, 0, 0))
+		expected = [x.slerp(y, 0.4, False) or x.lerp(y, 0.4) for x, y in zip(a, b)]
+		self.assertVectors(VectorArray(a).slerp(VectorArray(b), 0.4), expected)
+		for vector in VectorArray(a[2:]).slerp(VectorArray(b[2:]), 0.4):
+			self.assertAlmostEqual(vector.length, 1.0, 5)
+
+	def test_matrix_transforms(self):
+		a = self.vectors()
+		batch = VectorArray(a)
+		for matrix in (self.matrices()[0], Matrix.Rotation(0.3, 3, "Z")):
+			self.assertVectors(matrix @ batch, [matrix @ x for x in a])
+		planar = self.vectors(2)
+		self.assertVectors(Matrix.Rotation(0.3, 2) @ VectorArray(planar), [Matrix.Rotation(0.3, 2) @ x for x in planar])
+
+	def test_items_write_through(self):
+		a = self.vectors()
+		batch = VectorArray(a)
+		batch[2].x = 5.0
+		batch[3] = (1, 2, 3)
+		a[2].x, a[3] = 5.0, Vector((1, 2, 3))
+		self.assertVectors(batch, a)
+		self.assertEqual(batch.to_list()[3], Vector((1, 2, 3)))
+		self.assertVectors(batch[::3], a[::3])
+
+	def test_matrix_products(self):
+		a, b, points = self.matrices(), self.matrices(), self.vectors()
+		batch = MatrixArray(a)
+		self.assertMatrices(batch @ MatrixArray(b), [x @ y for x, y in zip(a, b)], 4)
+		self.assertMatrices(batch @ b[0], [x @ b[0] for x in a], 4)
+		# Every matrix moves its own point
+		self.assertVectors(batch @ VectorArray(points), [x @ y for x, y in zip(a, points)], 4)
+		self.assertVectors(batch @ points[0], [x @ points[0] for x in a], 4)
+		self.assertVectors(batch.translation, [x.translation for x in a])
+		self.assertMatrices(MatrixArray.Identity(3), [Matrix.Identity(4)] * 3)
+		# 3x3 matrices are extended
+		self.assertMatrices(MatrixArray([Matrix.Rotation(0.3, 3, "X")]), [Matrix.Rotation(0.3, 4, "X")])
+
+	def test_quaternion_products(self):
+		a, b, points = self.quaternions(), self.quaternions(), self.vectors()
+		batch = QuaternionArray(a)
+		close(self, batch.dot(QuaternionArray(b)), [x.dot(y) for x, y in zip(a, b)])
+		self.assertQuaternions(batch @ QuaternionArray(b), [x @ y for x, y in zip(a, b)])
+		self.assertQuaternions(batch @ b[0], [x @ b[0] for x in a])
+		self.assertQuaternions(batch.conjugated(), [x.conjugated() for x in a])
+		self.assertVectors(batch @ VectorArray(points), [x @ y for x, y in zip(a, points)])
+		self.assertMatrices(batch.to_matrix(), [x.normalized().to_matrix().to_4x4() for x in a])
+
+	def test_quaternion_normalize(self):
+		a = [quaternion * 3.0 for quaternion in self.quaternions()]
+		a[5] = Quaternion((0, 0, 0, 0))
+		batch = QuaternionArray(a)
+		self.assertQuaternions(batch.normalized(), [x.normalized() for x in a])
+		batch.normalize()
+		self.assertQuaternions(batch, [x.normalized() for x in a])
+
+	def test_quaternion_slerp(self):
+		a, b = self.quaternions(), self.quaternions()
+		# Nearly equal rotations
+		b[0] = Quaternion(single(a[0] @ Quaternion((0, 0, 1), 0.001)))
+		batch = QuaternionArray(a)
+		expected = [x.slerp(y, 0.3) for x, y in zip(a, b)]
+		self.assertQuaternions(batch.slerp(QuaternionArray(b), 0.3), expected)
+		factors = single([self.random.random() for _ in range(self.COUNT)])
+		self.assertQuaternions(batch.slerp(b[1], factors), [x.slerp(b[1], t) for x, t in zip(a, factors)])
+		# The short way round, whatever the sign of the other side
+		self.assertQuaternions(batch.slerp(QuaternionArray([-y for y in b]), 0.3), expected)
+
+	def test_quaternion_nlerp(self):
+		a, b = self.quaternions(), self.quaternions()
+		batch = QuaternionArray(a)
+		expected = []
+		for x, y in zip(a, b):
+			y = -y if x.dot(y) < 0.0 else y
+			expected.append((x + (y - x) * 0.3).normalized())
+		self.assertQuaternions(batch.nlerp(QuaternionArray(b), 0.3), expected)
+		self.assertQuaternions(batch.nlerp(QuaternionArray([-y for y in b]), [0.3] * self.COUNT), expected)
+		# Close to slerp for small angles
+		small = [Quaternion(single(x @ Quaternion((1, 0, 0), 0.05))) for x in a]
+		self.assertQuaternions(batch.nlerp(QuaternionArray(small), 0.5), [x.slerp(y, 0.5) for x, y in zip(a, small)], 4)
+
+	def test_empty_arrays(self):
+		self.assertEqual(len(VectorArray()), 0)
+		self.assertEqual(len(VectorArray() + (1, 2, 3)), 0)
+		self.assertEqual(len(MatrixArray.Identity(0) @ MatrixArray()), 0)
+		self.assertEqual(len(QuaternionArray().normalized()), 0)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class NumpyArrayTest(ArrayTest):
+	"""The same operations with numpy buffers."""
+
+	backend = numpy
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,177 @@
+import random
+import unittest
+
+from mathutils import Vector
+
+from Range import headless
+
+CUBE = headless.Mesh(
+	"Cube",
+	[(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)],
+	[(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)],
+	uvs=[(index & 1, index >> 1 & 1) for index in range(8)],
+)
+TRIANGLE = headless.Mesh("Triangle", [(0, 0, 0), (2, 0, 0), (0, 2, 0)], [(0, 1, 2)])
+
+
+def triangle_hit(origin, direction, a, b, c):
+	"""Distance along the ray to the triangle, None when it misses (Moller-Trumbore)."""
+	e1, e2 = b - a, c - a
+	p = direction.cross(e2)
+	determinant = e1.dot(p)
+	if abs(determinant) < 1e-12:
+		return None
+	t = origin - a
+	u = t.dot(p) / determinant
+	if u < 0.0 or u > 1.0:
+		return None
+	q = t.cross(e1)
+	v = direction.dot(q) / determinant
+	if v < 0.0 or u + v > 1.0:
+		return None
+	distance = e2.dot(q) / determinant
+	return distance if distance >= 0.0 else None
+
+
+def brute_force(objects, origin, target, dist=0.0, prop="", xray=False, mask=0xFFFF, ignore=None):
+	"""(distance, object, polygon index) of the nearest hit, testing every polygon of every object."""
+	origin, direction = Vector(origin), Vector(target) - Vector(origin)
+	length = direction.length
+	if not length:
+		return None
+	direction /= length
+	if dist < 0:
+		direction = -direction
+	limit = abs(dist) if dist else length
+	best = None
+	for obj in objects:
+		if obj is ignore or not obj.collisionGroup & mask or (xray and prop and prop not in obj):
+			continue
+		matrix, mesh = obj.worldTransform, obj.meshes[0]
+		for index in range(mesh.numPolygons):
+			polygon = mesh.getPolygon(index)
+			corners = [
+				matrix @ mesh.getVertex(polygon.material_id, polygon.getVertexIndex(corner)).XYZ
+				for corner in range(polygon.getNumVertex())]
+			for corner in range(1, len(corners) - 1):
+				distance = triangle_hit(origin, direction, corners[0], corners[corner], corners[corner + 1])
+				if distance is not None and distance <= limit and (best is None or distance < best[0]):
+					best = (distance, obj, index)
+	if best is not None and prop and prop not in best[1]:
+		return None
+	return best
+
+
+class SceneBVHTest(unittest.TestCase):
+	def setUp(self):
+		self.random = random.Random(11)
+		self.game = headless.Game()
+		self.scene = self.game.addScene("Scene")
+		self.objects = [self.create(index) for index in range(150)]
+		# Objects without a mesh are never hit
+		self.caster = self.scene.createObject("Caster")
+
+	def create(self, index):
+		obj = self.scene.createObject(
+			"Object%d" % index, position=self.point(30), rotation=self.point(3),
+			# Uniform scales, so that worldTransform has no shear
+			scale=[self.random.uniform(0.5, 2.5)] * 3,
+			properties={"wall": True} if index % 4 == 0 else None,
+			mesh=TRIANGLE if index % 7 == 0 else CUBE)
+		obj.collisionGroup = 1 << (index % 3)
+		return obj
+
+	def point(self, extent):
+		return [self.random.uniform(-extent, extent) for _ in range(3)]
+
+	def check(self, count=60):
+		bvh = self.scene.bvh
+		for _ in range(count):
+			origin, target = self.point(40), self.point(40)
+			dist = self.random.choice([0.0, 0.0, 25.0, -15.0])
+			prop = self.random.choice(["", "", "wall"])
+			xray = self.random.random() < 0.5
+			mask = self.random.choice([0xFFFF, 1, 6])
+			expected = brute_force(self.objects, origin, target, dist, prop, xray, mask)
+			obj, point, normal, polygon, uv = bvh.rayCast(origin, target, dist, prop, True, xray, mask, uv=True)
+			if expected is None:
+				self.assertIsNone(obj)
+				continue
+			distance, hit, index = expected
+			self.assertIs(obj, hit)
+			self.assertAlmostEqual((point - Vector(origin)).length, distance, 6)
+			self.assertEqual(polygon.getMesh(), hit.meshes[0])
+			self.assertAlmostEqual(normal.length, 1.0, 6)
+			self.assertEqual(len(uv), 2)
+
+	def test_rays_match_brute_force(self):
+		self.check()
+
+	def test_rays_follow_moved_added_and_removed_objects(self):
+		self.check(20)
+		for obj in self.random.sample(self.objects, 40):
+			obj.worldPosition = self.point(30)
+			obj.applyRotation(self.point(1))
+		self.scene._removeObjects(self.objects[10:30])
+		self.objects = [obj for obj in self.objects if not obj.invalid]
+		self.objects += [self.create(index) for index in range(200, 220)]
+		self.check()
+
+	def test_only_members_moving_refit(self):
+		bvh = self.scene.bvh
+		self.check(5)
+		refits = bvh.stats()["refits"]
+		# The caster has no mesh, like an agent walking around between its ray casts
+		for step in range(20):
+			self.caster.worldPosition = (step, 0.0, 0.0)
+			self.caster.rayCast((step, 0.0, 10.0), None, 5.0)
+		self.assertEqual(bvh.stats()["refits"], refits)
+		self.objects[0].worldPosition = self.point(30)
+		self.check(5)
+		self.assertEqual(bvh.stats()["refits"], refits + 1)
+
+	def test_normals_face_the_ray_origin(self):
+		target = self.scene.createObject("Target", position=(100, 0, 0), mesh=CUBE)
+		hit, point, normal = self.caster.rayCast(target, (100, 0, 5))
+		self.assertIs(hit, target)
+		self.assertEqual(list(point), [100.0, 0.0, 1.0])
+		self.assertEqual(list(normal), [0.0, 0.0, 1.0])
+		# Inside the cube the face normal points away from the origin of the ray
+		inside = self.scene.bvh.rayCast((100, 0, 0), (100, 0, 5), face=False)
+		self.assertLess(inside[2].z, 0.0)
+
+	def test_poly_and_uv_results(self):
+		target = self.scene.createObject("Target", position=(100, 0, 0), mesh=CUBE)
+		self.assertEqual(len(self.caster.rayCast(target, (100, 0, 5))), 3)
+		hit = self.caster.rayCast((100.5, 0.5, 0), (100.5, 0.5, 5), poly=2)
+		self.assertEqual(len(hit), 5)
+		self.assertIsInstance(hit[3], headless.Polygon)
+		self.assertAlmostEqual(hit[4][0], 1.0)
+		self.assertAlmostEqual(hit[4][1], 0.75)
+		self.assertEqual(self.caster.rayCast((200, 0, 0), (200, 0, 5), poly=1), (None,) * 4)
+
+	def test_ray_cast_to_ignores_the_caster(self):
+		self.caster.meshes = headless.ListValue([CUBE])
+		wall = self.scene.createObject("Wall", position=(0, 0, 60), mesh=CUBE, properties={"wall": True})
+		self.assertIs(self.caster.rayCastTo(wall), wall)
+		self.assertIsNone(self.caster.rayCastTo(wall, prop="door"))
+
+	def test_ray_cast_many_matches_ray_cast(self):
+		targets = [self.point(40) for _ in range(40)]
+		many = self.caster.rayCastMany(targets, (0, 0, 0))
+		for target, result in zip(targets, many):
+			self.assertEqual(result, self.caster.rayCast(target, (0, 0, 0), poly=1))
+
+	def test_mesh_edits_move_the_surface(self):
+		mesh = headless.Mesh("Plane", [(-1, -1, 0), (1, -1, 0), (1, 1, 0), (-1, 1, 0)], [(0, 1, 2, 3)])
+		plane = self.scene.createObject("Plane", position=(100, 0, 0), mesh=mesh)
+		self.assertEqual(self.caster.rayCast((100, 0, -5), (100, 0, 5))[1].z, 0.0)
+		for index in range(4):
+			vertex = mesh.getVertex(0, index)
+			vertex.z = 2.0
+		self.assertIs(self.caster.rayCast((100, 0, -5), (100, 0, 5))[0], plane)
+		self.assertEqual(self.caster.rayCast((100, 0, -5), (100, 0, 5))[1].z, 2.0)
+
+
+if __name__ == "__main__":
+	unittest.main()
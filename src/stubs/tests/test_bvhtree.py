@@ -0,0 +1,46 @@
+import types
+import unittest
+
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+from Range import headless
+
+VERTICES = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1)]
+POLYGONS = [(0, 1, 2, 3), (0, 1, 4)]
+
+
+def bmesh():
+	verts = [types.SimpleNamespace(co=Vector(co)) for co in VERTICES]
+	faces = [types.SimpleNamespace(verts=[verts[index] for index in polygon]) for polygon in POLYGONS]
+	return types.SimpleNamespace(verts=verts, faces=faces)
+
+
+class ConstructorTest(unittest.TestCase):
+	def assertSameHits(self, tree, expected):
+		for origin, direction in (((0.5, 0.5, 5), (0, 0, -1)), ((0.5, -5, 0.2), (0, 1, 0)), ((5, 5, 5), (1, 0, 0))):
+			self.assertEqual(tree.ray_cast(origin, direction), expected.ray_cast(origin, direction))
+
+	def test_from_bmesh_uses_face_indices(self):
+		tree = BVHTree.FromBMesh(bmesh())
+		self.assertSameHits(tree, BVHTree.FromPolygons(VERTICES, POLYGONS))
+		self.assertEqual(tree.ray_cast((0.5, -5, 0.2), (0, 1, 0))[2], 1)
+
+	def test_from_object_uses_the_first_mesh_in_object_space(self):
+		game = headless.Game()
+		mesh = headless.Mesh("Mesh", VERTICES, POLYGONS)
+		obj = game.addScene("Scene").createObject("Object", position=(10, 0, 0), mesh=mesh)
+		self.assertSameHits(BVHTree.FromObject(obj, None), BVHTree.FromPolygons(VERTICES, POLYGONS))
+
+	def test_unsupported_inputs_raise_type_error(self):
+		with self.assertRaises(TypeError):
+			BVHTree.FromBMesh(object())
+		with self.assertRaises(TypeError):
+			BVHTree.FromObject(object(), None)
+		game = headless.Game()
+		with self.assertRaises(TypeError):
+			BVHTree.FromObject(game.addScene("Scene").createObject("Empty"), None)
+
+
+if __name__ == "__main__":
+	unittest.main()
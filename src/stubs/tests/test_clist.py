@@ -0,0 +1,118 @@
+import random
+import unittest
+
+from Range.types import CListValue
+
+
+class Item:
+	def __init__(self, name):
+		self.name = name
+
+	def __repr__(self):
+		return "Item(%r)" % self.name
+
+
+class CListValueTest(unittest.TestCase):
+	def setUp(self):
+		self.random = random.Random(2)
+		# Shared names, the engine does not keep object names unique
+		self.items = [Item(name) for name in ("Cube", "Lamp", "Cube", "Camera", "Cube", "Lamp", "Empty")]
+
+	def check(self, clist, expected, candidates=None):
+		"""The lookups of clist agree with the plain list expected."""
+
+		self.assertEqual(len(clist), len(expected))
+		self.assertEqual([id(item) for item in clist], [id(item) for item in expected])
+		self.assertEqual(bool(clist), bool(expected))
+		for name in {item.name for item in self.items} | {"Missing"}:
+			found = [item for item in expected if item.name == name]
+			self.assertIs(clist.get(name), found[0] if found else None)
+			self.assertEqual(name in clist, bool(found))
+			if found:
+				self.assertIs(clist[name], found[0])
+			else:
+				with self.assertRaises(KeyError):
+					clist[name]
+		for item in self.items if candidates is None else candidates:
+			positions = [position for position, other in enumerate(expected) if other is item]
+			self.assertEqual(item in clist, bool(positions))
+			self.assertEqual(clist.count(item), len(positions))
+			if positions:
+				self.assertEqual(clist.index(item), positions[0])
+				self.assertIs(clist.from_id(id(item)), item)
+			else:
+				with self.assertRaises(ValueError):
+					clist.index(item)
+				with self.assertRaises(IndexError):
+					clist.from_id(id(item))
+
+	def test_lookups_follow_appends_removals_and_reverse(self):
+		clist, expected = CListValue(), []
+		for _ in range(300):
+			operation = self.random.random()
+			if operation < 0.45 or not expected:
+				# The same item may be appended again
+				item = self.random.choice(self.items)
+				clist.append(item)
+				expected.append(item)
+			elif operation < 0.8:
+				item = self.random.choice(expected)
+				clist._remove(item)
+				expected.remove(next(other for other in expected if other is item))
+			elif operation < 0.9:
+				clist.reverse()
+				expected.reverse()
+			else:
+				gone = self.random.sample(self.items, 2)
+				clist._removeMany(gone)
+				expected = [item for item in expected if all(item is not other for other in gone)]
+			self.check(clist, expected)
+
+	def test_removing_a_missing_item(self):
+		clist = CListValue(self.items[:3])
+		with self.assertRaises(ValueError):
+			clist._remove(self.items[3])
+		clist._removeMany([self.items[3]])
+		self.check(clist, self.items[:3])
+
+	def test_duplicate_names_resolve_to_the_first(self):
+		first, second = self.items[0], self.items[2]
+		clist = CListValue([first, second])
+		self.assertIs(clist["Cube"], first)
+		clist.reverse()
+		self.assertIs(clist["Cube"], second)
+		clist._remove(second)
+		self.assertIs(clist["Cube"], first)
+		clist._remove(first)
+		self.assertNotIn("Cube", clist)
+
+	def test_slices_stay_live(self):
+		clist = CListValue(self.items)
+		expected = list(self.items)
+		keys = [slice(1, 5), slice(None, None, 2), slice(None, None, -1), slice(-2, None, -2), slice(2, None)]
+		# A view shows what is now at the positions it was sliced at
+		views = [(clist[key], range(len(expected))[key]) for key in keys]
+		nested = clist[1:6][::2]
+		nested_positions = range(len(expected))[1:6][::2]
+		for change in range(4):
+			if change == 1:
+				clist.reverse()
+				expected.reverse()
+			elif change == 2:
+				clist._remove(expected[0])
+				del expected[0]
+			elif change == 3:
+				clist._removeMany(expected[:3])
+				expected = expected[3:]
+			for view, positions in views + [(nested, nested_positions)]:
+				self.check(view, [expected[position] for position in positions if position < len(expected)])
+
+	def test_slices_are_read_only(self):
+		view = CListValue(self.items)[1:3]
+		for edit in (lambda: view.append(self.items[0]), view.reverse, lambda: view._remove(self.items[1])):
+			with self.assertRaises(TypeError):
+				edit()
+
+
+if __name__ == "__main__":
+	unittest.main()
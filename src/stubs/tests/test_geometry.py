@@ -0,0 +1,168 @@
+import random
+import unittest
+from array import array
+
+from mathutils import Vector, VectorArray, geometry
+from mathutils.arrays import numpy
+
+TRIANGLE = (Vector((0, 0, 0)), Vector((1, 0, 0)), Vector((0, 1, 0)))
+
+
+def close(test, a, b, places=9):
+	if a is None or b is None:
+		test.assertIs(a, b)
+		return
+	test.assertEqual(len(a), len(b))
+	for x, y in zip(a, b):
+		test.assertAlmostEqual(x, y, places)
+
+
+class ScalarTest(unittest.TestCase):
+	def test_intersect_ray_tri(self):
+		down = Vector((0, 0, -1))
+		close(self, geometry.intersect_ray_tri(*TRIANGLE, down, (0.25, 0.25, 1)), (0.25, 0.25, 0))
+		# The ray misses the triangle, not its plane
+		self.assertIsNone(geometry.intersect_ray_tri(*TRIANGLE, down, (2, 2, 1)))
+		close(self, geometry.intersect_ray_tri(*TRIANGLE, down, (2, 2, 1), False), (2, 2, 0))
+		# Both sides of the triangle are hit, the ray must go towards it
+		close(self, geometry.intersect_ray_tri(*TRIANGLE, -down, (0.25, 0.25, -1)), (0.25, 0.25, 0))
+		for clip in (True, False):
+			self.assertIsNone(geometry.intersect_ray_tri(*TRIANGLE, -down, (0.25, 0.25, 1), clip))
+			self.assertIsNone(geometry.intersect_ray_tri(*TRIANGLE, (1, 0, 0), (0.25, 0.25, 1), clip))
+		# The length of the direction does not matter
+		close(self, geometry.intersect_ray_tri(*TRIANGLE, (0, 0, -7), (0.5, 0, 3)), (0.5, 0, 0))
+
+	def test_intersect_line_line(self):
+		# Skew lines: the x axis and a line along y at z = 1
+		first, second = geometry.intersect_line_line((-1, 0, 0), (3, 0, 0), (2, 5, 1), (2, 6, 1))
+		close(self, first, (2, 0, 0))
+		close(self, second, (2, 0, 1))
+		# Crossing lines share their closest point, the segments do not need to reach it
+		first, second = geometry.intersect_line_line((0, 0, 0), (1, 1, 1), (4, 0, 4), (3, 1, 3))
+		close(self, first, (2, 2, 2))
+		close(self, second, (2, 2, 2))
+		first, second = geometry.intersect_line_line((0, 0), (1, 1), (0, 1), (1, 0))
+		close(self, first, (0.5, 0.5))
+		self.assertEqual(len(second), 2)
+		self.assertIsNone(geometry.intersect_line_line((0, 0, 0), (1, 1, 1), (0, 1, 0), (2, 3, 2)))
+		self.assertIsNone(geometry.intersect_line_line((0, 0, 0), (0, 0, 0), (0, 1, 0), (1, 1, 0)))
+
+	def test_intersect_point_line(self):
+		point, factor = geometry.intersect_point_line((1, 1, 0), (0, 0, 0), (2, 0, 0))
+		close(self, point, (1, 0, 0))
+		self.assertAlmostEqual(factor, 0.5)
+		# The line goes on past its points
+		point, factor = geometry.intersect_point_line((5, -3, 2), (0, 0, 0), (2, 0, 0))
+		close(self, point, (5, 0, 0))
+		self.assertAlmostEqual(factor, 2.5)
+		point, factor = geometry.intersect_point_line((0, 2), (1, 1), (3, 3))
+		close(self, point, (1, 1))
+		self.assertAlmostEqual(factor, 0.0)
+
+	def test_area_tri(self):
+		self.assertAlmostEqual(geometry.area_tri((0, 0, 0), (3, 0, 0), (0, 4, 0)), 6.0)
+		self.assertAlmostEqual(geometry.area_tri((1, 1, 1), (1, 3, 1), (1, 1, 5)), 4.0)
+		self.assertAlmostEqual(geometry.area_tri((0, 0), (2, 0), (2, 2)), 2.0)
+		self.assertEqual(geometry.area_tri((0, 0, 0), (1, 1, 1), (2, 2, 2)), 0.0)
+		with self.assertRaises(ValueError):
+			geometry.area_tri((0, 0), (1, 0, 0), (0, 1, 0))
+
+
+class ManyTest(unittest.TestCase):
+	"""The *_many forms against their scalar functions, numpy arrays are used when numpy is installed."""
+
+	COUNT = 50
+
+	def setUp(self):
+		self.random = random.Random(5)
+
+	def points(self, extent=2.0, size=3):
+		# Single precision, like VectorArray keeps them
+		return [
+			Vector(array("f", [self.random.uniform(-extent, extent) for _ in range(size)]).tolist())
+			for _ in range(self.COUNT)]
+
+	def forms(self, points):
+		"""The batch as vectors, a VectorArray and a numpy array."""
+
+		forms = [points, VectorArray(points)]
+		if numpy is not None:
+			forms.append(numpy.array([list(point) for point in points]))
+		return forms
+
+	def test_area_tri_many(self):
+		a, b, c = self.points(), self.points(), self.points()
+		expected = [geometry.area_tri(*triangle) for triangle in zip(a, b, c)]
+		for form in self.forms(a):
+			areas = geometry.area_tri_many(form, b, c)
+			for area, value in zip(areas, expected):
+				self.assertAlmostEqual(area, value, 9)
+
+	def test_intersect_ray_tri_many(self):
+		a, b, c = self.points(), self.points(), self.points()
+		origins, jitter = self.points(4.0), self.points(0.5)
+		# Towards the triangles, every third ray looking away from them
+		rays = [
+			((p1 + p2 + p3) / 3.0 - origin + offset) * (-1.0 if index % 3 == 0 else 1.0)
+			for index, (p1, p2, p3, origin, offset) in enumerate(zip(a, b, c, origins, jitter))]
+		for clip in (True, False):
+			expected = [geometry.intersect_ray_tri(*item, clip) for item in zip(a, b, c, rays, origins)]
+			self.assertTrue(any(point is None for point in expected))
+			self.assertTrue(any(point is not None for point in expected))
+			for form in self.forms(origins):
+				for point, value in zip(geometry.intersect_ray_tri_many(a, b, c, rays, form, clip), expected):
+					close(self, point, value)
+		# One ray against every triangle
+		hits = geometry.intersect_ray_tri_many(a, b, c, rays[0], origins[0])
+		for point, triangle in zip(hits, zip(a, b, c)):
+			close(self, point, geometry.intersect_ray_tri(*triangle, rays[0], origins[0]))
+
+	def test_intersect_line_plane_many(self):
+		a, b, co, no = self.points(), self.points(), self.points(), self.points()
+		expected = [geometry.intersect_line_plane(*item) for item in zip(a, b, co, no)]
+		for form in self.forms(no):
+			for point, value in zip(geometry.intersect_line_plane_many(a, b, co, form), expected):
+				close(self, point, value, 7)
+		# A line parallel to its plane
+		self.assertEqual(geometry.intersect_line_plane_many([(0, 0, 1)], [(1, 0, 1)], (0, 0, 0), (0, 0, 1)), [None])
+
+	def test_closest_point_on_tri_many(self):
+		points, a, b, c = self.points(4.0), self.points(), self.points(), self.points()
+		expected = [geometry.closest_point_on_tri(*item) for item in zip(points, a, b, c)]
+		for form in self.forms(points):
+			for point, value in zip(geometry.closest_point_on_tri_many(form, a, b, c), expected):
+				close(self, point, value)
+
+	def test_intersect_sphere_sphere_2d_many(self):
+		a, b = self.points(size=2), self.points(size=2)
+		radii = [self.random.uniform(0.2, 2.5) for _ in range(self.COUNT)]
+		expected = [geometry.intersect_sphere_sphere_2d(*item) for item in zip(a, radii, b, radii[::-1])]
+		self.assertIn((None, None), expected)
+		for form in self.forms(a):
+			for points, values in zip(geometry.intersect_sphere_sphere_2d_many(form, radii, b, radii[::-1]), expected):
+				close(self, points[0], values[0])
+				close(self, points[1], values[1])
+
+	def test_batches_must_have_the_same_length(self):
+		a, b, c = self.points(), self.points(), self.points()
+		short = a[:-1]
+		with self.assertRaises(ValueError):
+			geometry.area_tri_many(short, b, c)
+		with self.assertRaises(ValueError):
+			geometry.intersect_ray_tri_many(a, b, c, short, (0, 0, 0))
+		with self.assertRaises(ValueError):
+			geometry.intersect_line_plane_many(a, VectorArray(short), (0, 0, 0), (0, 0, 1))
+		with self.assertRaises(ValueError):
+			geometry.closest_point_on_tri_many(a, b, c, short)
+		with self.assertRaises(ValueError):
+			geometry.intersect_sphere_sphere_2d_many(a, 1.0, short, 1.0)
+		with self.assertRaises(ValueError):
+			geometry.intersect_sphere_sphere_2d_many(a, [1.0] * 3, b, 1.0)
+
+	def test_empty_batches(self):
+		self.assertEqual(geometry.area_tri_many([], [], []), [])
+		self.assertEqual(geometry.intersect_ray_tri_many([], [], [], (0, 0, -1), (0, 0, 1)), [])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,176 @@
+import math
+import unittest
+
+from Range import headless, logic
+
+
+def close(test, a, b, places=6):
+	test.assertEqual(len(a), len(b))
+	for x, y in zip(a, b):
+		test.assertAlmostEqual(x, y, places)
+
+
+class FrameLoopTest(unittest.TestCase):
+	def setUp(self):
+		self.game = headless.Game(ticRate=50.0)
+		self.scene = self.game.addScene("Scene")
+
+	def test_controllers_run_every_frame(self):
+		owner = self.scene.createObject("Player")
+		calls = []
+
+		def main(cont):
+			calls.append((self.game.frame, cont.owner, logic.getCurrentController() is cont, logic.getCurrentScene()))
+
+		self.game.addController(owner, main)
+		self.assertEqual(self.game.run(3), 3)
+		self.assertEqual(calls, [(frame, owner, True, self.scene) for frame in (1, 2, 3)])
+		self.assertAlmostEqual(self.game.frameTime, 3 / 50.0)
+
+	def test_high_priority_controllers_run_first(self):
+		owner = self.scene.createObject("Player")
+		order = []
+		self.game.addController(owner, lambda: order.append("normal"))
+		self.game.addController(owner, lambda: order.append("high"), useHighPriority=True)
+		self.game.step()
+		self.assertEqual(order, ["high", "normal"])
+
+	def test_sensors_and_states_gate_controllers(self):
+		owner = self.scene.createObject("Player")
+		calls = []
+		controller = self.game.addController(owner, lambda: calls.append("sensed"), sensors=["Keyboard"])
+		self.game.addController(owner, lambda: calls.append("state 2"), state=2)
+		controller.sensors["Keyboard"].positive = False
+		self.game.step()
+		self.assertEqual(calls, [])
+		controller.sensors["Keyboard"].positive = True
+		owner.state = 3
+		self.game.step()
+		self.assertEqual(calls, ["sensed", "state 2"])
+
+	def test_end_game_stops_the_loop(self):
+		owner = self.scene.createObject("Player")
+		self.game.addController(owner, lambda: logic.endGame() if self.game.frame == 2 else None)
+		self.assertEqual(self.game.run(10), 2)
+
+	def test_logic_answers_while_the_game_is_active(self):
+		with self.game:
+			self.assertEqual(logic.getLogicTicRate(), 50.0)
+			self.assertEqual(list(logic.getSceneList()), [self.scene])
+		self.assertNotEqual(logic.getLogicTicRate(), 50.0)
+
+
+class TransformTest(unittest.TestCase):
+	def setUp(self):
+		self.game = headless.Game()
+		self.scene = self.game.addScene("Scene")
+
+	def test_parenting_keeps_the_world_transform(self):
+		parent = self.scene.createObject("Parent", position=(1, 2, 3), rotation=(0, 0, math.pi / 2), scale=(2, 2, 2))
+		child = self.scene.createObject("Child", position=(1, 0, 0))
+		child.setParent(parent)
+		close(self, child.worldPosition, (1, 0, 0))
+		close(self, child.localPosition, (-1, 0, -1.5))
+		self.assertIs(child.parent, parent)
+		self.assertEqual(list(parent.children), [child])
+
+	def test_children_follow_their_parent(self):
+		parent = self.scene.createObject("Parent", position=(1, 2, 3), rotation=(0, 0, math.pi / 2), scale=(2, 2, 2))
+		child = self.scene.createObject("Child", position=(1, 0, 0), parent=parent)
+		grandchild = self.scene.createObject("Grandchild", position=(1, 1, 0), parent=child)
+		self.assertEqual(list(parent.childrenRecursive), [child, grandchild])
+		parent.worldPosition = (0, 0, 0)
+		close(self, child.worldPosition, (0, -2, -3))
+		close(self, grandchild.worldPosition, (0, -1, -3))
+		close(self, child.worldScale, (1, 1, 1))
+		child.removeParent()
+		close(self, child.worldPosition, (0, -2, -3))
+		self.assertIsNone(child.parent)
+		parent.worldPosition = (5, 5, 5)
+		close(self, grandchild.worldPosition, (0, -1, -3))
+
+	def test_world_transform_composes_the_hierarchy(self):
+		# Uniform parent scale: like the engine, transforms hold no shear
+		parent = self.scene.createObject("Parent", position=(4, 0, 0), rotation=(0.3, -0.2, 1.1), scale=(2, 2, 2))
+		child = self.scene.createObject("Child", parent=parent)
+		child.localPosition = (1, 2, 3)
+		child.localOrientation = (0.5, 0.0, -0.4)
+		expected = parent.worldTransform @ child.localTransform
+		for row, other in zip(child.worldTransform, expected):
+			close(self, row, other)
+
+	def test_dynamic_objects_fall(self):
+		ball = self.scene.createObject("Ball", position=(0, 0, 10), dynamic=True)
+		wall = self.scene.createObject("Wall", position=(0, 0, 10))
+		self.game.run(60)
+		self.assertLess(ball.worldPosition.z, 10 - 4.0)
+		self.assertAlmostEqual(ball.getLinearVelocity().z, -9.8, 3)
+		close(self, wall.worldPosition, (0, 0, 10))
+
+
+class LifetimeTest(unittest.TestCase):
+	def setUp(self):
+		self.game = headless.Game()
+		self.scene = self.game.addScene("Scene")
+
+	def test_added_objects_end_after_their_lifetime(self):
+		self.scene.createObject("Bullet", inactive=True)
+		spawner = self.scene.createObject("Spawner", position=(1, 2, 3))
+		bullet = self.scene.addObject("Bullet", spawner, 3)
+		close(self, bullet.worldPosition, (1, 2, 3))
+		self.game.run(2)
+		self.assertFalse(bullet.invalid)
+		self.assertIn(bullet, self.scene.objects)
+		self.game.step()
+		self.assertTrue(bullet.invalid)
+		self.assertNotIn(bullet, self.scene.objects)
+		with self.assertRaises(SystemError):
+			bullet.worldPosition
+
+	def test_end_object_removes_children_at_the_end_of_the_frame(self):
+		parent = self.scene.createObject("Parent")
+		child = self.scene.createObject("Child", parent=parent)
+		seen = []
+
+		def main():
+			parent.endObject()
+			seen.append(parent.invalid)
+
+		self.game.addController(parent, main)
+		self.game.step()
+		self.assertEqual(seen, [False])
+		self.assertTrue(parent.invalid)
+		self.assertTrue(child.invalid)
+		self.assertEqual(len(self.scene.objects), 0)
+		# Their slots are reused
+		other = self.scene.createObject("Other", position=(7, 0, 0))
+		close(self, other.worldPosition, (7, 0, 0))
+		self.assertIsNone(other.parent)
+
+	def test_add_object_needs_an_inactive_template(self):
+		active = self.scene.createObject("Active")
+		with self.assertRaises(ValueError):
+			self.scene.addObject(active)
+
+	def test_state_made_on_first_use_is_not_shared(self):
+		first = self.scene.createObject("First", properties={"hp": 3})
+		second = self.scene.createObject("Second")
+		# Nothing beyond the name, scene and transform is made before it is used
+		self.assertEqual(sorted(vars(second)), ["_name", "_scene", "_slot"])
+		first["ammo"] = 10
+		first.sensors.append(headless.Sensor("Always", first))
+		first.setLinearVelocity((1, 0, 0))
+		self.assertEqual(second.getPropertyNames(), [])
+		self.assertEqual(len(second.sensors), 0)
+		self.assertEqual(list(second.getLinearVelocity()), [0.0, 0.0, 0.0])
+		self.assertEqual(second.mass, 1.0)
+		self.assertEqual(list(second.color), [1.0, 1.0, 1.0, 1.0])
+		self.assertIsNot(first.color, second.color)
+		self.assertIsNone(second.groupObject)
+		child = self.scene.createObject("Child", parent=first)
+		self.assertEqual(list(first.children), [child])
+		self.assertEqual(list(second.children), [])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,153 @@
+import math
+import random
+import unittest
+
+from mathutils import Vector, VectorArray, interpolate
+
+TRIANGLE = ((0, 0, 0), (1, 0, 0), (0, 1, 0))
+# A convex pentagon, not in an axis plane
+PENTAGON = [Vector((math.cos(angle), math.sin(angle), 0.5 * math.cos(angle))) for angle in (0.0, 1.2, 2.5, 3.6, 5.0)]
+
+
+def close(test, a, b, places=9):
+	test.assertEqual(len(a), len(b))
+	for x, y in zip(a, b):
+		test.assertAlmostEqual(x, y, places)
+
+
+class PolyTest(unittest.TestCase):
+	def setUp(self):
+		self.random = random.Random(11)
+
+	def inside(self, polygon):
+		"""A random point inside the convex polygon."""
+
+		weights = [self.random.random() for _ in polygon]
+		return sum((vertex * weight for vertex, weight in zip(polygon, weights)), Vector((0, 0, 0))) / sum(weights)
+
+	def check(self, polygon, co, weights):
+		"""weights sum to 1 and mix the vertices of polygon back into co."""
+
+		self.assertEqual(len(weights), len(polygon))
+		self.assertAlmostEqual(sum(weights), 1.0)
+		mixed = sum((Vector(vertex) * weight for vertex, weight in zip(polygon, weights)), Vector((0, 0, 0)))
+		close(self, mixed, co)
+
+	def test_triangle(self):
+		close(self, interpolate.poly_3d_calc(TRIANGLE, (0.2, 0.3, 0)), (0.5, 0.2, 0.3))
+		close(self, interpolate.poly_3d_calc(TRIANGLE, (1 / 3, 1 / 3, 0)), (1 / 3, 1 / 3, 1 / 3))
+		# 2D vectors are in the z = 0 plane
+		close(self, interpolate.poly_3d_calc([vertex[:2] for vertex in TRIANGLE], (0.2, 0.3)), (0.5, 0.2, 0.3))
+
+	def test_vertices_and_edges(self):
+		for index, vertex in enumerate(PENTAGON):
+			weights = interpolate.poly_3d_calc(PENTAGON, vertex)
+			self.assertEqual(weights, [1.0 if other == index else 0.0 for other in range(len(PENTAGON))])
+		# Along an edge only its two vertices count
+		co = PENTAGON[1].lerp(PENTAGON[2], 0.25)
+		weights = interpolate.poly_3d_calc(PENTAGON, co)
+		close(self, weights, (0.0, 0.75, 0.25, 0.0, 0.0))
+		self.check(PENTAGON, co, weights)
+
+	def test_points_inside(self):
+		square = ((-1, -1, 0), (1, -1, 0), (1, 1, 0), (-1, 1, 0))
+		close(self, interpolate.poly_3d_calc(square, (0, 0, 0)), (0.25,) * 4)
+		for polygon in (TRIANGLE, square, PENTAGON):
+			polygon = [Vector(vertex) for vertex in polygon]
+			for _ in range(30):
+				co = self.inside(polygon)
+				weights = interpolate.poly_3d_calc(polygon, co)
+				self.check(polygon, co, weights)
+				self.assertTrue(all(weight >= 0.0 for weight in weights))
+
+	def test_many_matches_single_points(self):
+		points = [self.inside(PENTAGON) for _ in range(20)] + PENTAGON + [PENTAGON[0].lerp(PENTAGON[4], 0.5)]
+		expected = [interpolate.poly_3d_calc(PENTAGON, co) for co in points]
+		for form in (points, VectorArray(points)):
+			for weights, values in zip(interpolate.poly_3d_calc_many(PENTAGON, form), expected):
+				close(self, weights, values, 6)
+		self.assertEqual(len(interpolate.poly_3d_calc_many(PENTAGON, [])), 0)
+
+	def test_invalid_polygons(self):
+		with self.assertRaises(ValueError):
+			interpolate.poly_3d_calc(TRIANGLE[:2], (0, 0, 0))
+		with self.assertRaises(ValueError):
+			interpolate.poly_3d_calc_many(TRIANGLE[:2], [(0, 0, 0)])
+		with self.assertRaises(ValueError):
+			interpolate.poly_3d_calc([(0, 0, 0, 0)] * 3, (0, 0, 0))
+
+
+class SplineTest(unittest.TestCase):
+	POINTS = tuple(Vector(point) for point in ((0, 0, 0), (1, 2, 0), (3, 2, 1), (4, 0, 1), (6, -1, 0)))
+
+	def test_bezier_passes_through_its_knots(self):
+		# knot, handle, handle, knot, handle, handle, knot
+		points = [Vector(point) for point in ((0, 0, 0), (1, 2, 0), (3, 2, 1), (4, 0, 1), (5, -2, 1), (7, -1, 0), (8, 0, 0))]
+		spline = interpolate.BezierSpline(points)
+		self.assertEqual(len(spline), 2)
+		for t, knot in ((0.0, points[0]), (0.5, points[3]), (1.0, points[6])):
+			close(self, spline.evaluate(t), knot)
+		# The middle of a segment is (p0 + 3 p1 + 3 p2 + p3) / 8
+		close(self, spline.evaluate(0.25), (points[0] + 3 * points[1] + 3 * points[2] + points[3]) / 8)
+		# The handles give the direction at the knots
+		close(self, spline.tangent(0.0), (points[1] - points[0]).normalized())
+		close(self, spline.tangent(1.0), (points[6] - points[5]).normalized())
+
+	def test_catmull_rom_passes_through_its_points(self):
+		spline = interpolate.CatmullRomSpline(self.POINTS)
+		self.assertEqual(len(spline), len(self.POINTS) - 1)
+		for index, point in enumerate(self.POINTS):
+			close(self, spline.evaluate(index / (len(self.POINTS) - 1)), point)
+		# The tangent at an inner point is along its neighbours
+		close(self, spline.tangent(0.25), (self.POINTS[2] - self.POINTS[0]).normalized())
+
+	def test_cyclic_catmull_rom(self):
+		spline = interpolate.CatmullRomSpline(self.POINTS, cyclic=True)
+		self.assertEqual(len(spline), len(self.POINTS))
+		for index, point in enumerate(self.POINTS + self.POINTS[:1]):
+			close(self, spline.evaluate(index / len(self.POINTS)), point)
+		close(self, spline.tangent(0.0), (self.POINTS[1] - self.POINTS[-1]).normalized())
+		close(self, spline.tangent(1.0), spline.tangent(0.0))
+
+	def test_lengths_and_distances(self):
+		# Evenly spaced points on a line make a straight curve at constant speed
+		line = [Vector((0, 0, 0)), Vector((1, 1, 0)), Vector((2, 2, 0)), Vector((3, 3, 0))]
+		for spline in (interpolate.BezierSpline(line), interpolate.CatmullRomSpline(line)):
+			self.assertAlmostEqual(spline.length, 3 * math.sqrt(2))
+			close(self, spline.evaluate_distance(math.sqrt(2)), (1, 1, 0))
+			self.assertAlmostEqual(spline.parameter(spline.length / 2), 0.5)
+			# Distances are clamped to the curve
+			close(self, spline.evaluate_distance(-1.0), line[0])
+			close(self, spline.evaluate_distance(100.0), line[-1])
+		# A quarter circle of radius 1
+		k = 4 / 3 * (math.sqrt(2) - 1)
+		arc = interpolate.BezierSpline([(1, 0), (1, k), (k, 1), (0, 1)])
+		self.assertAlmostEqual(arc.length, math.pi / 2, 3)
+		self.assertEqual(len(arc.evaluate(0.5)), 2)
+
+	def test_many_matches_single_points(self):
+		spline = interpolate.CatmullRomSpline(VectorArray(self.POINTS))
+		parameters = [index / 16 for index in range(17)] + [-0.5, 1.5]
+		for point, t in zip(spline.evaluate_many(parameters), parameters):
+			close(self, point, spline.evaluate(t), 5)
+		for tangent, t in zip(spline.tangent_many(parameters), parameters):
+			close(self, tangent, spline.tangent(t), 5)
+		distances = [spline.length * index / 10 for index in range(11)]
+		for t, distance in zip(spline.parameter_many(distances), distances):
+			self.assertAlmostEqual(t, spline.parameter(distance))
+		for point, distance in zip(spline.evaluate_distance_many(distances), distances):
+			close(self, point, spline.evaluate_distance(distance), 5)
+
+	def test_invalid_points(self):
+		with self.assertRaises(ValueError):
+			interpolate.BezierSpline(self.POINTS)
+		with self.assertRaises(ValueError):
+			interpolate.CatmullRomSpline(self.POINTS[:1])
+		with self.assertRaises(ValueError):
+			interpolate.CatmullRomSpline(self.POINTS, samples=0)
+		with self.assertRaises(ValueError):
+			interpolate.CatmullRomSpline([(0, 0, 0, 0), (1, 1, 1, 1)])
+
+
+if __name__ == "__main__":
+	unittest.main()
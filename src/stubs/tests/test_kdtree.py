@@ -0,0 +1,132 @@
+import math
+import random
+import unittest
+
+from mathutils import kdtree
+
+
+class KDTreeTest(unittest.TestCase):
+	COUNT = 300
+
+	def setUp(self):
+		self.random = random.Random(3)
+		self.points = [self.point() for _ in range(self.COUNT)]
+		# Indices need not be positions
+		self.indices = [index * 7 + 1 for index in range(self.COUNT)]
+		self.tree = kdtree.KDTree(self.COUNT)
+		for point, index in zip(self.points, self.indices):
+			self.tree.insert(point, index)
+		self.tree.balance()
+		self.queries = [self.point(12.0) for _ in range(40)]
+
+	def point(self, extent=10.0):
+		return tuple(self.random.uniform(-extent, extent) for _ in range(3))
+
+	def brute_force(self, co, filter=None):
+		"""(distance, index) of every point, nearest first."""
+
+		return sorted(
+			(math.dist(co, point), index) for point, index in zip(self.points, self.indices)
+			if filter is None or filter(index))
+
+	def check(self, results, expected):
+		self.assertEqual([index for _, index, _ in results], [index for _, index in expected])
+		for (co, index, distance), (value, _) in zip(results, expected):
+			self.assertAlmostEqual(distance, value, 9)
+			self.assertEqual(tuple(co), self.points[self.indices.index(index)])
+
+	def test_find_matches_brute_force(self):
+		for co in self.queries + self.points[:10]:
+			self.check([self.tree.find(co)], self.brute_force(co)[:1])
+
+	def test_find_filter(self):
+		even = lambda index: index % 2 == 0
+		for co in self.queries:
+			self.check([self.tree.find(co, even)], self.brute_force(co, even)[:1])
+		self.assertEqual(self.tree.find((0, 0, 0), lambda index: False), (None, None, None))
+
+	def test_find_n_matches_brute_force(self):
+		for n in (1, 5, 32):
+			for co in self.queries:
+				self.check(self.tree.find_n(co, n), self.brute_force(co)[:n])
+		self.assertEqual(self.tree.find_n((0, 0, 0), 0), [])
+
+	def test_find_range_matches_brute_force(self):
+		for radius in (0.0, 2.5, 6.0):
+			for co in self.queries:
+				expected = [item for item in self.brute_force(co) if item[0] <= radius]
+				self.check(self.tree.find_range(co, radius), expected)
+		# A point found at distance 0
+		self.check(self.tree.find_range(self.points[4], 0.0), [(0.0, self.indices[4])])
+
+	def test_n_beyond_the_point_count(self):
+		co = self.queries[0]
+		self.check(self.tree.find_n(co, self.COUNT + 50), self.brute_force(co))
+
+	def test_many_match_the_single_queries(self):
+		self.assertEqual(self.tree.find_many(self.queries), [self.tree.find(co) for co in self.queries])
+		self.assertEqual(self.tree.find_n_many(self.queries, 6), [self.tree.find_n(co, 6) for co in self.queries])
+		self.assertEqual(self.tree.find_range_many(self.queries, 4.0), [self.tree.find_range(co, 4.0) for co in self.queries])
+
+	def test_from_points_matches_insert(self):
+		tree = kdtree.KDTree.FromPoints(self.points, self.indices)
+		self.assertEqual(len(tree), self.COUNT)
+		for co in self.queries:
+			self.assertEqual(tree.find_n(co, 8), self.tree.find_n(co, 8))
+		# Without indices the points are numbered by position
+		self.assertEqual(kdtree.KDTree.FromPoints(self.points).find(self.points[17])[1], 17)
+		with self.assertRaises(ValueError):
+			kdtree.KDTree.FromPoints(self.points, self.indices[1:])
+
+	def test_empty_tree(self):
+		for tree in (kdtree.KDTree(0), kdtree.KDTree(10), kdtree.KDTree.FromPoints([])):
+			tree.balance()
+			self.assertEqual(len(tree), 0)
+			self.assertEqual(tree.find((1, 2, 3)), (None, None, None))
+			self.assertEqual(tree.find_n((1, 2, 3), 4), [])
+			self.assertEqual(tree.find_range((1, 2, 3), 100.0), [])
+			self.assertEqual(tree.find_many([(1, 2, 3)]), [(None, None, None)])
+
+	def test_lookups_need_a_balanced_tree(self):
+		tree = kdtree.KDTree(4)
+		tree.insert((0, 0, 0), 0)
+		lookups = (
+			lambda: tree.find((0, 0, 0)),
+			lambda: tree.find_n((0, 0, 0), 1),
+			lambda: tree.find_range((0, 0, 0), 1.0),
+			lambda: tree.find_many([(0, 0, 0)]),
+			lambda: tree.find_n_many([(0, 0, 0)], 1),
+			lambda: tree.find_range_many([(0, 0, 0)], 1.0),
+		)
+		for lookup in lookups:
+			with self.assertRaises(RuntimeError):
+				lookup()
+		tree.balance()
+		self.assertEqual(tree.find((1, 0, 0))[1], 0)
+		# Inserting again needs another balance
+		tree.insert((2, 0, 0), 1)
+		with self.assertRaises(RuntimeError):
+			tree.find((1, 0, 0))
+		tree.balance()
+		self.assertEqual([index for _, index, _ in tree.find_n((1.5, 0, 0), 2)], [1, 0])
+
+	def test_invalid_arguments(self):
+		tree = kdtree.KDTree(1)
+		with self.assertRaises(ValueError):
+			kdtree.KDTree(-1)
+		with self.assertRaises(ValueError):
+			tree.insert((0, 0, 0), -1)
+		with self.assertRaises(ValueError):
+			tree.insert((0, 0), 0)
+		tree.insert((0, 0, 0), 0)
+		with self.assertRaises(ValueError):
+			tree.insert((1, 1, 1), 1)
+		tree.balance()
+		with self.assertRaises(ValueError):
+			tree.find_n((0, 0, 0), -1)
+		with self.assertRaises(ValueError):
+			tree.find_range((0, 0, 0), -1.0)
+
+
+if __name__ == "__main__":
+	unittest.main()
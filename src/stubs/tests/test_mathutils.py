@@ -0,0 +1,252 @@
+import math
+import unittest
+
+from mathutils import Euler, Matrix, Quaternion, Vector
+
+
+def close(test, a, b, places=9):
+	test.assertEqual(len(a), len(b))
+	for x, y in zip(a, b):
+		test.assertAlmostEqual(x, y, places)
+
+
+class VectorTest(unittest.TestCase):
+	def test_arithmetic(self):
+		a, b = Vector((1, 2, 3)), Vector((4, -5, 6))
+		self.assertEqual(list(a + b), [5, -3, 9])
+		self.assertEqual(list(a - b), [-3, 7, -3])
+		self.assertEqual(list(a * 2), [2, 4, 6])
+		self.assertEqual(list(2 * a), [2, 4, 6])
+		self.assertEqual(list(a / 2), [0.5, 1, 1.5])
+		self.assertEqual(list(-a), [-1, -2, -3])
+		# Element-wise product, @ is the dot product
+		self.assertEqual(list(a * b), [4, -10, 18])
+		self.assertEqual(a @ b, 12.0)
+		with self.assertRaises(ValueError):
+			Vector((1, 2)) + a
+
+	def test_in_place_arithmetic_keeps_the_vector(self):
+		a = Vector((1, 2, 3))
+		same = a
+		a += Vector((1, 1, 1))
+		a *= 2
+		self.assertIs(a, same)
+		self.assertEqual(list(a), [4, 6, 8])
+
+	def test_products_and_lengths(self):
+		a, b = Vector((1, 2, 3)), Vector((4, -5, 6))
+		self.assertEqual(a.dot(b), 12.0)
+		self.assertEqual(list(a.cross(b)), [27, 6, -13])
+		self.assertEqual(a.cross(b).dot(a), 0.0)
+		self.assertEqual(a.length_squared, 14.0)
+		self.assertAlmostEqual(a.length, math.sqrt(14))
+		close(self, a.normalized(), [value / math.sqrt(14) for value in (1, 2, 3)])
+		self.assertAlmostEqual(a.normalized().length, 1.0)
+		# Zero vectors stay zero
+		self.assertEqual(list(Vector((0, 0, 0)).normalized()), [0, 0, 0])
+		self.assertAlmostEqual(Vector((1, 0, 0)).angle(Vector((1, 1, 0))), math.pi / 4)
+		self.assertEqual(list(Vector((3, 4)).project(Vector((2, 0)))), [3, 0])
+		self.assertEqual(list(Vector((1, -1, 0)).reflect(Vector((0, 1, 0)))), [1, 1, 0])
+
+	def test_lerp(self):
+		a, b = Vector((1, 2, 3)), Vector((4, -5, 6))
+		close(self, a.lerp(b, 0.25), (1.75, 0.25, 3.75))
+		self.assertEqual(list(a.lerp(b, 0.0)), list(a))
+		self.assertEqual(list(a.lerp(b, 1.0)), list(b))
+
+	def test_swizzles(self):
+		a = Vector((1, 2, 3, 4))
+		self.assertEqual(list(a.zyx), [3, 2, 1])
+		self.assertEqual(list(a.wxxw), [4, 1, 1, 4])
+		self.assertEqual(a.w, 4)
+		a.yx = (7, 8)
+		a.zw = Vector((5, 6))
+		self.assertEqual(list(a), [8, 7, 5, 6])
+		with self.assertRaises(AttributeError):
+			a.xx = (1, 2)
+		with self.assertRaises(AttributeError):
+			Vector((1, 2)).z
+		# Swizzles are class attributes, vectors keep no per-instance dict
+		self.assertFalse(hasattr(a, "__dict__"))
+
+	def test_freeze(self):
+		frozen = Vector((1, 2, 3)).freeze()
+		self.assertTrue(frozen.is_frozen)
+		self.assertEqual(hash(frozen), hash(Vector((1, 2, 3)).freeze()))
+		self.assertIn(frozen, {Vector((1, 2, 3)).freeze()})
+		for edit in (
+			lambda: setattr(frozen, "x", 5.0),
+			lambda: setattr(frozen, "xy", (1, 1)),
+			lambda: frozen.__setitem__(0, 5.0),
+			frozen.normalize,
+		):
+			with self.assertRaises(TypeError):
+				edit()
+		with self.assertRaises(TypeError):
+			frozen += Vector((1, 1, 1))
+		self.assertEqual(list(frozen), [1, 2, 3])
+		# Copies can be changed again, vectors that can change cannot be hashed
+		copy = frozen.copy()
+		self.assertFalse(copy.is_frozen)
+		copy.x = 5.0
+		with self.assertRaises(TypeError):
+			hash(copy)
+
+
+class MatrixTest(unittest.TestCase):
+	# Translation, a rotation about Z and a non-uniform scale, composed in that order
+	TRANSLATION = (1.0, -2.0, 3.0)
+	ANGLE = 0.4
+	SCALE = ((2, 0, 0, 0), (0, 3, 0, 0), (0, 0, 0.5, 0), (0, 0, 0, 1))
+
+	def composed(self):
+		return Matrix.Translation(self.TRANSLATION) @ Matrix.Rotation(self.ANGLE, 4, "Z") @ Matrix(self.SCALE)
+
+	def assertMatrix(self, matrix, rows, places=9):
+		self.assertEqual(len(matrix), len(rows))
+		for row, expected in zip(matrix, rows):
+			close(self, row, expected, places)
+
+	def test_products(self):
+		a, b = Matrix(((1, 2), (3, 4))), Matrix(((0, 1), (-1, 2)))
+		self.assertMatrix(a @ b, ((-2, 5), (-4, 11)))
+		self.assertEqual(list(a @ Vector((1, -1))), [-1, -1])
+		# Points get the translation, 3D vectors multiply 4x4 matrices as points
+		close(self, self.composed() @ Vector((1, 0, 0)), (1 + 2 * math.cos(0.4), -2 + 2 * math.sin(0.4), 3))
+
+	def test_inverted(self):
+		self.assertMatrix(Matrix(((1, 2), (3, 4))).inverted(), ((-2, 1), (1.5, -0.5)))
+		three = Matrix(((1, 2, 3), (0, 1, 4), (5, 6, 0)))
+		self.assertAlmostEqual(three.determinant(), 1.0)
+		self.assertMatrix(three.inverted(), ((-24, 18, 5), (20, -15, -4), (-5, 4, 1)))
+		matrix = self.composed()
+		# The inverse undoes the parts in the reverse order
+		expected = (
+			Matrix(((0.5, 0, 0, 0), (0, 1 / 3, 0, 0), (0, 0, 2, 0), (0, 0, 0, 1)))
+			@ Matrix.Rotation(-self.ANGLE, 4, "Z") @ Matrix.Translation([-value for value in self.TRANSLATION]))
+		self.assertMatrix(matrix.inverted(), expected)
+		self.assertMatrix(matrix @ matrix.inverted(), Matrix.Identity(4))
+		self.assertAlmostEqual(matrix.determinant(), 3.0)
+
+	def test_singular_matrices(self):
+		singular = Matrix(((1, 2), (2, 4)))
+		with self.assertRaises(ValueError):
+			singular.inverted()
+		self.assertEqual(singular.inverted("fallback"), "fallback")
+		with self.assertRaises(ValueError):
+			Matrix(((1, 2, 3), (4, 5, 6))).inverted()
+
+	def test_decompose(self):
+		translation, rotation, scale = self.composed().decompose()
+		close(self, translation, self.TRANSLATION)
+		close(self, rotation, Quaternion((0, 0, 1), self.ANGLE))
+		close(self, scale, (2, 3, 0.5))
+		# A mirror is a half turn about x with a negative scale, like Blender
+		translation, rotation, scale = Matrix.Scale(-1, 4, (1, 0, 0)).decompose()
+		close(self, rotation, (0, 1, 0, 0))
+		close(self, scale, (-1, -1, -1))
+
+	def test_freeze(self):
+		matrix = self.composed()
+		frozen = self.composed().freeze()
+		self.assertTrue(frozen.is_frozen)
+		self.assertEqual(hash(frozen), hash(self.composed().freeze()))
+		for edit in (
+			frozen.invert,
+			frozen.identity,
+			frozen.transpose,
+			lambda: frozen[0].__setitem__(0, 3.0),
+			lambda: setattr(frozen, "translation", (0, 0, 0)),
+		):
+			with self.assertRaises(TypeError):
+				edit()
+		self.assertMatrix(frozen, matrix)
+		# The remembered inverse and decomposition are handed out as copies
+		inverse = frozen.inverted()
+		inverse[0][0] = 99.0
+		self.assertMatrix(frozen.inverted(), matrix.inverted())
+		translation = frozen.decompose()[0]
+		translation.x = 99.0
+		close(self, frozen.decompose()[0], self.TRANSLATION)
+		self.assertFalse(frozen.copy().is_frozen)
+
+
+class RotationTest(unittest.TestCase):
+	ANGLES = (0.3, -0.5, 1.1)
+
+	def assertRotation(self, a, b, places=9):
+		"""Quaternions a and b turn the same way, q and -q are the same rotation."""
+
+		sign = 1.0 if a.dot(b) >= 0.0 else -1.0
+		close(self, a, [sign * value for value in b], places)
+
+	def test_euler_orders(self):
+		for order in ("XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX"):
+			with self.subTest(order=order):
+				euler = Euler(self.ANGLES, order)
+				# The first axis of the order turns first, so its matrix is on the right
+				expected = Matrix.Identity(3)
+				for axis in order:
+					expected = Matrix.Rotation(self.ANGLES["XYZ".index(axis)], 3, axis) @ expected
+				matrix = euler.to_matrix()
+				for row, values in zip(matrix, expected):
+					close(self, row, values)
+				for row, values in zip(euler.to_quaternion().to_matrix(), expected):
+					close(self, row, values)
+				# Back to the same angles in the same order
+				close(self, matrix.to_euler(order), self.ANGLES)
+
+	def test_slerp(self):
+		start, end = Quaternion(), Quaternion((0, 0, 1), 1.0)
+		close(self, start.slerp(end, 0.0), start)
+		close(self, start.slerp(end, 1.0), end)
+		close(self, start.slerp(end, 0.25), Quaternion((0, 0, 1), 0.25))
+		a, b = Quaternion((1, 0, 0), 0.5), Quaternion((0, 0, 1), 1.0)
+		half = a.slerp(b, 0.5)
+		self.assertAlmostEqual(a.rotation_difference(half).angle, a.rotation_difference(b).angle / 2)
+		self.assertAlmostEqual(half.magnitude, 1.0)
+		# The short way round, whatever the sign of the other quaternion
+		self.assertRotation(a.slerp(-b, 0.5), half)
+		close(self, start.slerp(Quaternion((0, 0, 1), 6.0), 0.5), Quaternion((0, 0, 1), 3.0 - math.pi))
+
+	def test_make_compatible(self):
+		euler = Euler((0.3, 3.1, 0.2))
+		euler.make_compatible(Euler((0.0, -3.0, 0.0)))
+		close(self, euler, (0.3, 3.1 - 2 * math.pi, 0.2))
+		# Each angle ends up within half a turn of the other and turns the same way
+		for row, values in zip(euler.to_matrix(), Euler((0.3, 3.1, 0.2)).to_matrix()):
+			close(self, row, values)
+		compatible = Quaternion((1, 0, 0), 0.5).to_euler("XYZ", Euler((6.2, 0.0, 0.0)))
+		close(self, compatible, (0.5 + 2 * math.pi, 0.0, 0.0))
+		# Angles already close enough stay as they are
+		euler = Euler(self.ANGLES)
+		euler.make_compatible(Euler((0.0, 0.0, 0.0)))
+		close(self, euler, self.ANGLES)
+
+	def test_freeze(self):
+		euler = Euler(self.ANGLES, "ZXY").freeze()
+		quaternion = Quaternion((1, 0, 0), 0.5).freeze()
+		self.assertEqual(hash(euler), hash(Euler(self.ANGLES, "ZXY").freeze()))
+		self.assertEqual(hash(quaternion), hash(Quaternion((1, 0, 0), 0.5).freeze()))
+		for edit in (
+			lambda: setattr(euler, "x", 1.0),
+			lambda: setattr(euler, "order", "XYZ"),
+			lambda: euler.make_compatible(Euler()),
+			euler.zero,
+			lambda: setattr(quaternion, "w", 1.0),
+			lambda: quaternion.__setitem__(1, 0.0),
+			quaternion.normalize,
+			quaternion.invert,
+		):
+			with self.assertRaises(TypeError):
+				edit()
+		close(self, euler, self.ANGLES)
+		self.assertEqual(euler.order, "ZXY")
+		close(self, quaternion, Quaternion((1, 0, 0), 0.5))
+		# Results are new rotations that can be changed
+		self.assertFalse(quaternion.inverted().is_frozen)
+		self.assertFalse(euler.to_quaternion().is_frozen)
+
+
+if __name__ == "__main__":
+	unittest.main()
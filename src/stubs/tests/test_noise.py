@@ -0,0 +1,38 @@
+import unittest
+
+from mathutils import noise
+from mathutils.arrays import numpy
+
+POSITIONS = [(index * 0.37 - 5.0, index * 0.113 + 1.0, -index * 0.071) for index in range(40)]
+
+
+class ManyTest(unittest.TestCase):
+	def test_fractal_many_matches_fractal(self):
+		values = noise.fractal_many(POSITIONS, 1.0, 2.0, 3.5, noise.types.NEWPERLIN)
+		for position, value in zip(POSITIONS, values):
+			self.assertAlmostEqual(value, noise.fractal(position, 1.0, 2.0, 3.5, noise.types.NEWPERLIN), places=12)
+
+	def test_voronoi_many_matches_voronoi(self):
+		distances, locations = noise.voronoi_many(POSITIONS, noise.distance_metrics.MINKOVSKY, 3.0)
+		self.assertEqual(len(distances), len(POSITIONS))
+		for position, nearest, features in zip(POSITIONS, distances, locations):
+			expected, points = noise.voronoi(position, noise.distance_metrics.MINKOVSKY, 3.0)
+			self.assertEqual(len(nearest), 4)
+			for distance, value in zip(nearest, expected):
+				self.assertAlmostEqual(distance, value, places=12)
+			for feature, point in zip(features, points):
+				self.assertEqual(len(feature), 3)
+				for value, axis in zip(feature, point):
+					self.assertAlmostEqual(value, axis, places=12)
+
+	@unittest.skipIf(numpy is None, "numpy is not installed")
+	def test_voronoi_many_keeps_the_grid_shape(self):
+		distances, locations = noise.voronoi_many(noise.grid((3, 5), step=(0.7, 0.7, 1.0)))
+		self.assertEqual(distances.shape, (3, 5, 4))
+		self.assertEqual(locations.shape, (3, 5, 4, 3))
+		self.assertEqual(distances.dtype, numpy.float64)
+		self.assertTrue(numpy.all(numpy.diff(distances, axis=-1) >= 0.0))
+
+
+if __name__ == "__main__":
+	unittest.main()
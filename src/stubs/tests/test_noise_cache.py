@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+
+from mathutils import noise
+from mathutils.noise.cache import TileCache
+
+# H, lacunarity and octaves of the fractal noise of the tiles
+ARGUMENTS = (0.8, 2.0, 3)
+
+
+def flat(values):
+	"""The values of a tile or region, row after row."""
+
+	return [float(value) for value in (values.ravel() if hasattr(values, "ravel") else values)]
+
+
+class TileCacheTest(unittest.TestCase):
+	def setUp(self):
+		noise.seed_set(0)
+		self.addCleanup(noise.seed_set, 0)
+
+	def cache(self, **options):
+		cache = TileCache(tile_size=4, step=(0.3, 0.5), origin=(1.0, -2.0, 0.25), **options)
+		self.addCleanup(cache.close)
+		return cache
+
+	def test_tiles_hold_the_noise_of_their_samples(self):
+		cache = self.cache()
+		values = flat(cache.tile(noise.fractal, (1, -1), *ARGUMENTS))
+		self.assertEqual(len(values), 16)
+		for row in range(4):
+			for column in range(4):
+				position = (1.0 + (4 + column) * 0.3, -2.0 + (-4 + row) * 0.5, 0.25)
+				self.assertAlmostEqual(values[row * 4 + column], noise.fractal(position, *ARGUMENTS), places=12)
+
+	def test_regions_are_assembled_from_tiles(self):
+		cache = self.cache()
+		region = flat(cache.region(noise.fractal, (-3, 2), (5, 7), *ARGUMENTS))
+		for row in range(5):
+			for column in range(7):
+				position = (1.0 + (column - 3) * 0.3, -2.0 + (row + 2) * 0.5, 0.25)
+				self.assertAlmostEqual(region[row * 7 + column], noise.fractal(position, *ARGUMENTS), places=12)
+		# Columns -3 to 3 and rows 2 to 6 span 2 x 2 tiles
+		self.assertEqual(cache.stats()["misses"], 4)
+
+	def test_least_recently_used_tiles_are_evicted(self):
+		# Two tiles of 4 x 4 doubles fit
+		cache = self.cache(max_bytes=2 * 16 * 8)
+		for coordinate in ((0, 0), (1, 0), (0, 0), (2, 0)):
+			cache.tile(noise.fractal, coordinate, *ARGUMENTS)
+		self.assertEqual(cache.stats(), {
+			"hits": 1, "spill_hits": 0, "misses": 3, "evictions": 1, "tiles": 2, "spilled": 0, "bytes": 256})
+		# (1, 0) was evicted, (0, 0) was used after it
+		cache.tile(noise.fractal, (0, 0), *ARGUMENTS)
+		cache.tile(noise.fractal, (1, 0), *ARGUMENTS)
+		stats = cache.stats()
+		self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (2, 4, 2))
+		self.assertEqual(len(cache), 2)
+
+	def test_evicted_tiles_come_back_from_the_spill_file(self):
+		with tempfile.TemporaryDirectory() as folder:
+			for spill in (True, os.path.join(folder, "tiles.bin")):
+				# One tile in memory, two in the spill file
+				cache = self.cache(max_bytes=16 * 8, spill=spill, spill_bytes=2 * 16 * 8)
+				first = flat(cache.tile(noise.fractal, (0, 0), *ARGUMENTS))
+				cache.tile(noise.fractal, (1, 0), *ARGUMENTS)
+				cache.tile(noise.fractal, (2, 0), *ARGUMENTS)
+				self.assertEqual((cache.stats()["tiles"], cache.stats()["spilled"]), (1, 2))
+				self.assertEqual(flat(cache.tile(noise.fractal, (0, 0), *ARGUMENTS)), first)
+				self.assertEqual(cache.stats()["spill_hits"], 1)
+				# The spill file is full, (1, 0) was spilled first and is dropped
+				cache.tile(noise.fractal, (3, 0), *ARGUMENTS)
+				cache.tile(noise.fractal, (1, 0), *ARGUMENTS)
+				self.assertEqual(cache.stats(), {
+					"hits": 0, "spill_hits": 1, "misses": 5, "evictions": 5, "tiles": 1, "spilled": 2, "bytes": 128})
+				cache.close()
+
+	def test_spill_file_must_hold_a_tile(self):
+		with self.assertRaises(ValueError):
+			TileCache(tile_size=4, spill=True, spill_bytes=100)
+
+	def test_equivalent_calls_share_tiles(self):
+		cache = self.cache()
+		values = cache.tile(noise.fractal, (0, 0), 0.8, 2.0, 3)
+		self.assertIs(cache.tile("fractal", (0, 0), 0.8, 2.0, 3, noise.types.STDPERLIN), values)
+		self.assertIs(cache.tile("fractal", (0, 0), H=0.8, octaves=3, lacunarity=2.0), values)
+		self.assertEqual(cache.stats()["hits"], 2)
+		self.assertIsNot(cache.tile("fractal", (0, 0), 0.8, 2.0, 3, noise.types.BLENDER), values)
+		noise.seed_set(7)
+		self.assertIsNot(cache.tile("fractal", (0, 0), 0.8, 2.0, 3), values)
+		self.assertEqual(cache.stats()["misses"], 3)
+
+	def test_calls_are_checked(self):
+		cache = self.cache()
+		with self.assertRaises(TypeError):
+			cache.tile(noise.fractal, (0, 0), 0.8)
+		with self.assertRaises(TypeError):
+			cache.tile(noise.noise, (0, 0), scale=2.0)
+		# Vector noise has no tiles
+		with self.assertRaises(ValueError):
+			cache.tile(noise.noise_vector, (0, 0))
+
+	def test_clear_keeps_the_counters(self):
+		cache = self.cache(max_bytes=16 * 8, spill=True)
+		cache.tile(noise.fractal, (0, 0), *ARGUMENTS)
+		cache.tile(noise.fractal, (1, 0), *ARGUMENTS)
+		cache.clear()
+		self.assertEqual(len(cache), 0)
+		stats = cache.stats()
+		self.assertEqual((stats["misses"], stats["evictions"], stats["spilled"], stats["bytes"]), (2, 1, 0, 0))
+		# The freed spill slots are used again
+		for x in range(4):
+			cache.tile(noise.fractal, (x, 0), *ARGUMENTS)
+		self.assertEqual(cache.stats()["spilled"], 3)
+
+
+if __name__ == "__main__":
+	unittest.main()
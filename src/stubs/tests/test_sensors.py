@@ -0,0 +1,105 @@
+import math
+import random
+import unittest
+
+from Range import headless
+
+
+def near(owner, objects, distance, prop=""):
+	origin = owner.worldPosition
+	return {
+		id(obj) for obj in objects
+		if obj is not owner and (not prop or prop in obj) and (obj.worldPosition - origin).length <= distance
+	}
+
+
+def radar(owner, objects, axis, angle, distance, prop=""):
+	origin = owner.worldPosition
+	direction = owner.getAxisVect([1.0 if index == axis % 3 else 0.0 for index in range(3)])
+	if axis >= 3:
+		direction = -direction
+	found = set()
+	for obj in objects:
+		offset = obj.worldPosition - origin
+		length = offset.length
+		if obj is owner or (prop and prop not in obj) or not length or length > distance:
+			continue
+		if offset.dot(direction) >= math.cos(math.radians(angle) / 2.0) * length:
+			found.add(id(obj))
+	return found
+
+
+class SensorTest(unittest.TestCase):
+	def setUp(self):
+		self.random = random.Random(3)
+		self.game = headless.Game()
+		self.scene = self.game.addScene("Scene")
+		self.objects = [
+			self.scene.createObject(
+				"Object%d" % index, position=[self.random.uniform(-20, 20) for _ in range(3)],
+				properties={"enemy": True} if index % 3 == 0 else None)
+			for index in range(300)
+		]
+
+	def shuffle(self):
+		for obj in self.random.sample(self.objects, 100):
+			obj.worldPosition = [self.random.uniform(-20, 20) for _ in range(3)]
+
+	def test_near_sensors_match_brute_force(self):
+		owners = self.objects[:10]
+		sensors = [self.game.addNearSensor(owner, distance=6.0, propName="enemy" if index % 2 else "") for index, owner in enumerate(owners)]
+		for _ in range(5):
+			self.game.step()
+			for sensor in sensors:
+				expected = near(sensor.owner, self.objects, 6.0, sensor.propName)
+				self.assertEqual({id(obj) for obj in sensor.hitObjectList}, expected)
+				self.assertEqual(sensor.positive, bool(expected))
+				if expected:
+					self.assertIn(id(sensor.hitObject), expected)
+			self.shuffle()
+
+	def test_near_sensors_reset_beyond_reset_distance(self):
+		owner = self.scene.createObject("Owner", position=(100, 0, 0))
+		target = self.scene.createObject("Target", position=(103, 0, 0))
+		sensor = self.game.addNearSensor(owner, distance=2.0, resetDistance=4.0)
+		self.game.step()
+		self.assertFalse(sensor.positive)
+		target.worldPosition = (101.5, 0, 0)
+		self.game.step()
+		self.assertTrue(sensor.positive)
+		self.assertEqual(sensor.status, 1)
+		target.worldPosition = (103, 0, 0)
+		self.game.step()
+		self.assertTrue(sensor.positive)
+		self.assertIs(sensor.hitObject, target)
+		target.worldPosition = (105, 0, 0)
+		self.game.step()
+		self.assertFalse(sensor.positive)
+		self.assertEqual(sensor.status, 3)
+
+	def test_radar_sensors_match_brute_force(self):
+		sensors = []
+		for index, owner in enumerate(self.objects[:12]):
+			owner.worldOrientation = [self.random.uniform(-math.pi, math.pi) for _ in range(3)]
+			sensors.append(self.game.addRadarSensor(owner, distance=15.0, angle=40.0 + index * 5, axis=index % 6))
+		for _ in range(3):
+			self.game.step()
+			for sensor in sensors:
+				expected = radar(sensor.owner, self.objects, sensor.axis, sensor.angle, sensor.distance)
+				self.assertEqual({id(obj) for obj in sensor.hitObjectList}, expected)
+			self.shuffle()
+
+	def test_removed_objects_are_not_sensed(self):
+		owner = self.scene.createObject("Owner", position=(100, 0, 0))
+		target = self.scene.createObject("Target", position=(100.5, 0, 0))
+		sensor = self.game.addNearSensor(owner, distance=2.0)
+		self.game.step()
+		self.assertIs(sensor.hitObject, target)
+		target.endObject()
+		self.game.run(2)
+		self.assertIsNone(sensor.hitObject)
+		self.assertFalse(sensor.positive)
+
+
+if __name__ == "__main__":
+	unittest.main()
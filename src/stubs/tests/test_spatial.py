@@ -0,0 +1,101 @@
+import math
+import random
+import unittest
+
+from Range import headless
+
+
+class SpatialIndexTest(unittest.TestCase):
+	def setUp(self):
+		self.random = random.Random(7)
+		self.game = headless.Game()
+		self.scene = self.game.addScene("Scene")
+		self.objects = [
+			self.scene.createObject("Object%d" % index, position=self.point(40))
+			for index in range(500)
+		]
+		self.index = self.scene.spatialIndex
+
+	def point(self, extent):
+		return [self.random.uniform(-extent, extent) for _ in range(3)]
+
+	def positions(self):
+		return {id(obj): list(obj.worldPosition) for obj in self.objects if not obj.invalid}
+
+	def change(self):
+		"""Move, remove and add objects, the index follows."""
+		for obj in self.random.sample(self.objects, 80):
+			obj.worldPosition = self.point(40)
+		parent = self.objects[0]
+		for child in self.objects[1:20]:
+			child.setParent(parent)
+		parent.applyMovement((3, -2, 1))
+		self.scene._removeObjects(self.objects[100:130])
+		self.objects = [obj for obj in self.objects if not obj.invalid]
+		self.objects += [self.scene.createObject("New%d" % index, position=self.point(40)) for index in range(30)]
+
+	def check(self):
+		positions = self.positions()
+		for _ in range(40):
+			center, radius = self.point(50), self.random.uniform(0, 20)
+			expected = {key for key, point in positions.items() if math.dist(point, center) <= radius}
+			found = self.index.radius(center, radius, sort=True)
+			self.assertEqual({id(obj) for obj in found}, expected)
+			distances = [math.dist(positions[id(obj)], center) for obj in found]
+			self.assertEqual(distances, sorted(distances))
+
+			low = self.point(50)
+			high = [value + self.random.uniform(0, 30) for value in low]
+			expected = {
+				key for key, point in positions.items()
+				if all(low[axis] <= point[axis] <= high[axis] for axis in range(3))
+			}
+			self.assertEqual({id(obj) for obj in self.index.box(low, high)}, expected)
+
+			count = self.random.randint(1, 8)
+			nearest = self.index.nearest(center, count)
+			expected = sorted(math.dist(point, center) for point in positions.values())[:count]
+			self.assertEqual(len(nearest), count)
+			for (obj, distance), want in zip(nearest, expected):
+				self.assertAlmostEqual(distance, want)
+				self.assertAlmostEqual(distance, math.dist(positions[id(obj)], center))
+
+			direction, angle, distance = self.point(1), self.random.uniform(0.1, 1.2), self.random.uniform(5, 40)
+			length = math.sqrt(sum(value * value for value in direction))
+			expected = set()
+			for key, point in positions.items():
+				offset = [a - b for a, b in zip(point, center)]
+				squared = sum(value * value for value in offset)
+				if squared and squared <= distance * distance and \
+						sum(a * b for a, b in zip(offset, direction)) >= math.cos(angle) * math.sqrt(squared) * length:
+					expected.add(key)
+			self.assertEqual({id(obj) for obj in self.index.cone(center, direction, angle, distance)}, expected)
+
+	def test_queries_match_brute_force(self):
+		self.check()
+
+	def test_queries_follow_changes(self):
+		self.check()
+		self.change()
+		self.check()
+
+	def test_rebuild_with_another_cell_size(self):
+		self.change()
+		self.index.rebuild(cellSize=1.5)
+		self.check()
+		self.index.rebuild(cellSize=25.0)
+		self.check()
+
+	def test_nearest_within_distance(self):
+		center = self.point(10)
+		found = self.index.nearest(center, 1000, distance=8.0)
+		expected = {key for key, point in self.positions().items() if math.dist(point, center) <= 8.0}
+		self.assertEqual({id(obj) for obj, _ in found}, expected)
+
+	def test_cell_size_must_be_positive(self):
+		with self.assertRaises(ValueError):
+			self.index.rebuild(cellSize=0.0)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,116 @@
+import * as assert from 'assert';
+import * as path from 'path';
+
+import { ApiIndex } from '../apiIndex';
+import { ExpressionResolver, expressionStart } from '../apiProviders';
+import { loadStubBundles, selectVersion } from '../stubRoots';
+
+// The extension root, tests run from out/test
+const EXTENSION_PATH = path.resolve(__dirname, '..', '..');
+
+function lines(text: string) {
+	const split = text.split('\n');
+	return { lineCount: split.length, lineAt: (line: number) => ({ text: split[line] }) };
+}
+
+// A small slice of the Range API, in the shape of api-index.json
+const index = ApiIndex.fromSymbols({
+	'Range': { k: 'module', m: ['logic', 'types'] },
+	'Range.logic': { k: 'module', m: ['getCurrentController'] },
+	'Range.logic.getCurrentController': { k: 'function', s: '()', t: 'Range.types.SCA_PythonController' },
+	'Range.types': { k: 'module', m: ['CValue', 'SCA_ILogicBrick', 'SCA_PythonController', 'KX_GameObject'] },
+	'Range.types.CValue': { k: 'class', m: ['name'] },
+	'Range.types.CValue.name': { k: 'property', t: 'str' },
+	'Range.types.SCA_ILogicBrick': { k: 'class', b: ['Range.types.CValue'], m: ['owner'] },
+	'Range.types.SCA_ILogicBrick.owner': { k: 'property', t: 'Range.types.KX_GameObject' },
+	'Range.types.SCA_PythonController': { k: 'class', b: ['Range.types.SCA_ILogicBrick'], m: ['sensors'] },
+	'Range.types.SCA_PythonController.sensors': { k: 'property', t: 'Range.types.CListValue' },
+	'Range.types.KX_GameObject': { k: 'class', b: ['Range.types.CValue'], m: ['name', 'getDistanceTo', 'children'] },
+	'Range.types.KX_GameObject.name': { k: 'property', t: 'str' },
+	'Range.types.KX_GameObject.getDistanceTo': { k: 'method', s: '(self, other)', t: 'float' },
+	'Range.types.KX_GameObject.children': { k: 'property', t: 'Range.types.CListValue' },
+});
+
+suite('API Providers Test Suite', () => {
+	test('Finds the start of a dotted expression', () => {
+		const line = 'x = Range.logic.getCurrentController().owner';
+		assert.strictEqual(line.slice(expressionStart(line, line.length)), 'Range.logic.getCurrentController().owner');
+	});
+
+	test('Skips nested calls and subscripts', () => {
+		const line = 'speed = Vector((1, (2), 3))[0]';
+		assert.strictEqual(line.slice(expressionStart(line, line.length)), 'Vector((1, (2), 3))[0]');
+	});
+
+	test('Rejects unbalanced brackets', () => {
+		const line = 'print(a))';
+		assert.strictEqual(expressionStart(line, line.length), -1);
+	});
+
+	test('Inherits members from base classes', () => {
+		const members = index.members('Range.types.SCA_PythonController');
+		assert.strictEqual(members.get('sensors'), 'Range.types.SCA_PythonController.sensors');
+		assert.strictEqual(members.get('owner'), 'Range.types.SCA_ILogicBrick.owner');
+		assert.strictEqual(members.get('name'), 'Range.types.CValue.name');
+		// Own members shadow inherited ones
+		assert.strictEqual(index.member('Range.types.KX_GameObject', 'name'), 'Range.types.KX_GameObject.name');
+	});
+
+	test('Resolves a chain of assignments', () => {
+		const source = lines([
+			'import Range',
+			'cont = Range.logic.getCurrentController()',
+			'own = cont.owner',
+			'own.',
+		].join('\n'));
+		const resolver = new ExpressionResolver(index);
+		assert.strictEqual(resolver.scopeOf('cont', source, 3), 'Range.types.SCA_PythonController');
+		assert.strictEqual(resolver.scopeOf('own', source, 3), 'Range.types.KX_GameObject');
+		assert.strictEqual(resolver.symbolOf('own.getDistanceTo', source, 3), 'Range.types.KX_GameObject.getDistanceTo');
+		assert.strictEqual(resolver.symbolOf('cont.name', source, 3), 'Range.types.CValue.name');
+	});
+
+	test('Resolves aliased imports', () => {
+		const source = lines([
+			'from Range.logic import getCurrentController as controller',
+			'from Range import types as t',
+			'own = controller().owner',
+			'',
+		].join('\n'));
+		const resolver = new ExpressionResolver(index);
+		assert.strictEqual(resolver.scopeOf('own', source, 3), 'Range.types.KX_GameObject');
+		assert.strictEqual(resolver.scopeOf('t.KX_GameObject', source, 3), 'Range.types.KX_GameObject');
+		assert.strictEqual(resolver.symbolOf('controller', source, 3), 'Range.logic.getCurrentController');
+	});
+
+	test('Gives up on subscripts and calls of values', () => {
+		const source = lines([
+			'import Range',
+			'own = Range.logic.getCurrentController().owner',
+			'',
+		].join('\n'));
+		const resolver = new ExpressionResolver(index);
+		assert.strictEqual(resolver.scopeOf('own.children[0]', source, 2), undefined);
+		assert.strictEqual(resolver.scopeOf('own()', source, 2), undefined);
+		assert.strictEqual(resolver.scopeOf('own.name()', source, 2), undefined);
+		assert.strictEqual(resolver.scopeOf('Range.logic.getCurrentController', source, 2), undefined);
+	});
+
+	test('Completes cached properties of the built index', () => {
+		// Built by the pretest script
+		const bundles = loadStubBundles(EXTENSION_PATH);
+		assert.ok(bundles);
+		const built = ApiIndex.load(EXTENSION_PATH, selectVersion(bundles, undefined));
+		assert.ok(built);
+		const source = lines([
+			'import Range',
+			'own = Range.logic.getCurrentController().owner',
+			'own.scene.',
+		].join('\n'));
+		const resolver = new ExpressionResolver(built);
+		assert.strictEqual(resolver.scopeOf('own', source, 2), 'Range.types.KX_GameObject');
+		assert.strictEqual(resolver.scopeOf('own.scene', source, 2), 'Range.types.KX_Scene');
+		assert.ok(built.members('Range.types.KX_Scene').has('objects'));
+		assert.strictEqual(resolver.scopeOf('own.parent', source, 2), 'Range.types.KX_GameObject');
+	});
+});
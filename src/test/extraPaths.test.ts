@@ -0,0 +1,84 @@
+import * as assert from 'assert';
+import * as path from 'path';
+
+import { ExtraPathsWriter, PathsSetting } from '../extraPaths';
+
+const EXTENSION_PATH = path.resolve('extensions', 'rangeengine.range-engine-api-0.1.2');
+const EXTENSION_ID = 'RangeEngine.range-engine-api';
+
+// The setting in memory, every update is recorded, the first one takes longest
+class MemorySetting implements PathsSetting {
+	readonly writes: (string[] | undefined)[] = [];
+
+	constructor(private value: string[] = []) {}
+
+	get(): string[] {
+		return this.value;
+	}
+
+	async update(value: string[] | undefined) {
+		this.writes.push(value);
+		await sleep(this.writes.length === 1 ? 50 : 10);
+		this.value = value ?? [];
+	}
+}
+
+function stub(version: string, name: string) {
+	return path.join(EXTENSION_PATH, 'dist', 'stubs', version, name);
+}
+
+function sleep(ms: number) {
+	return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+suite('Extra Paths Test Suite', () => {
+	test('Coalesces repeated requests into one write', async () => {
+		const setting = new MemorySetting(['/user/lib']);
+		const writer = new ExtraPathsWriter(EXTENSION_PATH, EXTENSION_ID, setting);
+		writer.set([stub('1.4', 'Range')]);
+		writer.set([stub('1.5', 'Range')]);
+		writer.set([stub('1.5', 'Range'), stub('1.5', 'mathutils')]);
+		await sleep(400);
+		assert.deepStrictEqual(setting.writes, [['/user/lib', stub('1.5', 'Range'), stub('1.5', 'mathutils')]]);
+		writer.dispose();
+	});
+
+	test('Skips writes that change nothing', async () => {
+		const setting = new MemorySetting(['/user/lib', stub('1.5', 'Range')]);
+		const writer = new ExtraPathsWriter(EXTENSION_PATH, EXTENSION_ID, setting);
+		writer.set([stub('1.5', 'Range')]);
+		await writer.flush();
+		assert.strictEqual(setting.writes.length, 0);
+	});
+
+	test('Serializes writes', async () => {
+		const setting = new MemorySetting();
+		const writer = new ExtraPathsWriter(EXTENSION_PATH, EXTENSION_ID, setting);
+		writer.set([stub('1.5', 'Range')]);
+		const first = writer.flush();
+		// Requested while the slow first write is in progress
+		await sleep(5);
+		writer.set([stub('1.5', 'mathutils')]);
+		await Promise.all([first, writer.flush()]);
+		// The second write waited for the first, so it is the one that stays
+		assert.deepStrictEqual(setting.writes, [[stub('1.5', 'Range')], [stub('1.5', 'mathutils')]]);
+		assert.deepStrictEqual(setting.get(), [stub('1.5', 'mathutils')]);
+	});
+
+	test('Clear removes only the entries of the extension', async () => {
+		const older = path.resolve('extensions', 'rangeengine.range-engine-api-0.1.0', 'dist', 'stubs', 'Range');
+		const user = path.resolve('project', 'src', 'stubs');
+		const setting = new MemorySetting(['/user/lib', stub('1.5', 'Range'), older, user]);
+		const writer = new ExtraPathsWriter(EXTENSION_PATH, EXTENSION_ID, setting);
+		await writer.clear();
+		assert.deepStrictEqual(setting.get(), ['/user/lib', user]);
+		await new ExtraPathsWriter(EXTENSION_PATH, EXTENSION_ID, setting).clear();
+		assert.strictEqual(setting.writes.length, 1);
+	});
+
+	test('Clear removes the setting when nothing else is left', async () => {
+		const setting = new MemorySetting([stub('1.5', 'Range')]);
+		await new ExtraPathsWriter(EXTENSION_PATH, EXTENSION_ID, setting).clear();
+		assert.deepStrictEqual(setting.writes, [undefined]);
+	});
+});
@@ -0,0 +1,35 @@
+import * as assert from 'assert';
+
+import { scanHeader } from '../importScanner';
+
+function lines(text: string) {
+	const split = text.split('\n');
+	return { lineCount: split.length, lineAt: (line: number) => ({ text: split[line] }) };
+}
+
+suite('Import Scanner Test Suite', () => {
+	test('Collects imports from the header', () => {
+		const scan = scanHeader(lines([
+			'"""Docstring',
+			'"""',
+			'import Range',
+			'from mathutils import (',
+			'    Vector,',
+			')',
+			'import bgl as gl, aud',
+			'from . import sibling',
+			'',
+			'own = Range.logic.getCurrentController().owner',
+			'import late',
+		].join('\n')));
+
+		assert.deepStrictEqual([...scan.modules], ['Range', 'mathutils', 'bgl', 'aud']);
+		assert.strictEqual(scan.endLine, 9);
+	});
+
+	test('Stops at the first statement', () => {
+		const scan = scanHeader(lines('x = 1\nimport Range'));
+		assert.strictEqual(scan.modules.size, 0);
+		assert.strictEqual(scan.endLine, 0);
+	});
+});
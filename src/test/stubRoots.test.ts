@@ -0,0 +1,48 @@
+import * as assert from 'assert';
+import * as path from 'path';
+
+import { resolvePackages, selectVersion, stubRoots } from '../stubRoots';
+
+suite('Stub Roots Test Suite', () => {
+	const manifest = {
+		packages: {
+			'Range': { dependencies: ['mathutils'] },
+			'bgl': { dependencies: [] },
+			'bpy': { dependencies: ['mathutils'] },
+			'mathutils': { dependencies: [] },
+		},
+	};
+
+	test('Includes dependencies of requested packages', () => {
+		assert.deepStrictEqual(resolvePackages(manifest, ['Range']), ['Range', 'mathutils']);
+	});
+
+	test('Drops modules without stubs', () => {
+		assert.deepStrictEqual(resolvePackages(manifest, ['bgl', 'numpy']), ['bgl']);
+	});
+
+	const bundles = {
+		default: '1.10',
+		versions: { '1.4': manifest, '1.5': manifest, '1.10': manifest },
+	};
+
+	test('Selects the bundled engine version', () => {
+		assert.strictEqual(selectVersion(bundles, '1.5'), '1.5');
+		assert.strictEqual(selectVersion(bundles, undefined), '1.10');
+	});
+
+	test('Falls back to the closest older engine version', () => {
+		assert.strictEqual(selectVersion(bundles, '1.9.2'), '1.5');
+		assert.strictEqual(selectVersion(bundles, '1.2'), '1.4');
+	});
+
+	test('Exposes one root per resolved package', () => {
+		const roots = stubRoots('ext', bundles, '1.5', ['Range']);
+		assert.deepStrictEqual(roots, [path.join('ext', 'dist', 'stubs', '1.5', 'Range'), path.join('ext', 'dist', 'stubs', '1.5', 'mathutils')]);
+	});
+
+	test('Exposes nothing without a built bundle', () => {
+		assert.deepStrictEqual(stubRoots('ext', undefined, undefined, ['Range']), []);
+		assert.deepStrictEqual(stubRoots('ext', bundles, '2.0', ['Range']), []);
+	});
+});
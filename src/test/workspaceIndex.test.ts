@@ -0,0 +1,113 @@
+import * as assert from 'assert';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import * as vscode from 'vscode';
+
+import { INDEX_VERSION, STATE_KEY, WorkspaceIndex, WorkspaceIndexer } from '../workspaceIndex';
+
+// The workspace state, in memory
+class MemoryState implements vscode.Memento {
+	readonly values = new Map<string, unknown>();
+	updates = 0;
+
+	keys(): readonly string[] {
+		return [...this.values.keys()];
+	}
+
+	get<T>(key: string, defaultValue?: T): T | undefined {
+		return this.values.has(key) ? this.values.get(key) as T : defaultValue;
+	}
+
+	update(key: string, value: unknown): Thenable<void> {
+		this.values.set(key, JSON.parse(JSON.stringify(value)));
+		this.updates++;
+		return Promise.resolve();
+	}
+}
+
+const MODULES = ['Range', 'mathutils'];
+
+suite('Workspace Index Test Suite', () => {
+	let folder: string;
+
+	suiteSetup(() => {
+		folder = fs.mkdtempSync(path.join(os.tmpdir(), 'range-index-'));
+	});
+
+	suiteTeardown(() => {
+		fs.rmSync(folder, { recursive: true, force: true });
+	});
+
+	// Python files importing Range, 100 bytes each
+	function files(count: number, prefix: string): vscode.Uri[] {
+		return Array.from({ length: count }, (_, index) => {
+			const file = path.join(folder, `${prefix}${index}.py`);
+			fs.writeFileSync(file, `import Range\n# ${'x'.repeat(84)}\n`);
+			return vscode.Uri.file(file);
+		});
+	}
+
+	test('Keeps a stored index of the current version', () => {
+		const state = new MemoryState();
+		const stored: WorkspaceIndex = {
+			version: INDEX_VERSION, modules: MODULES, walked: true, complete: true, files: { 'file:///a.py': ['Range'] },
+		};
+		state.values.set(STATE_KEY, stored);
+		const indexer = new WorkspaceIndexer(state, MODULES);
+		assert.ok(indexer.built);
+		assert.deepStrictEqual([...indexer.usedModules()], ['Range']);
+	});
+
+	test('Drops a stored index of another version or other modules', () => {
+		for (const stored of [
+			{ version: INDEX_VERSION - 1, modules: MODULES, walked: true, complete: true, folders: { 'file:///': ['Range'] } },
+			{ version: INDEX_VERSION, modules: ['Range'], walked: true, complete: true, files: { 'file:///a.py': ['Range'] } },
+		]) {
+			const state = new MemoryState();
+			state.values.set(STATE_KEY, stored);
+			const indexer = new WorkspaceIndexer(state, MODULES);
+			assert.ok(!indexer.built);
+			assert.strictEqual(indexer.usedModules().size, 0);
+		}
+	});
+
+	test('Stops the walk at the file cap', async () => {
+		const indexer = new WorkspaceIndexer(new MemoryState(), MODULES, { maxFiles: 3, maxBytes: 1 << 20 });
+		const index = await indexer.indexFiles(files(5, 'count'));
+		assert.strictEqual(Object.keys(index.files).length, 3);
+		assert.ok(index.walked);
+		assert.ok(!index.complete);
+	});
+
+	test('Stops the walk at the byte cap', async () => {
+		// Every file is 100 bytes, the cap is reached after the third
+		const indexer = new WorkspaceIndexer(new MemoryState(), MODULES, { maxFiles: 100, maxBytes: 250 });
+		const index = await indexer.indexFiles(files(5, 'bytes'));
+		assert.strictEqual(Object.keys(index.files).length, 3);
+		assert.ok(!index.complete);
+	});
+
+	test('Completes a walk within the caps', async () => {
+		const state = new MemoryState();
+		const indexer = new WorkspaceIndexer(state, MODULES);
+		const index = await indexer.indexFiles(files(2, 'small'));
+		assert.ok(index.complete);
+		assert.deepStrictEqual(state.get<WorkspaceIndex>(STATE_KEY)?.files, index.files);
+	});
+
+	test('Replaces the imports recorded for a file', async () => {
+		const state = new MemoryState();
+		const indexer = new WorkspaceIndexer(state, MODULES);
+		const a = vscode.Uri.file(path.join(folder, 'a.py'));
+		const b = vscode.Uri.file(path.join(folder, 'b.py'));
+		assert.ok(await indexer.record(a, new Set(['Range', 'numpy'])));
+		assert.ok(!await indexer.record(a, new Set(['Range'])));
+		assert.ok(await indexer.record(b, new Set(['mathutils'])));
+		assert.deepStrictEqual([...indexer.usedModules()].sort(), ['Range', 'mathutils']);
+		// Dropping the import of the only file using Range drops Range
+		assert.ok(await indexer.record(a, new Set()));
+		assert.deepStrictEqual([...indexer.usedModules()], ['mathutils']);
+		assert.deepStrictEqual(Object.keys(state.get<WorkspaceIndex>(STATE_KEY)!.files), [b.toString()]);
+	});
+});
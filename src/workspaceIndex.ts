@@ -0,0 +1,201 @@
+import * as vscode from 'vscode';
+import * as fs from 'fs';
+import { scanHeader } from './importScanner';
+
+export const STATE_KEY = 'rangeEngine.workspaceIndex';
+// Bump when the stored shape changes, so old indexes get rebuilt
+export const INDEX_VERSION = 4;
+
+// Budgets for the one-time walk of the workspace
+export interface IndexLimits {
+    maxFiles: number;
+    maxBytes: number;
+}
+const LIMITS: IndexLimits = { maxFiles: 5000, maxBytes: 32 * 1024 * 1024 };
+// Only the start of each file is read, the import header lives there
+const HEAD_BYTES = 16 * 1024;
+const EXCLUDE = '**/{node_modules,.git,.venv,venv,__pycache__,site-packages}/**';
+
+// Files that mark a Range Engine project, keep in sync with the
+// workspaceContains activation events in package.json
+const PROJECT_MARKERS = '{**/*.blend,**/*.range}';
+
+// Whether the workspace contains a file marking a Range Engine project
+export async function hasProjectMarkers(): Promise<boolean> {
+    const found = await vscode.workspace.findFiles(PROJECT_MARKERS, EXCLUDE, 1);
+    return found.length > 0;
+}
+
+// File at the root of a workspace folder naming the Range Engine version
+// the project targets, e.g. `1.5`
+export const VERSION_FILE = '.range-version';
+
+// The engine version from the version file of the first folder that has one
+export async function detectEngineVersion(): Promise<string | undefined> {
+    for (const folder of vscode.workspace.workspaceFolders ?? []) {
+        let content: Uint8Array;
+        try {
+            content = await vscode.workspace.fs.readFile(vscode.Uri.joinPath(folder.uri, VERSION_FILE));
+        } catch {
+            continue;
+        }
+        const version = Buffer.from(content).toString('utf8').trim().split(/\s+/)[0];
+        if (version) {
+            return version;
+        }
+    }
+    return undefined;
+}
+
+export interface WorkspaceIndex {
+    version: number;
+    // The modules the index looks for
+    modules: string[];
+    // Whether the workspace has been walked, or only opened documents recorded
+    walked: boolean;
+    // Whether the walk covered every python file or hit a budget
+    complete: boolean;
+    // File URI -> indexed modules imported by that file, files importing none are left out
+    files: { [file: string]: string[] };
+}
+
+async function readHead(uri: vscode.Uri): Promise<string> {
+    if (uri.scheme === 'file') {
+        const handle = await fs.promises.open(uri.fsPath, 'r');
+        try {
+            const buffer = Buffer.alloc(HEAD_BYTES);
+            const { bytesRead } = await handle.read(buffer, 0, HEAD_BYTES, 0);
+            return buffer.toString('utf8', 0, bytesRead);
+        } finally {
+            await handle.close();
+        }
+    }
+    const content = await vscode.workspace.fs.readFile(uri);
+    return Buffer.from(content.subarray(0, HEAD_BYTES)).toString('utf8');
+}
+
+/**
+ * Remembers which files of the workspace import Range Engine stub packages.
+ * Range projects are walked once by a budgeted background walk, opened
+ * documents are recorded as they come and replace what was known of their
+ * file. The index is persisted in the workspace state, so later sessions
+ * start from what is known already.
+ */
+export class WorkspaceIndexer {
+    private index: WorkspaceIndex;
+    private building: Promise<WorkspaceIndex> | undefined;
+
+    // modules: the stub packages whose imports are recorded
+    constructor(
+        private readonly state: vscode.Memento,
+        private readonly modules: string[],
+        private readonly limits: IndexLimits = LIMITS
+    ) {
+        const stored = state.get<WorkspaceIndex>(STATE_KEY);
+        if (stored && stored.version === INDEX_VERSION && stored.modules?.join() === modules.join()) {
+            this.index = stored;
+        } else {
+            this.index = this.emptyIndex();
+        }
+    }
+
+    private emptyIndex(): WorkspaceIndex {
+        return { version: INDEX_VERSION, modules: this.modules, walked: false, complete: false, files: {} };
+    }
+
+    // Union of the indexed modules used anywhere in the workspace
+    usedModules(): Set<string> {
+        const modules = new Set<string>();
+        for (const used of Object.values(this.index.files)) {
+            used.forEach((module) => modules.add(module));
+        }
+        return modules;
+    }
+
+    // Whether the workspace was walked in this or a previous session
+    get built(): boolean {
+        return this.index.walked;
+    }
+
+    // Walk the workspace, unless a previous session already did
+    ensure(): Promise<WorkspaceIndex> {
+        if (this.index.walked) {
+            return Promise.resolve(this.index);
+        }
+        if (!this.building) {
+            this.building = this.build().finally(() => {
+                this.building = undefined;
+            });
+        }
+        return this.building;
+    }
+
+    private async build(): Promise<WorkspaceIndex> {
+        return this.indexFiles(await vscode.workspace.findFiles('**/*.py', EXCLUDE, this.limits.maxFiles + 1));
+    }
+
+    // Index python files as the walk of the workspace, within the budgets
+    async indexFiles(files: vscode.Uri[]): Promise<WorkspaceIndex> {
+        const index = { ...this.emptyIndex(), walked: true, complete: true };
+        if (files.length > this.limits.maxFiles) {
+            files = files.slice(0, this.limits.maxFiles);
+            index.complete = false;
+        }
+
+        let bytes = 0;
+        for (const file of files) {
+            if (bytes >= this.limits.maxBytes) {
+                index.complete = false;
+                break;
+            }
+            let head: string;
+            try {
+                head = await readHead(file);
+            } catch {
+                continue;
+            }
+            bytes += head.length;
+            const lines = head.split('\n');
+            const { modules } = scanHeader({
+                lineCount: lines.length,
+                lineAt: (line: number) => ({ text: lines[line] }),
+            });
+            this.put(index, file, modules);
+        }
+
+        // What opened documents recorded, also while the walk ran, is newer than the files
+        Object.assign(index.files, this.index.files);
+        this.index = index;
+        await this.state.update(STATE_KEY, index);
+        return index;
+    }
+
+    /**
+     * Record the imports of a single document, replacing the ones recorded
+     * for it before. Returns true when this changed the modules used by the
+     * workspace.
+     */
+    async record(uri: vscode.Uri, modules: Set<string>): Promise<boolean> {
+        const before = [...this.usedModules()].sort().join();
+        if (!this.put(this.index, uri, modules)) {
+            return false;
+        }
+        await this.state.update(STATE_KEY, this.index);
+        return [...this.usedModules()].sort().join() !== before;
+    }
+
+    // Set the modules of a file, returns whether its entry changed
+    private put(index: WorkspaceIndex, uri: vscode.Uri, modules: Set<string>): boolean {
+        const used = this.modules.filter((module) => modules.has(module));
+        const file = uri.toString();
+        if ((index.files[file] ?? []).join() === used.join()) {
+            return false;
+        }
+        if (used.length === 0) {
+            delete index.files[file];
+        } else {
+            index.files[file] = used;
+        }
+        return true;
+    }
+}